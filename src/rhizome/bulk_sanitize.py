@@ -0,0 +1,92 @@
+"""
+Column-wise sanitization of whole result batches.
+
+`RhizomeModel.sanitize()` copies an instance per row and hashes the fields
+declared with `SanitizeUUID` metadata. For large results the bulk path skips
+the copies: rows are serialized once and the declared columns are hashed in
+place, each distinct value once per batch. Models that override `sanitize()`
+keep using it per row.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlmodel import SQLModel
+
+from rhizome.models.base import RhizomeModel
+from rhizome.sanitize_helpers import sanitize_uuid_field, sanitized_fields
+
+
+def sanitize_plan(model_class: type[SQLModel]) -> dict[str, int] | None:
+    """
+    Work out which columns a model's `sanitize()` hashes, and to what length.
+
+    Args:
+        model_class: Model class with a `sanitize()` method
+
+    Returns:
+        Mapping of field name → sanitized length, or None if the model overrides
+        `RhizomeModel.sanitize()` (callers must then use it per row)
+    """
+    owner = next((cls for cls in model_class.__mro__ if "sanitize" in vars(cls)), None)
+    if owner is not RhizomeModel:
+        return None
+    return sanitized_fields(model_class)
+
+
+def sanitize_serialized(results: Sequence[SQLModel], serialized: list[dict[str, Any]]) -> bool:
+    """
+    Sanitize a batch of serialized rows in place, column by column.
+
+    Hashes are computed from the models' raw values (as `sanitize()` would) and each
+    distinct value is hashed once per batch; foreign keys in particular repeat a lot.
+
+    Args:
+        results: Model instances the rows were serialized from, all of one class
+        serialized: `model_dump()` output of each instance, in the same order
+
+    Returns:
+        False if the model class has no column-wise plan; the rows are then untouched
+        and must be sanitized per instance instead
+    """
+    if not results:
+        return True
+    plan = sanitize_plan(type(results[0]))
+    if plan is None:
+        return False
+
+    for column, length in plan.items():
+        hashes: dict[Any, str | None] = {}
+        for result, row in zip(results, serialized, strict=True):
+            if column not in row:
+                # Partial model: the column wasn't selected
+                continue
+            value: str | bytes | None = getattr(result, column)
+            hashed = hashes.get(value)
+            if hashed is None:
+                hashed = sanitize_uuid_field(value, length)
+                hashes[value] = hashed
+            row[column] = hashed
+    return True
+
+
+def sanitize_columns(rows: list[dict[str, Any]], plan: dict[str, int]) -> None:
+    """
+    Sanitize raw row dicts in place, hashing each planned column that the rows hold.
+
+    Args:
+        rows: Row dicts of unserialized values (e.g. straight from the database)
+        plan: Mapping of column name → sanitized length, from `sanitize_plan`
+    """
+    for column, length in plan.items():
+        hashes: dict[Any, str | None] = {}
+        for row in rows:
+            if column not in row:
+                # The column wasn't selected
+                continue
+            value: str | bytes | None = row[column]
+            hashed = hashes.get(value)
+            if hashed is None:
+                hashed = sanitize_uuid_field(value, length)
+                hashes[value] = hashed
+            row[column] = hashed
@@ -5,12 +5,9 @@ import typer
 
 from rhizome import __version__
 from rhizome.environments.environment_list import RhizomeEnvironment
-from rhizome.server import run
-from rhizome.sync_data import sync_data
-from rhizome.sync_report import sync_report
-from rhizome.sync_schema import sync_schema
 from trifolium.config import Home
 
+# The server and sync modules are imported by the commands using them, so `rhizome --help` stays fast
 app = typer.Typer(help="Database access helper for test tools")
 sync_app = typer.Typer(help="Synchronize database schemas, models, and data.")
 app.add_typer(sync_app, name="sync")
@@ -23,8 +20,37 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _parse_databases(value: str | None) -> list[str] | None:
+    """Parse a comma-separated list of databases (RhizomeEnvironment values), or "all"."""
+    if value is None:
+        return None
+    if value.strip() == "all":
+        return [str(env) for env in RhizomeEnvironment]
+    databases = [database.strip() for database in value.split(",") if database.strip()]
+    unknown = [database for database in databases if database not in RhizomeEnvironment.__members__]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown database(s): {', '.join(unknown)}. Choose from: {', '.join(RhizomeEnvironment)}"
+        )
+    return databases
+
+
 @app.command()
 def serve(
+    warm: Annotated[
+        str | None,
+        typer.Option(
+            help="Comma-separated databases (e.g. dev_billing_bookkeeper,dev_meta), or 'all', to warm up at startup: "
+            "their tunnels, secrets and pooled connections are set up concurrently before the first query.",
+        ),
+    ] = None,
+    keep_tunnels: Annotated[
+        bool,
+        typer.Option(
+            help="Leave port-forwards running when the server stops, so that the next 'rhizome serve' adopts them "
+            "instead of setting them up again.",
+        ),
+    ] = False,
     version: Annotated[
         bool,
         typer.Option(
@@ -36,13 +62,17 @@ def serve(
     ] = False,
 ) -> None:
     """Start the rhizome server for handling database connections."""
+    databases = _parse_databases(warm)
+
+    from rhizome.server import run
+
     sock = socket.socket()
     sock.bind(("", 0))
     port = sock.getsockname()[1]
 
     home = Home()
     home.set_port(port)
-    run(home)
+    run(home, warm=databases, keep_tunnels=keep_tunnels)
 
 
 @sync_app.command()
@@ -67,6 +97,8 @@ def data(
     ] = False,
 ) -> None:
     """Syncs the expected data for all environments."""
+    from rhizome.sync_data import sync_data
+
     sync_data(env, table_names=table, verbose=verbose, missing_only=missing_only)
 
 
@@ -92,6 +124,8 @@ def schema(
     ] = False,
 ) -> None:
     """Syncs the schema for all environments."""
+    from rhizome.sync_schema import sync_schema
+
     sync_schema(env, table_names=table, verbose=verbose, missing_only=missing_only)
 
 
@@ -103,6 +137,8 @@ def report(
     ] = None,
 ) -> None:
     """Generate a report of sync status for all environment/table pairs."""
+    from rhizome.sync_report import sync_report
+
     sync_report(env)
 
 
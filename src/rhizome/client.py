@@ -6,8 +6,9 @@ rhizome server and getting connection handles back.
 """
 
 import json
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
@@ -18,7 +19,9 @@ from httpx_sse import connect_sse
 from sqlmodel import create_engine
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
+from rhizome.logship import QueryLogShipper
 from rhizome.models.base import RhizomeModel
+from rhizome.server_models import ExecuteQueryRequest, ExecuteQueryResponse, GetMode
 from rhizome.tools import SubprocessTools
 from trifolium.config import Home
 
@@ -29,6 +32,12 @@ TOne = TypeVar("TOne", bound=RhizomeModel)
 # Timeout for query execution requests (includes time for server-side port forward setup)
 QUERY_TIMEOUT = 30.0
 
+# Idle connections to the rhizome server kept open for reuse (one per concurrently querying thread)
+HTTP_KEEPALIVE_CONNECTIONS = 10
+
+# Timeout for shipping a batch of query logs (runs on a background thread, never delays queries)
+LOG_TIMEOUT = 5.0
+
 
 @dataclass
 class Handle:
@@ -49,15 +58,78 @@ class Handle:
         pass
 
 
+@dataclass
+class BatchQuery:
+    """One query of a `RhizomeClient.select_many` batch."""
+
+    database_id: str  # RhizomeEnvironment enum value, e.g., "dev_meta"
+    query: SelectOfScalar[Any]
+    mode: GetMode = GetMode.FIRST  # FIRST, ALL or ONE, as in select_first/select_all/select_one
+    sanitize: bool = True
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one query of a `RhizomeClient.select_many` batch."""
+
+    result: Any  # Model instance or None (FIRST/ONE), list of model instances (ALL)
+    error: str | None = None
+
+    @property
+    def value(self) -> Any:  # noqa: ANN401
+        """
+        The query's result.
+
+        Raises:
+            RuntimeError: If the query failed
+        """
+        if self.error is not None:
+            raise RuntimeError(f"Query execution failed: {self.error}")
+        return self.result
+
+
 class RhizomeClient:
-    """Client for communicating with the rhizome server."""
+    """
+    Client for communicating with the rhizome server.
 
-    def __init__(self, home: Home | None = None, tools: SubprocessTools | None = None, *, data_in_logs: bool) -> None:
+    The client keeps one pooled, keep-alive HTTP connection pool to the server for its
+    whole lifetime. Call `close()` (or use the client as a context manager) when done.
+    """
+
+    def __init__(
+        self,
+        home: Home | None = None,
+        tools: SubprocessTools | None = None,
+        *,
+        data_in_logs: bool,
+        unix_socket: bool = True,
+        columnar_results: bool = True,
+    ) -> None:
+        """
+        Args:
+            home: Where to find the server's port (and socket) files
+            tools: External tools (kubectl, gcloud, ...), mockable for tests
+            data_in_logs: Whether to log query results
+            unix_socket: Talk to the server over its Unix domain socket when it has one, instead of TCP
+            columnar_results: Ask for query results in the compact columnar encoding (see `rhizome.wire`)
+        """
         self.home = home or Home()
         self.logger = structlog.get_logger("rhizome.client")
         self.tools = tools or SubprocessTools()
         self._base_url: str | None = None
+        self._http: httpx.Client | None = None
+        self._log_shipper: QueryLogShipper | None = None
+        # The log shipper's thread shares the HTTP client, so both are created and swapped under this lock
+        self._lock = threading.Lock()
         self.data_in_logs = data_in_logs
+        self.unix_socket = unix_socket
+        self.columnar_results = columnar_results
+
+    def __enter__(self) -> "RhizomeClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @property
     def base_url(self) -> str:
@@ -66,9 +138,61 @@ class RhizomeClient:
             port = self.home.get_port()
             if port is None:
                 raise RuntimeError("Rhizome server port not found. Make sure the rhizome server is running.")
-            self._base_url = f"http://0.0.0.0:{port}"
+            self._base_url = f"http://127.0.0.1:{port}"
         return self._base_url
 
+    @property
+    def http(self) -> httpx.Client:
+        """
+        Shared HTTP client for requests to the rhizome server.
+
+        Connections are kept alive and reused across requests. If the server listens on a
+        Unix domain socket (and `unix_socket` is enabled), requests go through it; the URL
+        host is then ignored.
+        """
+        http = self._http
+        if http is not None:
+            return http
+        with self._lock:
+            if self._http is None:
+                socket_path = self.home.get_socket_path() if self.unix_socket else None
+                transport = httpx.HTTPTransport(uds=str(socket_path)) if socket_path is not None else None
+                self._http = httpx.Client(
+                    timeout=QUERY_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS, keepalive_expiry=60.0),
+                    transport=transport,
+                )
+            return self._http
+
+    @property
+    def log_shipper(self) -> QueryLogShipper:
+        """Background shipper for the query logs of engines from `_create_instrumented_engine`."""
+        with self._lock:
+            if self._log_shipper is None:
+                self._log_shipper = QueryLogShipper(self._post_log_batch)
+            return self._log_shipper
+
+    def _post_log_batch(self, body: bytes) -> None:
+        response = self.http.post(
+            f"{self.base_url}/log_batch",
+            content=body,
+            headers={"Content-Type": "application/json"},
+            timeout=LOG_TIMEOUT,
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        """Flush pending query logs and close pooled connections to the rhizome server."""
+        with self._lock:
+            log_shipper, self._log_shipper = self._log_shipper, None
+        # Flushing posts through self.http, so it must happen outside the lock
+        if log_shipper is not None:
+            log_shipper.close()
+        with self._lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
     def request_portforward(
         self, kube_context: str, kube_namespace: str, kube_deployment: str, sql_connection: str, local_port: int = 3306
     ) -> Handle:
@@ -86,18 +210,17 @@ class RhizomeClient:
             Handle: Connection handle with connection string and port info
         """
         # Make request to rhizome server to start port forward
-        with httpx.Client() as client:
-            response = client.post(
-                f"{self.base_url}/portforward",
-                json={
-                    "kube_context": kube_context,
-                    "kube_namespace": kube_namespace,
-                    "kube_deployment": kube_deployment,
-                    "sql_connection": sql_connection,
-                    "local_port": local_port,
-                },
-            )
-            response.raise_for_status()
+        response = self.http.post(
+            f"{self.base_url}/portforward",
+            json={
+                "kube_context": kube_context,
+                "kube_namespace": kube_namespace,
+                "kube_deployment": kube_deployment,
+                "sql_connection": sql_connection,
+                "local_port": local_port,
+            },
+        )
+        response.raise_for_status()
 
         # Wait a moment for the port forward to establish
         time.sleep(2)
@@ -131,21 +254,18 @@ class RhizomeClient:
         credentials: dict[str, Any] = {}
 
         # Connect to SSE endpoint for credential streaming
-        with (
-            httpx.Client() as client,
-            connect_sse(
-                client,
-                "POST",
-                f"{self.base_url}/localk8s",
-                json={
-                    "kube_context": kube_context,
-                    "kube_namespace": kube_namespace,
-                    "kube_deployment": kube_deployment,
-                    "local_port": local_port,
-                    "delay": delay,
-                },
-            ) as event_source,
-        ):
+        with connect_sse(
+            self.http,
+            "POST",
+            f"{self.base_url}/localk8s",
+            json={
+                "kube_context": kube_context,
+                "kube_namespace": kube_namespace,
+                "kube_deployment": kube_deployment,
+                "local_port": local_port,
+                "delay": delay,
+            },
+        ) as event_source:
             for sse in event_source.iter_sse():
                 if sse.event == "status":
                     status_data = json.loads(sse.data)
@@ -176,9 +296,8 @@ class RhizomeClient:
             Handle: Connection handle with sleeper process info
         """
         # Make request to rhizome server to start sleeper
-        with httpx.Client() as client:
-            response = client.post(f"{self.base_url}/sleeper", json={"iterations": iterations})
-            response.raise_for_status()
+        response = self.http.post(f"{self.base_url}/sleeper", json={"iterations": iterations})
+        response.raise_for_status()
 
         # Wait a moment for the process to start
         time.sleep(0.1)
@@ -256,7 +375,9 @@ class RhizomeClient:
         Create a SQLAlchemy engine with event listeners for query logging.
 
         This method provides centralized query logging via SQLAlchemy's event system.
-        All queries are logged to the rhizome server before and after execution.
+        All queries are logged to the rhizome server before and after execution. Log
+        records are queued and shipped in batches by `log_shipper`, so logging never
+        blocks the query.
 
         Args:
             connection_string: Database connection string
@@ -266,12 +387,12 @@ class RhizomeClient:
         """
         import time
         import uuid
-        from contextlib import suppress
 
         from sqlalchemy import event
         from sqlalchemy.engine import Connection, ExecutionContext
 
         engine = create_engine(connection_string)
+        shipper = self.log_shipper
 
         # Extract database name from connection string for logging
         database = engine.url.database or "unknown"
@@ -291,19 +412,16 @@ class RhizomeClient:
             context._query_id = query_id  # type: ignore[attr-defined]
             context._query_start_time = time.time()  # type: ignore[attr-defined]
 
-            # Log to rhizome server (non-blocking, fire-and-forget)
-            with suppress(Exception):
-                httpx.post(
-                    f"{self.base_url}/log_query",
-                    json={
-                        "query_id": query_id,
-                        "statement": statement,
-                        "parameters": parameters,
-                        "database": database,
-                        "connection_string": connection_string,
-                    },
-                    timeout=1.0,  # Short timeout to avoid blocking queries
-                )
+            # Queue for the rhizome server (non-blocking, dropped if the queue is full)
+            shipper.submit(
+                {
+                    "query_id": query_id,
+                    "statement": statement,
+                    "parameters": parameters,
+                    "database": database,
+                    "connection_string": connection_string,
+                }
+            )
 
         @event.listens_for(engine, "after_cursor_execute")
         def after_cursor_execute(  # type: ignore[reportUnusedFunction]
@@ -322,21 +440,30 @@ class RhizomeClient:
             # Get row count if available
             row_count = cursor.rowcount if cursor.rowcount >= 0 else None
 
-            # Log to rhizome server (non-blocking, fire-and-forget)
+            # Queue for the rhizome server (non-blocking, dropped if the queue is full)
             # Note: Only log query_id, duration, and row_count. Context (statement, database, etc.) was already logged.
-            with suppress(Exception):
-                httpx.post(
-                    f"{self.base_url}/log_query_result",
-                    json={  # type: ignore[arg-type]
-                        "query_id": query_id,
-                        "duration_ms": duration,
-                        "row_count": row_count,
-                    },
-                    timeout=1.0,  # Short timeout to avoid blocking queries
-                )
+            shipper.submit({"query_id": query_id, "duration_ms": duration, "row_count": row_count})
 
         return engine
 
+    def _execute_query(self, request: ExecuteQueryRequest) -> ExecuteQueryResponse:
+        """
+        Send a query to the server's /execute_query endpoint.
+
+        Asks for the columnar MessagePack encoding when `columnar_results` is enabled;
+        the server may still answer with JSON.
+        """
+        from rhizome.wire import COLUMNAR_MEDIA_TYPE, decode_response
+
+        headers = {"Accept": f"{COLUMNAR_MEDIA_TYPE}, application/json;q=0.5"} if self.columnar_results else None
+        response = self.http.post(f"{self.base_url}/execute_query", json=request.model_dump(), headers=headers)
+        response.raise_for_status()
+
+        # Compare exactly: anything but the columnar media type is JSON
+        if response.headers.get("content-type") == COLUMNAR_MEDIA_TYPE:
+            return decode_response(response.content)
+        return ExecuteQueryResponse.model_validate(response.json())
+
     def select_first(self, database_id: str, query: SelectOfScalar[TFirst], sanitize: bool = True) -> TFirst | None:
         """
         Execute a query server-side and return the first result or None.
@@ -349,35 +476,25 @@ class RhizomeClient:
         Returns:
             First model instance (sanitized or raw) or None
         """
-        from rhizome.serialization import deserialize_result, get_model_info, serialize_query
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import deserialize_result, get_model_class, serialize_query
         from rhizome.server_models import ExecuteQueryRequest, GetMode
 
         # Serialize query
         sql, parameters = serialize_query(query)
-        model_info = get_model_info(query)
+        model_class = get_model_class(query)
 
         # Send to server
         request = ExecuteQueryRequest(
             database_id=database_id,
             sql=sql,
             parameters=parameters,
-            model_module=model_info["model_module"],
-            model_class=model_info["model_class"],
+            model_id=model_id(model_class),
             mode=GetMode.FIRST,
             sanitize=sanitize,
         )
 
-        with httpx.Client(timeout=QUERY_TIMEOUT) as client:
-            response = client.post(
-                f"{self.base_url}/execute_query",
-                json=request.model_dump(),
-            )
-            response.raise_for_status()
-
-        # Parse response
-        from rhizome.server_models import ExecuteQueryResponse
-
-        result = ExecuteQueryResponse.model_validate(response.json())
+        result = self._execute_query(request)
 
         if not result.success:
             raise RuntimeError(f"Query execution failed: {result.error}")
@@ -386,10 +503,6 @@ class RhizomeClient:
             return None
 
         # Deserialize result
-        # Import the model class to deserialize
-        from rhizome.serialization import import_model_class
-
-        model_class = import_model_class(model_info["model_module"], model_info["model_class"])
         # Type assertion: we know result.result is a dict here, not a list
         assert isinstance(result.result, dict)
         return deserialize_result(result.result, model_class)  # type: ignore[return-value]
@@ -406,35 +519,25 @@ class RhizomeClient:
         Returns:
             List of model instances (sanitized or raw)
         """
-        from rhizome.serialization import deserialize_result_list, get_model_info, serialize_query
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import deserialize_result_list, get_model_class, serialize_query
         from rhizome.server_models import ExecuteQueryRequest, GetMode
 
         # Serialize query
         sql, parameters = serialize_query(query)
-        model_info = get_model_info(query)
+        model_class = get_model_class(query)
 
         # Send to server
         request = ExecuteQueryRequest(
             database_id=database_id,
             sql=sql,
             parameters=parameters,
-            model_module=model_info["model_module"],
-            model_class=model_info["model_class"],
+            model_id=model_id(model_class),
             mode=GetMode.ALL,
             sanitize=sanitize,
         )
 
-        with httpx.Client(timeout=QUERY_TIMEOUT) as client:
-            response = client.post(
-                f"{self.base_url}/execute_query",
-                json=request.model_dump(),
-            )
-            response.raise_for_status()
-
-        # Parse response
-        from rhizome.server_models import ExecuteQueryResponse
-
-        result = ExecuteQueryResponse.model_validate(response.json())
+        result = self._execute_query(request)
 
         if not result.success:
             raise RuntimeError(f"Query execution failed: {result.error}")
@@ -443,11 +546,166 @@ class RhizomeClient:
             return []
 
         # Deserialize results
-        from rhizome.serialization import import_model_class
-
-        model_class = import_model_class(model_info["model_module"], model_info["model_class"])
         return deserialize_result_list(result.result, model_class)  # type: ignore[arg-type]
 
+    def select_keyset_page(
+        self, database_id: str, query: SelectOfScalar[TAll], keyset_columns: list[str], sanitize: bool = True
+    ) -> tuple[list[TAll], list[Any] | None]:
+        """
+        Execute one page of a keyset-paginated query server-side.
+
+        Args:
+            database_id: Database identifier (RhizomeEnvironment enum value, e.g., "dev_meta")
+            query: SQLModel query to execute, ordered by the keyset columns
+            keyset_columns: Column names that make up the pagination key
+            sanitize: If True, return sanitized results. If False, return raw results. Default: True
+
+        Returns:
+            Tuple of (model instances, unsanitized key of the last row or None if the page is empty)
+        """
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import deserialize_result_list, get_model_class, serialize_query
+        from rhizome.server_models import ExecuteQueryRequest, GetMode
+
+        # Serialize query
+        sql, parameters = serialize_query(query)
+        model_class = get_model_class(query)
+
+        # Send to server
+        request = ExecuteQueryRequest(
+            database_id=database_id,
+            sql=sql,
+            parameters=parameters,
+            model_id=model_id(model_class),
+            mode=GetMode.ALL,
+            sanitize=sanitize,
+            keyset_columns=keyset_columns,
+        )
+
+        result = self._execute_query(request)
+
+        if not result.success:
+            raise RuntimeError(f"Query execution failed: {result.error}")
+
+        if not result.result:
+            return [], None
+        return deserialize_result_list(result.result, model_class), result.last_key  # type: ignore[arg-type, return-value]
+
+    def select_iter(
+        self, database_id: str, query: SelectOfScalar[TAll], sanitize: bool = True, batch_size: int = 1000
+    ) -> Iterator[TAll]:
+        """
+        Execute a query server-side and yield results as they arrive.
+
+        Results are streamed from the server as NDJSON batches and deserialized one
+        batch at a time, so memory use stays flat regardless of the number of rows.
+
+        Args:
+            database_id: Database identifier (RhizomeEnvironment enum value, e.g., "dev_meta")
+            query: SQLModel query to execute
+            sanitize: If True, yield sanitized results. If False, yield raw results. Default: True
+            batch_size: Number of rows the server sends per batch
+
+        Yields:
+            Model instances (sanitized or raw)
+
+        Raises:
+            RuntimeError: If the query fails (possibly after some results were yielded)
+        """
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import deserialize_result_list, get_model_class, serialize_query
+        from rhizome.server_models import ExecuteQueryRequest, GetMode, QueryStreamChunk
+
+        # Serialize query
+        sql, parameters = serialize_query(query)
+        model_class = get_model_class(query)
+
+        request = ExecuteQueryRequest(
+            database_id=database_id,
+            sql=sql,
+            parameters=parameters,
+            model_id=model_id(model_class),
+            mode=GetMode.STREAM,
+            sanitize=sanitize,
+            batch_size=batch_size,
+        )
+
+        with self.http.stream("POST", f"{self.base_url}/execute_query_stream", json=request.model_dump()) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+
+                chunk = QueryStreamChunk.model_validate_json(line)
+                if chunk.error is not None:
+                    raise RuntimeError(f"Query execution failed: {chunk.error}")
+
+                yield from deserialize_result_list(chunk.rows, model_class)  # type: ignore[misc]
+
+                if chunk.done:
+                    return
+
+        raise RuntimeError("Query execution failed: result stream ended unexpectedly")
+
+    def select_many(self, queries: Sequence[BatchQuery], concurrent: bool = True) -> list[BatchResult]:
+        """
+        Execute several queries server-side in a single round trip.
+
+        The server runs each database's queries in order on one pooled connection.
+        A failing query doesn't affect the others: its BatchResult carries the error.
+
+        Args:
+            queries: Queries to run, each with its database and mode
+            concurrent: Run queries for different databases concurrently on the server
+
+        Returns:
+            One BatchResult per query, in the same order
+        """
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import (
+            deserialize_result,
+            deserialize_result_list,
+            get_model_class,
+            serialize_query,
+        )
+        from rhizome.server_models import ExecuteBatchRequest, ExecuteBatchResponse, ExecuteQueryRequest
+
+        requests: list[ExecuteQueryRequest] = []
+        for batch_query in queries:
+            sql, parameters = serialize_query(batch_query.query)
+            model_class = get_model_class(batch_query.query)
+            requests.append(
+                ExecuteQueryRequest(
+                    database_id=batch_query.database_id,
+                    sql=sql,
+                    parameters=parameters,
+                    model_id=model_id(model_class),
+                    mode=batch_query.mode,
+                    sanitize=batch_query.sanitize,
+                )
+            )
+
+        response = self.http.post(
+            f"{self.base_url}/execute_batch",
+            json=ExecuteBatchRequest(queries=requests, concurrent=concurrent).model_dump(),
+        )
+        response.raise_for_status()
+        batch = ExecuteBatchResponse.model_validate(response.json())
+
+        results: list[BatchResult] = []
+        for batch_query, result in zip(queries, batch.results, strict=True):
+            if not result.success:
+                results.append(BatchResult(result=None, error=result.error))
+            elif result.result is None:
+                results.append(BatchResult(result=None))
+            else:
+                model_class = get_model_class(batch_query.query)
+                if isinstance(result.result, list):
+                    results.append(BatchResult(result=deserialize_result_list(result.result, model_class)))
+                else:
+                    results.append(BatchResult(result=deserialize_result(result.result, model_class)))
+        return results
+
     def select_one(self, database_id: str, query: SelectOfScalar[TOne], sanitize: bool = True) -> TOne:
         """
         Execute a query server-side and return exactly one result.
@@ -463,35 +721,25 @@ class RhizomeClient:
         Raises:
             RuntimeError: If zero or more than one results found
         """
-        from rhizome.serialization import deserialize_result, get_model_info, serialize_query
+        from rhizome.model_registry import model_id
+        from rhizome.serialization import deserialize_result, get_model_class, serialize_query
         from rhizome.server_models import ExecuteQueryRequest, GetMode
 
         # Serialize query
         sql, parameters = serialize_query(query)
-        model_info = get_model_info(query)
+        model_class = get_model_class(query)
 
         # Send to server
         request = ExecuteQueryRequest(
             database_id=database_id,
             sql=sql,
             parameters=parameters,
-            model_module=model_info["model_module"],
-            model_class=model_info["model_class"],
+            model_id=model_id(model_class),
             mode=GetMode.ONE,
             sanitize=sanitize,
         )
 
-        with httpx.Client(timeout=QUERY_TIMEOUT) as client:
-            response = client.post(
-                f"{self.base_url}/execute_query",
-                json=request.model_dump(),
-            )
-            response.raise_for_status()
-
-        # Parse response
-        from rhizome.server_models import ExecuteQueryResponse
-
-        result = ExecuteQueryResponse.model_validate(response.json())
+        result = self._execute_query(request)
 
         if not result.success:
             raise RuntimeError(f"Query execution failed: {result.error}")
@@ -500,9 +748,6 @@ class RhizomeClient:
             raise RuntimeError("Query returned no results (expected exactly one)")
 
         # Deserialize result
-        from rhizome.serialization import import_model_class
-
-        model_class = import_model_class(model_info["model_module"], model_info["model_class"])
         # Type assertion: we know result.result is a dict here, not a list
         assert isinstance(result.result, dict)
         deserialized = deserialize_result(result.result, model_class)
@@ -588,10 +833,10 @@ class RhizomeClient:
         if entity_descriptions is not None:
             payload["entity_descriptions"] = entity_descriptions
 
-        with httpx.Client(timeout=300.0) as client:  # 5 min timeout for user interaction
-            response = client.post(
-                f"{self.base_url}/write_query",
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self.http.post(
+            f"{self.base_url}/write_query",
+            json=payload,
+            timeout=300.0,  # 5 min timeout for user interaction
+        )
+        response.raise_for_status()
+        return response.json()
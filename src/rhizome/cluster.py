@@ -2,15 +2,179 @@
 Cluster connection management.
 
 This module handles connecting to Kubernetes clusters.
+
+Connecting runs `gcloud container clusters get-credentials` and two kubectl
+config commands, which takes seconds, and every database behind a cluster
+needs it. Connections are therefore cached per (project, cluster, region,
+server):
+
+- A connection is reused for a configurable TTL
+- If the kubeconfig changed since, `kubectl cluster-info` checks that the
+  cluster's context still works before the connection is reused
+- Concurrent callers for the same cluster share a single connect
 """
 
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING
 
 import structlog
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from rhizome.environments.base import Tools
 
+logger = structlog.get_logger()
+
+ClusterKey = tuple[str, str, str, str]  # (project, cluster, region, server)
+
+
+def _kubeconfig_mtime() -> float | None:
+    """Latest modification time of the kubeconfig files kubectl reads, if any exist."""
+    paths = os.environ.get("KUBECONFIG") or str(Path.home() / ".kube" / "config")
+    mtimes = [Path(path).stat().st_mtime for path in paths.split(os.pathsep) if path and Path(path).is_file()]
+    return max(mtimes, default=None)
+
+
+class ClusterConnectionInfo(BaseModel):
+    project: str
+    cluster: str
+    region: str
+    server: str
+    connected_at: float
+    expires_at: float
+
+
+class ClusterConnectionsResponse(BaseModel):
+    ttl_seconds: float
+    clusters: list[ClusterConnectionInfo]
+    hits: int  # Connections reused as they were
+    verifications: int  # Connections reused after `kubectl cluster-info` vouched for them
+    misses: int  # Connects run
+
+
+@dataclass
+class _ClusterConnection:
+    connected_at: float
+    kubeconfig_mtime: float | None  # When the connection was last known to work
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    verifications: int = 0
+    misses: int = 0
+
+
+class ClusterConnectionCache:
+    """Cache of cluster connections with TTL, kubeconfig freshness checks and single-flight connects."""
+
+    def __init__(self, ttl_seconds: float = 3600.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[ClusterKey, _ClusterConnection] = {}
+        self._in_flight: dict[ClusterKey, Future[None]] = {}
+        self._stats = _Stats()
+        # Environments connect from their own event loops (asyncio.run), possibly in other threads
+        self._lock = Lock()
+
+    async def connect(
+        self, key: ClusterKey, connect: Callable[[], Awaitable[None]], verify: Callable[[], Awaitable[bool]]
+    ) -> None:
+        """
+        Connect to a cluster unless a fresh connection to it is cached.
+
+        Only one connect (or verification) per cluster runs at a time; concurrent
+        callers (from any thread or event loop) wait for its outcome.
+
+        Args:
+            key: (project, cluster, region, server)
+            connect: Coroutine factory that connects to the cluster
+            verify: Coroutine factory that checks whether the cached connection still works
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.connected_at + self.ttl_seconds <= time.time():
+                entry = None
+            if entry is not None and entry.kubeconfig_mtime == _kubeconfig_mtime():
+                self._stats.hits += 1
+                return
+
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if pending is None:
+                pending = Future[None]()
+                self._in_flight[key] = pending
+
+        if not owner:
+            logger.debug("Waiting for in-flight cluster connect", cluster=key[1])
+            return await asyncio.wrap_future(pending)
+
+        try:
+            # The kubeconfig changed (e.g. another cluster was connected): check that ours still works
+            if entry is not None and await verify():
+                connected_at = entry.connected_at
+                self._stats.verifications += 1
+            else:
+                await connect()
+                connected_at = time.time()
+                self._stats.misses += 1
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            self._entries[key] = _ClusterConnection(connected_at=connected_at, kubeconfig_mtime=_kubeconfig_mtime())
+            del self._in_flight[key]
+        pending.set_result(None)
+
+    def evict(self, key: ClusterKey) -> bool:
+        """
+        Forget a cluster's connection, e.g. because a tunnel through it failed.
+
+        Returns:
+            True if a connection was cached
+        """
+        with self._lock:
+            removed = self._entries.pop(key, None) is not None
+        if removed:
+            logger.info("Evicted cluster connection", cluster=key[1])
+        return removed
+
+    def clear(self) -> None:
+        """Forget every cluster connection."""
+        with self._lock:
+            self._entries.clear()
+
+    def describe(self) -> ClusterConnectionsResponse:
+        """Describe cached cluster connections and hit/miss counters."""
+        with self._lock:
+            clusters = [
+                ClusterConnectionInfo(
+                    project=project,
+                    cluster=cluster,
+                    region=region,
+                    server=server,
+                    connected_at=entry.connected_at,
+                    expires_at=entry.connected_at + self.ttl_seconds,
+                )
+                for (project, cluster, region, server), entry in self._entries.items()
+            ]
+            return ClusterConnectionsResponse(
+                ttl_seconds=self.ttl_seconds,
+                clusters=clusters,
+                hits=self._stats.hits,
+                verifications=self._stats.verifications,
+                misses=self._stats.misses,
+            )
+
 
 async def connect_cluster(
     project: str,
@@ -18,6 +182,32 @@ async def connect_cluster(
     region: str,
     server: str,
     tools: "Tools",
+) -> None:
+    """
+    Connect to a Kubernetes cluster, reusing a cached connection if it is still fresh.
+
+    Raises:
+        RuntimeError: If the cluster's credentials or server cannot be set
+    """
+    fqcn = f"gke_{project}_{region}_{cluster}"
+
+    async def verify() -> bool:
+        result = await tools.kubectl.cluster_info(context=fqcn)
+        return result.success
+
+    await cluster_connections.connect(
+        (project, cluster, region, server),
+        connect=lambda: _connect_cluster(project=project, cluster=cluster, region=region, server=server, tools=tools),
+        verify=verify,
+    )
+
+
+async def _connect_cluster(
+    project: str,
+    cluster: str,
+    region: str,
+    server: str,
+    tools: "Tools",
 ) -> None:
     """
     Connect to a Kubernetes cluster.
@@ -61,3 +251,7 @@ async def connect_cluster(
         )
         # This is not a fatal error, so we just log it and continue.
         log.warning("Could not unset certificate authority data. This may or may not be a problem.")
+
+
+# Global cluster connection cache instance
+cluster_connections = ClusterConnectionCache()
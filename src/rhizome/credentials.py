@@ -0,0 +1,241 @@
+"""
+Server-side credential cache.
+
+Resolving credentials means spawning `op read` (1Password) or `pybritive checkout`,
+which takes seconds. The rhizome server caches the results, keyed by
+(secret_manager, secret_reference), so that repeated queries reuse them:
+
+- 1Password secrets live for a configurable TTL
+- Pybritive checkouts are leases, so they are kept for the lease length (the
+  checkout output doesn't say when the lease ends, so it is a setting)
+- Concurrent requests for the same key share a single fetch
+- Entries are evicted when the database rejects the credentials
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.exc import DBAPIError
+
+from rhizome.environments.base import SecretManager
+from rhizome.tools import BritiveInfo, OnePasswordTool, PybritiveTool
+
+logger = structlog.get_logger()
+
+# MySQL ER_ACCESS_DENIED_ERROR: the server rejected the username/password
+_AUTH_ERROR_CODES = {1045}
+
+CredentialKey = tuple[SecretManager, str]
+
+
+class CredentialCacheSettings(BaseModel):
+    """Lifetime settings for cached credentials."""
+
+    ttl_seconds: float = 900.0  # How long 1Password secrets are reused
+    lease_seconds: float = 3600.0  # Length of a pybritive lease, counted from the checkout
+    expiry_margin_seconds: float = 60.0  # Refresh leases this long before they expire
+
+
+class CredentialInfo(BaseModel):
+    """Status of a single cached credential (the secret itself is never exposed)."""
+
+    secret_manager: SecretManager
+    secret_reference: str
+    fetched_at: float
+    expires_at: float
+
+
+class CredentialCacheResponse(BaseModel):
+    settings: CredentialCacheSettings
+    credentials: list[CredentialInfo]
+    hits: int
+    misses: int
+    evictions: int
+
+
+@dataclass
+class _CachedCredential:
+    value: Any
+    fetched_at: float
+    expires_at: float
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CredentialCache:
+    """Cache of resolved secrets with TTL/lease expiry and single-flight refresh."""
+
+    def __init__(self, settings: CredentialCacheSettings | None = None) -> None:
+        self.settings = settings or CredentialCacheSettings()
+        self._entries: dict[CredentialKey, _CachedCredential] = {}
+        self._in_flight: dict[CredentialKey, Future[Any]] = {}
+        self._stats = _Stats()
+        # Credentials are resolved from threadpool workers, each running its own event loop
+        self._lock = Lock()
+
+    async def get(
+        self, key: CredentialKey, fetch: Callable[[], Awaitable[Any]], expires_at: Callable[[], float] | None = None
+    ) -> Any:  # noqa: ANN401
+        """
+        Get a credential, fetching it if it is missing or expired.
+
+        Only one fetch per key runs at a time; concurrent callers (from any thread
+        or event loop) wait for its result.
+
+        Args:
+            key: (secret_manager, secret_reference)
+            fetch: Coroutine factory that resolves the credential
+            expires_at: Computes the expiry time once the value is fetched (defaults to now + TTL)
+
+        Returns:
+            The cached or freshly fetched credential
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.time():
+                self._stats.hits += 1
+                return entry.value
+
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if pending is None:
+                pending = Future[Any]()
+                self._in_flight[key] = pending
+                self._stats.misses += 1
+
+        if not owner:
+            logger.debug("Waiting for in-flight credential fetch", secret_reference=key[1])
+            return await asyncio.wrap_future(pending)
+
+        try:
+            value = await fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+
+        now = time.time()
+        expiry = expires_at() if expires_at else now + self.settings.ttl_seconds
+        with self._lock:
+            self._entries[key] = _CachedCredential(value=value, fetched_at=now, expires_at=expiry)
+            del self._in_flight[key]
+        pending.set_result(value)
+        logger.info("Cached credential", secret_manager=key[0], secret_reference=key[1], expires_at=expiry)
+        return value
+
+    def lease_expiry(self) -> float:
+        """Expiry time for a pybritive checkout made now, leaving a safety margin before the lease ends."""
+        return time.time() + self.settings.lease_seconds - self.settings.expiry_margin_seconds
+
+    def evict(self, keys: list[CredentialKey]) -> int:
+        """
+        Evict credentials, e.g. because the database rejected them.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            self._stats.evictions += removed
+        if removed:
+            logger.info("Evicted cached credentials", secret_references=[key[1] for key in keys])
+        return removed
+
+    def clear(self) -> None:
+        """Drop every cached credential."""
+        with self._lock:
+            self._stats.evictions += len(self._entries)
+            self._entries.clear()
+
+    def configure(self, settings: CredentialCacheSettings) -> None:
+        """Apply new lifetime settings. Already cached entries keep their expiry."""
+        with self._lock:
+            self.settings = settings
+
+    def describe(self) -> CredentialCacheResponse:
+        """Describe cached credentials and hit/miss counters."""
+        with self._lock:
+            credentials = [
+                CredentialInfo(
+                    secret_manager=manager,
+                    secret_reference=reference,
+                    fetched_at=entry.fetched_at,
+                    expires_at=entry.expires_at,
+                )
+                for (manager, reference), entry in self._entries.items()
+            ]
+            return CredentialCacheResponse(
+                settings=self.settings,
+                credentials=credentials,
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+            )
+
+
+class CachingOnePasswordTool(OnePasswordTool):
+    """1Password tool that serves secrets from the credential cache."""
+
+    def __init__(self, inner: OnePasswordTool, cache: CredentialCache, used_keys: list[CredentialKey]) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._used_keys = used_keys
+
+    async def read_secret(self, reference: str) -> str:
+        """Read a secret, reusing a cached value if it has not expired."""
+        key = (SecretManager.ONEPASSWORD, reference)
+        self._used_keys.append(key)
+        return await self._cache.get(key, lambda: self._inner.read_secret(reference))
+
+
+class CachingPybritiveTool(PybritiveTool):
+    """Pybritive tool that reuses checkouts until their lease expires."""
+
+    def __init__(self, inner: PybritiveTool, cache: CredentialCache, used_keys: list[CredentialKey]) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._used_keys = used_keys
+
+    async def checkout(
+        self, resource_path: str, pattern: str | None = None, database_name: str | None = None
+    ) -> BritiveInfo:
+        """Checkout temporary credentials, reusing an unexpired lease."""
+        # One checkout can describe several databases, each parsed (per pattern) into different connection details
+        reference = f"{resource_path}#{database_name}" if database_name else resource_path
+        if pattern:
+            reference = f"{reference}?pattern={pattern}"
+        key = (SecretManager.PYBRITIVE, reference)
+        self._used_keys.append(key)
+        return await self._cache.get(
+            key,
+            lambda: self._inner.checkout(resource_path, pattern=pattern, database_name=database_name),
+            expires_at=self._cache.lease_expiry,
+        )
+
+
+def is_auth_error(error: BaseException) -> bool:
+    """Check whether a database error means the credentials were rejected."""
+    if isinstance(error, DBAPIError):
+        args = getattr(error.orig, "args", ())
+        return bool(args) and args[0] in _AUTH_ERROR_CODES
+    return False
+
+
+# Global credential cache instance
+credential_cache = CredentialCache()
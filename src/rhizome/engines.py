@@ -0,0 +1,186 @@
+"""
+Pooled SQLAlchemy engines for server-side query execution.
+
+The rhizome server keeps one long-lived engine per database_id so that repeated
+queries reuse pooled connections through the port-forward instead of paying a
+fresh TCP + MySQL handshake for every request. Engines are async (aiomysql), so
+queries run on the server's event loop and a slow database does not tie up a
+worker thread that queries to other databases need.
+
+Engines are replaced whenever the connection details for a database change
+(e.g. rotated credentials or a re-established port-forward on a new local port),
+and can be dropped explicitly when the underlying tunnel is known to be dead.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+logger = structlog.get_logger()
+
+# MySQL client error codes which indicate the connection itself is unusable
+# (CR_CONN_HOST_ERROR, CR_SERVER_GONE_ERROR, CR_SERVER_LOST)
+_CONNECTION_ERROR_CODES = {2003, 2006, 2013}
+
+
+class PoolSettings(BaseModel):
+    """Connection pool settings applied to every engine in the registry."""
+
+    pool_size: int = 5  # Connections kept open per database
+    max_overflow: int = 10  # Extra connections allowed under burst load
+    pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    pool_recycle: int = 1800  # Idle timeout: recycle connections older than this (seconds)
+    pool_pre_ping: bool = True  # Test connections on checkout, replacing stale ones
+
+
+class EngineInfo(BaseModel):
+    """Status of a single pooled engine."""
+
+    database_id: str
+    created_at: float
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+
+
+class EngineListResponse(BaseModel):
+    settings: PoolSettings
+    engines: list[EngineInfo]
+    count: int
+
+
+@dataclass
+class _RegisteredEngine:
+    engine: AsyncEngine
+    connection_string: str
+    created_at: float
+
+
+class EngineRegistry:
+    """Registry of long-lived, pooled engines keyed by database_id."""
+
+    def __init__(self, settings: PoolSettings | None = None) -> None:
+        self._settings = settings or PoolSettings()
+        self._engines: dict[str, _RegisteredEngine] = {}
+        # Sync endpoints run in a threadpool, so registry access must be thread-safe.
+        # The lock is never held across an await.
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self) -> PoolSettings:
+        """Pool settings used for newly created engines."""
+        return self._settings
+
+    async def get_engine(self, database_id: str, connection_string: str) -> AsyncEngine:
+        """
+        Get the pooled engine for a database, creating it if needed.
+
+        If the connection string differs from the one the existing engine was built
+        with (credentials rotated, port-forward moved to a new port), the old engine
+        is disposed and replaced.
+        """
+        stale: AsyncEngine | None = None
+        with self._lock:
+            entry = self._engines.get(database_id)
+            if entry is not None and entry.connection_string == connection_string:
+                return entry.engine
+
+            if entry is not None:
+                logger.info("Connection details changed, replacing engine", database_id=database_id)
+                stale = entry.engine
+
+            engine = create_async_engine(
+                connection_string,
+                pool_size=self._settings.pool_size,
+                max_overflow=self._settings.max_overflow,
+                pool_timeout=self._settings.pool_timeout,
+                pool_recycle=self._settings.pool_recycle,
+                pool_pre_ping=self._settings.pool_pre_ping,
+            )
+            self._engines[database_id] = _RegisteredEngine(
+                engine=engine, connection_string=connection_string, created_at=time.time()
+            )
+            logger.info("Created pooled engine", database_id=database_id, pool_size=self._settings.pool_size)
+
+        if stale is not None:
+            await stale.dispose()
+        return engine
+
+    async def invalidate(self, database_id: str) -> bool:
+        """
+        Drop the engine for a database, closing its pooled connections.
+
+        Returns:
+            True if an engine was registered for the database
+        """
+        with self._lock:
+            entry = self._engines.pop(database_id, None)
+
+        if entry is None:
+            return False
+
+        await entry.engine.dispose()
+        logger.info("Invalidated pooled engine", database_id=database_id)
+        return True
+
+    async def configure(self, settings: PoolSettings) -> None:
+        """
+        Apply new pool settings.
+
+        Existing engines are disposed so that they get rebuilt with the new
+        settings on their next use.
+        """
+        with self._lock:
+            self._settings = settings
+            entries = list(self._engines.values())
+            self._engines.clear()
+
+        for entry in entries:
+            await entry.engine.dispose()
+        logger.info("Updated pool settings", **settings.model_dump())
+
+    async def dispose_all(self) -> None:
+        """Dispose every engine (used at server shutdown)."""
+        with self._lock:
+            entries = list(self._engines.values())
+            self._engines.clear()
+
+        for entry in entries:
+            await entry.engine.dispose()
+
+    def list_engines(self) -> EngineListResponse:
+        """Describe all registered engines and their pool usage."""
+        with self._lock:
+            items = list(self._engines.items())
+
+        engines: list[EngineInfo] = []
+        for database_id, entry in items:
+            info = EngineInfo(database_id=database_id, created_at=entry.created_at)
+            pool = entry.engine.pool
+            if isinstance(pool, QueuePool):
+                info.checked_in = pool.checkedin()
+                info.checked_out = pool.checkedout()
+                info.overflow = pool.overflow()
+            engines.append(info)
+
+        return EngineListResponse(settings=self._settings, engines=engines, count=len(engines))
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Check whether a database error means the connection (or tunnel) is unusable."""
+    if isinstance(error, DBAPIError):
+        if error.connection_invalidated:
+            return True
+        args = getattr(error.orig, "args", ())
+        return bool(args) and args[0] in _CONNECTION_ERROR_CODES
+    return False
+
+
+# Global engine registry instance
+engine_registry = EngineRegistry()
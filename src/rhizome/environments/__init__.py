@@ -1,10 +1,15 @@
 """Rhizome environments package."""
 
-from rhizome.environments.demo import DemoBillingBookkeeper, DemoBillingEvent
-from rhizome.environments.dev import DevBillingBookkeeper, DevBillingEvent
-from rhizome.environments.na_prod.billing import NorthAmericaBilling
-from rhizome.environments.na_prod.billing_bookkeeper import NorthAmericaBillingBookkeeper
-from rhizome.environments.na_prod.billing_event import NorthAmericaBillingEvent
+from typing import TYPE_CHECKING
+
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from rhizome.environments.demo import DemoBillingBookkeeper, DemoBillingEvent
+    from rhizome.environments.dev import DevBillingBookkeeper, DevBillingEvent
+    from rhizome.environments.na_prod.billing import NorthAmericaBilling
+    from rhizome.environments.na_prod.billing_bookkeeper import NorthAmericaBillingBookkeeper
+    from rhizome.environments.na_prod.billing_event import NorthAmericaBillingEvent
 
 __all__ = [
     "NorthAmericaBilling",
@@ -15,3 +20,17 @@ __all__ = [
     "DemoBillingBookkeeper",
     "DemoBillingEvent",
 ]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "NorthAmericaBilling": "rhizome.environments.na_prod.billing",
+        "NorthAmericaBillingBookkeeper": "rhizome.environments.na_prod.billing_bookkeeper",
+        "NorthAmericaBillingEvent": "rhizome.environments.na_prod.billing_event",
+        "DemoBillingBookkeeper": "rhizome.environments.demo",
+        "DemoBillingEvent": "rhizome.environments.demo",
+        "DevBillingBookkeeper": "rhizome.environments.dev",
+        "DevBillingEvent": "rhizome.environments.dev",
+    },
+)
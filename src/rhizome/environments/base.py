@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
+import decimal
 import socket
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum, auto
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from urllib.parse import quote_plus
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from sqlalchemy import ColumnElement
     from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
     from rhizome.models.base import Emplacement, RhizomeModel
@@ -85,6 +91,18 @@ class EnvironmentClient(Protocol):
         """Execute a query and return exactly one result."""
         ...
 
+    def select_iter(
+        self, database_id: str, query: SelectOfScalar[TAll], sanitize: bool = True, batch_size: int = 1000
+    ) -> Iterator[TAll]:
+        """Execute a query and yield results as they are streamed in batches."""
+        ...
+
+    def select_keyset_page(
+        self, database_id: str, query: SelectOfScalar[TAll], keyset_columns: list[str], sanitize: bool = True
+    ) -> tuple[list[TAll], list[Any] | None]:
+        """Execute one page of a keyset-paginated query, returning the rows and the last row's key."""
+        ...
+
 
 class SecretManager(StrEnum):
     """Enum for credential management systems."""
@@ -121,6 +139,62 @@ class DatabaseConfigWithRW:
     rw_password: str
 
 
+@dataclass
+class ExportCheckpoint:
+    """
+    Position of a keyset-paginated export.
+
+    Pass it back to `Environment.export` to resume after the last exported row.
+    All values are JSON-compatible, so a checkpoint can be persisted between runs.
+    """
+
+    key_columns: list[str]  # Primary key column names, in pagination order
+    last_key: list[Any]  # Primary key of the last exported row
+    rows_exported: int = 0
+
+
+# Primary key types that keyset pagination supports. Checkpoints and query parameters carry
+# keys as JSON, and these types compare correctly in their JSON form (dates and Decimals as
+# strings); binary keys would come back as text and compare wrongly in `WHERE pk > :last`.
+_KEYSET_TYPES = (int, float, decimal.Decimal, str, datetime.date, datetime.time)
+
+
+def _check_keyset_columns(model: type[RhizomeModel], key_columns: list[Any]) -> None:
+    """
+    Check that a model's primary key can be paginated by.
+
+    Raises:
+        ValueError: If the model has no primary key, or a key column's type can't be used as a cursor
+    """
+    if not key_columns:
+        raise ValueError(f"{model.__name__} has no primary key to paginate by")
+    import sqlalchemy
+
+    for column in key_columns:
+        # Custom types (e.g. SQLModel's AutoString) don't know their Python type; what they wrap does
+        column_type = column.type
+        if isinstance(column_type, sqlalchemy.TypeDecorator):
+            column_type = column_type.impl_instance
+        try:
+            python_type = column_type.python_type
+        except NotImplementedError:
+            python_type = None
+        if python_type is None or not issubclass(python_type, _KEYSET_TYPES):
+            type_name = python_type.__name__ if python_type else str(column.type)
+            raise ValueError(
+                f"Cannot export {model.__name__} by primary key: column {column.name} is {type_name}, "
+                "which doesn't survive a JSON checkpoint"
+            )
+
+
+@dataclass
+class ExportBatch[T: RhizomeModel]:
+    """A batch of exported rows, and the checkpoint to resume after it."""
+
+    rows: list[T]
+    checkpoint: ExportCheckpoint
+
+
 @dataclass
 class PortForwardConfig:
     """Port forwarding configuration for Kubernetes environments."""
@@ -147,10 +221,38 @@ class PortForwardConfig:
     remote_port: int = 3306  # Port on the remote pod/service
 
 
+class TableSituation(Mapping[StrEnum, tuple["type[RhizomeModel] | None", "type[Emplacement[Any]] | None"]]):
+    """
+    An environment's tables → (model class, emplacement class).
+
+    Each table is situated on first lookup, so that only the models and emplacements in use get imported.
+    """
+
+    def __init__(self, environment: Environment) -> None:
+        self._environment = environment
+        self._tables = environment.tables()
+        self._situated: dict[StrEnum, tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]] = {}
+
+    def __getitem__(self, table: StrEnum) -> tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]:
+        situation = self._situated.get(table)
+        if situation is None:
+            if table not in self._tables:
+                raise KeyError(table)
+            situation = self._environment.situate_table(table)
+            self._situated[table] = situation
+        return situation
+
+    def __iter__(self) -> Iterator[StrEnum]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+
 class Environment(ABC):
     """Abstract base class for rhizome environments."""
 
-    table_situation: dict[StrEnum, tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]]
+    table_situation: Mapping[StrEnum, tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]]
 
     # Class-level set to track logged connections (shared across all environments)
     _logged_connections: set[tuple[str, int, str, str]] = set()
@@ -221,7 +323,7 @@ class Environment(ABC):
     def __init__(self, client: EnvironmentClient) -> None:
         """Initialize environment."""
         self.client = client
-        self.table_situation = {table: self.situate_table(table) for table in self.tables()}
+        self.table_situation = TableSituation(self)
 
     def get_versioned(self, model_class: type[TModel]) -> type[TModel]:
         """
@@ -487,6 +589,95 @@ class Environment(ABC):
         """
         return self.client.select_all(self.database_id(), query, sanitize=sanitize)
 
+    def select_iter(self, query: SelectOfScalar[TAll], sanitize: bool = True, batch_size: int = 1000) -> Iterator[TAll]:
+        """Execute a query and yield results as they are streamed from the server.
+
+        Unlike select_all, results are never held in memory all at once, which makes this
+        suitable for large tables.
+
+        Args:
+            query: SQLModel query to execute
+            sanitize: If True, yield sanitized results. If False, yield raw results. Default: True
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Model instances (sanitized or raw)
+        """
+        return self.client.select_iter(self.database_id(), query, sanitize=sanitize, batch_size=batch_size)
+
+    def export(
+        self,
+        model: type[TModel],
+        where: ColumnElement[bool] | None = None,
+        batch_size: int = 1000,
+        checkpoint: ExportCheckpoint | None = None,
+        sanitize: bool = True,
+    ) -> Generator[ExportBatch[TModel], None, None]:
+        """Export a table (or a filtered part of it) in batches, paginating by primary key.
+
+        Each page is fetched with `WHERE pk > :last_key ORDER BY pk LIMIT :batch_size`
+        (row-value comparison for composite keys), so every page costs the same no matter
+        how deep into the table it is, unlike LIMIT/OFFSET.
+
+        Args:
+            model: Model class of the table to export
+            where: Optional filter, e.g. `Model.created_time >= start`
+            batch_size: Rows per batch
+            checkpoint: Resume after the position recorded in this checkpoint
+            sanitize: If True, yield sanitized results. If False, yield raw results. Default: True
+
+        Yields:
+            Batches of rows, each with the checkpoint to resume after it
+
+        Raises:
+            ValueError: If the primary key has a type that can't be paginated by (e.g. binary),
+                or the checkpoint was taken with a different primary key
+        """
+        import sqlalchemy
+        from sqlmodel import select
+
+        key_columns: list[ColumnElement[Any]] = list(sqlalchemy.inspect(model).primary_key)
+        _check_keyset_columns(model, key_columns)
+        key_names = [column.name for column in key_columns]
+
+        if checkpoint is None:
+            last_key: list[Any] | None = None
+            rows_exported = 0
+        else:
+            if checkpoint.key_columns != key_names:
+                raise ValueError(
+                    f"Checkpoint is for key {checkpoint.key_columns}, but {model.__name__} has {key_names}"
+                )
+            last_key = checkpoint.last_key
+            rows_exported = checkpoint.rows_exported
+
+        while True:
+            query = select(model)
+            if where is not None:
+                query = query.where(where)
+            if last_key is not None:
+                if len(key_columns) == 1:
+                    query = query.where(key_columns[0] > last_key[0])
+                else:
+                    query = query.where(sqlalchemy.tuple_(*key_columns) > sqlalchemy.tuple_(*last_key))
+            query = query.order_by(*key_columns).limit(batch_size)
+
+            rows, page_last_key = self.client.select_keyset_page(
+                self.database_id(), query, keyset_columns=key_names, sanitize=sanitize
+            )
+            if not rows or page_last_key is None:
+                return
+
+            last_key = page_last_key
+            rows_exported += len(rows)
+            yield ExportBatch(
+                rows=rows,
+                checkpoint=ExportCheckpoint(key_columns=key_names, last_key=last_key, rows_exported=rows_exported),
+            )
+
+            if len(rows) < batch_size:
+                return
+
     def select_one(self, query: SelectOfScalar[TOne], sanitize: bool = True) -> TOne:
         """Execute a query and return exactly one result.
 
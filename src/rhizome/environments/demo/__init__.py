@@ -1,8 +1,24 @@
 """Demo environment modules."""
 
-from .billing import DemoBilling
-from .billing_bookkeeper import DemoBillingBookkeeper
-from .billing_event import DemoBillingEvent
-from .meta import DemoMeta
+from typing import TYPE_CHECKING
+
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .billing import DemoBilling
+    from .billing_bookkeeper import DemoBillingBookkeeper
+    from .billing_event import DemoBillingEvent
+    from .meta import DemoMeta
 
 __all__ = ["DemoBilling", "DemoBillingBookkeeper", "DemoBillingEvent", "DemoMeta"]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DemoBilling": ".billing",
+        "DemoBillingBookkeeper": ".billing_bookkeeper",
+        "DemoBillingEvent": ".billing_event",
+        "DemoMeta": ".meta",
+    },
+)
@@ -8,492 +8,855 @@ demo cluster through CloudSQL proxy port-forwarding.
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rhizome.environments.base import DatabaseConfig, Environment, PortForwardConfig, SecretManager, Tools
-from rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action import AdjustActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action_fee_code import AdjustActionFeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action_type import AdjustActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_reason import AdjustReasonDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action import AppMeterActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_error import AppMeterActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_fee_code import (
-    AppMeterActionFeeCodeDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_type import AppMeterActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action import AppSubActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_error import AppSubActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_fee_code import AppSubActionFeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_type import AppSubActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_advice import AutoAdjustAdviceDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_qualifier import AutoAdjustQualifierDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_rule import AutoAdjustRuleDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_archetype import BillingArchetypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_entity import BillingEntityDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_entity_config import BillingEntityConfigDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_event_history import BillingEventHistoryDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy import BillingHierarchyDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy_cycle import BillingHierarchyCycleDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy_type import BillingHierarchyTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_pseudo_entity import BillingPseudoEntityDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_billing_schedule import BillingScheduleDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action import CellularActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_error import CellularActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_fee_code import (
-    CellularActionFeeCodeDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_type import CellularActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_consumer_failure import ConsumerFailureDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_consumer_failure_history import (
-    ConsumerFailureHistoryDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cycle_validation import CycleValidationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_cycle_validation_mutation import (
-    CycleValidationMutationDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_deserializable_failure import DeserializableFailureDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_category import FeeCategoryDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code import FeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code_app import FeeCodeAppDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code_ledger_account import FeeCodeLedgerAccountDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_ctd import FeeCtdDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate import FeeRateDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate_error_report import FeeRateErrorReportDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate_report_action_error import (
-    FeeRateReportActionErrorDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_summary import FeeSummaryDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_summary_mutation import FeeSummaryMutationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_tax import FeeTaxDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_tax_mutation import FeeTaxMutationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_fee_ytd import FeeYtdDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_flyway_schema_history import FlywaySchemaHistoryDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_alliance_code import InvoiceAllianceCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info import InvoiceInfoDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_amount import InvoiceInfoAmountDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_mutation import InvoiceInfoMutationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_settlement import InvoiceInfoSettlementDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_settlement_mutation import (
-    InvoiceInfoSettlementMutationDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_job_assassination_contract import (
-    JobAssassinationContractDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_backgroundjobservers import (
-    JobrunrBackgroundjobserversDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_jobs import JobrunrJobsDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_metadata import JobrunrMetadataDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_migrations import JobrunrMigrationsDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_recurring_jobs import JobrunrRecurringJobsDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account import LedgerAccountDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_action import LedgerAccountActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_balance import LedgerAccountBalanceDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key import LedgerAccountKeyDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key_app import LedgerAccountKeyAppDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key_purpose import (
-    LedgerAccountKeyPurposeDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_purpose import LedgerAccountPurposeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_settlement import (
-    LedgerAccountSettlementDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_transition import (
-    LedgerAccountTransitionDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_journal import LedgerJournalDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_journal_mutation import LedgerJournalMutationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_lexi_attribute import LexiAttributeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_lexi_rule import LexiRuleDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_look import LookDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_look_data import LookDataDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_merchant_detail import MerchantDetailDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action import MiscActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_error import MiscActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_fee_code import MiscActionFeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_type import MiscActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_misc_specifier import MiscSpecifierDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_model_fee_summary import ModelFeeSummaryDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_adjustment import MonetaryAdjustmentDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_adjustment_mutation import (
-    MonetaryAdjustmentMutationDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_alias import MonetaryRuleAliasDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_set import MonetaryRuleSetDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_set_rule import MonetaryRuleSetRuleDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_partner_config import PartnerConfigDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action import PlanActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_error import PlanActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_fee_code import PlanActionFeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_type import PlanActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_processing_group_dates import ProcessingGroupDatesDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_processing_note import ProcessingNoteDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_processing_note_mutation import (
-    ProcessingNoteMutationDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_prototype_fee_rate import PrototypeFeeRateDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_prototype_fee_set import PrototypeFeeSetDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action import RevenueActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_error import RevenueActionErrorDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_fee_code import RevenueActionFeeCodeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_type import RevenueActionTypeDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_share_group import RevenueShareGroupDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_server_config import ServerConfigDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_settlement import SettlementDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_settlement_action import SettlementActionDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_settlement_mutation import SettlementMutationDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_skip_fee_category_lexi_tag import (
-    SkipFeeCategoryLexiTagDemo,
-)
-from rhizome.environments.demo.expected_data.billing_bookkeeper_tier_detail import TierDetailDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_pricing import TieredPricingDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_qualifier import TieredQualifierDemo
-from rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_rule import TieredRuleDemo
+from rhizome.lazy import LazyMapping, lazy_class
 from rhizome.models.base import Emplacement, RhizomeModel
-from rhizome.models.billing_bookkeeper.adjust_action_fee_code_v1 import AdjustActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.adjust_action_type_v1 import AdjustActionTypeV1
-from rhizome.models.billing_bookkeeper.adjust_action_v1 import AdjustActionV1
-from rhizome.models.billing_bookkeeper.adjust_reason_v1 import AdjustReasonV1
-from rhizome.models.billing_bookkeeper.app_meter_action_error_v1 import AppMeterActionErrorV1
-from rhizome.models.billing_bookkeeper.app_meter_action_fee_code_v1 import AppMeterActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.app_meter_action_type_v1 import AppMeterActionTypeV1
-from rhizome.models.billing_bookkeeper.app_meter_action_v1 import AppMeterActionV1
-from rhizome.models.billing_bookkeeper.app_sub_action_error_v1 import AppSubActionErrorV1
-from rhizome.models.billing_bookkeeper.app_sub_action_fee_code_v1 import AppSubActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.app_sub_action_type_v1 import AppSubActionTypeV1
-from rhizome.models.billing_bookkeeper.app_sub_action_v1 import AppSubActionV1
-from rhizome.models.billing_bookkeeper.auto_adjust_advice_v1 import AutoAdjustAdviceV1
-from rhizome.models.billing_bookkeeper.auto_adjust_qualifier_v1 import AutoAdjustQualifierV1
-from rhizome.models.billing_bookkeeper.auto_adjust_rule_v1 import AutoAdjustRuleV1
-from rhizome.models.billing_bookkeeper.billing_archetype_v1 import BillingArchetypeV1
-from rhizome.models.billing_bookkeeper.billing_entity_config_v1 import BillingEntityConfigV1
-from rhizome.models.billing_bookkeeper.billing_entity_v1 import BillingEntityV1
-from rhizome.models.billing_bookkeeper.billing_event_history_v1 import BillingEventHistoryV1
-from rhizome.models.billing_bookkeeper.billing_hierarchy_cycle_v1 import BillingHierarchyCycleV1
-from rhizome.models.billing_bookkeeper.billing_hierarchy_type_v1 import BillingHierarchyTypeV1
-from rhizome.models.billing_bookkeeper.billing_hierarchy_v1 import BillingHierarchyV1
-from rhizome.models.billing_bookkeeper.billing_pseudo_entity_v1 import BillingPseudoEntityV1
-from rhizome.models.billing_bookkeeper.billing_schedule_v1 import BillingScheduleV1
-from rhizome.models.billing_bookkeeper.cellular_action_error_v1 import CellularActionErrorV1
-from rhizome.models.billing_bookkeeper.cellular_action_fee_code_v1 import CellularActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.cellular_action_type_v1 import CellularActionTypeV1
-from rhizome.models.billing_bookkeeper.cellular_action_v1 import CellularActionV1
-from rhizome.models.billing_bookkeeper.consumer_failure_history_v1 import ConsumerFailureHistoryV1
-from rhizome.models.billing_bookkeeper.consumer_failure_v1 import ConsumerFailureV1
-from rhizome.models.billing_bookkeeper.cycle_validation_mutation_v1 import CycleValidationMutationV1
-from rhizome.models.billing_bookkeeper.cycle_validation_v1 import CycleValidationV1
-from rhizome.models.billing_bookkeeper.deserializable_failure_v1 import DeserializableFailureV1
-from rhizome.models.billing_bookkeeper.fee_category_v1 import FeeCategoryV1
-from rhizome.models.billing_bookkeeper.fee_code_app_v1 import FeeCodeAppV1
-from rhizome.models.billing_bookkeeper.fee_code_ledger_account_v1 import FeeCodeLedgerAccountV1
-from rhizome.models.billing_bookkeeper.fee_code_v1 import FeeCodeV1
-from rhizome.models.billing_bookkeeper.fee_ctd_v1 import FeeCtdV1
-from rhizome.models.billing_bookkeeper.fee_rate_error_report_v1 import FeeRateErrorReportV1
-from rhizome.models.billing_bookkeeper.fee_rate_report_action_error_v1 import FeeRateReportActionErrorV1
-from rhizome.models.billing_bookkeeper.fee_rate_v1 import FeeRateV1
-from rhizome.models.billing_bookkeeper.fee_summary_mutation_v1 import FeeSummaryMutationV1
-from rhizome.models.billing_bookkeeper.fee_summary_v1 import FeeSummaryV1
-from rhizome.models.billing_bookkeeper.fee_tax_mutation_v1 import FeeTaxMutationV1
-from rhizome.models.billing_bookkeeper.fee_tax_v1 import FeeTaxV1
-from rhizome.models.billing_bookkeeper.fee_ytd_v1 import FeeYtdV1
-from rhizome.models.billing_bookkeeper.flyway_schema_history_v1 import FlywaySchemaHistoryV1
-from rhizome.models.billing_bookkeeper.invoice_alliance_code_v1 import InvoiceAllianceCodeV1
-from rhizome.models.billing_bookkeeper.invoice_info_amount_v1 import InvoiceInfoAmountV1
-from rhizome.models.billing_bookkeeper.invoice_info_mutation_v1 import InvoiceInfoMutationV1
-from rhizome.models.billing_bookkeeper.invoice_info_settlement_mutation_v1 import InvoiceInfoSettlementMutationV1
-from rhizome.models.billing_bookkeeper.invoice_info_settlement_v1 import InvoiceInfoSettlementV1
-from rhizome.models.billing_bookkeeper.invoice_info_v1 import InvoiceInfoV1
-from rhizome.models.billing_bookkeeper.job_assassination_contract_v1 import JobAssassinationContractV1
-from rhizome.models.billing_bookkeeper.jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
-from rhizome.models.billing_bookkeeper.jobrunr_jobs_v1 import JobrunrJobsV1
-from rhizome.models.billing_bookkeeper.jobrunr_metadata_v1 import JobrunrMetadataV1
-from rhizome.models.billing_bookkeeper.jobrunr_migrations_v1 import JobrunrMigrationsV1
-from rhizome.models.billing_bookkeeper.jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
-from rhizome.models.billing_bookkeeper.ledger_account_action_v1 import LedgerAccountActionV1
-from rhizome.models.billing_bookkeeper.ledger_account_balance_v1 import LedgerAccountBalanceV1
-from rhizome.models.billing_bookkeeper.ledger_account_key_app_v1 import LedgerAccountKeyAppV1
-from rhizome.models.billing_bookkeeper.ledger_account_key_purpose_v1 import LedgerAccountKeyPurposeV1
-from rhizome.models.billing_bookkeeper.ledger_account_key_v1 import LedgerAccountKeyV1
-from rhizome.models.billing_bookkeeper.ledger_account_purpose_v1 import LedgerAccountPurposeV1
-from rhizome.models.billing_bookkeeper.ledger_account_settlement_v1 import LedgerAccountSettlementV1
-from rhizome.models.billing_bookkeeper.ledger_account_transition_v1 import LedgerAccountTransitionV1
-from rhizome.models.billing_bookkeeper.ledger_account_v1 import LedgerAccountV1
-from rhizome.models.billing_bookkeeper.ledger_journal_mutation_v1 import LedgerJournalMutationV1
-from rhizome.models.billing_bookkeeper.ledger_journal_v1 import LedgerJournalV1
-from rhizome.models.billing_bookkeeper.lexi_attribute_v1 import LexiAttributeV1
-from rhizome.models.billing_bookkeeper.lexi_rule_v1 import LexiRuleV1
-from rhizome.models.billing_bookkeeper.look_data_v1 import LookDataV1
-from rhizome.models.billing_bookkeeper.look_v1 import LookV1
-from rhizome.models.billing_bookkeeper.merchant_detail_v1 import MerchantDetailV1
-from rhizome.models.billing_bookkeeper.misc_action_error_v1 import MiscActionErrorV1
-from rhizome.models.billing_bookkeeper.misc_action_fee_code_v1 import MiscActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.misc_action_type_v1 import MiscActionTypeV1
-from rhizome.models.billing_bookkeeper.misc_action_v1 import MiscActionV1
-from rhizome.models.billing_bookkeeper.misc_specifier_v1 import MiscSpecifierV1
-from rhizome.models.billing_bookkeeper.model_fee_summary_v1 import ModelFeeSummaryV1
-from rhizome.models.billing_bookkeeper.monetary_adjustment_mutation_v1 import MonetaryAdjustmentMutationV1
-from rhizome.models.billing_bookkeeper.monetary_adjustment_v1 import MonetaryAdjustmentV1
-from rhizome.models.billing_bookkeeper.monetary_rule_alias_v1 import MonetaryRuleAliasV1
-from rhizome.models.billing_bookkeeper.monetary_rule_set_rule_v1 import MonetaryRuleSetRuleV1
-from rhizome.models.billing_bookkeeper.monetary_rule_set_v1 import MonetaryRuleSetV1
-from rhizome.models.billing_bookkeeper.partner_config_v1 import PartnerConfigV1
-from rhizome.models.billing_bookkeeper.plan_action_error_v1 import PlanActionErrorV1
-from rhizome.models.billing_bookkeeper.plan_action_fee_code_v1 import PlanActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.plan_action_type_v1 import PlanActionTypeV1
-from rhizome.models.billing_bookkeeper.plan_action_v1 import PlanActionV1
-from rhizome.models.billing_bookkeeper.processing_group_dates_v1 import ProcessingGroupDatesV1
-from rhizome.models.billing_bookkeeper.processing_note_mutation_v1 import ProcessingNoteMutationV1
-from rhizome.models.billing_bookkeeper.processing_note_v1 import ProcessingNoteV1
-from rhizome.models.billing_bookkeeper.prototype_fee_rate_v1 import PrototypeFeeRateV1
-from rhizome.models.billing_bookkeeper.prototype_fee_set_v1 import PrototypeFeeSetV1
-from rhizome.models.billing_bookkeeper.revenue_action_error_v1 import RevenueActionErrorV1
-from rhizome.models.billing_bookkeeper.revenue_action_fee_code_v1 import RevenueActionFeeCodeV1
-from rhizome.models.billing_bookkeeper.revenue_action_type_v1 import RevenueActionTypeV1
-from rhizome.models.billing_bookkeeper.revenue_action_v1 import RevenueActionV1
-from rhizome.models.billing_bookkeeper.revenue_share_group_v1 import RevenueShareGroupV1
-from rhizome.models.billing_bookkeeper.server_config_v1 import ServerConfigV1
-from rhizome.models.billing_bookkeeper.settlement_action_v1 import SettlementActionV1
-from rhizome.models.billing_bookkeeper.settlement_mutation_v1 import SettlementMutationV1
-from rhizome.models.billing_bookkeeper.settlement_v1 import SettlementV1
-from rhizome.models.billing_bookkeeper.skip_fee_category_lexi_tag_v1 import SkipFeeCategoryLexiTagV1
-from rhizome.models.billing_bookkeeper.tier_detail_v1 import TierDetailV1
-from rhizome.models.billing_bookkeeper.tiered_pricing_v1 import TieredPricingV1
-from rhizome.models.billing_bookkeeper.tiered_qualifier_v1 import TieredQualifierV1
-from rhizome.models.billing_bookkeeper.tiered_rule_v1 import TieredRuleV1
 from rhizome.models.table_list import BillingBookkeeperTable
 
-models: dict[BillingBookkeeperTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = {
-    BillingBookkeeperTable.adjust_action: (AdjustActionV1, AdjustActionDemo),
-    BillingBookkeeperTable.adjust_action_fee_code: (AdjustActionFeeCodeV1, AdjustActionFeeCodeDemo),
-    BillingBookkeeperTable.adjust_action_type: (AdjustActionTypeV1, AdjustActionTypeDemo),
-    BillingBookkeeperTable.adjust_reason: (AdjustReasonV1, AdjustReasonDemo),
-    BillingBookkeeperTable.app_meter_action: (AppMeterActionV1, AppMeterActionDemo),
-    BillingBookkeeperTable.app_meter_action_error: (AppMeterActionErrorV1, AppMeterActionErrorDemo),
-    BillingBookkeeperTable.app_meter_action_fee_code: (AppMeterActionFeeCodeV1, AppMeterActionFeeCodeDemo),
-    BillingBookkeeperTable.app_meter_action_type: (AppMeterActionTypeV1, AppMeterActionTypeDemo),
-    BillingBookkeeperTable.app_sub_action: (AppSubActionV1, AppSubActionDemo),
-    BillingBookkeeperTable.app_sub_action_error: (AppSubActionErrorV1, AppSubActionErrorDemo),
-    BillingBookkeeperTable.app_sub_action_fee_code: (AppSubActionFeeCodeV1, AppSubActionFeeCodeDemo),
-    BillingBookkeeperTable.app_sub_action_type: (AppSubActionTypeV1, AppSubActionTypeDemo),
-    BillingBookkeeperTable.auto_adjust_advice: (AutoAdjustAdviceV1, AutoAdjustAdviceDemo),
-    BillingBookkeeperTable.auto_adjust_qualifier: (AutoAdjustQualifierV1, AutoAdjustQualifierDemo),
-    BillingBookkeeperTable.auto_adjust_rule: (AutoAdjustRuleV1, AutoAdjustRuleDemo),
-    BillingBookkeeperTable.billing_archetype: (BillingArchetypeV1, BillingArchetypeDemo),
-    BillingBookkeeperTable.billing_entity: (BillingEntityV1, BillingEntityDemo),
-    BillingBookkeeperTable.billing_entity_config: (BillingEntityConfigV1, BillingEntityConfigDemo),
-    BillingBookkeeperTable.billing_event_history: (BillingEventHistoryV1, BillingEventHistoryDemo),
-    BillingBookkeeperTable.billing_hierarchy: (BillingHierarchyV1, BillingHierarchyDemo),
-    BillingBookkeeperTable.billing_hierarchy_cycle: (BillingHierarchyCycleV1, BillingHierarchyCycleDemo),
-    BillingBookkeeperTable.billing_hierarchy_type: (BillingHierarchyTypeV1, BillingHierarchyTypeDemo),
-    BillingBookkeeperTable.billing_pseudo_entity: (BillingPseudoEntityV1, BillingPseudoEntityDemo),
-    BillingBookkeeperTable.billing_schedule: (BillingScheduleV1, BillingScheduleDemo),
-    BillingBookkeeperTable.cellular_action: (CellularActionV1, CellularActionDemo),
-    BillingBookkeeperTable.cellular_action_error: (CellularActionErrorV1, CellularActionErrorDemo),
-    BillingBookkeeperTable.cellular_action_fee_code: (CellularActionFeeCodeV1, CellularActionFeeCodeDemo),
-    BillingBookkeeperTable.cellular_action_type: (CellularActionTypeV1, CellularActionTypeDemo),
-    BillingBookkeeperTable.consumer_failure: (ConsumerFailureV1, ConsumerFailureDemo),
-    BillingBookkeeperTable.consumer_failure_history: (ConsumerFailureHistoryV1, ConsumerFailureHistoryDemo),
-    BillingBookkeeperTable.cycle_validation: (CycleValidationV1, CycleValidationDemo),
-    BillingBookkeeperTable.cycle_validation_mutation: (CycleValidationMutationV1, CycleValidationMutationDemo),
-    BillingBookkeeperTable.deserializable_failure: (DeserializableFailureV1, DeserializableFailureDemo),
-    BillingBookkeeperTable.fee_category: (FeeCategoryV1, FeeCategoryDemo),
-    BillingBookkeeperTable.fee_code: (FeeCodeV1, FeeCodeDemo),
-    BillingBookkeeperTable.fee_code_app: (FeeCodeAppV1, FeeCodeAppDemo),
-    BillingBookkeeperTable.fee_code_ledger_account: (FeeCodeLedgerAccountV1, FeeCodeLedgerAccountDemo),
-    BillingBookkeeperTable.fee_ctd: (FeeCtdV1, FeeCtdDemo),
-    BillingBookkeeperTable.fee_rate: (FeeRateV1, FeeRateDemo),
-    BillingBookkeeperTable.fee_rate_error_report: (FeeRateErrorReportV1, FeeRateErrorReportDemo),
-    BillingBookkeeperTable.fee_rate_report_action_error: (FeeRateReportActionErrorV1, FeeRateReportActionErrorDemo),
-    BillingBookkeeperTable.fee_summary: (FeeSummaryV1, FeeSummaryDemo),
-    BillingBookkeeperTable.fee_summary_mutation: (FeeSummaryMutationV1, FeeSummaryMutationDemo),
-    BillingBookkeeperTable.fee_tax: (FeeTaxV1, FeeTaxDemo),
-    BillingBookkeeperTable.fee_tax_mutation: (FeeTaxMutationV1, FeeTaxMutationDemo),
-    BillingBookkeeperTable.fee_ytd: (FeeYtdV1, FeeYtdDemo),
-    BillingBookkeeperTable.flyway_schema_history: (FlywaySchemaHistoryV1, FlywaySchemaHistoryDemo),
-    BillingBookkeeperTable.invoice_alliance_code: (InvoiceAllianceCodeV1, InvoiceAllianceCodeDemo),
-    BillingBookkeeperTable.invoice_info: (InvoiceInfoV1, InvoiceInfoDemo),
-    BillingBookkeeperTable.invoice_info_amount: (InvoiceInfoAmountV1, InvoiceInfoAmountDemo),
-    BillingBookkeeperTable.invoice_info_mutation: (InvoiceInfoMutationV1, InvoiceInfoMutationDemo),
-    BillingBookkeeperTable.invoice_info_settlement: (InvoiceInfoSettlementV1, InvoiceInfoSettlementDemo),
-    BillingBookkeeperTable.invoice_info_settlement_mutation: (
-        InvoiceInfoSettlementMutationV1,
-        InvoiceInfoSettlementMutationDemo,
-    ),
-    BillingBookkeeperTable.job_assassination_contract: (JobAssassinationContractV1, JobAssassinationContractDemo),
-    BillingBookkeeperTable.jobrunr_backgroundjobservers: (
-        JobrunrBackgroundjobserversV1,
-        JobrunrBackgroundjobserversDemo,
-    ),
-    BillingBookkeeperTable.jobrunr_jobs: (JobrunrJobsV1, JobrunrJobsDemo),
-    BillingBookkeeperTable.jobrunr_metadata: (JobrunrMetadataV1, JobrunrMetadataDemo),
-    BillingBookkeeperTable.jobrunr_migrations: (JobrunrMigrationsV1, JobrunrMigrationsDemo),
-    BillingBookkeeperTable.jobrunr_recurring_jobs: (JobrunrRecurringJobsV1, JobrunrRecurringJobsDemo),
-    BillingBookkeeperTable.ledger_account: (LedgerAccountV1, LedgerAccountDemo),
-    BillingBookkeeperTable.ledger_account_action: (LedgerAccountActionV1, LedgerAccountActionDemo),
-    BillingBookkeeperTable.ledger_account_balance: (LedgerAccountBalanceV1, LedgerAccountBalanceDemo),
-    BillingBookkeeperTable.ledger_account_key: (LedgerAccountKeyV1, LedgerAccountKeyDemo),
-    BillingBookkeeperTable.ledger_account_key_app: (LedgerAccountKeyAppV1, LedgerAccountKeyAppDemo),
-    BillingBookkeeperTable.ledger_account_key_purpose: (LedgerAccountKeyPurposeV1, LedgerAccountKeyPurposeDemo),
-    BillingBookkeeperTable.ledger_account_purpose: (LedgerAccountPurposeV1, LedgerAccountPurposeDemo),
-    BillingBookkeeperTable.ledger_account_settlement: (LedgerAccountSettlementV1, LedgerAccountSettlementDemo),
-    BillingBookkeeperTable.ledger_account_transition: (LedgerAccountTransitionV1, LedgerAccountTransitionDemo),
-    BillingBookkeeperTable.ledger_journal: (LedgerJournalV1, LedgerJournalDemo),
-    BillingBookkeeperTable.ledger_journal_mutation: (LedgerJournalMutationV1, LedgerJournalMutationDemo),
-    BillingBookkeeperTable.lexi_attribute: (LexiAttributeV1, LexiAttributeDemo),
-    BillingBookkeeperTable.lexi_rule: (LexiRuleV1, LexiRuleDemo),
-    BillingBookkeeperTable.look: (LookV1, LookDemo),
-    BillingBookkeeperTable.look_data: (LookDataV1, LookDataDemo),
-    BillingBookkeeperTable.merchant_detail: (MerchantDetailV1, MerchantDetailDemo),
-    BillingBookkeeperTable.misc_action: (MiscActionV1, MiscActionDemo),
-    BillingBookkeeperTable.misc_action_error: (MiscActionErrorV1, MiscActionErrorDemo),
-    BillingBookkeeperTable.misc_action_fee_code: (MiscActionFeeCodeV1, MiscActionFeeCodeDemo),
-    BillingBookkeeperTable.misc_action_type: (MiscActionTypeV1, MiscActionTypeDemo),
-    BillingBookkeeperTable.misc_specifier: (MiscSpecifierV1, MiscSpecifierDemo),
-    BillingBookkeeperTable.model_fee_summary: (ModelFeeSummaryV1, ModelFeeSummaryDemo),
-    BillingBookkeeperTable.monetary_adjustment: (MonetaryAdjustmentV1, MonetaryAdjustmentDemo),
-    BillingBookkeeperTable.monetary_adjustment_mutation: (MonetaryAdjustmentMutationV1, MonetaryAdjustmentMutationDemo),
-    BillingBookkeeperTable.monetary_rule_alias: (MonetaryRuleAliasV1, MonetaryRuleAliasDemo),
-    BillingBookkeeperTable.monetary_rule_set: (MonetaryRuleSetV1, MonetaryRuleSetDemo),
-    BillingBookkeeperTable.monetary_rule_set_rule: (MonetaryRuleSetRuleV1, MonetaryRuleSetRuleDemo),
-    BillingBookkeeperTable.partner_config: (PartnerConfigV1, PartnerConfigDemo),
-    BillingBookkeeperTable.plan_action: (PlanActionV1, PlanActionDemo),
-    BillingBookkeeperTable.plan_action_error: (PlanActionErrorV1, PlanActionErrorDemo),
-    BillingBookkeeperTable.plan_action_fee_code: (PlanActionFeeCodeV1, PlanActionFeeCodeDemo),
-    BillingBookkeeperTable.plan_action_type: (PlanActionTypeV1, PlanActionTypeDemo),
-    BillingBookkeeperTable.processing_group_dates: (ProcessingGroupDatesV1, ProcessingGroupDatesDemo),
-    BillingBookkeeperTable.processing_note: (ProcessingNoteV1, ProcessingNoteDemo),
-    BillingBookkeeperTable.processing_note_mutation: (ProcessingNoteMutationV1, ProcessingNoteMutationDemo),
-    BillingBookkeeperTable.prototype_fee_rate: (PrototypeFeeRateV1, PrototypeFeeRateDemo),
-    BillingBookkeeperTable.prototype_fee_set: (PrototypeFeeSetV1, PrototypeFeeSetDemo),
-    BillingBookkeeperTable.revenue_action: (RevenueActionV1, RevenueActionDemo),
-    BillingBookkeeperTable.revenue_action_error: (RevenueActionErrorV1, RevenueActionErrorDemo),
-    BillingBookkeeperTable.revenue_action_fee_code: (RevenueActionFeeCodeV1, RevenueActionFeeCodeDemo),
-    BillingBookkeeperTable.revenue_action_type: (RevenueActionTypeV1, RevenueActionTypeDemo),
-    BillingBookkeeperTable.revenue_share_group: (RevenueShareGroupV1, RevenueShareGroupDemo),
-    BillingBookkeeperTable.server_config: (ServerConfigV1, ServerConfigDemo),
-    BillingBookkeeperTable.settlement: (SettlementV1, SettlementDemo),
-    BillingBookkeeperTable.settlement_action: (SettlementActionV1, SettlementActionDemo),
-    BillingBookkeeperTable.settlement_mutation: (SettlementMutationV1, SettlementMutationDemo),
-    BillingBookkeeperTable.skip_fee_category_lexi_tag: (SkipFeeCategoryLexiTagV1, SkipFeeCategoryLexiTagDemo),
-    BillingBookkeeperTable.tier_detail: (TierDetailV1, TierDetailDemo),
-    BillingBookkeeperTable.tiered_pricing: (TieredPricingV1, TieredPricingDemo),
-    BillingBookkeeperTable.tiered_qualifier: (TieredQualifierV1, TieredQualifierDemo),
-    BillingBookkeeperTable.tiered_rule: (TieredRuleV1, TieredRuleDemo),
-}
+if TYPE_CHECKING:
+    from rhizome.models.billing_bookkeeper.adjust_action_fee_code_v1 import AdjustActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.adjust_action_type_v1 import AdjustActionTypeV1
+    from rhizome.models.billing_bookkeeper.adjust_action_v1 import AdjustActionV1
+    from rhizome.models.billing_bookkeeper.adjust_reason_v1 import AdjustReasonV1
+    from rhizome.models.billing_bookkeeper.app_meter_action_error_v1 import AppMeterActionErrorV1
+    from rhizome.models.billing_bookkeeper.app_meter_action_fee_code_v1 import AppMeterActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.app_meter_action_type_v1 import AppMeterActionTypeV1
+    from rhizome.models.billing_bookkeeper.app_meter_action_v1 import AppMeterActionV1
+    from rhizome.models.billing_bookkeeper.app_sub_action_error_v1 import AppSubActionErrorV1
+    from rhizome.models.billing_bookkeeper.app_sub_action_fee_code_v1 import AppSubActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.app_sub_action_type_v1 import AppSubActionTypeV1
+    from rhizome.models.billing_bookkeeper.app_sub_action_v1 import AppSubActionV1
+    from rhizome.models.billing_bookkeeper.auto_adjust_advice_v1 import AutoAdjustAdviceV1
+    from rhizome.models.billing_bookkeeper.auto_adjust_qualifier_v1 import AutoAdjustQualifierV1
+    from rhizome.models.billing_bookkeeper.auto_adjust_rule_v1 import AutoAdjustRuleV1
+    from rhizome.models.billing_bookkeeper.billing_archetype_v1 import BillingArchetypeV1
+    from rhizome.models.billing_bookkeeper.billing_entity_config_v1 import BillingEntityConfigV1
+    from rhizome.models.billing_bookkeeper.billing_entity_v1 import BillingEntityV1
+    from rhizome.models.billing_bookkeeper.billing_event_history_v1 import BillingEventHistoryV1
+    from rhizome.models.billing_bookkeeper.billing_hierarchy_cycle_v1 import BillingHierarchyCycleV1
+    from rhizome.models.billing_bookkeeper.billing_hierarchy_type_v1 import BillingHierarchyTypeV1
+    from rhizome.models.billing_bookkeeper.billing_hierarchy_v1 import BillingHierarchyV1
+    from rhizome.models.billing_bookkeeper.billing_pseudo_entity_v1 import BillingPseudoEntityV1
+    from rhizome.models.billing_bookkeeper.billing_schedule_v1 import BillingScheduleV1
+    from rhizome.models.billing_bookkeeper.cellular_action_error_v1 import CellularActionErrorV1
+    from rhizome.models.billing_bookkeeper.cellular_action_fee_code_v1 import CellularActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.cellular_action_type_v1 import CellularActionTypeV1
+    from rhizome.models.billing_bookkeeper.cellular_action_v1 import CellularActionV1
+    from rhizome.models.billing_bookkeeper.consumer_failure_history_v1 import ConsumerFailureHistoryV1
+    from rhizome.models.billing_bookkeeper.consumer_failure_v1 import ConsumerFailureV1
+    from rhizome.models.billing_bookkeeper.cycle_validation_mutation_v1 import CycleValidationMutationV1
+    from rhizome.models.billing_bookkeeper.cycle_validation_v1 import CycleValidationV1
+    from rhizome.models.billing_bookkeeper.deserializable_failure_v1 import DeserializableFailureV1
+    from rhizome.models.billing_bookkeeper.fee_category_v1 import FeeCategoryV1
+    from rhizome.models.billing_bookkeeper.fee_code_app_v1 import FeeCodeAppV1
+    from rhizome.models.billing_bookkeeper.fee_code_ledger_account_v1 import FeeCodeLedgerAccountV1
+    from rhizome.models.billing_bookkeeper.fee_code_v1 import FeeCodeV1
+    from rhizome.models.billing_bookkeeper.fee_ctd_v1 import FeeCtdV1
+    from rhizome.models.billing_bookkeeper.fee_rate_error_report_v1 import FeeRateErrorReportV1
+    from rhizome.models.billing_bookkeeper.fee_rate_report_action_error_v1 import FeeRateReportActionErrorV1
+    from rhizome.models.billing_bookkeeper.fee_rate_v1 import FeeRateV1
+    from rhizome.models.billing_bookkeeper.fee_summary_mutation_v1 import FeeSummaryMutationV1
+    from rhizome.models.billing_bookkeeper.fee_summary_v1 import FeeSummaryV1
+    from rhizome.models.billing_bookkeeper.fee_tax_mutation_v1 import FeeTaxMutationV1
+    from rhizome.models.billing_bookkeeper.fee_tax_v1 import FeeTaxV1
+    from rhizome.models.billing_bookkeeper.fee_ytd_v1 import FeeYtdV1
+    from rhizome.models.billing_bookkeeper.flyway_schema_history_v1 import FlywaySchemaHistoryV1
+    from rhizome.models.billing_bookkeeper.invoice_alliance_code_v1 import InvoiceAllianceCodeV1
+    from rhizome.models.billing_bookkeeper.invoice_info_amount_v1 import InvoiceInfoAmountV1
+    from rhizome.models.billing_bookkeeper.invoice_info_mutation_v1 import InvoiceInfoMutationV1
+    from rhizome.models.billing_bookkeeper.invoice_info_settlement_v1 import InvoiceInfoSettlementV1
+    from rhizome.models.billing_bookkeeper.invoice_info_v1 import InvoiceInfoV1
+    from rhizome.models.billing_bookkeeper.job_assassination_contract_v1 import JobAssassinationContractV1
+    from rhizome.models.billing_bookkeeper.jobrunr_jobs_v1 import JobrunrJobsV1
+    from rhizome.models.billing_bookkeeper.jobrunr_metadata_v1 import JobrunrMetadataV1
+    from rhizome.models.billing_bookkeeper.jobrunr_migrations_v1 import JobrunrMigrationsV1
+    from rhizome.models.billing_bookkeeper.jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
+    from rhizome.models.billing_bookkeeper.ledger_account_action_v1 import LedgerAccountActionV1
+    from rhizome.models.billing_bookkeeper.ledger_account_balance_v1 import LedgerAccountBalanceV1
+    from rhizome.models.billing_bookkeeper.ledger_account_key_app_v1 import LedgerAccountKeyAppV1
+    from rhizome.models.billing_bookkeeper.ledger_account_key_purpose_v1 import LedgerAccountKeyPurposeV1
+    from rhizome.models.billing_bookkeeper.ledger_account_key_v1 import LedgerAccountKeyV1
+    from rhizome.models.billing_bookkeeper.ledger_account_purpose_v1 import LedgerAccountPurposeV1
+    from rhizome.models.billing_bookkeeper.ledger_account_settlement_v1 import LedgerAccountSettlementV1
+    from rhizome.models.billing_bookkeeper.ledger_account_transition_v1 import LedgerAccountTransitionV1
+    from rhizome.models.billing_bookkeeper.ledger_account_v1 import LedgerAccountV1
+    from rhizome.models.billing_bookkeeper.ledger_journal_mutation_v1 import LedgerJournalMutationV1
+    from rhizome.models.billing_bookkeeper.ledger_journal_v1 import LedgerJournalV1
+    from rhizome.models.billing_bookkeeper.lexi_attribute_v1 import LexiAttributeV1
+    from rhizome.models.billing_bookkeeper.lexi_rule_v1 import LexiRuleV1
+    from rhizome.models.billing_bookkeeper.look_data_v1 import LookDataV1
+    from rhizome.models.billing_bookkeeper.look_v1 import LookV1
+    from rhizome.models.billing_bookkeeper.merchant_detail_v1 import MerchantDetailV1
+    from rhizome.models.billing_bookkeeper.misc_action_error_v1 import MiscActionErrorV1
+    from rhizome.models.billing_bookkeeper.misc_action_fee_code_v1 import MiscActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.misc_action_type_v1 import MiscActionTypeV1
+    from rhizome.models.billing_bookkeeper.misc_action_v1 import MiscActionV1
+    from rhizome.models.billing_bookkeeper.misc_specifier_v1 import MiscSpecifierV1
+    from rhizome.models.billing_bookkeeper.model_fee_summary_v1 import ModelFeeSummaryV1
+    from rhizome.models.billing_bookkeeper.monetary_adjustment_mutation_v1 import MonetaryAdjustmentMutationV1
+    from rhizome.models.billing_bookkeeper.monetary_adjustment_v1 import MonetaryAdjustmentV1
+    from rhizome.models.billing_bookkeeper.monetary_rule_alias_v1 import MonetaryRuleAliasV1
+    from rhizome.models.billing_bookkeeper.monetary_rule_set_rule_v1 import MonetaryRuleSetRuleV1
+    from rhizome.models.billing_bookkeeper.monetary_rule_set_v1 import MonetaryRuleSetV1
+    from rhizome.models.billing_bookkeeper.partner_config_v1 import PartnerConfigV1
+    from rhizome.models.billing_bookkeeper.plan_action_error_v1 import PlanActionErrorV1
+    from rhizome.models.billing_bookkeeper.plan_action_fee_code_v1 import PlanActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.plan_action_type_v1 import PlanActionTypeV1
+    from rhizome.models.billing_bookkeeper.plan_action_v1 import PlanActionV1
+    from rhizome.models.billing_bookkeeper.processing_group_dates_v1 import ProcessingGroupDatesV1
+    from rhizome.models.billing_bookkeeper.processing_note_mutation_v1 import ProcessingNoteMutationV1
+    from rhizome.models.billing_bookkeeper.processing_note_v1 import ProcessingNoteV1
+    from rhizome.models.billing_bookkeeper.prototype_fee_rate_v1 import PrototypeFeeRateV1
+    from rhizome.models.billing_bookkeeper.prototype_fee_set_v1 import PrototypeFeeSetV1
+    from rhizome.models.billing_bookkeeper.revenue_action_error_v1 import RevenueActionErrorV1
+    from rhizome.models.billing_bookkeeper.revenue_action_fee_code_v1 import RevenueActionFeeCodeV1
+    from rhizome.models.billing_bookkeeper.revenue_action_type_v1 import RevenueActionTypeV1
+    from rhizome.models.billing_bookkeeper.revenue_action_v1 import RevenueActionV1
+    from rhizome.models.billing_bookkeeper.revenue_share_group_v1 import RevenueShareGroupV1
+    from rhizome.models.billing_bookkeeper.server_config_v1 import ServerConfigV1
+    from rhizome.models.billing_bookkeeper.settlement_action_v1 import SettlementActionV1
+    from rhizome.models.billing_bookkeeper.settlement_mutation_v1 import SettlementMutationV1
+    from rhizome.models.billing_bookkeeper.settlement_v1 import SettlementV1
+    from rhizome.models.billing_bookkeeper.skip_fee_category_lexi_tag_v1 import SkipFeeCategoryLexiTagV1
+    from rhizome.models.billing_bookkeeper.tier_detail_v1 import TierDetailV1
+    from rhizome.models.billing_bookkeeper.tiered_pricing_v1 import TieredPricingV1
+    from rhizome.models.billing_bookkeeper.tiered_qualifier_v1 import TieredQualifierV1
+    from rhizome.models.billing_bookkeeper.tiered_rule_v1 import TieredRuleV1
+
+models: LazyMapping[BillingBookkeeperTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = LazyMapping(
+    {
+        BillingBookkeeperTable.adjust_action: (
+            "rhizome.models.billing_bookkeeper.adjust_action_v1.AdjustActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action.AdjustActionDemo",
+        ),
+        BillingBookkeeperTable.adjust_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.adjust_action_fee_code_v1.AdjustActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action_fee_code.AdjustActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.adjust_action_type: (
+            "rhizome.models.billing_bookkeeper.adjust_action_type_v1.AdjustActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_action_type.AdjustActionTypeDemo",
+        ),
+        BillingBookkeeperTable.adjust_reason: (
+            "rhizome.models.billing_bookkeeper.adjust_reason_v1.AdjustReasonV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_adjust_reason.AdjustReasonDemo",
+        ),
+        BillingBookkeeperTable.app_meter_action: (
+            "rhizome.models.billing_bookkeeper.app_meter_action_v1.AppMeterActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action.AppMeterActionDemo",
+        ),
+        BillingBookkeeperTable.app_meter_action_error: (
+            "rhizome.models.billing_bookkeeper.app_meter_action_error_v1.AppMeterActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_error.AppMeterActionErrorDemo",
+        ),
+        BillingBookkeeperTable.app_meter_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.app_meter_action_fee_code_v1.AppMeterActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_fee_code.AppMeterActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.app_meter_action_type: (
+            "rhizome.models.billing_bookkeeper.app_meter_action_type_v1.AppMeterActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_meter_action_type.AppMeterActionTypeDemo",
+        ),
+        BillingBookkeeperTable.app_sub_action: (
+            "rhizome.models.billing_bookkeeper.app_sub_action_v1.AppSubActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action.AppSubActionDemo",
+        ),
+        BillingBookkeeperTable.app_sub_action_error: (
+            "rhizome.models.billing_bookkeeper.app_sub_action_error_v1.AppSubActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_error.AppSubActionErrorDemo",
+        ),
+        BillingBookkeeperTable.app_sub_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.app_sub_action_fee_code_v1.AppSubActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_fee_code.AppSubActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.app_sub_action_type: (
+            "rhizome.models.billing_bookkeeper.app_sub_action_type_v1.AppSubActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_app_sub_action_type.AppSubActionTypeDemo",
+        ),
+        BillingBookkeeperTable.auto_adjust_advice: (
+            "rhizome.models.billing_bookkeeper.auto_adjust_advice_v1.AutoAdjustAdviceV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_advice.AutoAdjustAdviceDemo",
+        ),
+        BillingBookkeeperTable.auto_adjust_qualifier: (
+            "rhizome.models.billing_bookkeeper.auto_adjust_qualifier_v1.AutoAdjustQualifierV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_qualifier.AutoAdjustQualifierDemo",
+        ),
+        BillingBookkeeperTable.auto_adjust_rule: (
+            "rhizome.models.billing_bookkeeper.auto_adjust_rule_v1.AutoAdjustRuleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_auto_adjust_rule.AutoAdjustRuleDemo",
+        ),
+        BillingBookkeeperTable.billing_archetype: (
+            "rhizome.models.billing_bookkeeper.billing_archetype_v1.BillingArchetypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_archetype.BillingArchetypeDemo",
+        ),
+        BillingBookkeeperTable.billing_entity: (
+            "rhizome.models.billing_bookkeeper.billing_entity_v1.BillingEntityV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_entity.BillingEntityDemo",
+        ),
+        BillingBookkeeperTable.billing_entity_config: (
+            "rhizome.models.billing_bookkeeper.billing_entity_config_v1.BillingEntityConfigV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_entity_config.BillingEntityConfigDemo",
+        ),
+        BillingBookkeeperTable.billing_event_history: (
+            "rhizome.models.billing_bookkeeper.billing_event_history_v1.BillingEventHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_event_history.BillingEventHistoryDemo",
+        ),
+        BillingBookkeeperTable.billing_hierarchy: (
+            "rhizome.models.billing_bookkeeper.billing_hierarchy_v1.BillingHierarchyV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy.BillingHierarchyDemo",
+        ),
+        BillingBookkeeperTable.billing_hierarchy_cycle: (
+            "rhizome.models.billing_bookkeeper.billing_hierarchy_cycle_v1.BillingHierarchyCycleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy_cycle.BillingHierarchyCycleDemo",
+        ),
+        BillingBookkeeperTable.billing_hierarchy_type: (
+            "rhizome.models.billing_bookkeeper.billing_hierarchy_type_v1.BillingHierarchyTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_hierarchy_type.BillingHierarchyTypeDemo",
+        ),
+        BillingBookkeeperTable.billing_pseudo_entity: (
+            "rhizome.models.billing_bookkeeper.billing_pseudo_entity_v1.BillingPseudoEntityV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_pseudo_entity.BillingPseudoEntityDemo",
+        ),
+        BillingBookkeeperTable.billing_schedule: (
+            "rhizome.models.billing_bookkeeper.billing_schedule_v1.BillingScheduleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_billing_schedule.BillingScheduleDemo",
+        ),
+        BillingBookkeeperTable.cellular_action: (
+            "rhizome.models.billing_bookkeeper.cellular_action_v1.CellularActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action.CellularActionDemo",
+        ),
+        BillingBookkeeperTable.cellular_action_error: (
+            "rhizome.models.billing_bookkeeper.cellular_action_error_v1.CellularActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_error.CellularActionErrorDemo",
+        ),
+        BillingBookkeeperTable.cellular_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.cellular_action_fee_code_v1.CellularActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_fee_code.CellularActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.cellular_action_type: (
+            "rhizome.models.billing_bookkeeper.cellular_action_type_v1.CellularActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cellular_action_type.CellularActionTypeDemo",
+        ),
+        BillingBookkeeperTable.consumer_failure: (
+            "rhizome.models.billing_bookkeeper.consumer_failure_v1.ConsumerFailureV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_consumer_failure.ConsumerFailureDemo",
+        ),
+        BillingBookkeeperTable.consumer_failure_history: (
+            "rhizome.models.billing_bookkeeper.consumer_failure_history_v1.ConsumerFailureHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_consumer_failure_history.ConsumerFailureHistoryDemo",
+        ),
+        BillingBookkeeperTable.cycle_validation: (
+            "rhizome.models.billing_bookkeeper.cycle_validation_v1.CycleValidationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cycle_validation.CycleValidationDemo",
+        ),
+        BillingBookkeeperTable.cycle_validation_mutation: (
+            "rhizome.models.billing_bookkeeper.cycle_validation_mutation_v1.CycleValidationMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_cycle_validation_mutation.CycleValidationMutationDemo",
+        ),
+        BillingBookkeeperTable.deserializable_failure: (
+            "rhizome.models.billing_bookkeeper.deserializable_failure_v1.DeserializableFailureV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_deserializable_failure.DeserializableFailureDemo",
+        ),
+        BillingBookkeeperTable.fee_category: (
+            "rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_category.FeeCategoryDemo",
+        ),
+        BillingBookkeeperTable.fee_code: (
+            "rhizome.models.billing_bookkeeper.fee_code_v1.FeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code.FeeCodeDemo",
+        ),
+        BillingBookkeeperTable.fee_code_app: (
+            "rhizome.models.billing_bookkeeper.fee_code_app_v1.FeeCodeAppV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code_app.FeeCodeAppDemo",
+        ),
+        BillingBookkeeperTable.fee_code_ledger_account: (
+            "rhizome.models.billing_bookkeeper.fee_code_ledger_account_v1.FeeCodeLedgerAccountV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_code_ledger_account.FeeCodeLedgerAccountDemo",
+        ),
+        BillingBookkeeperTable.fee_ctd: (
+            "rhizome.models.billing_bookkeeper.fee_ctd_v1.FeeCtdV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_ctd.FeeCtdDemo",
+        ),
+        BillingBookkeeperTable.fee_rate: (
+            "rhizome.models.billing_bookkeeper.fee_rate_v1.FeeRateV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate.FeeRateDemo",
+        ),
+        BillingBookkeeperTable.fee_rate_error_report: (
+            "rhizome.models.billing_bookkeeper.fee_rate_error_report_v1.FeeRateErrorReportV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate_error_report.FeeRateErrorReportDemo",
+        ),
+        BillingBookkeeperTable.fee_rate_report_action_error: (
+            "rhizome.models.billing_bookkeeper.fee_rate_report_action_error_v1.FeeRateReportActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_rate_report_action_error.FeeRateReportActionErrorDemo",
+        ),
+        BillingBookkeeperTable.fee_summary: (
+            "rhizome.models.billing_bookkeeper.fee_summary_v1.FeeSummaryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_summary.FeeSummaryDemo",
+        ),
+        BillingBookkeeperTable.fee_summary_mutation: (
+            "rhizome.models.billing_bookkeeper.fee_summary_mutation_v1.FeeSummaryMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_summary_mutation.FeeSummaryMutationDemo",
+        ),
+        BillingBookkeeperTable.fee_tax: (
+            "rhizome.models.billing_bookkeeper.fee_tax_v1.FeeTaxV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_tax.FeeTaxDemo",
+        ),
+        BillingBookkeeperTable.fee_tax_mutation: (
+            "rhizome.models.billing_bookkeeper.fee_tax_mutation_v1.FeeTaxMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_tax_mutation.FeeTaxMutationDemo",
+        ),
+        BillingBookkeeperTable.fee_ytd: (
+            "rhizome.models.billing_bookkeeper.fee_ytd_v1.FeeYtdV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_fee_ytd.FeeYtdDemo",
+        ),
+        BillingBookkeeperTable.flyway_schema_history: (
+            "rhizome.models.billing_bookkeeper.flyway_schema_history_v1.FlywaySchemaHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_flyway_schema_history.FlywaySchemaHistoryDemo",
+        ),
+        BillingBookkeeperTable.invoice_alliance_code: (
+            "rhizome.models.billing_bookkeeper.invoice_alliance_code_v1.InvoiceAllianceCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_alliance_code.InvoiceAllianceCodeDemo",
+        ),
+        BillingBookkeeperTable.invoice_info: (
+            "rhizome.models.billing_bookkeeper.invoice_info_v1.InvoiceInfoV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info.InvoiceInfoDemo",
+        ),
+        BillingBookkeeperTable.invoice_info_amount: (
+            "rhizome.models.billing_bookkeeper.invoice_info_amount_v1.InvoiceInfoAmountV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_amount.InvoiceInfoAmountDemo",
+        ),
+        BillingBookkeeperTable.invoice_info_mutation: (
+            "rhizome.models.billing_bookkeeper.invoice_info_mutation_v1.InvoiceInfoMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_mutation.InvoiceInfoMutationDemo",
+        ),
+        BillingBookkeeperTable.invoice_info_settlement: (
+            "rhizome.models.billing_bookkeeper.invoice_info_settlement_v1.InvoiceInfoSettlementV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_settlement.InvoiceInfoSettlementDemo",
+        ),
+        BillingBookkeeperTable.invoice_info_settlement_mutation: (
+            "rhizome.models.billing_bookkeeper.invoice_info_settlement_mutation_v1.InvoiceInfoSettlementMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_invoice_info_settlement_mutation.InvoiceInfoSettlementMutationDemo",
+        ),
+        BillingBookkeeperTable.job_assassination_contract: (
+            "rhizome.models.billing_bookkeeper.job_assassination_contract_v1.JobAssassinationContractV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_job_assassination_contract.JobAssassinationContractDemo",
+        ),
+        BillingBookkeeperTable.jobrunr_backgroundjobservers: (
+            "rhizome.models.billing_bookkeeper.jobrunr_backgroundjobservers_v1.JobrunrBackgroundjobserversV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_backgroundjobservers.JobrunrBackgroundjobserversDemo",
+        ),
+        BillingBookkeeperTable.jobrunr_jobs: (
+            "rhizome.models.billing_bookkeeper.jobrunr_jobs_v1.JobrunrJobsV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_jobs.JobrunrJobsDemo",
+        ),
+        BillingBookkeeperTable.jobrunr_metadata: (
+            "rhizome.models.billing_bookkeeper.jobrunr_metadata_v1.JobrunrMetadataV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_metadata.JobrunrMetadataDemo",
+        ),
+        BillingBookkeeperTable.jobrunr_migrations: (
+            "rhizome.models.billing_bookkeeper.jobrunr_migrations_v1.JobrunrMigrationsV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_migrations.JobrunrMigrationsDemo",
+        ),
+        BillingBookkeeperTable.jobrunr_recurring_jobs: (
+            "rhizome.models.billing_bookkeeper.jobrunr_recurring_jobs_v1.JobrunrRecurringJobsV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_jobrunr_recurring_jobs.JobrunrRecurringJobsDemo",
+        ),
+        BillingBookkeeperTable.ledger_account: (
+            "rhizome.models.billing_bookkeeper.ledger_account_v1.LedgerAccountV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account.LedgerAccountDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_action: (
+            "rhizome.models.billing_bookkeeper.ledger_account_action_v1.LedgerAccountActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_action.LedgerAccountActionDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_balance: (
+            "rhizome.models.billing_bookkeeper.ledger_account_balance_v1.LedgerAccountBalanceV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_balance.LedgerAccountBalanceDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_key: (
+            "rhizome.models.billing_bookkeeper.ledger_account_key_v1.LedgerAccountKeyV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key.LedgerAccountKeyDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_key_app: (
+            "rhizome.models.billing_bookkeeper.ledger_account_key_app_v1.LedgerAccountKeyAppV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key_app.LedgerAccountKeyAppDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_key_purpose: (
+            "rhizome.models.billing_bookkeeper.ledger_account_key_purpose_v1.LedgerAccountKeyPurposeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_key_purpose.LedgerAccountKeyPurposeDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_purpose: (
+            "rhizome.models.billing_bookkeeper.ledger_account_purpose_v1.LedgerAccountPurposeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_purpose.LedgerAccountPurposeDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_settlement: (
+            "rhizome.models.billing_bookkeeper.ledger_account_settlement_v1.LedgerAccountSettlementV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_settlement.LedgerAccountSettlementDemo",
+        ),
+        BillingBookkeeperTable.ledger_account_transition: (
+            "rhizome.models.billing_bookkeeper.ledger_account_transition_v1.LedgerAccountTransitionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_account_transition.LedgerAccountTransitionDemo",
+        ),
+        BillingBookkeeperTable.ledger_journal: (
+            "rhizome.models.billing_bookkeeper.ledger_journal_v1.LedgerJournalV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_journal.LedgerJournalDemo",
+        ),
+        BillingBookkeeperTable.ledger_journal_mutation: (
+            "rhizome.models.billing_bookkeeper.ledger_journal_mutation_v1.LedgerJournalMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_ledger_journal_mutation.LedgerJournalMutationDemo",
+        ),
+        BillingBookkeeperTable.lexi_attribute: (
+            "rhizome.models.billing_bookkeeper.lexi_attribute_v1.LexiAttributeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_lexi_attribute.LexiAttributeDemo",
+        ),
+        BillingBookkeeperTable.lexi_rule: (
+            "rhizome.models.billing_bookkeeper.lexi_rule_v1.LexiRuleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_lexi_rule.LexiRuleDemo",
+        ),
+        BillingBookkeeperTable.look: (
+            "rhizome.models.billing_bookkeeper.look_v1.LookV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_look.LookDemo",
+        ),
+        BillingBookkeeperTable.look_data: (
+            "rhizome.models.billing_bookkeeper.look_data_v1.LookDataV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_look_data.LookDataDemo",
+        ),
+        BillingBookkeeperTable.merchant_detail: (
+            "rhizome.models.billing_bookkeeper.merchant_detail_v1.MerchantDetailV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_merchant_detail.MerchantDetailDemo",
+        ),
+        BillingBookkeeperTable.misc_action: (
+            "rhizome.models.billing_bookkeeper.misc_action_v1.MiscActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action.MiscActionDemo",
+        ),
+        BillingBookkeeperTable.misc_action_error: (
+            "rhizome.models.billing_bookkeeper.misc_action_error_v1.MiscActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_error.MiscActionErrorDemo",
+        ),
+        BillingBookkeeperTable.misc_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.misc_action_fee_code_v1.MiscActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_fee_code.MiscActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.misc_action_type: (
+            "rhizome.models.billing_bookkeeper.misc_action_type_v1.MiscActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_misc_action_type.MiscActionTypeDemo",
+        ),
+        BillingBookkeeperTable.misc_specifier: (
+            "rhizome.models.billing_bookkeeper.misc_specifier_v1.MiscSpecifierV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_misc_specifier.MiscSpecifierDemo",
+        ),
+        BillingBookkeeperTable.model_fee_summary: (
+            "rhizome.models.billing_bookkeeper.model_fee_summary_v1.ModelFeeSummaryV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_model_fee_summary.ModelFeeSummaryDemo",
+        ),
+        BillingBookkeeperTable.monetary_adjustment: (
+            "rhizome.models.billing_bookkeeper.monetary_adjustment_v1.MonetaryAdjustmentV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_adjustment.MonetaryAdjustmentDemo",
+        ),
+        BillingBookkeeperTable.monetary_adjustment_mutation: (
+            "rhizome.models.billing_bookkeeper.monetary_adjustment_mutation_v1.MonetaryAdjustmentMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_adjustment_mutation.MonetaryAdjustmentMutationDemo",
+        ),
+        BillingBookkeeperTable.monetary_rule_alias: (
+            "rhizome.models.billing_bookkeeper.monetary_rule_alias_v1.MonetaryRuleAliasV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_alias.MonetaryRuleAliasDemo",
+        ),
+        BillingBookkeeperTable.monetary_rule_set: (
+            "rhizome.models.billing_bookkeeper.monetary_rule_set_v1.MonetaryRuleSetV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_set.MonetaryRuleSetDemo",
+        ),
+        BillingBookkeeperTable.monetary_rule_set_rule: (
+            "rhizome.models.billing_bookkeeper.monetary_rule_set_rule_v1.MonetaryRuleSetRuleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_monetary_rule_set_rule.MonetaryRuleSetRuleDemo",
+        ),
+        BillingBookkeeperTable.partner_config: (
+            "rhizome.models.billing_bookkeeper.partner_config_v1.PartnerConfigV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_partner_config.PartnerConfigDemo",
+        ),
+        BillingBookkeeperTable.plan_action: (
+            "rhizome.models.billing_bookkeeper.plan_action_v1.PlanActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action.PlanActionDemo",
+        ),
+        BillingBookkeeperTable.plan_action_error: (
+            "rhizome.models.billing_bookkeeper.plan_action_error_v1.PlanActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_error.PlanActionErrorDemo",
+        ),
+        BillingBookkeeperTable.plan_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.plan_action_fee_code_v1.PlanActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_fee_code.PlanActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.plan_action_type: (
+            "rhizome.models.billing_bookkeeper.plan_action_type_v1.PlanActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_plan_action_type.PlanActionTypeDemo",
+        ),
+        BillingBookkeeperTable.processing_group_dates: (
+            "rhizome.models.billing_bookkeeper.processing_group_dates_v1.ProcessingGroupDatesV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_processing_group_dates.ProcessingGroupDatesDemo",
+        ),
+        BillingBookkeeperTable.processing_note: (
+            "rhizome.models.billing_bookkeeper.processing_note_v1.ProcessingNoteV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_processing_note.ProcessingNoteDemo",
+        ),
+        BillingBookkeeperTable.processing_note_mutation: (
+            "rhizome.models.billing_bookkeeper.processing_note_mutation_v1.ProcessingNoteMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_processing_note_mutation.ProcessingNoteMutationDemo",
+        ),
+        BillingBookkeeperTable.prototype_fee_rate: (
+            "rhizome.models.billing_bookkeeper.prototype_fee_rate_v1.PrototypeFeeRateV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_prototype_fee_rate.PrototypeFeeRateDemo",
+        ),
+        BillingBookkeeperTable.prototype_fee_set: (
+            "rhizome.models.billing_bookkeeper.prototype_fee_set_v1.PrototypeFeeSetV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_prototype_fee_set.PrototypeFeeSetDemo",
+        ),
+        BillingBookkeeperTable.revenue_action: (
+            "rhizome.models.billing_bookkeeper.revenue_action_v1.RevenueActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action.RevenueActionDemo",
+        ),
+        BillingBookkeeperTable.revenue_action_error: (
+            "rhizome.models.billing_bookkeeper.revenue_action_error_v1.RevenueActionErrorV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_error.RevenueActionErrorDemo",
+        ),
+        BillingBookkeeperTable.revenue_action_fee_code: (
+            "rhizome.models.billing_bookkeeper.revenue_action_fee_code_v1.RevenueActionFeeCodeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_fee_code.RevenueActionFeeCodeDemo",
+        ),
+        BillingBookkeeperTable.revenue_action_type: (
+            "rhizome.models.billing_bookkeeper.revenue_action_type_v1.RevenueActionTypeV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_action_type.RevenueActionTypeDemo",
+        ),
+        BillingBookkeeperTable.revenue_share_group: (
+            "rhizome.models.billing_bookkeeper.revenue_share_group_v1.RevenueShareGroupV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_revenue_share_group.RevenueShareGroupDemo",
+        ),
+        BillingBookkeeperTable.server_config: (
+            "rhizome.models.billing_bookkeeper.server_config_v1.ServerConfigV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_server_config.ServerConfigDemo",
+        ),
+        BillingBookkeeperTable.settlement: (
+            "rhizome.models.billing_bookkeeper.settlement_v1.SettlementV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_settlement.SettlementDemo",
+        ),
+        BillingBookkeeperTable.settlement_action: (
+            "rhizome.models.billing_bookkeeper.settlement_action_v1.SettlementActionV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_settlement_action.SettlementActionDemo",
+        ),
+        BillingBookkeeperTable.settlement_mutation: (
+            "rhizome.models.billing_bookkeeper.settlement_mutation_v1.SettlementMutationV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_settlement_mutation.SettlementMutationDemo",
+        ),
+        BillingBookkeeperTable.skip_fee_category_lexi_tag: (
+            "rhizome.models.billing_bookkeeper.skip_fee_category_lexi_tag_v1.SkipFeeCategoryLexiTagV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_skip_fee_category_lexi_tag.SkipFeeCategoryLexiTagDemo",
+        ),
+        BillingBookkeeperTable.tier_detail: (
+            "rhizome.models.billing_bookkeeper.tier_detail_v1.TierDetailV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_tier_detail.TierDetailDemo",
+        ),
+        BillingBookkeeperTable.tiered_pricing: (
+            "rhizome.models.billing_bookkeeper.tiered_pricing_v1.TieredPricingV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_pricing.TieredPricingDemo",
+        ),
+        BillingBookkeeperTable.tiered_qualifier: (
+            "rhizome.models.billing_bookkeeper.tiered_qualifier_v1.TieredQualifierV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_qualifier.TieredQualifierDemo",
+        ),
+        BillingBookkeeperTable.tiered_rule: (
+            "rhizome.models.billing_bookkeeper.tiered_rule_v1.TieredRuleV1",
+            "rhizome.environments.demo.expected_data.billing_bookkeeper_tiered_rule.TieredRuleDemo",
+        ),
+    }
+)
 
 
 class DemoBillingBookkeeper(Environment):
     """Demo bookkeeper environment using CloudSQL."""
 
     # Type aliases for environment-specific model versions
-    AdjustAction: type[AdjustActionV1] = AdjustActionV1
-    AdjustActionFeeCode: type[AdjustActionFeeCodeV1] = AdjustActionFeeCodeV1
-    AdjustActionType: type[AdjustActionTypeV1] = AdjustActionTypeV1
-    AdjustReason: type[AdjustReasonV1] = AdjustReasonV1
-    AppMeterAction: type[AppMeterActionV1] = AppMeterActionV1
-    AppMeterActionError: type[AppMeterActionErrorV1] = AppMeterActionErrorV1
-    AppMeterActionFeeCode: type[AppMeterActionFeeCodeV1] = AppMeterActionFeeCodeV1
-    AppMeterActionType: type[AppMeterActionTypeV1] = AppMeterActionTypeV1
-    AppSubAction: type[AppSubActionV1] = AppSubActionV1
-    AppSubActionError: type[AppSubActionErrorV1] = AppSubActionErrorV1
-    AppSubActionFeeCode: type[AppSubActionFeeCodeV1] = AppSubActionFeeCodeV1
-    AppSubActionType: type[AppSubActionTypeV1] = AppSubActionTypeV1
-    AutoAdjustAdvice: type[AutoAdjustAdviceV1] = AutoAdjustAdviceV1
-    AutoAdjustQualifier: type[AutoAdjustQualifierV1] = AutoAdjustQualifierV1
-    AutoAdjustRule: type[AutoAdjustRuleV1] = AutoAdjustRuleV1
-    BillingArchetype: type[BillingArchetypeV1] = BillingArchetypeV1
-    BillingEntity: type[BillingEntityV1] = BillingEntityV1
-    BillingEntityConfig: type[BillingEntityConfigV1] = BillingEntityConfigV1
-    BillingEventHistory: type[BillingEventHistoryV1] = BillingEventHistoryV1
-    BillingHierarchy: type[BillingHierarchyV1] = BillingHierarchyV1
-    BillingHierarchyCycle: type[BillingHierarchyCycleV1] = BillingHierarchyCycleV1
-    BillingHierarchyType: type[BillingHierarchyTypeV1] = BillingHierarchyTypeV1
-    BillingPseudoEntity: type[BillingPseudoEntityV1] = BillingPseudoEntityV1
-    BillingSchedule: type[BillingScheduleV1] = BillingScheduleV1
-    CellularAction: type[CellularActionV1] = CellularActionV1
-    CellularActionError: type[CellularActionErrorV1] = CellularActionErrorV1
-    CellularActionFeeCode: type[CellularActionFeeCodeV1] = CellularActionFeeCodeV1
-    CellularActionType: type[CellularActionTypeV1] = CellularActionTypeV1
-    ConsumerFailure: type[ConsumerFailureV1] = ConsumerFailureV1
-    ConsumerFailureHistory: type[ConsumerFailureHistoryV1] = ConsumerFailureHistoryV1
-    CycleValidation: type[CycleValidationV1] = CycleValidationV1
-    CycleValidationMutation: type[CycleValidationMutationV1] = CycleValidationMutationV1
-    DeserializableFailure: type[DeserializableFailureV1] = DeserializableFailureV1
-    FeeCategory: type[FeeCategoryV1] = FeeCategoryV1
-    FeeCode: type[FeeCodeV1] = FeeCodeV1
-    FeeCodeApp: type[FeeCodeAppV1] = FeeCodeAppV1
-    FeeCodeLedgerAccount: type[FeeCodeLedgerAccountV1] = FeeCodeLedgerAccountV1
-    FeeCtd: type[FeeCtdV1] = FeeCtdV1
-    FeeRate: type[FeeRateV1] = FeeRateV1
-    FeeRateErrorReport: type[FeeRateErrorReportV1] = FeeRateErrorReportV1
-    FeeRateReportActionError: type[FeeRateReportActionErrorV1] = FeeRateReportActionErrorV1
-    FeeSummary: type[FeeSummaryV1] = FeeSummaryV1
-    FeeSummaryMutation: type[FeeSummaryMutationV1] = FeeSummaryMutationV1
-    FeeTax: type[FeeTaxV1] = FeeTaxV1
-    FeeTaxMutation: type[FeeTaxMutationV1] = FeeTaxMutationV1
-    FeeYtd: type[FeeYtdV1] = FeeYtdV1
-    FlywaySchemaHistory: type[FlywaySchemaHistoryV1] = FlywaySchemaHistoryV1
-    InvoiceAllianceCode: type[InvoiceAllianceCodeV1] = InvoiceAllianceCodeV1
-    InvoiceInfo: type[InvoiceInfoV1] = InvoiceInfoV1
-    InvoiceInfoAmount: type[InvoiceInfoAmountV1] = InvoiceInfoAmountV1
-    InvoiceInfoMutation: type[InvoiceInfoMutationV1] = InvoiceInfoMutationV1
-    InvoiceInfoSettlement: type[InvoiceInfoSettlementV1] = InvoiceInfoSettlementV1
-    JobAssassinationContract: type[JobAssassinationContractV1] = JobAssassinationContractV1
-    JobrunrJobs: type[JobrunrJobsV1] = JobrunrJobsV1
-    JobrunrMetadata: type[JobrunrMetadataV1] = JobrunrMetadataV1
-    JobrunrMigrations: type[JobrunrMigrationsV1] = JobrunrMigrationsV1
-    JobrunrRecurringJobs: type[JobrunrRecurringJobsV1] = JobrunrRecurringJobsV1
-    LedgerAccount: type[LedgerAccountV1] = LedgerAccountV1
-    LedgerAccountAction: type[LedgerAccountActionV1] = LedgerAccountActionV1
-    LedgerAccountBalance: type[LedgerAccountBalanceV1] = LedgerAccountBalanceV1
-    LedgerAccountKey: type[LedgerAccountKeyV1] = LedgerAccountKeyV1
-    LedgerAccountKeyApp: type[LedgerAccountKeyAppV1] = LedgerAccountKeyAppV1
-    LedgerAccountKeyPurpose: type[LedgerAccountKeyPurposeV1] = LedgerAccountKeyPurposeV1
-    LedgerAccountPurpose: type[LedgerAccountPurposeV1] = LedgerAccountPurposeV1
-    LedgerAccountSettlement: type[LedgerAccountSettlementV1] = LedgerAccountSettlementV1
-    LedgerAccountTransition: type[LedgerAccountTransitionV1] = LedgerAccountTransitionV1
-    LedgerJournal: type[LedgerJournalV1] = LedgerJournalV1
-    LedgerJournalMutation: type[LedgerJournalMutationV1] = LedgerJournalMutationV1
-    LexiAttribute: type[LexiAttributeV1] = LexiAttributeV1
-    LexiRule: type[LexiRuleV1] = LexiRuleV1
-    Look: type[LookV1] = LookV1
-    LookData: type[LookDataV1] = LookDataV1
-    MerchantDetail: type[MerchantDetailV1] = MerchantDetailV1
-    MiscAction: type[MiscActionV1] = MiscActionV1
-    MiscActionError: type[MiscActionErrorV1] = MiscActionErrorV1
-    MiscActionFeeCode: type[MiscActionFeeCodeV1] = MiscActionFeeCodeV1
-    MiscActionType: type[MiscActionTypeV1] = MiscActionTypeV1
-    MiscSpecifier: type[MiscSpecifierV1] = MiscSpecifierV1
-    ModelFeeSummary: type[ModelFeeSummaryV1] = ModelFeeSummaryV1
-    MonetaryAdjustment: type[MonetaryAdjustmentV1] = MonetaryAdjustmentV1
-    MonetaryAdjustmentMutation: type[MonetaryAdjustmentMutationV1] = MonetaryAdjustmentMutationV1
-    MonetaryRuleAlias: type[MonetaryRuleAliasV1] = MonetaryRuleAliasV1
-    MonetaryRuleSet: type[MonetaryRuleSetV1] = MonetaryRuleSetV1
-    MonetaryRuleSetRule: type[MonetaryRuleSetRuleV1] = MonetaryRuleSetRuleV1
-    PartnerConfig: type[PartnerConfigV1] = PartnerConfigV1
-    PlanAction: type[PlanActionV1] = PlanActionV1
-    PlanActionError: type[PlanActionErrorV1] = PlanActionErrorV1
-    PlanActionFeeCode: type[PlanActionFeeCodeV1] = PlanActionFeeCodeV1
-    PlanActionType: type[PlanActionTypeV1] = PlanActionTypeV1
-    ProcessingGroupDates: type[ProcessingGroupDatesV1] = ProcessingGroupDatesV1
-    ProcessingNote: type[ProcessingNoteV1] = ProcessingNoteV1
-    ProcessingNoteMutation: type[ProcessingNoteMutationV1] = ProcessingNoteMutationV1
-    PrototypeFeeRate: type[PrototypeFeeRateV1] = PrototypeFeeRateV1
-    PrototypeFeeSet: type[PrototypeFeeSetV1] = PrototypeFeeSetV1
-    RevenueAction: type[RevenueActionV1] = RevenueActionV1
-    RevenueActionError: type[RevenueActionErrorV1] = RevenueActionErrorV1
-    RevenueActionFeeCode: type[RevenueActionFeeCodeV1] = RevenueActionFeeCodeV1
-    RevenueActionType: type[RevenueActionTypeV1] = RevenueActionTypeV1
-    RevenueShareGroup: type[RevenueShareGroupV1] = RevenueShareGroupV1
-    ServerConfig: type[ServerConfigV1] = ServerConfigV1
-    Settlement: type[SettlementV1] = SettlementV1
-    SettlementAction: type[SettlementActionV1] = SettlementActionV1
-    SettlementMutation: type[SettlementMutationV1] = SettlementMutationV1
-    SkipFeeCategoryLexiTag: type[SkipFeeCategoryLexiTagV1] = SkipFeeCategoryLexiTagV1
-    TierDetail: type[TierDetailV1] = TierDetailV1
-    TieredPricing: type[TieredPricingV1] = TieredPricingV1
-    TieredQualifier: type[TieredQualifierV1] = TieredQualifierV1
-    TieredRule: type[TieredRuleV1] = TieredRuleV1
+    AdjustAction: type[AdjustActionV1] = lazy_class("rhizome.models.billing_bookkeeper.adjust_action_v1.AdjustActionV1")
+    AdjustActionFeeCode: type[AdjustActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.adjust_action_fee_code_v1.AdjustActionFeeCodeV1"
+    )
+    AdjustActionType: type[AdjustActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.adjust_action_type_v1.AdjustActionTypeV1"
+    )
+    AdjustReason: type[AdjustReasonV1] = lazy_class("rhizome.models.billing_bookkeeper.adjust_reason_v1.AdjustReasonV1")
+    AppMeterAction: type[AppMeterActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_meter_action_v1.AppMeterActionV1"
+    )
+    AppMeterActionError: type[AppMeterActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_meter_action_error_v1.AppMeterActionErrorV1"
+    )
+    AppMeterActionFeeCode: type[AppMeterActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_meter_action_fee_code_v1.AppMeterActionFeeCodeV1"
+    )
+    AppMeterActionType: type[AppMeterActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_meter_action_type_v1.AppMeterActionTypeV1"
+    )
+    AppSubAction: type[AppSubActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_sub_action_v1.AppSubActionV1"
+    )
+    AppSubActionError: type[AppSubActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_sub_action_error_v1.AppSubActionErrorV1"
+    )
+    AppSubActionFeeCode: type[AppSubActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_sub_action_fee_code_v1.AppSubActionFeeCodeV1"
+    )
+    AppSubActionType: type[AppSubActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.app_sub_action_type_v1.AppSubActionTypeV1"
+    )
+    AutoAdjustAdvice: type[AutoAdjustAdviceV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.auto_adjust_advice_v1.AutoAdjustAdviceV1"
+    )
+    AutoAdjustQualifier: type[AutoAdjustQualifierV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.auto_adjust_qualifier_v1.AutoAdjustQualifierV1"
+    )
+    AutoAdjustRule: type[AutoAdjustRuleV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.auto_adjust_rule_v1.AutoAdjustRuleV1"
+    )
+    BillingArchetype: type[BillingArchetypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_archetype_v1.BillingArchetypeV1"
+    )
+    BillingEntity: type[BillingEntityV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_entity_v1.BillingEntityV1"
+    )
+    BillingEntityConfig: type[BillingEntityConfigV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_entity_config_v1.BillingEntityConfigV1"
+    )
+    BillingEventHistory: type[BillingEventHistoryV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_event_history_v1.BillingEventHistoryV1"
+    )
+    BillingHierarchy: type[BillingHierarchyV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_hierarchy_v1.BillingHierarchyV1"
+    )
+    BillingHierarchyCycle: type[BillingHierarchyCycleV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_hierarchy_cycle_v1.BillingHierarchyCycleV1"
+    )
+    BillingHierarchyType: type[BillingHierarchyTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_hierarchy_type_v1.BillingHierarchyTypeV1"
+    )
+    BillingPseudoEntity: type[BillingPseudoEntityV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_pseudo_entity_v1.BillingPseudoEntityV1"
+    )
+    BillingSchedule: type[BillingScheduleV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_schedule_v1.BillingScheduleV1"
+    )
+    CellularAction: type[CellularActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cellular_action_v1.CellularActionV1"
+    )
+    CellularActionError: type[CellularActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cellular_action_error_v1.CellularActionErrorV1"
+    )
+    CellularActionFeeCode: type[CellularActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cellular_action_fee_code_v1.CellularActionFeeCodeV1"
+    )
+    CellularActionType: type[CellularActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cellular_action_type_v1.CellularActionTypeV1"
+    )
+    ConsumerFailure: type[ConsumerFailureV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.consumer_failure_v1.ConsumerFailureV1"
+    )
+    ConsumerFailureHistory: type[ConsumerFailureHistoryV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.consumer_failure_history_v1.ConsumerFailureHistoryV1"
+    )
+    CycleValidation: type[CycleValidationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cycle_validation_v1.CycleValidationV1"
+    )
+    CycleValidationMutation: type[CycleValidationMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.cycle_validation_mutation_v1.CycleValidationMutationV1"
+    )
+    DeserializableFailure: type[DeserializableFailureV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.deserializable_failure_v1.DeserializableFailureV1"
+    )
+    FeeCategory: type[FeeCategoryV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1")
+    FeeCode: type[FeeCodeV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_code_v1.FeeCodeV1")
+    FeeCodeApp: type[FeeCodeAppV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_code_app_v1.FeeCodeAppV1")
+    FeeCodeLedgerAccount: type[FeeCodeLedgerAccountV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.fee_code_ledger_account_v1.FeeCodeLedgerAccountV1"
+    )
+    FeeCtd: type[FeeCtdV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_ctd_v1.FeeCtdV1")
+    FeeRate: type[FeeRateV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_rate_v1.FeeRateV1")
+    FeeRateErrorReport: type[FeeRateErrorReportV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.fee_rate_error_report_v1.FeeRateErrorReportV1"
+    )
+    FeeRateReportActionError: type[FeeRateReportActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.fee_rate_report_action_error_v1.FeeRateReportActionErrorV1"
+    )
+    FeeSummary: type[FeeSummaryV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_summary_v1.FeeSummaryV1")
+    FeeSummaryMutation: type[FeeSummaryMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.fee_summary_mutation_v1.FeeSummaryMutationV1"
+    )
+    FeeTax: type[FeeTaxV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_tax_v1.FeeTaxV1")
+    FeeTaxMutation: type[FeeTaxMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.fee_tax_mutation_v1.FeeTaxMutationV1"
+    )
+    FeeYtd: type[FeeYtdV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_ytd_v1.FeeYtdV1")
+    FlywaySchemaHistory: type[FlywaySchemaHistoryV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.flyway_schema_history_v1.FlywaySchemaHistoryV1"
+    )
+    InvoiceAllianceCode: type[InvoiceAllianceCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.invoice_alliance_code_v1.InvoiceAllianceCodeV1"
+    )
+    InvoiceInfo: type[InvoiceInfoV1] = lazy_class("rhizome.models.billing_bookkeeper.invoice_info_v1.InvoiceInfoV1")
+    InvoiceInfoAmount: type[InvoiceInfoAmountV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.invoice_info_amount_v1.InvoiceInfoAmountV1"
+    )
+    InvoiceInfoMutation: type[InvoiceInfoMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.invoice_info_mutation_v1.InvoiceInfoMutationV1"
+    )
+    InvoiceInfoSettlement: type[InvoiceInfoSettlementV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.invoice_info_settlement_v1.InvoiceInfoSettlementV1"
+    )
+    JobAssassinationContract: type[JobAssassinationContractV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.job_assassination_contract_v1.JobAssassinationContractV1"
+    )
+    JobrunrJobs: type[JobrunrJobsV1] = lazy_class("rhizome.models.billing_bookkeeper.jobrunr_jobs_v1.JobrunrJobsV1")
+    JobrunrMetadata: type[JobrunrMetadataV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.jobrunr_metadata_v1.JobrunrMetadataV1"
+    )
+    JobrunrMigrations: type[JobrunrMigrationsV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.jobrunr_migrations_v1.JobrunrMigrationsV1"
+    )
+    JobrunrRecurringJobs: type[JobrunrRecurringJobsV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.jobrunr_recurring_jobs_v1.JobrunrRecurringJobsV1"
+    )
+    LedgerAccount: type[LedgerAccountV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_v1.LedgerAccountV1"
+    )
+    LedgerAccountAction: type[LedgerAccountActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_action_v1.LedgerAccountActionV1"
+    )
+    LedgerAccountBalance: type[LedgerAccountBalanceV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_balance_v1.LedgerAccountBalanceV1"
+    )
+    LedgerAccountKey: type[LedgerAccountKeyV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_key_v1.LedgerAccountKeyV1"
+    )
+    LedgerAccountKeyApp: type[LedgerAccountKeyAppV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_key_app_v1.LedgerAccountKeyAppV1"
+    )
+    LedgerAccountKeyPurpose: type[LedgerAccountKeyPurposeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_key_purpose_v1.LedgerAccountKeyPurposeV1"
+    )
+    LedgerAccountPurpose: type[LedgerAccountPurposeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_purpose_v1.LedgerAccountPurposeV1"
+    )
+    LedgerAccountSettlement: type[LedgerAccountSettlementV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_settlement_v1.LedgerAccountSettlementV1"
+    )
+    LedgerAccountTransition: type[LedgerAccountTransitionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_account_transition_v1.LedgerAccountTransitionV1"
+    )
+    LedgerJournal: type[LedgerJournalV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_journal_v1.LedgerJournalV1"
+    )
+    LedgerJournalMutation: type[LedgerJournalMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.ledger_journal_mutation_v1.LedgerJournalMutationV1"
+    )
+    LexiAttribute: type[LexiAttributeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.lexi_attribute_v1.LexiAttributeV1"
+    )
+    LexiRule: type[LexiRuleV1] = lazy_class("rhizome.models.billing_bookkeeper.lexi_rule_v1.LexiRuleV1")
+    Look: type[LookV1] = lazy_class("rhizome.models.billing_bookkeeper.look_v1.LookV1")
+    LookData: type[LookDataV1] = lazy_class("rhizome.models.billing_bookkeeper.look_data_v1.LookDataV1")
+    MerchantDetail: type[MerchantDetailV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.merchant_detail_v1.MerchantDetailV1"
+    )
+    MiscAction: type[MiscActionV1] = lazy_class("rhizome.models.billing_bookkeeper.misc_action_v1.MiscActionV1")
+    MiscActionError: type[MiscActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.misc_action_error_v1.MiscActionErrorV1"
+    )
+    MiscActionFeeCode: type[MiscActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.misc_action_fee_code_v1.MiscActionFeeCodeV1"
+    )
+    MiscActionType: type[MiscActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.misc_action_type_v1.MiscActionTypeV1"
+    )
+    MiscSpecifier: type[MiscSpecifierV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.misc_specifier_v1.MiscSpecifierV1"
+    )
+    ModelFeeSummary: type[ModelFeeSummaryV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.model_fee_summary_v1.ModelFeeSummaryV1"
+    )
+    MonetaryAdjustment: type[MonetaryAdjustmentV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.monetary_adjustment_v1.MonetaryAdjustmentV1"
+    )
+    MonetaryAdjustmentMutation: type[MonetaryAdjustmentMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.monetary_adjustment_mutation_v1.MonetaryAdjustmentMutationV1"
+    )
+    MonetaryRuleAlias: type[MonetaryRuleAliasV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.monetary_rule_alias_v1.MonetaryRuleAliasV1"
+    )
+    MonetaryRuleSet: type[MonetaryRuleSetV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.monetary_rule_set_v1.MonetaryRuleSetV1"
+    )
+    MonetaryRuleSetRule: type[MonetaryRuleSetRuleV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.monetary_rule_set_rule_v1.MonetaryRuleSetRuleV1"
+    )
+    PartnerConfig: type[PartnerConfigV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.partner_config_v1.PartnerConfigV1"
+    )
+    PlanAction: type[PlanActionV1] = lazy_class("rhizome.models.billing_bookkeeper.plan_action_v1.PlanActionV1")
+    PlanActionError: type[PlanActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.plan_action_error_v1.PlanActionErrorV1"
+    )
+    PlanActionFeeCode: type[PlanActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.plan_action_fee_code_v1.PlanActionFeeCodeV1"
+    )
+    PlanActionType: type[PlanActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.plan_action_type_v1.PlanActionTypeV1"
+    )
+    ProcessingGroupDates: type[ProcessingGroupDatesV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.processing_group_dates_v1.ProcessingGroupDatesV1"
+    )
+    ProcessingNote: type[ProcessingNoteV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.processing_note_v1.ProcessingNoteV1"
+    )
+    ProcessingNoteMutation: type[ProcessingNoteMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.processing_note_mutation_v1.ProcessingNoteMutationV1"
+    )
+    PrototypeFeeRate: type[PrototypeFeeRateV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.prototype_fee_rate_v1.PrototypeFeeRateV1"
+    )
+    PrototypeFeeSet: type[PrototypeFeeSetV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.prototype_fee_set_v1.PrototypeFeeSetV1"
+    )
+    RevenueAction: type[RevenueActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.revenue_action_v1.RevenueActionV1"
+    )
+    RevenueActionError: type[RevenueActionErrorV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.revenue_action_error_v1.RevenueActionErrorV1"
+    )
+    RevenueActionFeeCode: type[RevenueActionFeeCodeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.revenue_action_fee_code_v1.RevenueActionFeeCodeV1"
+    )
+    RevenueActionType: type[RevenueActionTypeV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.revenue_action_type_v1.RevenueActionTypeV1"
+    )
+    RevenueShareGroup: type[RevenueShareGroupV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.revenue_share_group_v1.RevenueShareGroupV1"
+    )
+    ServerConfig: type[ServerConfigV1] = lazy_class("rhizome.models.billing_bookkeeper.server_config_v1.ServerConfigV1")
+    Settlement: type[SettlementV1] = lazy_class("rhizome.models.billing_bookkeeper.settlement_v1.SettlementV1")
+    SettlementAction: type[SettlementActionV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.settlement_action_v1.SettlementActionV1"
+    )
+    SettlementMutation: type[SettlementMutationV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.settlement_mutation_v1.SettlementMutationV1"
+    )
+    SkipFeeCategoryLexiTag: type[SkipFeeCategoryLexiTagV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.skip_fee_category_lexi_tag_v1.SkipFeeCategoryLexiTagV1"
+    )
+    TierDetail: type[TierDetailV1] = lazy_class("rhizome.models.billing_bookkeeper.tier_detail_v1.TierDetailV1")
+    TieredPricing: type[TieredPricingV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.tiered_pricing_v1.TieredPricingV1"
+    )
+    TieredQualifier: type[TieredQualifierV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.tiered_qualifier_v1.TieredQualifierV1"
+    )
+    TieredRule: type[TieredRuleV1] = lazy_class("rhizome.models.billing_bookkeeper.tiered_rule_v1.TieredRuleV1")
 
     def tables(self) -> list[StrEnum]:
         return list(BillingBookkeeperTable)
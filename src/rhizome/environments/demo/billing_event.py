@@ -8,196 +8,337 @@ demo cluster through CloudSQL proxy port-forwarding.
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rhizome.environments.base import DatabaseConfig, Environment, PortForwardConfig, SecretManager, Tools
-from rhizome.environments.demo.expected_data.billing_event_app_metered_event import AppMeteredEventDemo
-from rhizome.environments.demo.expected_data.billing_event_app_subscription_current import AppSubscriptionCurrentDemo
-from rhizome.environments.demo.expected_data.billing_event_app_subscription_daily import AppSubscriptionDailyDemo
-from rhizome.environments.demo.expected_data.billing_event_app_subscription_event import AppSubscriptionEventDemo
-from rhizome.environments.demo.expected_data.billing_event_as_of_merchant import AsOfMerchantDemo
-from rhizome.environments.demo.expected_data.billing_event_as_of_merchant_device import AsOfMerchantDeviceDemo
-from rhizome.environments.demo.expected_data.billing_event_as_of_merchant_plan import AsOfMerchantPlanDemo
-from rhizome.environments.demo.expected_data.billing_event_backfill_acceptance import BackfillAcceptanceDemo
-from rhizome.environments.demo.expected_data.billing_event_billing_event_history import BillingEventHistoryDemo
-from rhizome.environments.demo.expected_data.billing_event_cellular_arrears_acceptances import (
-    CellularArrearsAcceptancesDemo,
-)
-from rhizome.environments.demo.expected_data.billing_event_cellular_billing_arrears_info import (
-    CellularBillingArrearsInfoDemo,
-)
-from rhizome.environments.demo.expected_data.billing_event_consumer_failure import ConsumerFailureDemo
-from rhizome.environments.demo.expected_data.billing_event_consumer_failure_history import ConsumerFailureHistoryDemo
-from rhizome.environments.demo.expected_data.billing_event_deserializable_failure import DeserializableFailureDemo
-from rhizome.environments.demo.expected_data.billing_event_event_filter import EventFilterDemo
-from rhizome.environments.demo.expected_data.billing_event_event_ignored import EventIgnoredDemo
-from rhizome.environments.demo.expected_data.billing_event_iccid_carrier import IccidCarrierDemo
-from rhizome.environments.demo.expected_data.billing_event_job_assassination_contract import (
-    JobAssassinationContractDemo,
-)
-from rhizome.environments.demo.expected_data.billing_event_jobrunr_backgroundjobservers import (
-    JobrunrBackgroundjobserversDemo,
-)
-from rhizome.environments.demo.expected_data.billing_event_jobrunr_jobs import JobrunrJobsDemo
-from rhizome.environments.demo.expected_data.billing_event_jobrunr_metadata import JobrunrMetadataDemo
-from rhizome.environments.demo.expected_data.billing_event_jobrunr_migrations import JobrunrMigrationsDemo
-from rhizome.environments.demo.expected_data.billing_event_jobrunr_recurring_jobs import JobrunrRecurringJobsDemo
-from rhizome.environments.demo.expected_data.billing_event_look import LookDemo
-from rhizome.environments.demo.expected_data.billing_event_look_data import LookDataDemo
-from rhizome.environments.demo.expected_data.billing_event_managed_item import ManagedItemDemo
-from rhizome.environments.demo.expected_data.billing_event_merchant_acceptance import MerchantAcceptanceDemo
-from rhizome.environments.demo.expected_data.billing_event_merchant_evolution import MerchantEvolutionDemo
-from rhizome.environments.demo.expected_data.billing_event_merchant_offboarding import MerchantOffboardingDemo
-from rhizome.environments.demo.expected_data.billing_event_merchant_payment import MerchantPaymentDemo
-from rhizome.environments.demo.expected_data.billing_event_merchant_payment_history import MerchantPaymentHistoryDemo
-from rhizome.environments.demo.expected_data.billing_event_migrated_merchant import MigratedMerchantDemo
-from rhizome.environments.demo.expected_data.billing_event_mlc_captured_event import MlcCapturedEventDemo
-from rhizome.environments.demo.expected_data.billing_event_pending_event import PendingEventDemo
-from rhizome.environments.demo.expected_data.billing_event_plan_billing_latest import PlanBillingLatestDemo
-from rhizome.environments.demo.expected_data.billing_event_plan_meta import PlanMetaDemo
-from rhizome.environments.demo.expected_data.billing_event_plan_trial import PlanTrialDemo
-from rhizome.environments.demo.expected_data.billing_event_producer_failure import ProducerFailureDemo
-from rhizome.environments.demo.expected_data.billing_event_producer_failure_history import ProducerFailureHistoryDemo
-from rhizome.environments.demo.expected_data.billing_event_server_config import ServerConfigDemo
-from rhizome.environments.demo.expected_data.billing_event_test_merchant_criteria import TestMerchantCriteriaDemo
-from rhizome.environments.demo.expected_data.billing_event_uninstalled_app import UninstalledAppDemo
+from rhizome.lazy import LazyMapping, lazy_class
 from rhizome.models.base import Emplacement, RhizomeModel
-from rhizome.models.billing_event.app_metered_event_v1 import AppMeteredEventV1
-from rhizome.models.billing_event.app_subscription_current_v1 import AppSubscriptionCurrentV1
-from rhizome.models.billing_event.app_subscription_daily_v1 import AppSubscriptionDailyV1
-from rhizome.models.billing_event.app_subscription_event_v1 import AppSubscriptionEventV1
-from rhizome.models.billing_event.as_of_merchant_device_v1 import AsOfMerchantDeviceV1
-from rhizome.models.billing_event.as_of_merchant_plan_v2 import AsOfMerchantPlanV2
-from rhizome.models.billing_event.as_of_merchant_v2 import AsOfMerchantV2
-from rhizome.models.billing_event.backfill_acceptance_v1 import BackfillAcceptanceV1
-from rhizome.models.billing_event.billing_event_history_v1 import BillingEventHistoryV1
-from rhizome.models.billing_event.cellular_arrears_acceptances_v1 import CellularArrearsAcceptancesV1
-from rhizome.models.billing_event.cellular_billing_arrears_info_v1 import CellularBillingArrearsInfoV1
-from rhizome.models.billing_event.consumer_failure_history_v1 import ConsumerFailureHistoryV1
-from rhizome.models.billing_event.consumer_failure_v1 import ConsumerFailureV1
-from rhizome.models.billing_event.deserializable_failure_v1 import DeserializableFailureV1
-from rhizome.models.billing_event.event_filter_v1 import EventFilterV1
-from rhizome.models.billing_event.event_ignored_v1 import EventIgnoredV1
-from rhizome.models.billing_event.iccid_carrier_v1 import IccidCarrierV1
-from rhizome.models.billing_event.job_assassination_contract_v1 import JobAssassinationContractV1
-from rhizome.models.billing_event.jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
-from rhizome.models.billing_event.jobrunr_jobs_v1 import JobrunrJobsV1
-from rhizome.models.billing_event.jobrunr_metadata_v1 import JobrunrMetadataV1
-from rhizome.models.billing_event.jobrunr_migrations_v1 import JobrunrMigrationsV1
-from rhizome.models.billing_event.jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
-from rhizome.models.billing_event.look_data_v1 import LookDataV1
-from rhizome.models.billing_event.look_v1 import LookV1
-from rhizome.models.billing_event.managed_item_v1 import ManagedItemV1
-from rhizome.models.billing_event.merchant_acceptance_v1 import MerchantAcceptanceV1
-from rhizome.models.billing_event.merchant_evolution_v2 import MerchantEvolutionV2
-from rhizome.models.billing_event.merchant_offboarding_v1 import MerchantOffboardingV1
-from rhizome.models.billing_event.merchant_payment_history_v1 import MerchantPaymentHistoryV1
-from rhizome.models.billing_event.merchant_payment_v1 import MerchantPaymentV1
-from rhizome.models.billing_event.migrated_merchant_v1 import MigratedMerchantV1
-from rhizome.models.billing_event.mlc_captured_event_v1 import MlcCapturedEventV1
-from rhizome.models.billing_event.pending_event_v1 import PendingEventV1
-from rhizome.models.billing_event.plan_billing_latest_v1 import PlanBillingLatestV1
-from rhizome.models.billing_event.plan_meta_v1 import PlanMetaV1
-from rhizome.models.billing_event.plan_trial_v1 import PlanTrialV1
-from rhizome.models.billing_event.producer_failure_history_v1 import ProducerFailureHistoryV1
-from rhizome.models.billing_event.producer_failure_v1 import ProducerFailureV1
-from rhizome.models.billing_event.server_config_v1 import ServerConfigV1
-from rhizome.models.billing_event.test_merchant_criteria_v1 import TestMerchantCriteriaV1
-from rhizome.models.billing_event.uninstalled_app_v1 import UninstalledAppV1
 from rhizome.models.table_list import BillingEventTable
 
-models: dict[BillingEventTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = {
-    BillingEventTable.app_metered_event: (AppMeteredEventV1, AppMeteredEventDemo),
-    BillingEventTable.app_subscription_current: (AppSubscriptionCurrentV1, AppSubscriptionCurrentDemo),
-    BillingEventTable.app_subscription_daily: (AppSubscriptionDailyV1, AppSubscriptionDailyDemo),
-    BillingEventTable.app_subscription_event: (AppSubscriptionEventV1, AppSubscriptionEventDemo),
-    BillingEventTable.as_of_merchant: (AsOfMerchantV2, AsOfMerchantDemo),
-    BillingEventTable.as_of_merchant_device: (AsOfMerchantDeviceV1, AsOfMerchantDeviceDemo),
-    BillingEventTable.as_of_merchant_plan: (AsOfMerchantPlanV2, AsOfMerchantPlanDemo),
-    BillingEventTable.backfill_acceptance: (BackfillAcceptanceV1, BackfillAcceptanceDemo),
-    BillingEventTable.billing_event_history: (BillingEventHistoryV1, BillingEventHistoryDemo),
-    BillingEventTable.cellular_arrears_acceptances: (CellularArrearsAcceptancesV1, CellularArrearsAcceptancesDemo),
-    BillingEventTable.cellular_billing_arrears_info: (CellularBillingArrearsInfoV1, CellularBillingArrearsInfoDemo),
-    BillingEventTable.consumer_failure: (ConsumerFailureV1, ConsumerFailureDemo),
-    BillingEventTable.consumer_failure_history: (ConsumerFailureHistoryV1, ConsumerFailureHistoryDemo),
-    BillingEventTable.deserializable_failure: (DeserializableFailureV1, DeserializableFailureDemo),
-    BillingEventTable.event_filter: (EventFilterV1, EventFilterDemo),
-    BillingEventTable.event_ignored: (EventIgnoredV1, EventIgnoredDemo),
-    BillingEventTable.iccid_carrier: (IccidCarrierV1, IccidCarrierDemo),
-    BillingEventTable.job_assassination_contract: (JobAssassinationContractV1, JobAssassinationContractDemo),
-    BillingEventTable.jobrunr_backgroundjobservers: (JobrunrBackgroundjobserversV1, JobrunrBackgroundjobserversDemo),
-    BillingEventTable.jobrunr_jobs: (JobrunrJobsV1, JobrunrJobsDemo),
-    BillingEventTable.jobrunr_metadata: (JobrunrMetadataV1, JobrunrMetadataDemo),
-    BillingEventTable.jobrunr_migrations: (JobrunrMigrationsV1, JobrunrMigrationsDemo),
-    BillingEventTable.jobrunr_recurring_jobs: (JobrunrRecurringJobsV1, JobrunrRecurringJobsDemo),
-    BillingEventTable.look: (LookV1, LookDemo),
-    BillingEventTable.look_data: (LookDataV1, LookDataDemo),
-    BillingEventTable.managed_item: (ManagedItemV1, ManagedItemDemo),
-    BillingEventTable.merchant_acceptance: (MerchantAcceptanceV1, MerchantAcceptanceDemo),
-    BillingEventTable.merchant_evolution: (MerchantEvolutionV2, MerchantEvolutionDemo),
-    BillingEventTable.merchant_offboarding: (MerchantOffboardingV1, MerchantOffboardingDemo),
-    BillingEventTable.merchant_payment: (MerchantPaymentV1, MerchantPaymentDemo),
-    BillingEventTable.merchant_payment_history: (MerchantPaymentHistoryV1, MerchantPaymentHistoryDemo),
-    BillingEventTable.migrated_merchant: (MigratedMerchantV1, MigratedMerchantDemo),
-    BillingEventTable.mlc_captured_event: (MlcCapturedEventV1, MlcCapturedEventDemo),
-    BillingEventTable.pending_event: (PendingEventV1, PendingEventDemo),
-    BillingEventTable.plan_billing_latest: (PlanBillingLatestV1, PlanBillingLatestDemo),
-    BillingEventTable.plan_meta: (PlanMetaV1, PlanMetaDemo),
-    BillingEventTable.plan_trial: (PlanTrialV1, PlanTrialDemo),
-    BillingEventTable.producer_failure: (ProducerFailureV1, ProducerFailureDemo),
-    BillingEventTable.producer_failure_history: (ProducerFailureHistoryV1, ProducerFailureHistoryDemo),
-    BillingEventTable.server_config: (ServerConfigV1, ServerConfigDemo),
-    BillingEventTable.test_merchant_criteria: (TestMerchantCriteriaV1, TestMerchantCriteriaDemo),
-    BillingEventTable.uninstalled_app: (UninstalledAppV1, UninstalledAppDemo),
-}
+if TYPE_CHECKING:
+    from rhizome.models.billing_event.app_metered_event_v1 import AppMeteredEventV1
+    from rhizome.models.billing_event.app_subscription_current_v1 import AppSubscriptionCurrentV1
+    from rhizome.models.billing_event.app_subscription_daily_v1 import AppSubscriptionDailyV1
+    from rhizome.models.billing_event.app_subscription_event_v1 import AppSubscriptionEventV1
+    from rhizome.models.billing_event.as_of_merchant_device_v1 import AsOfMerchantDeviceV1
+    from rhizome.models.billing_event.as_of_merchant_plan_v2 import AsOfMerchantPlanV2
+    from rhizome.models.billing_event.as_of_merchant_v2 import AsOfMerchantV2
+    from rhizome.models.billing_event.backfill_acceptance_v1 import BackfillAcceptanceV1
+    from rhizome.models.billing_event.billing_event_history_v1 import BillingEventHistoryV1
+    from rhizome.models.billing_event.cellular_arrears_acceptances_v1 import CellularArrearsAcceptancesV1
+    from rhizome.models.billing_event.cellular_billing_arrears_info_v1 import CellularBillingArrearsInfoV1
+    from rhizome.models.billing_event.consumer_failure_history_v1 import ConsumerFailureHistoryV1
+    from rhizome.models.billing_event.consumer_failure_v1 import ConsumerFailureV1
+    from rhizome.models.billing_event.deserializable_failure_v1 import DeserializableFailureV1
+    from rhizome.models.billing_event.event_filter_v1 import EventFilterV1
+    from rhizome.models.billing_event.event_ignored_v1 import EventIgnoredV1
+    from rhizome.models.billing_event.iccid_carrier_v1 import IccidCarrierV1
+    from rhizome.models.billing_event.job_assassination_contract_v1 import JobAssassinationContractV1
+    from rhizome.models.billing_event.jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
+    from rhizome.models.billing_event.jobrunr_jobs_v1 import JobrunrJobsV1
+    from rhizome.models.billing_event.jobrunr_metadata_v1 import JobrunrMetadataV1
+    from rhizome.models.billing_event.jobrunr_migrations_v1 import JobrunrMigrationsV1
+    from rhizome.models.billing_event.jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
+    from rhizome.models.billing_event.look_data_v1 import LookDataV1
+    from rhizome.models.billing_event.look_v1 import LookV1
+    from rhizome.models.billing_event.managed_item_v1 import ManagedItemV1
+    from rhizome.models.billing_event.merchant_acceptance_v1 import MerchantAcceptanceV1
+    from rhizome.models.billing_event.merchant_evolution_v2 import MerchantEvolutionV2
+    from rhizome.models.billing_event.merchant_offboarding_v1 import MerchantOffboardingV1
+    from rhizome.models.billing_event.merchant_payment_history_v1 import MerchantPaymentHistoryV1
+    from rhizome.models.billing_event.merchant_payment_v1 import MerchantPaymentV1
+    from rhizome.models.billing_event.migrated_merchant_v1 import MigratedMerchantV1
+    from rhizome.models.billing_event.mlc_captured_event_v1 import MlcCapturedEventV1
+    from rhizome.models.billing_event.pending_event_v1 import PendingEventV1
+    from rhizome.models.billing_event.plan_billing_latest_v1 import PlanBillingLatestV1
+    from rhizome.models.billing_event.plan_meta_v1 import PlanMetaV1
+    from rhizome.models.billing_event.plan_trial_v1 import PlanTrialV1
+    from rhizome.models.billing_event.producer_failure_history_v1 import ProducerFailureHistoryV1
+    from rhizome.models.billing_event.producer_failure_v1 import ProducerFailureV1
+    from rhizome.models.billing_event.server_config_v1 import ServerConfigV1
+    from rhizome.models.billing_event.test_merchant_criteria_v1 import TestMerchantCriteriaV1
+    from rhizome.models.billing_event.uninstalled_app_v1 import UninstalledAppV1
+
+models: LazyMapping[BillingEventTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = LazyMapping(
+    {
+        BillingEventTable.app_metered_event: (
+            "rhizome.models.billing_event.app_metered_event_v1.AppMeteredEventV1",
+            "rhizome.environments.demo.expected_data.billing_event_app_metered_event.AppMeteredEventDemo",
+        ),
+        BillingEventTable.app_subscription_current: (
+            "rhizome.models.billing_event.app_subscription_current_v1.AppSubscriptionCurrentV1",
+            "rhizome.environments.demo.expected_data.billing_event_app_subscription_current.AppSubscriptionCurrentDemo",
+        ),
+        BillingEventTable.app_subscription_daily: (
+            "rhizome.models.billing_event.app_subscription_daily_v1.AppSubscriptionDailyV1",
+            "rhizome.environments.demo.expected_data.billing_event_app_subscription_daily.AppSubscriptionDailyDemo",
+        ),
+        BillingEventTable.app_subscription_event: (
+            "rhizome.models.billing_event.app_subscription_event_v1.AppSubscriptionEventV1",
+            "rhizome.environments.demo.expected_data.billing_event_app_subscription_event.AppSubscriptionEventDemo",
+        ),
+        BillingEventTable.as_of_merchant: (
+            "rhizome.models.billing_event.as_of_merchant_v2.AsOfMerchantV2",
+            "rhizome.environments.demo.expected_data.billing_event_as_of_merchant.AsOfMerchantDemo",
+        ),
+        BillingEventTable.as_of_merchant_device: (
+            "rhizome.models.billing_event.as_of_merchant_device_v1.AsOfMerchantDeviceV1",
+            "rhizome.environments.demo.expected_data.billing_event_as_of_merchant_device.AsOfMerchantDeviceDemo",
+        ),
+        BillingEventTable.as_of_merchant_plan: (
+            "rhizome.models.billing_event.as_of_merchant_plan_v2.AsOfMerchantPlanV2",
+            "rhizome.environments.demo.expected_data.billing_event_as_of_merchant_plan.AsOfMerchantPlanDemo",
+        ),
+        BillingEventTable.backfill_acceptance: (
+            "rhizome.models.billing_event.backfill_acceptance_v1.BackfillAcceptanceV1",
+            "rhizome.environments.demo.expected_data.billing_event_backfill_acceptance.BackfillAcceptanceDemo",
+        ),
+        BillingEventTable.billing_event_history: (
+            "rhizome.models.billing_event.billing_event_history_v1.BillingEventHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_event_billing_event_history.BillingEventHistoryDemo",
+        ),
+        BillingEventTable.cellular_arrears_acceptances: (
+            "rhizome.models.billing_event.cellular_arrears_acceptances_v1.CellularArrearsAcceptancesV1",
+            "rhizome.environments.demo.expected_data.billing_event_cellular_arrears_acceptances.CellularArrearsAcceptancesDemo",
+        ),
+        BillingEventTable.cellular_billing_arrears_info: (
+            "rhizome.models.billing_event.cellular_billing_arrears_info_v1.CellularBillingArrearsInfoV1",
+            "rhizome.environments.demo.expected_data.billing_event_cellular_billing_arrears_info.CellularBillingArrearsInfoDemo",
+        ),
+        BillingEventTable.consumer_failure: (
+            "rhizome.models.billing_event.consumer_failure_v1.ConsumerFailureV1",
+            "rhizome.environments.demo.expected_data.billing_event_consumer_failure.ConsumerFailureDemo",
+        ),
+        BillingEventTable.consumer_failure_history: (
+            "rhizome.models.billing_event.consumer_failure_history_v1.ConsumerFailureHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_event_consumer_failure_history.ConsumerFailureHistoryDemo",
+        ),
+        BillingEventTable.deserializable_failure: (
+            "rhizome.models.billing_event.deserializable_failure_v1.DeserializableFailureV1",
+            "rhizome.environments.demo.expected_data.billing_event_deserializable_failure.DeserializableFailureDemo",
+        ),
+        BillingEventTable.event_filter: (
+            "rhizome.models.billing_event.event_filter_v1.EventFilterV1",
+            "rhizome.environments.demo.expected_data.billing_event_event_filter.EventFilterDemo",
+        ),
+        BillingEventTable.event_ignored: (
+            "rhizome.models.billing_event.event_ignored_v1.EventIgnoredV1",
+            "rhizome.environments.demo.expected_data.billing_event_event_ignored.EventIgnoredDemo",
+        ),
+        BillingEventTable.iccid_carrier: (
+            "rhizome.models.billing_event.iccid_carrier_v1.IccidCarrierV1",
+            "rhizome.environments.demo.expected_data.billing_event_iccid_carrier.IccidCarrierDemo",
+        ),
+        BillingEventTable.job_assassination_contract: (
+            "rhizome.models.billing_event.job_assassination_contract_v1.JobAssassinationContractV1",
+            "rhizome.environments.demo.expected_data.billing_event_job_assassination_contract.JobAssassinationContractDemo",
+        ),
+        BillingEventTable.jobrunr_backgroundjobservers: (
+            "rhizome.models.billing_event.jobrunr_backgroundjobservers_v1.JobrunrBackgroundjobserversV1",
+            "rhizome.environments.demo.expected_data.billing_event_jobrunr_backgroundjobservers.JobrunrBackgroundjobserversDemo",
+        ),
+        BillingEventTable.jobrunr_jobs: (
+            "rhizome.models.billing_event.jobrunr_jobs_v1.JobrunrJobsV1",
+            "rhizome.environments.demo.expected_data.billing_event_jobrunr_jobs.JobrunrJobsDemo",
+        ),
+        BillingEventTable.jobrunr_metadata: (
+            "rhizome.models.billing_event.jobrunr_metadata_v1.JobrunrMetadataV1",
+            "rhizome.environments.demo.expected_data.billing_event_jobrunr_metadata.JobrunrMetadataDemo",
+        ),
+        BillingEventTable.jobrunr_migrations: (
+            "rhizome.models.billing_event.jobrunr_migrations_v1.JobrunrMigrationsV1",
+            "rhizome.environments.demo.expected_data.billing_event_jobrunr_migrations.JobrunrMigrationsDemo",
+        ),
+        BillingEventTable.jobrunr_recurring_jobs: (
+            "rhizome.models.billing_event.jobrunr_recurring_jobs_v1.JobrunrRecurringJobsV1",
+            "rhizome.environments.demo.expected_data.billing_event_jobrunr_recurring_jobs.JobrunrRecurringJobsDemo",
+        ),
+        BillingEventTable.look: (
+            "rhizome.models.billing_event.look_v1.LookV1",
+            "rhizome.environments.demo.expected_data.billing_event_look.LookDemo",
+        ),
+        BillingEventTable.look_data: (
+            "rhizome.models.billing_event.look_data_v1.LookDataV1",
+            "rhizome.environments.demo.expected_data.billing_event_look_data.LookDataDemo",
+        ),
+        BillingEventTable.managed_item: (
+            "rhizome.models.billing_event.managed_item_v1.ManagedItemV1",
+            "rhizome.environments.demo.expected_data.billing_event_managed_item.ManagedItemDemo",
+        ),
+        BillingEventTable.merchant_acceptance: (
+            "rhizome.models.billing_event.merchant_acceptance_v1.MerchantAcceptanceV1",
+            "rhizome.environments.demo.expected_data.billing_event_merchant_acceptance.MerchantAcceptanceDemo",
+        ),
+        BillingEventTable.merchant_evolution: (
+            "rhizome.models.billing_event.merchant_evolution_v2.MerchantEvolutionV2",
+            "rhizome.environments.demo.expected_data.billing_event_merchant_evolution.MerchantEvolutionDemo",
+        ),
+        BillingEventTable.merchant_offboarding: (
+            "rhizome.models.billing_event.merchant_offboarding_v1.MerchantOffboardingV1",
+            "rhizome.environments.demo.expected_data.billing_event_merchant_offboarding.MerchantOffboardingDemo",
+        ),
+        BillingEventTable.merchant_payment: (
+            "rhizome.models.billing_event.merchant_payment_v1.MerchantPaymentV1",
+            "rhizome.environments.demo.expected_data.billing_event_merchant_payment.MerchantPaymentDemo",
+        ),
+        BillingEventTable.merchant_payment_history: (
+            "rhizome.models.billing_event.merchant_payment_history_v1.MerchantPaymentHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_event_merchant_payment_history.MerchantPaymentHistoryDemo",
+        ),
+        BillingEventTable.migrated_merchant: (
+            "rhizome.models.billing_event.migrated_merchant_v1.MigratedMerchantV1",
+            "rhizome.environments.demo.expected_data.billing_event_migrated_merchant.MigratedMerchantDemo",
+        ),
+        BillingEventTable.mlc_captured_event: (
+            "rhizome.models.billing_event.mlc_captured_event_v1.MlcCapturedEventV1",
+            "rhizome.environments.demo.expected_data.billing_event_mlc_captured_event.MlcCapturedEventDemo",
+        ),
+        BillingEventTable.pending_event: (
+            "rhizome.models.billing_event.pending_event_v1.PendingEventV1",
+            "rhizome.environments.demo.expected_data.billing_event_pending_event.PendingEventDemo",
+        ),
+        BillingEventTable.plan_billing_latest: (
+            "rhizome.models.billing_event.plan_billing_latest_v1.PlanBillingLatestV1",
+            "rhizome.environments.demo.expected_data.billing_event_plan_billing_latest.PlanBillingLatestDemo",
+        ),
+        BillingEventTable.plan_meta: (
+            "rhizome.models.billing_event.plan_meta_v1.PlanMetaV1",
+            "rhizome.environments.demo.expected_data.billing_event_plan_meta.PlanMetaDemo",
+        ),
+        BillingEventTable.plan_trial: (
+            "rhizome.models.billing_event.plan_trial_v1.PlanTrialV1",
+            "rhizome.environments.demo.expected_data.billing_event_plan_trial.PlanTrialDemo",
+        ),
+        BillingEventTable.producer_failure: (
+            "rhizome.models.billing_event.producer_failure_v1.ProducerFailureV1",
+            "rhizome.environments.demo.expected_data.billing_event_producer_failure.ProducerFailureDemo",
+        ),
+        BillingEventTable.producer_failure_history: (
+            "rhizome.models.billing_event.producer_failure_history_v1.ProducerFailureHistoryV1",
+            "rhizome.environments.demo.expected_data.billing_event_producer_failure_history.ProducerFailureHistoryDemo",
+        ),
+        BillingEventTable.server_config: (
+            "rhizome.models.billing_event.server_config_v1.ServerConfigV1",
+            "rhizome.environments.demo.expected_data.billing_event_server_config.ServerConfigDemo",
+        ),
+        BillingEventTable.test_merchant_criteria: (
+            "rhizome.models.billing_event.test_merchant_criteria_v1.TestMerchantCriteriaV1",
+            "rhizome.environments.demo.expected_data.billing_event_test_merchant_criteria.TestMerchantCriteriaDemo",
+        ),
+        BillingEventTable.uninstalled_app: (
+            "rhizome.models.billing_event.uninstalled_app_v1.UninstalledAppV1",
+            "rhizome.environments.demo.expected_data.billing_event_uninstalled_app.UninstalledAppDemo",
+        ),
+    }
+)
 
 
 class DemoBillingEvent(Environment):
     """Demo billing event environment using CloudSQL."""
 
     # Type aliases for environment-specific model versions
-    AppMeteredEvent: type[AppMeteredEventV1] = AppMeteredEventV1
-    AppSubscriptionCurrent: type[AppSubscriptionCurrentV1] = AppSubscriptionCurrentV1
-    AppSubscriptionDaily: type[AppSubscriptionDailyV1] = AppSubscriptionDailyV1
-    AppSubscriptionEvent: type[AppSubscriptionEventV1] = AppSubscriptionEventV1
-    AsOfMerchant: type[AsOfMerchantV2] = AsOfMerchantV2
-    AsOfMerchantDevice: type[AsOfMerchantDeviceV1] = AsOfMerchantDeviceV1
-    AsOfMerchantPlan: type[AsOfMerchantPlanV2] = AsOfMerchantPlanV2
-    BackfillAcceptance: type[BackfillAcceptanceV1] = BackfillAcceptanceV1
-    BillingEventHistory: type[BillingEventHistoryV1] = BillingEventHistoryV1
-    CellularArrearsAcceptances: type[CellularArrearsAcceptancesV1] = CellularArrearsAcceptancesV1
-    CellularBillingArrearsInfo: type[CellularBillingArrearsInfoV1] = CellularBillingArrearsInfoV1
-    ConsumerFailure: type[ConsumerFailureV1] = ConsumerFailureV1
-    ConsumerFailureHistory: type[ConsumerFailureHistoryV1] = ConsumerFailureHistoryV1
-    DeserializableFailure: type[DeserializableFailureV1] = DeserializableFailureV1
-    EventFilter: type[EventFilterV1] = EventFilterV1
-    EventIgnored: type[EventIgnoredV1] = EventIgnoredV1
-    IccidCarrier: type[IccidCarrierV1] = IccidCarrierV1
-    JobAssassinationContract: type[JobAssassinationContractV1] = JobAssassinationContractV1
-    JobrunrBackgroundjobservers: type[JobrunrBackgroundjobserversV1] = JobrunrBackgroundjobserversV1
-    JobrunrJobs: type[JobrunrJobsV1] = JobrunrJobsV1
-    JobrunrMetadata: type[JobrunrMetadataV1] = JobrunrMetadataV1
-    JobrunrMigrations: type[JobrunrMigrationsV1] = JobrunrMigrationsV1
-    JobrunrRecurringJobs: type[JobrunrRecurringJobsV1] = JobrunrRecurringJobsV1
-    Look: type[LookV1] = LookV1
-    LookData: type[LookDataV1] = LookDataV1
-    ManagedItem: type[ManagedItemV1] = ManagedItemV1
-    MerchantAcceptance: type[MerchantAcceptanceV1] = MerchantAcceptanceV1
-    MerchantEvolution: type[MerchantEvolutionV2] = MerchantEvolutionV2
-    MerchantOffboarding: type[MerchantOffboardingV1] = MerchantOffboardingV1
-    MerchantPayment: type[MerchantPaymentV1] = MerchantPaymentV1
-    MerchantPaymentHistory: type[MerchantPaymentHistoryV1] = MerchantPaymentHistoryV1
-    MigratedMerchant: type[MigratedMerchantV1] = MigratedMerchantV1
-    MlcCapturedEvent: type[MlcCapturedEventV1] = MlcCapturedEventV1
-    PendingEvent: type[PendingEventV1] = PendingEventV1
-    PlanBillingLatest: type[PlanBillingLatestV1] = PlanBillingLatestV1
-    PlanMeta: type[PlanMetaV1] = PlanMetaV1
-    PlanTrial: type[PlanTrialV1] = PlanTrialV1
-    ProducerFailure: type[ProducerFailureV1] = ProducerFailureV1
-    ProducerFailureHistory: type[ProducerFailureHistoryV1] = ProducerFailureHistoryV1
-    ServerConfig: type[ServerConfigV1] = ServerConfigV1
-    TestMerchantCriteria: type[TestMerchantCriteriaV1] = TestMerchantCriteriaV1
-    UninstalledApp: type[UninstalledAppV1] = UninstalledAppV1
+    AppMeteredEvent: type[AppMeteredEventV1] = lazy_class(
+        "rhizome.models.billing_event.app_metered_event_v1.AppMeteredEventV1"
+    )
+    AppSubscriptionCurrent: type[AppSubscriptionCurrentV1] = lazy_class(
+        "rhizome.models.billing_event.app_subscription_current_v1.AppSubscriptionCurrentV1"
+    )
+    AppSubscriptionDaily: type[AppSubscriptionDailyV1] = lazy_class(
+        "rhizome.models.billing_event.app_subscription_daily_v1.AppSubscriptionDailyV1"
+    )
+    AppSubscriptionEvent: type[AppSubscriptionEventV1] = lazy_class(
+        "rhizome.models.billing_event.app_subscription_event_v1.AppSubscriptionEventV1"
+    )
+    AsOfMerchant: type[AsOfMerchantV2] = lazy_class("rhizome.models.billing_event.as_of_merchant_v2.AsOfMerchantV2")
+    AsOfMerchantDevice: type[AsOfMerchantDeviceV1] = lazy_class(
+        "rhizome.models.billing_event.as_of_merchant_device_v1.AsOfMerchantDeviceV1"
+    )
+    AsOfMerchantPlan: type[AsOfMerchantPlanV2] = lazy_class(
+        "rhizome.models.billing_event.as_of_merchant_plan_v2.AsOfMerchantPlanV2"
+    )
+    BackfillAcceptance: type[BackfillAcceptanceV1] = lazy_class(
+        "rhizome.models.billing_event.backfill_acceptance_v1.BackfillAcceptanceV1"
+    )
+    BillingEventHistory: type[BillingEventHistoryV1] = lazy_class(
+        "rhizome.models.billing_event.billing_event_history_v1.BillingEventHistoryV1"
+    )
+    CellularArrearsAcceptances: type[CellularArrearsAcceptancesV1] = lazy_class(
+        "rhizome.models.billing_event.cellular_arrears_acceptances_v1.CellularArrearsAcceptancesV1"
+    )
+    CellularBillingArrearsInfo: type[CellularBillingArrearsInfoV1] = lazy_class(
+        "rhizome.models.billing_event.cellular_billing_arrears_info_v1.CellularBillingArrearsInfoV1"
+    )
+    ConsumerFailure: type[ConsumerFailureV1] = lazy_class(
+        "rhizome.models.billing_event.consumer_failure_v1.ConsumerFailureV1"
+    )
+    ConsumerFailureHistory: type[ConsumerFailureHistoryV1] = lazy_class(
+        "rhizome.models.billing_event.consumer_failure_history_v1.ConsumerFailureHistoryV1"
+    )
+    DeserializableFailure: type[DeserializableFailureV1] = lazy_class(
+        "rhizome.models.billing_event.deserializable_failure_v1.DeserializableFailureV1"
+    )
+    EventFilter: type[EventFilterV1] = lazy_class("rhizome.models.billing_event.event_filter_v1.EventFilterV1")
+    EventIgnored: type[EventIgnoredV1] = lazy_class("rhizome.models.billing_event.event_ignored_v1.EventIgnoredV1")
+    IccidCarrier: type[IccidCarrierV1] = lazy_class("rhizome.models.billing_event.iccid_carrier_v1.IccidCarrierV1")
+    JobAssassinationContract: type[JobAssassinationContractV1] = lazy_class(
+        "rhizome.models.billing_event.job_assassination_contract_v1.JobAssassinationContractV1"
+    )
+    JobrunrBackgroundjobservers: type[JobrunrBackgroundjobserversV1] = lazy_class(
+        "rhizome.models.billing_event.jobrunr_backgroundjobservers_v1.JobrunrBackgroundjobserversV1"
+    )
+    JobrunrJobs: type[JobrunrJobsV1] = lazy_class("rhizome.models.billing_event.jobrunr_jobs_v1.JobrunrJobsV1")
+    JobrunrMetadata: type[JobrunrMetadataV1] = lazy_class(
+        "rhizome.models.billing_event.jobrunr_metadata_v1.JobrunrMetadataV1"
+    )
+    JobrunrMigrations: type[JobrunrMigrationsV1] = lazy_class(
+        "rhizome.models.billing_event.jobrunr_migrations_v1.JobrunrMigrationsV1"
+    )
+    JobrunrRecurringJobs: type[JobrunrRecurringJobsV1] = lazy_class(
+        "rhizome.models.billing_event.jobrunr_recurring_jobs_v1.JobrunrRecurringJobsV1"
+    )
+    Look: type[LookV1] = lazy_class("rhizome.models.billing_event.look_v1.LookV1")
+    LookData: type[LookDataV1] = lazy_class("rhizome.models.billing_event.look_data_v1.LookDataV1")
+    ManagedItem: type[ManagedItemV1] = lazy_class("rhizome.models.billing_event.managed_item_v1.ManagedItemV1")
+    MerchantAcceptance: type[MerchantAcceptanceV1] = lazy_class(
+        "rhizome.models.billing_event.merchant_acceptance_v1.MerchantAcceptanceV1"
+    )
+    MerchantEvolution: type[MerchantEvolutionV2] = lazy_class(
+        "rhizome.models.billing_event.merchant_evolution_v2.MerchantEvolutionV2"
+    )
+    MerchantOffboarding: type[MerchantOffboardingV1] = lazy_class(
+        "rhizome.models.billing_event.merchant_offboarding_v1.MerchantOffboardingV1"
+    )
+    MerchantPayment: type[MerchantPaymentV1] = lazy_class(
+        "rhizome.models.billing_event.merchant_payment_v1.MerchantPaymentV1"
+    )
+    MerchantPaymentHistory: type[MerchantPaymentHistoryV1] = lazy_class(
+        "rhizome.models.billing_event.merchant_payment_history_v1.MerchantPaymentHistoryV1"
+    )
+    MigratedMerchant: type[MigratedMerchantV1] = lazy_class(
+        "rhizome.models.billing_event.migrated_merchant_v1.MigratedMerchantV1"
+    )
+    MlcCapturedEvent: type[MlcCapturedEventV1] = lazy_class(
+        "rhizome.models.billing_event.mlc_captured_event_v1.MlcCapturedEventV1"
+    )
+    PendingEvent: type[PendingEventV1] = lazy_class("rhizome.models.billing_event.pending_event_v1.PendingEventV1")
+    PlanBillingLatest: type[PlanBillingLatestV1] = lazy_class(
+        "rhizome.models.billing_event.plan_billing_latest_v1.PlanBillingLatestV1"
+    )
+    PlanMeta: type[PlanMetaV1] = lazy_class("rhizome.models.billing_event.plan_meta_v1.PlanMetaV1")
+    PlanTrial: type[PlanTrialV1] = lazy_class("rhizome.models.billing_event.plan_trial_v1.PlanTrialV1")
+    ProducerFailure: type[ProducerFailureV1] = lazy_class(
+        "rhizome.models.billing_event.producer_failure_v1.ProducerFailureV1"
+    )
+    ProducerFailureHistory: type[ProducerFailureHistoryV1] = lazy_class(
+        "rhizome.models.billing_event.producer_failure_history_v1.ProducerFailureHistoryV1"
+    )
+    ServerConfig: type[ServerConfigV1] = lazy_class("rhizome.models.billing_event.server_config_v1.ServerConfigV1")
+    TestMerchantCriteria: type[TestMerchantCriteriaV1] = lazy_class(
+        "rhizome.models.billing_event.test_merchant_criteria_v1.TestMerchantCriteriaV1"
+    )
+    UninstalledApp: type[UninstalledAppV1] = lazy_class(
+        "rhizome.models.billing_event.uninstalled_app_v1.UninstalledAppV1"
+    )
 
     def tables(self) -> list[StrEnum]:
         return list(BillingEventTable)
@@ -1,8 +1,24 @@
 """Dev environment modules."""
 
-from .billing import DevBilling
-from .billing_bookkeeper import DevBillingBookkeeper
-from .billing_event import DevBillingEvent
-from .meta import DevMeta
+from typing import TYPE_CHECKING
+
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .billing import DevBilling
+    from .billing_bookkeeper import DevBillingBookkeeper
+    from .billing_event import DevBillingEvent
+    from .meta import DevMeta
 
 __all__ = ["DevBilling", "DevBillingBookkeeper", "DevBillingEvent", "DevMeta"]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DevBilling": ".billing",
+        "DevBillingBookkeeper": ".billing_bookkeeper",
+        "DevBillingEvent": ".billing_event",
+        "DevMeta": ".meta",
+    },
+)
@@ -8,7 +8,7 @@ through direct connection using legacy MySQL credentials.
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rhizome.environments.base import (
     DatabaseConfig,
@@ -18,161 +18,256 @@ from rhizome.environments.base import (
     SecretManager,
     Tools,
 )
+from rhizome.lazy import LazyMapping, lazy_class
 from rhizome.models.base import Emplacement, RhizomeModel
-from rhizome.models.meta.account import Account
-from rhizome.models.meta.app_app_bundle_v1 import AppAppBundleV1
-from rhizome.models.meta.app_bundle_v1 import AppBundleV1
-from rhizome.models.meta.app_metered_country_v1 import AppMeteredCountryV1
-from rhizome.models.meta.app_metered_event_v1 import AppMeteredEventV1
-from rhizome.models.meta.app_metered_v1 import AppMeteredV1
-from rhizome.models.meta.app_permission_v1 import AppPermissionV1
-from rhizome.models.meta.app_subscription_country_v1 import AppSubscriptionCountryV1
-from rhizome.models.meta.app_subscription_v1 import AppSubscriptionV1
-from rhizome.models.meta.country import Country
-from rhizome.models.meta.developer import Developer
-from rhizome.models.meta.developer_app_v1 import DeveloperAppV1
-from rhizome.models.meta.device_events_v1 import DeviceEventsV1
-from rhizome.models.meta.device_provision_v1 import DeviceProvisionV1
-from rhizome.models.meta.device_type_v1 import DeviceTypeV1
-from rhizome.models.meta.locale import Locale
-from rhizome.models.meta.merchant import Merchant
-from rhizome.models.meta.merchant_address_v1 import MerchantAddressV1
-from rhizome.models.meta.merchant_app_subscription_history_v1 import MerchantAppSubscriptionHistoryV1
-from rhizome.models.meta.merchant_app_v1 import MerchantAppV1
-from rhizome.models.meta.merchant_boarding_v1 import MerchantBoardingV1
-from rhizome.models.meta.merchant_creation_details_v1 import MerchantCreationDetailsV1
-from rhizome.models.meta.merchant_gateway_v1 import MerchantGatewayV1
-from rhizome.models.meta.merchant_merchant_plan_history_v1 import MerchantMerchantPlanHistoryV1
-from rhizome.models.meta.merchant_plan_group_v1 import MerchantPlanGroupV1
-from rhizome.models.meta.merchant_plan_merchant_plan_group_v1 import MerchantPlanMerchantPlanGroupV1
-from rhizome.models.meta.merchant_plan_v1 import MerchantPlanV1
-from rhizome.models.meta.merchant_role_v1 import MerchantRoleV1
-from rhizome.models.meta.payment_processor_v1 import PaymentProcessorV1
-from rhizome.models.meta.processor_key_v1 import ProcessorKeyV1
-from rhizome.models.meta.reseller import Reseller
-from rhizome.models.meta.reseller_permissions_v1 import ResellerPermissionsV1
-from rhizome.models.meta.reseller_plan_trial_v1 import ResellerPlanTrialV1
-from rhizome.models.meta.reseller_role_v1 import ResellerRoleV1
-from rhizome.models.meta.server_feature_v1 import ServerFeatureV1
-from rhizome.models.meta.terminal_config_merchant_props_v1 import TerminalConfigMerchantPropsV1
-from rhizome.models.meta.timezones import Timezones
 from rhizome.models.table_list import MetaTable
 
-# Import emplacements
-from .expected_data.meta_account import AccountDev
-from .expected_data.meta_app_app_bundle import AppAppBundleDev
-from .expected_data.meta_app_bundle import AppBundleDev
-from .expected_data.meta_app_metered import AppMeteredDev
-from .expected_data.meta_app_metered_country import AppMeteredCountryDev
-from .expected_data.meta_app_metered_event import AppMeteredEventDev
-from .expected_data.meta_app_permission import AppPermissionDev
-from .expected_data.meta_app_subscription import AppSubscriptionDev
-from .expected_data.meta_app_subscription_country import AppSubscriptionCountryDev
-from .expected_data.meta_country import CountryDev
-from .expected_data.meta_developer import DeveloperDev
-from .expected_data.meta_developer_app import DeveloperAppDev
-from .expected_data.meta_device_events import DeviceEventsDev
-from .expected_data.meta_device_provision import DeviceProvisionDev
-from .expected_data.meta_device_type import DeviceTypeDev
-from .expected_data.meta_locale import LocaleDev
-from .expected_data.meta_merchant import MerchantDev
-from .expected_data.meta_merchant_address import MerchantAddressDev
-from .expected_data.meta_merchant_app import MerchantAppDev
-from .expected_data.meta_merchant_app_subscription_history import MerchantAppSubscriptionHistoryDev
-from .expected_data.meta_merchant_boarding import MerchantBoardingDev
-from .expected_data.meta_merchant_creation_details import MerchantCreationDetailsDev
-from .expected_data.meta_merchant_gateway import MerchantGatewayDev
-from .expected_data.meta_merchant_merchant_plan_history import MerchantMerchantPlanHistoryDev
-from .expected_data.meta_merchant_plan import MerchantPlanDev
-from .expected_data.meta_merchant_plan_group import MerchantPlanGroupDev
-from .expected_data.meta_merchant_plan_merchant_plan_group import MerchantPlanMerchantPlanGroupDev
-from .expected_data.meta_merchant_role import MerchantRoleDev
-from .expected_data.meta_payment_processor import PaymentProcessorDev
-from .expected_data.meta_processor_key import ProcessorKeyDev
-from .expected_data.meta_reseller import ResellerDev
-from .expected_data.meta_reseller_permissions import ResellerPermissionsDev
-from .expected_data.meta_reseller_plan_trial import ResellerPlanTrialDev
-from .expected_data.meta_reseller_role import ResellerRoleDev
-from .expected_data.meta_server_feature import ServerFeatureDev
-from .expected_data.meta_terminal_config_merchant_props import TerminalConfigMerchantPropsDev
-from .expected_data.meta_timezones import TimezonesDev
+if TYPE_CHECKING:
+    from rhizome.models.meta.app_app_bundle_v1 import AppAppBundleV1
+    from rhizome.models.meta.app_bundle_v1 import AppBundleV1
+    from rhizome.models.meta.app_metered_country_v1 import AppMeteredCountryV1
+    from rhizome.models.meta.app_metered_event_v1 import AppMeteredEventV1
+    from rhizome.models.meta.app_metered_v1 import AppMeteredV1
+    from rhizome.models.meta.app_permission_v1 import AppPermissionV1
+    from rhizome.models.meta.app_subscription_country_v1 import AppSubscriptionCountryV1
+    from rhizome.models.meta.app_subscription_v1 import AppSubscriptionV1
+    from rhizome.models.meta.developer_app_v1 import DeveloperAppV1
+    from rhizome.models.meta.device_events_v1 import DeviceEventsV1
+    from rhizome.models.meta.device_provision_v1 import DeviceProvisionV1
+    from rhizome.models.meta.device_type_v1 import DeviceTypeV1
+    from rhizome.models.meta.merchant_address_v1 import MerchantAddressV1
+    from rhizome.models.meta.merchant_app_subscription_history_v1 import MerchantAppSubscriptionHistoryV1
+    from rhizome.models.meta.merchant_app_v1 import MerchantAppV1
+    from rhizome.models.meta.merchant_boarding_v1 import MerchantBoardingV1
+    from rhizome.models.meta.merchant_creation_details_v1 import MerchantCreationDetailsV1
+    from rhizome.models.meta.merchant_gateway_v1 import MerchantGatewayV1
+    from rhizome.models.meta.merchant_merchant_plan_history_v1 import MerchantMerchantPlanHistoryV1
+    from rhizome.models.meta.merchant_plan_group_v1 import MerchantPlanGroupV1
+    from rhizome.models.meta.merchant_plan_merchant_plan_group_v1 import MerchantPlanMerchantPlanGroupV1
+    from rhizome.models.meta.merchant_plan_v1 import MerchantPlanV1
+    from rhizome.models.meta.merchant_role_v1 import MerchantRoleV1
+    from rhizome.models.meta.payment_processor_v1 import PaymentProcessorV1
+    from rhizome.models.meta.processor_key_v1 import ProcessorKeyV1
+    from rhizome.models.meta.reseller_permissions_v1 import ResellerPermissionsV1
+    from rhizome.models.meta.reseller_plan_trial_v1 import ResellerPlanTrialV1
+    from rhizome.models.meta.reseller_role_v1 import ResellerRoleV1
+    from rhizome.models.meta.server_feature_v1 import ServerFeatureV1
+    from rhizome.models.meta.terminal_config_merchant_props_v1 import TerminalConfigMerchantPropsV1
+
 
 # Register all meta table models with their emplacements (JSON data to be generated via 'rhizome sync data')
-models: dict[MetaTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]] = {
-    MetaTable.account: (Account, AccountDev),
-    MetaTable.country: (Country, CountryDev),
-    MetaTable.device_type: (DeviceTypeV1, DeviceTypeDev),
-    MetaTable.server_feature: (ServerFeatureV1, ServerFeatureDev),
-    MetaTable.merchant: (Merchant, MerchantDev),
-    MetaTable.terminal_config_merchant_props: (TerminalConfigMerchantPropsV1, TerminalConfigMerchantPropsDev),
-    MetaTable.reseller: (Reseller, ResellerDev),
-    MetaTable.reseller_permissions: (ResellerPermissionsV1, ResellerPermissionsDev),
-    MetaTable.reseller_role: (ResellerRoleV1, ResellerRoleDev),
-    MetaTable.merchant_address: (MerchantAddressV1, MerchantAddressDev),
-    MetaTable.merchant_gateway: (MerchantGatewayV1, MerchantGatewayDev),
-    MetaTable.payment_processor: (PaymentProcessorV1, PaymentProcessorDev),
-    MetaTable.processor_key: (ProcessorKeyV1, ProcessorKeyDev),
-    MetaTable.merchant_plan: (MerchantPlanV1, MerchantPlanDev),
-    MetaTable.merchant_plan_group: (MerchantPlanGroupV1, MerchantPlanGroupDev),
-    MetaTable.merchant_plan_merchant_plan_group: (MerchantPlanMerchantPlanGroupV1, MerchantPlanMerchantPlanGroupDev),
-    MetaTable.merchant_role: (MerchantRoleV1, MerchantRoleDev),
-    MetaTable.developer: (Developer, DeveloperDev),
-    MetaTable.locale: (Locale, LocaleDev),
-    MetaTable.timezones: (Timezones, TimezonesDev),
-    MetaTable.app_app_bundle: (AppAppBundleV1, AppAppBundleDev),
-    MetaTable.app_bundle: (AppBundleV1, AppBundleDev),
-    MetaTable.app_metered: (AppMeteredV1, AppMeteredDev),
-    MetaTable.app_metered_country: (AppMeteredCountryV1, AppMeteredCountryDev),
-    MetaTable.app_metered_event: (AppMeteredEventV1, AppMeteredEventDev),
-    MetaTable.app_permission: (AppPermissionV1, AppPermissionDev),
-    MetaTable.app_subscription: (AppSubscriptionV1, AppSubscriptionDev),
-    MetaTable.app_subscription_country: (AppSubscriptionCountryV1, AppSubscriptionCountryDev),
-    MetaTable.developer_app: (DeveloperAppV1, DeveloperAppDev),
-    MetaTable.device_events: (DeviceEventsV1, DeviceEventsDev),
-    MetaTable.device_provision: (DeviceProvisionV1, DeviceProvisionDev),
-    MetaTable.merchant_app: (MerchantAppV1, MerchantAppDev),
-    MetaTable.merchant_app_subscription_history: (MerchantAppSubscriptionHistoryV1, MerchantAppSubscriptionHistoryDev),
-    MetaTable.merchant_boarding: (MerchantBoardingV1, MerchantBoardingDev),
-    MetaTable.merchant_creation_details: (MerchantCreationDetailsV1, MerchantCreationDetailsDev),
-    MetaTable.merchant_merchant_plan_history: (MerchantMerchantPlanHistoryV1, MerchantMerchantPlanHistoryDev),
-    MetaTable.reseller_plan_trial: (ResellerPlanTrialV1, ResellerPlanTrialDev),
-}
+models: LazyMapping[MetaTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]] | None]] = LazyMapping(
+    {
+        MetaTable.account: (
+            "rhizome.models.meta.account.Account",
+            "rhizome.environments.dev.expected_data.meta_account.AccountDev",
+        ),
+        MetaTable.country: (
+            "rhizome.models.meta.country.Country",
+            "rhizome.environments.dev.expected_data.meta_country.CountryDev",
+        ),
+        MetaTable.device_type: (
+            "rhizome.models.meta.device_type_v1.DeviceTypeV1",
+            "rhizome.environments.dev.expected_data.meta_device_type.DeviceTypeDev",
+        ),
+        MetaTable.server_feature: (
+            "rhizome.models.meta.server_feature_v1.ServerFeatureV1",
+            "rhizome.environments.dev.expected_data.meta_server_feature.ServerFeatureDev",
+        ),
+        MetaTable.merchant: (
+            "rhizome.models.meta.merchant.Merchant",
+            "rhizome.environments.dev.expected_data.meta_merchant.MerchantDev",
+        ),
+        MetaTable.terminal_config_merchant_props: (
+            "rhizome.models.meta.terminal_config_merchant_props_v1.TerminalConfigMerchantPropsV1",
+            "rhizome.environments.dev.expected_data.meta_terminal_config_merchant_props.TerminalConfigMerchantPropsDev",
+        ),
+        MetaTable.reseller: (
+            "rhizome.models.meta.reseller.Reseller",
+            "rhizome.environments.dev.expected_data.meta_reseller.ResellerDev",
+        ),
+        MetaTable.reseller_permissions: (
+            "rhizome.models.meta.reseller_permissions_v1.ResellerPermissionsV1",
+            "rhizome.environments.dev.expected_data.meta_reseller_permissions.ResellerPermissionsDev",
+        ),
+        MetaTable.reseller_role: (
+            "rhizome.models.meta.reseller_role_v1.ResellerRoleV1",
+            "rhizome.environments.dev.expected_data.meta_reseller_role.ResellerRoleDev",
+        ),
+        MetaTable.merchant_address: (
+            "rhizome.models.meta.merchant_address_v1.MerchantAddressV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_address.MerchantAddressDev",
+        ),
+        MetaTable.merchant_gateway: (
+            "rhizome.models.meta.merchant_gateway_v1.MerchantGatewayV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_gateway.MerchantGatewayDev",
+        ),
+        MetaTable.payment_processor: (
+            "rhizome.models.meta.payment_processor_v1.PaymentProcessorV1",
+            "rhizome.environments.dev.expected_data.meta_payment_processor.PaymentProcessorDev",
+        ),
+        MetaTable.processor_key: (
+            "rhizome.models.meta.processor_key_v1.ProcessorKeyV1",
+            "rhizome.environments.dev.expected_data.meta_processor_key.ProcessorKeyDev",
+        ),
+        MetaTable.merchant_plan: (
+            "rhizome.models.meta.merchant_plan_v1.MerchantPlanV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_plan.MerchantPlanDev",
+        ),
+        MetaTable.merchant_plan_group: (
+            "rhizome.models.meta.merchant_plan_group_v1.MerchantPlanGroupV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_plan_group.MerchantPlanGroupDev",
+        ),
+        MetaTable.merchant_plan_merchant_plan_group: (
+            "rhizome.models.meta.merchant_plan_merchant_plan_group_v1.MerchantPlanMerchantPlanGroupV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_plan_merchant_plan_group.MerchantPlanMerchantPlanGroupDev",
+        ),
+        MetaTable.merchant_role: (
+            "rhizome.models.meta.merchant_role_v1.MerchantRoleV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_role.MerchantRoleDev",
+        ),
+        MetaTable.developer: (
+            "rhizome.models.meta.developer.Developer",
+            "rhizome.environments.dev.expected_data.meta_developer.DeveloperDev",
+        ),
+        MetaTable.locale: (
+            "rhizome.models.meta.locale.Locale",
+            "rhizome.environments.dev.expected_data.meta_locale.LocaleDev",
+        ),
+        MetaTable.timezones: (
+            "rhizome.models.meta.timezones.Timezones",
+            "rhizome.environments.dev.expected_data.meta_timezones.TimezonesDev",
+        ),
+        MetaTable.app_app_bundle: (
+            "rhizome.models.meta.app_app_bundle_v1.AppAppBundleV1",
+            "rhizome.environments.dev.expected_data.meta_app_app_bundle.AppAppBundleDev",
+        ),
+        MetaTable.app_bundle: (
+            "rhizome.models.meta.app_bundle_v1.AppBundleV1",
+            "rhizome.environments.dev.expected_data.meta_app_bundle.AppBundleDev",
+        ),
+        MetaTable.app_metered: (
+            "rhizome.models.meta.app_metered_v1.AppMeteredV1",
+            "rhizome.environments.dev.expected_data.meta_app_metered.AppMeteredDev",
+        ),
+        MetaTable.app_metered_country: (
+            "rhizome.models.meta.app_metered_country_v1.AppMeteredCountryV1",
+            "rhizome.environments.dev.expected_data.meta_app_metered_country.AppMeteredCountryDev",
+        ),
+        MetaTable.app_metered_event: (
+            "rhizome.models.meta.app_metered_event_v1.AppMeteredEventV1",
+            "rhizome.environments.dev.expected_data.meta_app_metered_event.AppMeteredEventDev",
+        ),
+        MetaTable.app_permission: (
+            "rhizome.models.meta.app_permission_v1.AppPermissionV1",
+            "rhizome.environments.dev.expected_data.meta_app_permission.AppPermissionDev",
+        ),
+        MetaTable.app_subscription: (
+            "rhizome.models.meta.app_subscription_v1.AppSubscriptionV1",
+            "rhizome.environments.dev.expected_data.meta_app_subscription.AppSubscriptionDev",
+        ),
+        MetaTable.app_subscription_country: (
+            "rhizome.models.meta.app_subscription_country_v1.AppSubscriptionCountryV1",
+            "rhizome.environments.dev.expected_data.meta_app_subscription_country.AppSubscriptionCountryDev",
+        ),
+        MetaTable.developer_app: (
+            "rhizome.models.meta.developer_app_v1.DeveloperAppV1",
+            "rhizome.environments.dev.expected_data.meta_developer_app.DeveloperAppDev",
+        ),
+        MetaTable.device_events: (
+            "rhizome.models.meta.device_events_v1.DeviceEventsV1",
+            "rhizome.environments.dev.expected_data.meta_device_events.DeviceEventsDev",
+        ),
+        MetaTable.device_provision: (
+            "rhizome.models.meta.device_provision_v1.DeviceProvisionV1",
+            "rhizome.environments.dev.expected_data.meta_device_provision.DeviceProvisionDev",
+        ),
+        MetaTable.merchant_app: (
+            "rhizome.models.meta.merchant_app_v1.MerchantAppV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_app.MerchantAppDev",
+        ),
+        MetaTable.merchant_app_subscription_history: (
+            "rhizome.models.meta.merchant_app_subscription_history_v1.MerchantAppSubscriptionHistoryV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_app_subscription_history.MerchantAppSubscriptionHistoryDev",
+        ),
+        MetaTable.merchant_boarding: (
+            "rhizome.models.meta.merchant_boarding_v1.MerchantBoardingV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_boarding.MerchantBoardingDev",
+        ),
+        MetaTable.merchant_creation_details: (
+            "rhizome.models.meta.merchant_creation_details_v1.MerchantCreationDetailsV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_creation_details.MerchantCreationDetailsDev",
+        ),
+        MetaTable.merchant_merchant_plan_history: (
+            "rhizome.models.meta.merchant_merchant_plan_history_v1.MerchantMerchantPlanHistoryV1",
+            "rhizome.environments.dev.expected_data.meta_merchant_merchant_plan_history.MerchantMerchantPlanHistoryDev",
+        ),
+        MetaTable.reseller_plan_trial: (
+            "rhizome.models.meta.reseller_plan_trial_v1.ResellerPlanTrialV1",
+            "rhizome.environments.dev.expected_data.meta_reseller_plan_trial.ResellerPlanTrialDev",
+        ),
+    }
+)
 
 
 class DevMeta(Environment):
     """Development meta environment using direct database connection."""
 
     # Type aliases for environment-specific model versions
-    DeviceType: type[DeviceTypeV1] = DeviceTypeV1
-    ServerFeature: type[ServerFeatureV1] = ServerFeatureV1
-    ResellerPermissions: type[ResellerPermissionsV1] = ResellerPermissionsV1
-    ResellerRole: type[ResellerRoleV1] = ResellerRoleV1
-    TerminalConfigMerchantProps: type[TerminalConfigMerchantPropsV1] = TerminalConfigMerchantPropsV1
-    MerchantAddress: type[MerchantAddressV1] = MerchantAddressV1
-    MerchantGateway: type[MerchantGatewayV1] = MerchantGatewayV1
-    PaymentProcessor: type[PaymentProcessorV1] = PaymentProcessorV1
-    ProcessorKey: type[ProcessorKeyV1] = ProcessorKeyV1
-    MerchantPlan: type[MerchantPlanV1] = MerchantPlanV1
-    MerchantPlanGroup: type[MerchantPlanGroupV1] = MerchantPlanGroupV1
-    MerchantPlanMerchantPlanGroup: type[MerchantPlanMerchantPlanGroupV1] = MerchantPlanMerchantPlanGroupV1
-    MerchantRole: type[MerchantRoleV1] = MerchantRoleV1
-    AppAppBundle: type[AppAppBundleV1] = AppAppBundleV1
-    AppBundle: type[AppBundleV1] = AppBundleV1
-    AppMetered: type[AppMeteredV1] = AppMeteredV1
-    AppMeteredCountry: type[AppMeteredCountryV1] = AppMeteredCountryV1
-    AppMeteredEvent: type[AppMeteredEventV1] = AppMeteredEventV1
-    AppPermission: type[AppPermissionV1] = AppPermissionV1
-    AppSubscription: type[AppSubscriptionV1] = AppSubscriptionV1
-    AppSubscriptionCountry: type[AppSubscriptionCountryV1] = AppSubscriptionCountryV1
-    DeveloperApp: type[DeveloperAppV1] = DeveloperAppV1
-    DeviceEvents: type[DeviceEventsV1] = DeviceEventsV1
-    DeviceProvision: type[DeviceProvisionV1] = DeviceProvisionV1
-    MerchantApp: type[MerchantAppV1] = MerchantAppV1
-    MerchantAppSubscriptionHistory: type[MerchantAppSubscriptionHistoryV1] = MerchantAppSubscriptionHistoryV1
-    MerchantBoarding: type[MerchantBoardingV1] = MerchantBoardingV1
-    MerchantCreationDetails: type[MerchantCreationDetailsV1] = MerchantCreationDetailsV1
-    MerchantMerchantPlanHistory: type[MerchantMerchantPlanHistoryV1] = MerchantMerchantPlanHistoryV1
-    ResellerPlanTrial: type[ResellerPlanTrialV1] = ResellerPlanTrialV1
+    DeviceType: type[DeviceTypeV1] = lazy_class("rhizome.models.meta.device_type_v1.DeviceTypeV1")
+    ServerFeature: type[ServerFeatureV1] = lazy_class("rhizome.models.meta.server_feature_v1.ServerFeatureV1")
+    ResellerPermissions: type[ResellerPermissionsV1] = lazy_class(
+        "rhizome.models.meta.reseller_permissions_v1.ResellerPermissionsV1"
+    )
+    ResellerRole: type[ResellerRoleV1] = lazy_class("rhizome.models.meta.reseller_role_v1.ResellerRoleV1")
+    TerminalConfigMerchantProps: type[TerminalConfigMerchantPropsV1] = lazy_class(
+        "rhizome.models.meta.terminal_config_merchant_props_v1.TerminalConfigMerchantPropsV1"
+    )
+    MerchantAddress: type[MerchantAddressV1] = lazy_class("rhizome.models.meta.merchant_address_v1.MerchantAddressV1")
+    MerchantGateway: type[MerchantGatewayV1] = lazy_class("rhizome.models.meta.merchant_gateway_v1.MerchantGatewayV1")
+    PaymentProcessor: type[PaymentProcessorV1] = lazy_class(
+        "rhizome.models.meta.payment_processor_v1.PaymentProcessorV1"
+    )
+    ProcessorKey: type[ProcessorKeyV1] = lazy_class("rhizome.models.meta.processor_key_v1.ProcessorKeyV1")
+    MerchantPlan: type[MerchantPlanV1] = lazy_class("rhizome.models.meta.merchant_plan_v1.MerchantPlanV1")
+    MerchantPlanGroup: type[MerchantPlanGroupV1] = lazy_class(
+        "rhizome.models.meta.merchant_plan_group_v1.MerchantPlanGroupV1"
+    )
+    MerchantPlanMerchantPlanGroup: type[MerchantPlanMerchantPlanGroupV1] = lazy_class(
+        "rhizome.models.meta.merchant_plan_merchant_plan_group_v1.MerchantPlanMerchantPlanGroupV1"
+    )
+    MerchantRole: type[MerchantRoleV1] = lazy_class("rhizome.models.meta.merchant_role_v1.MerchantRoleV1")
+    AppAppBundle: type[AppAppBundleV1] = lazy_class("rhizome.models.meta.app_app_bundle_v1.AppAppBundleV1")
+    AppBundle: type[AppBundleV1] = lazy_class("rhizome.models.meta.app_bundle_v1.AppBundleV1")
+    AppMetered: type[AppMeteredV1] = lazy_class("rhizome.models.meta.app_metered_v1.AppMeteredV1")
+    AppMeteredCountry: type[AppMeteredCountryV1] = lazy_class(
+        "rhizome.models.meta.app_metered_country_v1.AppMeteredCountryV1"
+    )
+    AppMeteredEvent: type[AppMeteredEventV1] = lazy_class("rhizome.models.meta.app_metered_event_v1.AppMeteredEventV1")
+    AppPermission: type[AppPermissionV1] = lazy_class("rhizome.models.meta.app_permission_v1.AppPermissionV1")
+    AppSubscription: type[AppSubscriptionV1] = lazy_class("rhizome.models.meta.app_subscription_v1.AppSubscriptionV1")
+    AppSubscriptionCountry: type[AppSubscriptionCountryV1] = lazy_class(
+        "rhizome.models.meta.app_subscription_country_v1.AppSubscriptionCountryV1"
+    )
+    DeveloperApp: type[DeveloperAppV1] = lazy_class("rhizome.models.meta.developer_app_v1.DeveloperAppV1")
+    DeviceEvents: type[DeviceEventsV1] = lazy_class("rhizome.models.meta.device_events_v1.DeviceEventsV1")
+    DeviceProvision: type[DeviceProvisionV1] = lazy_class("rhizome.models.meta.device_provision_v1.DeviceProvisionV1")
+    MerchantApp: type[MerchantAppV1] = lazy_class("rhizome.models.meta.merchant_app_v1.MerchantAppV1")
+    MerchantAppSubscriptionHistory: type[MerchantAppSubscriptionHistoryV1] = lazy_class(
+        "rhizome.models.meta.merchant_app_subscription_history_v1.MerchantAppSubscriptionHistoryV1"
+    )
+    MerchantBoarding: type[MerchantBoardingV1] = lazy_class(
+        "rhizome.models.meta.merchant_boarding_v1.MerchantBoardingV1"
+    )
+    MerchantCreationDetails: type[MerchantCreationDetailsV1] = lazy_class(
+        "rhizome.models.meta.merchant_creation_details_v1.MerchantCreationDetailsV1"
+    )
+    MerchantMerchantPlanHistory: type[MerchantMerchantPlanHistoryV1] = lazy_class(
+        "rhizome.models.meta.merchant_merchant_plan_history_v1.MerchantMerchantPlanHistoryV1"
+    )
+    ResellerPlanTrial: type[ResellerPlanTrialV1] = lazy_class(
+        "rhizome.models.meta.reseller_plan_trial_v1.ResellerPlanTrialV1"
+    )
 
     def tables(self) -> list[StrEnum]:
         return list(MetaTable)
@@ -8,22 +8,12 @@ clusters and connection types.
 from __future__ import annotations
 
 from enum import StrEnum, auto
+from typing import TYPE_CHECKING
 
-from rhizome.environments.base import Environment
-from rhizome.environments.demo.billing import DemoBilling
-from rhizome.environments.demo.billing_bookkeeper import DemoBillingBookkeeper
-from rhizome.environments.demo.billing_event import DemoBillingEvent
-from rhizome.environments.demo.meta import DemoMeta
-from rhizome.environments.dev.billing import DevBilling
-from rhizome.environments.dev.billing_bookkeeper import DevBillingBookkeeper
-from rhizome.environments.dev.billing_event import DevBillingEvent
-from rhizome.environments.dev.meta import DevMeta
-from rhizome.environments.na_prod.billing import NorthAmericaBilling
-from rhizome.environments.na_prod.billing_bookkeeper import (
-    NorthAmericaBillingBookkeeper,
-)
-from rhizome.environments.na_prod.billing_event import NorthAmericaBillingEvent
-from rhizome.environments.na_prod.meta import NorthAmericaMeta
+from rhizome.lazy import LazyMapping
+
+if TYPE_CHECKING:
+    from rhizome.environments.base import Environment
 
 
 class RhizomeEnvironment(StrEnum):
@@ -48,20 +38,23 @@ class RhizomeEnvironment(StrEnum):
     na_prod_meta = auto()
 
 
-environment_type: dict[RhizomeEnvironment, type[Environment]] = {
-    RhizomeEnvironment.dev_billing: DevBilling,
-    RhizomeEnvironment.dev_billing_bookkeeper: DevBillingBookkeeper,
-    RhizomeEnvironment.dev_billing_event: DevBillingEvent,
-    RhizomeEnvironment.dev_meta: DevMeta,
-    RhizomeEnvironment.demo_billing: DemoBilling,
-    RhizomeEnvironment.demo_billing_bookkeeper: DemoBillingBookkeeper,
-    RhizomeEnvironment.demo_billing_event: DemoBillingEvent,
-    RhizomeEnvironment.demo_meta: DemoMeta,
-    RhizomeEnvironment.na_prod_billing: NorthAmericaBilling,
-    RhizomeEnvironment.na_prod_billing_bookkeeper: NorthAmericaBillingBookkeeper,
-    RhizomeEnvironment.na_prod_billing_event: NorthAmericaBillingEvent,
-    RhizomeEnvironment.na_prod_meta: NorthAmericaMeta,
-}
+# Environment classes are imported on first lookup
+environment_type: LazyMapping[RhizomeEnvironment, type[Environment]] = LazyMapping(
+    {
+        RhizomeEnvironment.dev_billing: "rhizome.environments.dev.billing.DevBilling",
+        RhizomeEnvironment.dev_billing_bookkeeper: "rhizome.environments.dev.billing_bookkeeper.DevBillingBookkeeper",
+        RhizomeEnvironment.dev_billing_event: "rhizome.environments.dev.billing_event.DevBillingEvent",
+        RhizomeEnvironment.dev_meta: "rhizome.environments.dev.meta.DevMeta",
+        RhizomeEnvironment.demo_billing: "rhizome.environments.demo.billing.DemoBilling",
+        RhizomeEnvironment.demo_billing_bookkeeper: "rhizome.environments.demo.billing_bookkeeper.DemoBillingBookkeeper",  # noqa: E501
+        RhizomeEnvironment.demo_billing_event: "rhizome.environments.demo.billing_event.DemoBillingEvent",
+        RhizomeEnvironment.demo_meta: "rhizome.environments.demo.meta.DemoMeta",
+        RhizomeEnvironment.na_prod_billing: "rhizome.environments.na_prod.billing.NorthAmericaBilling",
+        RhizomeEnvironment.na_prod_billing_bookkeeper: "rhizome.environments.na_prod.billing_bookkeeper.NorthAmericaBillingBookkeeper",  # noqa: E501
+        RhizomeEnvironment.na_prod_billing_event: "rhizome.environments.na_prod.billing_event.NorthAmericaBillingEvent",
+        RhizomeEnvironment.na_prod_meta: "rhizome.environments.na_prod.meta.NorthAmericaMeta",
+    }
+)
 
 
 def get_environment_enum_by_name(env_name: str) -> RhizomeEnvironment | None:
@@ -91,12 +84,12 @@ def get_environment_enum_by_name(env_name: str) -> RhizomeEnvironment | None:
     # class names and string matching instead
     name_to_enum: dict[str, RhizomeEnvironment] = {}
 
-    for enum_value, env_class in environment_type.items():
-        # Map class names to enums
+    for enum_value, env_path in environment_type.paths.items():
+        # Map class names to enums (without importing the classes)
         # DevMeta -> dev_meta
         # DemoBillingBookkeeper -> demo_billing_bookkeeper
         # NorthAmericaMeta -> na_prod_meta
-        class_name = env_class.__name__
+        class_name = str(env_path).rpartition(".")[2]
         name_to_enum[class_name] = enum_value
 
     return name_to_enum.get(env_name)
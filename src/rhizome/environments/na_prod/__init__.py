@@ -1,7 +1,22 @@
 """NA Production environment modules."""
 
-from .billing import NorthAmericaBilling
-from .billing_bookkeeper import NorthAmericaBillingBookkeeper
-from .billing_event import NorthAmericaBillingEvent
+from typing import TYPE_CHECKING
+
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .billing import NorthAmericaBilling
+    from .billing_bookkeeper import NorthAmericaBillingBookkeeper
+    from .billing_event import NorthAmericaBillingEvent
 
 __all__ = ["NorthAmericaBilling", "NorthAmericaBillingBookkeeper", "NorthAmericaBillingEvent"]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "NorthAmericaBilling": ".billing",
+        "NorthAmericaBillingBookkeeper": ".billing_bookkeeper",
+        "NorthAmericaBillingEvent": ".billing_event",
+    },
+)
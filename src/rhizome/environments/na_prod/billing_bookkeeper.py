@@ -8,40 +8,57 @@ na-prod-us-central1 cluster through CloudSQL proxy port-forwarding.
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rhizome.environments.base import DatabaseConfig, Environment, PortForwardConfig, SecretManager, Tools
-from rhizome.environments.na_prod.expected_data.billing_bookkeeper_billing_entity import BillingEntityNaProd
-from rhizome.environments.na_prod.expected_data.billing_bookkeeper_fee_rate import FeeRateNaProd
-from rhizome.environments.na_prod.expected_data.billing_bookkeeper_fee_summary import FeeSummaryNaProd
-from rhizome.environments.na_prod.expected_data.billing_bookkeeper_invoice_info import InvoiceInfoNaProd
-from rhizome.environments.na_prod.expected_data.billing_bookkeeper_settlement import SettlementNaProd
+from rhizome.lazy import LazyMapping, lazy_class
 from rhizome.models.base import Emplacement, RhizomeModel
-from rhizome.models.billing_bookkeeper.billing_entity_v1 import BillingEntityV1
-from rhizome.models.billing_bookkeeper.fee_rate_v1 import FeeRateV1
-from rhizome.models.billing_bookkeeper.fee_summary_v1 import FeeSummaryV1
-from rhizome.models.billing_bookkeeper.invoice_info_v1 import InvoiceInfoV1
-from rhizome.models.billing_bookkeeper.settlement_v1 import SettlementV1
 from rhizome.models.table_list import BillingBookkeeperTable
 
-models: dict[BillingBookkeeperTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = {
-    BillingBookkeeperTable.billing_entity: (BillingEntityV1, BillingEntityNaProd),
-    BillingBookkeeperTable.fee_rate: (FeeRateV1, FeeRateNaProd),
-    BillingBookkeeperTable.fee_summary: (FeeSummaryV1, FeeSummaryNaProd),
-    BillingBookkeeperTable.invoice_info: (InvoiceInfoV1, InvoiceInfoNaProd),
-    BillingBookkeeperTable.settlement: (SettlementV1, SettlementNaProd),
-}
+if TYPE_CHECKING:
+    from rhizome.models.billing_bookkeeper.billing_entity_v1 import BillingEntityV1
+    from rhizome.models.billing_bookkeeper.fee_rate_v1 import FeeRateV1
+    from rhizome.models.billing_bookkeeper.fee_summary_v1 import FeeSummaryV1
+    from rhizome.models.billing_bookkeeper.invoice_info_v1 import InvoiceInfoV1
+    from rhizome.models.billing_bookkeeper.settlement_v1 import SettlementV1
+
+models: LazyMapping[BillingBookkeeperTable, tuple[type[RhizomeModel] | None, type[Emplacement[Any]]]] = LazyMapping(
+    {
+        BillingBookkeeperTable.billing_entity: (
+            "rhizome.models.billing_bookkeeper.billing_entity_v1.BillingEntityV1",
+            "rhizome.environments.na_prod.expected_data.billing_bookkeeper_billing_entity.BillingEntityNaProd",
+        ),
+        BillingBookkeeperTable.fee_rate: (
+            "rhizome.models.billing_bookkeeper.fee_rate_v1.FeeRateV1",
+            "rhizome.environments.na_prod.expected_data.billing_bookkeeper_fee_rate.FeeRateNaProd",
+        ),
+        BillingBookkeeperTable.fee_summary: (
+            "rhizome.models.billing_bookkeeper.fee_summary_v1.FeeSummaryV1",
+            "rhizome.environments.na_prod.expected_data.billing_bookkeeper_fee_summary.FeeSummaryNaProd",
+        ),
+        BillingBookkeeperTable.invoice_info: (
+            "rhizome.models.billing_bookkeeper.invoice_info_v1.InvoiceInfoV1",
+            "rhizome.environments.na_prod.expected_data.billing_bookkeeper_invoice_info.InvoiceInfoNaProd",
+        ),
+        BillingBookkeeperTable.settlement: (
+            "rhizome.models.billing_bookkeeper.settlement_v1.SettlementV1",
+            "rhizome.environments.na_prod.expected_data.billing_bookkeeper_settlement.SettlementNaProd",
+        ),
+    }
+)
 
 
 class NorthAmericaBillingBookkeeper(Environment):
     """North America production billing bookkeeper environment using CloudSQL."""
 
     # Type aliases for environment-specific model versions
-    BillingEntity: type[BillingEntityV1] = BillingEntityV1
-    FeeRate: type[FeeRateV1] = FeeRateV1
-    FeeSummary: type[FeeSummaryV1] = FeeSummaryV1
-    InvoiceInfo: type[InvoiceInfoV1] = InvoiceInfoV1
-    Settlement: type[SettlementV1] = SettlementV1
+    BillingEntity: type[BillingEntityV1] = lazy_class(
+        "rhizome.models.billing_bookkeeper.billing_entity_v1.BillingEntityV1"
+    )
+    FeeRate: type[FeeRateV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_rate_v1.FeeRateV1")
+    FeeSummary: type[FeeSummaryV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_summary_v1.FeeSummaryV1")
+    InvoiceInfo: type[InvoiceInfoV1] = lazy_class("rhizome.models.billing_bookkeeper.invoice_info_v1.InvoiceInfoV1")
+    Settlement: type[SettlementV1] = lazy_class("rhizome.models.billing_bookkeeper.settlement_v1.SettlementV1")
 
     def tables(self) -> list[StrEnum]:
         return list(BillingBookkeeperTable)
@@ -0,0 +1,121 @@
+"""
+Deferred imports for the modules that name hundreds of classes.
+
+Environments map every table to a model class and an emplacement class, and the
+model packages re-export every model. Importing all of them up front makes
+`import rhizome.client` or `rhizome --help` import hundreds of modules, so these
+name classes by dotted path ("package.module.ClassName") and import each one the
+first time it is looked up.
+"""
+
+import importlib
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
+
+# A class's dotted path, a tuple of them (e.g. a table's model and emplacement), or None
+type ClassPaths = str | tuple[str | None, ...] | None
+
+
+def import_class(path: str) -> Any:  # noqa: ANN401
+    """
+    Import a class by dotted path.
+
+    Args:
+        path: "package.module.ClassName"
+
+    Returns:
+        The class
+    """
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module), name)
+
+
+def _resolve(paths: ClassPaths) -> Any:  # noqa: ANN401
+    if paths is None:
+        return None
+    if isinstance(paths, tuple):
+        return tuple(_resolve(path) for path in paths)
+    return import_class(paths)
+
+
+class LazyMapping[K, V](Mapping[K, V]):
+    """Mapping whose values name classes by dotted path, imported on first lookup."""
+
+    def __init__(self, paths: Mapping[K, ClassPaths]) -> None:
+        self._paths = dict(paths)
+        self._resolved: dict[K, V] = {}
+
+    @property
+    def paths(self) -> Mapping[K, ClassPaths]:
+        """The dotted paths, for inspecting the mapping without importing anything."""
+        return MappingProxyType(self._paths)
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            return self._resolved[key]
+        except KeyError:
+            value = _resolve(self._paths[key])
+            self._resolved[key] = value
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._paths
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+class _LazyClass:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> Any:  # noqa: ANN401
+        value = import_class(self.path)
+        # Later lookups find the class itself
+        setattr(owner, self.name, value)
+        return value
+
+
+def lazy_class(path: str) -> Any:  # noqa: ANN401
+    """
+    Class attribute holding a class named by dotted path, imported on first access.
+
+    Example:
+        >>> class DevBillingBookkeeper(Environment):
+        ...     FeeCategory: type[FeeCategoryV1] = lazy_class(
+        ...         "rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1"
+        ...     )
+    """
+    return _LazyClass(path)
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Module `__getattr__` that imports a package's re-exported names on first access.
+
+    Args:
+        package: The package's `__name__`
+        exports: Name → module it is defined in, absolute or relative to the package (e.g. ".fee_category")
+
+    Returns:
+        The function to assign to the package's `__getattr__`
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Later lookups find the name in the package's namespace
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    return __getattr__
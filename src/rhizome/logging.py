@@ -2,6 +2,9 @@ import logging
 
 import structlog
 
+# Endpoints the clients call for every query; their access/httpx logs are noise
+LOGGING_ENDPOINTS = ("/log_query", "/log_query_result", "/log_batch", "/log_request", "/log_response")
+
 
 class FilterLoggingEndpoints(logging.Filter):
     """Filter to exclude access logs for logging endpoints."""
@@ -10,9 +13,7 @@ class FilterLoggingEndpoints(logging.Filter):
         """Return False to filter out logging endpoint requests."""
         message = record.getMessage()
         # Filter out POST requests to logging endpoints
-        return not any(
-            endpoint in message for endpoint in ["/log_query", "/log_query_result", "/log_request", "/log_response"]
-        )
+        return not any(endpoint in message for endpoint in LOGGING_ENDPOINTS)
 
 
 class FilterHttpxLoggingEndpoints(logging.Filter):
@@ -22,10 +23,7 @@ class FilterHttpxLoggingEndpoints(logging.Filter):
         """Return False to filter out health check and logging endpoint requests."""
         message = record.getMessage()
         # Filter out httpx logs for health checks and logging endpoints
-        return not any(
-            endpoint in message
-            for endpoint in ["/health", "/log_query", "/log_query_result", "/log_request", "/log_response"]
-        )
+        return not any(endpoint in message for endpoint in ("/health", *LOGGING_ENDPOINTS))
 
 
 def setup_logging() -> None:
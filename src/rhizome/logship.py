@@ -0,0 +1,160 @@
+"""
+Background shipping of client-side query logs to the rhizome server.
+
+The instrumented engines that `RhizomeClient` hands out log every statement
+(before execution) and its duration/row count (after execution) to the rhizome
+server. Posting each record synchronously would add two HTTP round trips to
+every query, so records are put on a bounded in-process queue instead and a
+background thread sends them to `/log_batch` in batches.
+
+Query latency is independent of logging: when the queue is full (server slow or
+down), new records are dropped and counted rather than blocking the query.
+"""
+
+import atexit
+import json
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from pydantic import BaseModel
+
+logger = structlog.get_logger("rhizome.client")
+
+# Sentinel telling the worker thread to send what it has and exit
+_STOP = object()
+
+
+class LogShipperStats(BaseModel):
+    """Counters for query log records handled by a shipper."""
+
+    submitted: int = 0  # Records accepted onto the queue
+    shipped: int = 0  # Records the server acknowledged
+    dropped: int = 0  # Records discarded because the queue was full
+    failed: int = 0  # Records lost because a batch could not be sent
+    batches: int = 0  # Successful /log_batch requests
+    queued: int = 0  # Records currently waiting to be sent
+
+
+class QueryLogShipper:
+    """Bounded queue of log records, drained by a daemon thread that posts them in batches."""
+
+    def __init__(
+        self,
+        post: Callable[[bytes], object],
+        max_queue: int = 10_000,
+        max_batch: int = 500,
+        close_timeout: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            post: Sends one JSON-encoded `/log_batch` body to the server, raising on failure
+            max_queue: Records held in memory at most; further records are dropped
+            max_batch: Records sent per request at most
+            close_timeout: Seconds `close()` waits for queued records to be sent
+        """
+        self._post = post
+        self.max_batch = max_batch
+        self.close_timeout = close_timeout
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._stats = LogShipperStats()
+        # Drops not yet reported to the server
+        self._unreported_drops = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """
+        Queue a record for shipping without blocking.
+
+        Returns:
+            False if the record was dropped because the queue is full or the shipper is closed
+        """
+        if self._closed:
+            return False
+        self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._stats.dropped += 1
+                self._unreported_drops += 1
+            return False
+        with self._lock:
+            self._stats.submitted += 1
+        return True
+
+    def stats(self) -> LogShipperStats:
+        """Snapshot of the shipper's counters."""
+        with self._lock:
+            return self._stats.model_copy(update={"queued": self._queue.qsize()})
+
+    def close(self) -> None:
+        """Send queued records (waiting up to `close_timeout`) and stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=self.close_timeout)
+        except queue.Full:
+            logger.debug("Query log queue still full at close, abandoning queued records")
+            return
+        self._thread.join(timeout=self.close_timeout)
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="rhizome-log-shipper", daemon=True)
+            self._thread.start()
+        # Flush what's left when the interpreter exits without an explicit close()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            record = self._queue.get()
+            if record is _STOP:
+                break
+
+            # Whatever piled up while the previous batch was in flight goes out together
+            batch = [record]
+            while len(batch) < self.max_batch:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            self._send(batch)
+
+    def _send(self, batch: list[dict[str, Any]]) -> None:
+        with self._lock:
+            dropped = self._unreported_drops
+            self._unreported_drops = 0
+
+        try:
+            # default=str: query parameters may hold dates, decimals, bytes, ...
+            body = json.dumps({"entries": batch, "dropped": dropped}, default=str).encode()
+            self._post(body)
+        except Exception as e:
+            with self._lock:
+                self._stats.failed += len(batch)
+                self._unreported_drops += dropped
+            logger.debug("Failed to ship query logs", records=len(batch), error=str(e))
+            return
+
+        with self._lock:
+            self._stats.shipped += len(batch)
+            self._stats.batches += 1
@@ -0,0 +1,179 @@
+"""
+Registry of the model classes that query results are built from.
+
+Requests name their model with a compact, stable model id (the model's module
+below `rhizome.models` and its class name, e.g. "meta.reseller:Reseller")
+rather than a full module path and class name. The server resolves ids
+through this registry, which is filled at startup from every environment's
+table situation. Registering a model also compiles the per-model metadata that
+serialization caches (the fields needing type coercion and the sanitize plan),
+so the first query against it doesn't pay for that.
+
+Models that no environment situates (e.g. ad-hoc models) are still accepted:
+their id names the module to import, and they are registered on first use.
+"""
+
+import importlib
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import structlog
+from pydantic import BaseModel
+from sqlmodel import SQLModel
+
+from rhizome.bulk_sanitize import sanitize_plan
+from rhizome.serialization import type_normalizer
+
+logger = structlog.get_logger()
+
+# Models under this package get ids relative to it
+_MODELS_PACKAGE = "rhizome.models."
+
+
+def model_id(model_class: type[Any]) -> str:
+    """
+    The stable identifier of a model class, as sent over the wire.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        "<module>:<class>", with the module relative to `rhizome.models` when it is below it
+    """
+    module = model_class.__module__
+    # Absolute module paths are marked so they can't be mistaken for relative ones
+    relative = module.removeprefix(_MODELS_PACKAGE) if module.startswith(_MODELS_PACKAGE) else f"/{module}"
+    return f"{relative}:{model_class.__name__}"
+
+
+def _import_model(model_id: str) -> type[SQLModel]:
+    """Import the model class a model id names."""
+    module, _, class_name = model_id.partition(":")
+    if not class_name:
+        raise ValueError(f"Invalid model id: {model_id!r}")
+    module = module[1:] if module.startswith("/") else _MODELS_PACKAGE + module
+    return getattr(importlib.import_module(module), class_name)
+
+
+@dataclass(frozen=True)
+class RegisteredModel:
+    """A model class and its model id."""
+
+    model_id: str
+    model_class: type[SQLModel]
+
+
+def _sanitized_fields(model_class: type[SQLModel]) -> dict[str, int] | None:
+    """Field → hash length of the columns a model's results are sanitized in; None if sanitize() is custom."""
+    return sanitize_plan(model_class) if hasattr(model_class, "sanitize") else {}
+
+
+class ModelInfo(BaseModel):
+    """Summary of a registered model."""
+
+    model_id: str
+    fields: int
+    coerced_fields: list[str]
+    sanitized_fields: list[str] | None
+
+
+class ModelListResponse(BaseModel):
+    models: list[ModelInfo]
+
+
+class ModelRegistry:
+    """Model classes by model id, each with its precomputed metadata."""
+
+    def __init__(self) -> None:
+        self._models: dict[str, RegisteredModel] = {}
+        self._lock = Lock()
+
+    def register(self, model_class: type[SQLModel]) -> RegisteredModel:
+        """
+        Register a model class (idempotent), compiling the metadata serialization caches for it.
+
+        Args:
+            model_class: Model class
+
+        Returns:
+            The registry entry
+        """
+        key = model_id(model_class)
+        entry = self._models.get(key)
+        if entry is not None and entry.model_class is model_class:
+            return entry
+
+        # Serialization looks these up per query; they are cached, so compile them now
+        type_normalizer(model_class)
+        _sanitized_fields(model_class)
+        entry = RegisteredModel(model_id=key, model_class=model_class)
+        with self._lock:
+            self._models[key] = entry
+        return entry
+
+    def register_environments(self) -> int:
+        """
+        Register every model that an environment situates one of its tables with.
+
+        Returns:
+            Number of registered models
+        """
+        from rhizome.environments.environment_list import environment_type
+
+        for env_enum, env_class in environment_type.items():
+            # Table situations don't depend on the environment's client, so don't build one
+            env = env_class.__new__(env_class)
+            unsituated: list[str] = []
+            for table in env.tables():
+                try:
+                    situated_model, _ = env.situate_table(table)
+                except Exception:
+                    unsituated.append(str(table))
+                    continue
+                if situated_model is not None:
+                    self.register(situated_model)
+            if unsituated:
+                logger.warning("Could not situate tables", environment=env_enum, tables=unsituated)
+
+        logger.info("Registered models", models=len(self._models))
+        return len(self._models)
+
+    def resolve(self, model_id: str) -> RegisteredModel:
+        """
+        Look up a model by id, importing and registering it if no environment registered it.
+
+        Args:
+            model_id: Identifier produced by `model_id()`
+
+        Returns:
+            The registry entry
+
+        Raises:
+            ValueError: If the id is malformed
+            ImportError: If the module cannot be imported
+            AttributeError: If the class does not exist in the module
+        """
+        entry = self._models.get(model_id)
+        if entry is None:
+            entry = self.register(_import_model(model_id))
+        return entry
+
+    def describe(self) -> ModelListResponse:
+        """List registered models and their metadata."""
+        models: list[ModelInfo] = []
+        for entry in sorted(self._models.values(), key=lambda entry: entry.model_id):
+            sanitized = _sanitized_fields(entry.model_class)
+            models.append(
+                ModelInfo(
+                    model_id=entry.model_id,
+                    fields=len(entry.model_class.model_fields),
+                    coerced_fields=list(type_normalizer(entry.model_class).coercions),
+                    sanitized_fields=None if sanitized is None else list(sanitized),
+                )
+            )
+        return ModelListResponse(models=models)
+
+
+# Global registry instance
+model_registry = ModelRegistry()
@@ -10,6 +10,8 @@ from jsondiff import diff  # type: ignore[import-untyped]
 from sqlmodel import SQLModel, select
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
+from rhizome.sanitize_helpers import sanitize_uuid_field, sanitized_fields
+
 T = TypeVar("T", bound="RhizomeModel")
 
 
@@ -23,11 +25,24 @@ class DataMismatchError(AssertionError):
 
 
 class RhizomeModel(SQLModel, ABC):
-    """Abstract base class for models that support sanitization."""
+    """
+    Base class for models that support sanitization.
+
+    Fields annotated with `SanitizeUUID` metadata are sanitized; see `sanitize()`.
+    """
 
-    @abstractmethod
     def sanitize(self: T) -> T:
-        """Return a sanitized copy of this model instance."""
+        """
+        Return a sanitized copy of this model instance.
+
+        Fields declared with `SanitizeUUID` metadata are replaced by deterministic hashes,
+        the others are copied unchanged. The copy is not re-validated.
+        """
+        model_class = type(self)
+        values = {name: getattr(self, name) for name in model_class.model_fields}
+        for name, length in sanitized_fields(model_class).items():
+            values[name] = sanitize_uuid_field(values[name], length)
+        return model_class.model_construct(**values)
 
 
 class Emplacement[T: "RhizomeModel"](ABC):
@@ -1,182 +1,187 @@
 """Billing models package."""
 
-from .app_suppression import AppSuppression
-from .app_suppression_v1 import AppSuppressionV1
-from .auto_debit_no_auth_config import AutoDebitNoAuthConfig
-from .auto_debit_no_auth_config_v1 import AutoDebitNoAuthConfigV1
-from .bank_routing import BankRouting
-from .bank_routing_v1 import BankRoutingV1
-from .banner_curb import BannerCurb
-from .banner_curb_v1 import BannerCurbV1
-from .banner_data import BannerData
-from .banner_data_v1 import BannerDataV1
-from .banner_details import BannerDetails
-from .banner_details_v1 import BannerDetailsV1
-from .bi_context import BiContext
-from .bi_context_v1 import BiContextV1
-from .biie_config import BiieConfig
-from .biie_config_v1 import BiieConfigV1
-from .biie_file_def import BiieFileDef
-from .biie_file_def_v1 import BiieFileDefV1
-from .biie_file_instance import BiieFileInstance
-from .biie_file_instance_request import BiieFileInstanceRequest
-from .biie_file_instance_request_v1 import BiieFileInstanceRequestV1
-from .biie_file_instance_v1 import BiieFileInstanceV1
-from .biie_file_staging_data import BiieFileStagingData
-from .biie_file_staging_data_v1 import BiieFileStagingDataV1
-from .billing_business_initiative import BillingBusinessInitiative
-from .billing_business_initiative_v1 import BillingBusinessInitiativeV1
-from .billing_request import BillingRequest
-from .billing_request_state import BillingRequestState
-from .billing_request_state_v1 import BillingRequestStateV1
-from .billing_request_v1 import BillingRequestV1
-from .charge_capture_error import ChargeCaptureError
-from .charge_capture_error_v1 import ChargeCaptureErrorV1
-from .charge_invoice_number import ChargeInvoiceNumber
-from .charge_invoice_number_v1 import ChargeInvoiceNumberV1
+from typing import TYPE_CHECKING
 
-# from .charge_metrics import ChargeMetrics
-# from .charge_metrics_v1 import ChargeMetricsV1
-from .charge_post_date import ChargePostDate
-from .charge_post_date_v1 import ChargePostDateV1
-from .charge_state_attempt import ChargeStateAttempt
-from .charge_state_attempt_v1 import ChargeStateAttemptV1
-from .combined_charge import CombinedCharge
-from .combined_charge_tree import CombinedChargeTree
-from .combined_charge_tree_v1 import CombinedChargeTreeV1
-from .combined_charge_v1 import CombinedChargeV1
-from .combined_disbursement import CombinedDisbursement
-from .combined_disbursement_tree import CombinedDisbursementTree
-from .combined_disbursement_tree_v1 import CombinedDisbursementTreeV1
-from .combined_disbursement_v1 import CombinedDisbursementV1
-from .corollary_data import CorollaryData
-from .corollary_data_v1 import CorollaryDataV1
-from .country_suppression import CountrySuppression
-from .country_suppression_v1 import CountrySuppressionV1
-from .device_order_tracking import DeviceOrderTracking
-from .device_order_tracking_v1 import DeviceOrderTrackingV1
-from .disbursement_invoice_number import DisbursementInvoiceNumber
-from .disbursement_invoice_number_v1 import DisbursementInvoiceNumberV1
-from .email_audit import EmailAudit
-from .email_audit_v1 import EmailAuditV1
-from .email_developer_charge import EmailDeveloperCharge
-from .email_developer_charge_v1 import EmailDeveloperChargeV1
-from .explanation import Explanation
-from .explanation_data import ExplanationData
-from .explanation_data_v1 import ExplanationDataV1
-from .explanation_v1 import ExplanationV1
-from .export_tracker import ExportTracker
-from .export_tracker_v1 import ExportTrackerV1
-from .fee import Fee
-from .fee_exception import FeeException
-from .fee_exception_v1 import FeeExceptionV1
-from .fee_v1 import FeeV1
-from .flight_check import FlightCheck
-from .flight_check_archive import FlightCheckArchive
-from .flight_check_archive_v1 import FlightCheckArchiveV1
-from .flight_check_execution import FlightCheckExecution
-from .flight_check_execution_v1 import FlightCheckExecutionV1
-from .flight_check_v1 import FlightCheckV1
-from .heartbeat import Heartbeat
-from .heartbeat_v1 import HeartbeatV1
-from .invoice_charge import InvoiceCharge
-from .invoice_charge_v1 import InvoiceChargeV1
-from .job_lock import JobLock
-from .job_lock_v1 import JobLockV1
-from .merchant_device_info import MerchantDeviceInfo
-from .merchant_device_info_v1 import MerchantDeviceInfoV1
-from .merchant_odessa_mapping import MerchantOdessaMapping
-from .merchant_odessa_mapping_v1 import MerchantOdessaMappingV1
-from .merchant_queue_sensitive import MerchantQueueSensitive
-from .merchant_queue_sensitive_v1 import MerchantQueueSensitiveV1
-from .merchant_subscription_action import MerchantSubscriptionAction
-from .merchant_subscription_action_v1 import MerchantSubscriptionActionV1
-from .merchant_suppression import MerchantSuppression
-from .merchant_suppression_by_app import MerchantSuppressionByApp
-from .merchant_suppression_by_app_v1 import MerchantSuppressionByAppV1
-from .merchant_suppression_v1 import MerchantSuppressionV1
-from .merchant_terms_acceptance import MerchantTermsAcceptance
-from .merchant_terms_acceptance_events import MerchantTermsAcceptanceEvents
-from .merchant_terms_acceptance_events_v1 import MerchantTermsAcceptanceEventsV1
-from .merchant_terms_acceptance_failed_event_log import MerchantTermsAcceptanceFailedEventLog
-from .merchant_terms_acceptance_failed_event_log_v1 import MerchantTermsAcceptanceFailedEventLogV1
-from .merchant_terms_acceptance_v1 import MerchantTermsAcceptanceV1
-from .merchant_terms_missing_acceptance import MerchantTermsMissingAcceptance
-from .merchant_terms_missing_acceptance_v1 import MerchantTermsMissingAcceptanceV1
-from .offboarding import Offboarding
-from .offboarding_v1 import OffboardingV1
-from .plan_authorization_settings import PlanAuthorizationSettings
-from .plan_authorization_settings_v1 import PlanAuthorizationSettingsV1
-from .plan_meta import PlanMeta
-from .plan_meta_history import PlanMetaHistory
-from .plan_meta_history_v1 import PlanMetaHistoryV1
-from .plan_meta_v1 import PlanMetaV1
-from .producer_failure import ProducerFailure
-from .producer_failure_v1 import ProducerFailureV1
-from .promo import Promo
-from .promo_control import PromoControl
-from .promo_control_v1 import PromoControlV1
-from .promo_v1 import PromoV1
-from .remit_merchant_details import RemitMerchantDetails
-from .remit_merchant_details_v1 import RemitMerchantDetailsV1
-from .reseller_app_rev_share import ResellerAppRevShare
-from .reseller_app_rev_share_v1 import ResellerAppRevShareV1
-from .reseller_invoice_alliance import ResellerInvoiceAlliance
-from .reseller_invoice_alliance_v1 import ResellerInvoiceAllianceV1
-from .reseller_plan_fee import ResellerPlanFee
-from .reseller_plan_fee_v1 import ResellerPlanFeeV1
-from .reseller_plan_rev_share import ResellerPlanRevShare
-from .reseller_plan_rev_share_v1 import ResellerPlanRevShareV1
-from .reseller_suppression import ResellerSuppression
-from .reseller_suppression_v1 import ResellerSuppressionV1
-from .reseller_usage_job_config import ResellerUsageJobConfig
-from .reseller_usage_job_config_v1 import ResellerUsageJobConfigV1
-from .rev_share import RevShare
-from .rev_share_v1 import RevShareV1
-from .seasonal_merchant_trans_audit import SeasonalMerchantTransAudit
-from .seasonal_merchant_trans_audit_v1 import SeasonalMerchantTransAuditV1
-from .seasonal_reseller_info import SeasonalResellerInfo
-from .seasonal_reseller_info_v1 import SeasonalResellerInfoV1
-from .server_config import ServerConfig
-from .server_config_v1 import ServerConfigV1
-from .stage_app_metered_event import StageAppMeteredEvent
-from .stage_app_metered_event_v1 import StageAppMeteredEventV1
-from .stage_charge import StageCharge
-from .stage_charge_capture_error import StageChargeCaptureError
-from .stage_charge_capture_error_v1 import StageChargeCaptureErrorV1
-from .stage_charge_history import StageChargeHistory
-from .stage_charge_history_v1 import StageChargeHistoryV1
-from .stage_charge_state_attempt import StageChargeStateAttempt
-from .stage_charge_state_attempt_v1 import StageChargeStateAttemptV1
-from .stage_charge_update import StageChargeUpdate
-from .stage_charge_update_v1 import StageChargeUpdateV1
-from .stage_charge_v1 import StageChargeV1
-from .stage_email import StageEmail
-from .stage_email_merchant_charge import StageEmailMerchantCharge
-from .stage_email_merchant_charge_v1 import StageEmailMerchantChargeV1
-from .stage_email_v1 import StageEmailV1
-from .stage_infolease_charge_attempt import StageInfoleaseChargeAttempt
-from .stage_infolease_charge_attempt_v1 import StageInfoleaseChargeAttemptV1
-from .stage_infolease_disbursement_attempt import StageInfoleaseDisbursementAttempt
-from .stage_infolease_disbursement_attempt_v1 import StageInfoleaseDisbursementAttemptV1
-from .stage_merchant_app_charge import StageMerchantAppCharge
-from .stage_merchant_app_charge_v1 import StageMerchantAppChargeV1
-from .stage_merchant_plan_charge import StageMerchantPlanCharge
-from .stage_merchant_plan_charge_v1 import StageMerchantPlanChargeV1
-from .stage_vendor_disbursement_error import StageVendorDisbursementError
-from .stage_vendor_disbursement_error_v1 import StageVendorDisbursementErrorV1
-from .stage_vendor_disbursement_state_attempt import StageVendorDisbursementStateAttempt
-from .stage_vendor_disbursement_state_attempt_v1 import StageVendorDisbursementStateAttemptV1
-from .stop_ach_history import StopAchHistory
-from .stop_ach_history_v1 import StopAchHistoryV1
-from .suppression_metrics import SuppressionMetrics
-from .suppression_metrics_v1 import SuppressionMetricsV1
-from .vat_vendor_disbursement import VatVendorDisbursement
-from .vat_vendor_disbursement_v1 import VatVendorDisbursementV1
-from .vendor_disbursement_error import VendorDisbursementError
-from .vendor_disbursement_error_v1 import VendorDisbursementErrorV1
-from .vendor_disbursement_state_attempt import VendorDisbursementStateAttempt
-from .vendor_disbursement_state_attempt_v1 import VendorDisbursementStateAttemptV1
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app_suppression import AppSuppression
+    from .app_suppression_v1 import AppSuppressionV1
+    from .auto_debit_no_auth_config import AutoDebitNoAuthConfig
+    from .auto_debit_no_auth_config_v1 import AutoDebitNoAuthConfigV1
+    from .bank_routing import BankRouting
+    from .bank_routing_v1 import BankRoutingV1
+    from .banner_curb import BannerCurb
+    from .banner_curb_v1 import BannerCurbV1
+    from .banner_data import BannerData
+    from .banner_data_v1 import BannerDataV1
+    from .banner_details import BannerDetails
+    from .banner_details_v1 import BannerDetailsV1
+    from .bi_context import BiContext
+    from .bi_context_v1 import BiContextV1
+    from .biie_config import BiieConfig
+    from .biie_config_v1 import BiieConfigV1
+    from .biie_file_def import BiieFileDef
+    from .biie_file_def_v1 import BiieFileDefV1
+    from .biie_file_instance import BiieFileInstance
+    from .biie_file_instance_request import BiieFileInstanceRequest
+    from .biie_file_instance_request_v1 import BiieFileInstanceRequestV1
+    from .biie_file_instance_v1 import BiieFileInstanceV1
+    from .biie_file_staging_data import BiieFileStagingData
+    from .biie_file_staging_data_v1 import BiieFileStagingDataV1
+    from .billing_business_initiative import BillingBusinessInitiative
+    from .billing_business_initiative_v1 import BillingBusinessInitiativeV1
+    from .billing_request import BillingRequest
+    from .billing_request_state import BillingRequestState
+    from .billing_request_state_v1 import BillingRequestStateV1
+    from .billing_request_v1 import BillingRequestV1
+    from .charge_capture_error import ChargeCaptureError
+    from .charge_capture_error_v1 import ChargeCaptureErrorV1
+    from .charge_invoice_number import ChargeInvoiceNumber
+    from .charge_invoice_number_v1 import ChargeInvoiceNumberV1
+
+    # from .charge_metrics import ChargeMetrics
+    # from .charge_metrics_v1 import ChargeMetricsV1
+    from .charge_post_date import ChargePostDate
+    from .charge_post_date_v1 import ChargePostDateV1
+    from .charge_state_attempt import ChargeStateAttempt
+    from .charge_state_attempt_v1 import ChargeStateAttemptV1
+    from .combined_charge import CombinedCharge
+    from .combined_charge_tree import CombinedChargeTree
+    from .combined_charge_tree_v1 import CombinedChargeTreeV1
+    from .combined_charge_v1 import CombinedChargeV1
+    from .combined_disbursement import CombinedDisbursement
+    from .combined_disbursement_tree import CombinedDisbursementTree
+    from .combined_disbursement_tree_v1 import CombinedDisbursementTreeV1
+    from .combined_disbursement_v1 import CombinedDisbursementV1
+    from .corollary_data import CorollaryData
+    from .corollary_data_v1 import CorollaryDataV1
+    from .country_suppression import CountrySuppression
+    from .country_suppression_v1 import CountrySuppressionV1
+    from .device_order_tracking import DeviceOrderTracking
+    from .device_order_tracking_v1 import DeviceOrderTrackingV1
+    from .disbursement_invoice_number import DisbursementInvoiceNumber
+    from .disbursement_invoice_number_v1 import DisbursementInvoiceNumberV1
+    from .email_audit import EmailAudit
+    from .email_audit_v1 import EmailAuditV1
+    from .email_developer_charge import EmailDeveloperCharge
+    from .email_developer_charge_v1 import EmailDeveloperChargeV1
+    from .explanation import Explanation
+    from .explanation_data import ExplanationData
+    from .explanation_data_v1 import ExplanationDataV1
+    from .explanation_v1 import ExplanationV1
+    from .export_tracker import ExportTracker
+    from .export_tracker_v1 import ExportTrackerV1
+    from .fee import Fee
+    from .fee_exception import FeeException
+    from .fee_exception_v1 import FeeExceptionV1
+    from .fee_v1 import FeeV1
+    from .flight_check import FlightCheck
+    from .flight_check_archive import FlightCheckArchive
+    from .flight_check_archive_v1 import FlightCheckArchiveV1
+    from .flight_check_execution import FlightCheckExecution
+    from .flight_check_execution_v1 import FlightCheckExecutionV1
+    from .flight_check_v1 import FlightCheckV1
+    from .heartbeat import Heartbeat
+    from .heartbeat_v1 import HeartbeatV1
+    from .invoice_charge import InvoiceCharge
+    from .invoice_charge_v1 import InvoiceChargeV1
+    from .job_lock import JobLock
+    from .job_lock_v1 import JobLockV1
+    from .merchant_device_info import MerchantDeviceInfo
+    from .merchant_device_info_v1 import MerchantDeviceInfoV1
+    from .merchant_odessa_mapping import MerchantOdessaMapping
+    from .merchant_odessa_mapping_v1 import MerchantOdessaMappingV1
+    from .merchant_queue_sensitive import MerchantQueueSensitive
+    from .merchant_queue_sensitive_v1 import MerchantQueueSensitiveV1
+    from .merchant_subscription_action import MerchantSubscriptionAction
+    from .merchant_subscription_action_v1 import MerchantSubscriptionActionV1
+    from .merchant_suppression import MerchantSuppression
+    from .merchant_suppression_by_app import MerchantSuppressionByApp
+    from .merchant_suppression_by_app_v1 import MerchantSuppressionByAppV1
+    from .merchant_suppression_v1 import MerchantSuppressionV1
+    from .merchant_terms_acceptance import MerchantTermsAcceptance
+    from .merchant_terms_acceptance_events import MerchantTermsAcceptanceEvents
+    from .merchant_terms_acceptance_events_v1 import MerchantTermsAcceptanceEventsV1
+    from .merchant_terms_acceptance_failed_event_log import MerchantTermsAcceptanceFailedEventLog
+    from .merchant_terms_acceptance_failed_event_log_v1 import MerchantTermsAcceptanceFailedEventLogV1
+    from .merchant_terms_acceptance_v1 import MerchantTermsAcceptanceV1
+    from .merchant_terms_missing_acceptance import MerchantTermsMissingAcceptance
+    from .merchant_terms_missing_acceptance_v1 import MerchantTermsMissingAcceptanceV1
+    from .offboarding import Offboarding
+    from .offboarding_v1 import OffboardingV1
+    from .plan_authorization_settings import PlanAuthorizationSettings
+    from .plan_authorization_settings_v1 import PlanAuthorizationSettingsV1
+    from .plan_meta import PlanMeta
+    from .plan_meta_history import PlanMetaHistory
+    from .plan_meta_history_v1 import PlanMetaHistoryV1
+    from .plan_meta_v1 import PlanMetaV1
+    from .producer_failure import ProducerFailure
+    from .producer_failure_v1 import ProducerFailureV1
+    from .promo import Promo
+    from .promo_control import PromoControl
+    from .promo_control_v1 import PromoControlV1
+    from .promo_v1 import PromoV1
+    from .remit_merchant_details import RemitMerchantDetails
+    from .remit_merchant_details_v1 import RemitMerchantDetailsV1
+    from .reseller_app_rev_share import ResellerAppRevShare
+    from .reseller_app_rev_share_v1 import ResellerAppRevShareV1
+    from .reseller_invoice_alliance import ResellerInvoiceAlliance
+    from .reseller_invoice_alliance_v1 import ResellerInvoiceAllianceV1
+    from .reseller_plan_fee import ResellerPlanFee
+    from .reseller_plan_fee_v1 import ResellerPlanFeeV1
+    from .reseller_plan_rev_share import ResellerPlanRevShare
+    from .reseller_plan_rev_share_v1 import ResellerPlanRevShareV1
+    from .reseller_suppression import ResellerSuppression
+    from .reseller_suppression_v1 import ResellerSuppressionV1
+    from .reseller_usage_job_config import ResellerUsageJobConfig
+    from .reseller_usage_job_config_v1 import ResellerUsageJobConfigV1
+    from .rev_share import RevShare
+    from .rev_share_v1 import RevShareV1
+    from .seasonal_merchant_trans_audit import SeasonalMerchantTransAudit
+    from .seasonal_merchant_trans_audit_v1 import SeasonalMerchantTransAuditV1
+    from .seasonal_reseller_info import SeasonalResellerInfo
+    from .seasonal_reseller_info_v1 import SeasonalResellerInfoV1
+    from .server_config import ServerConfig
+    from .server_config_v1 import ServerConfigV1
+    from .stage_app_metered_event import StageAppMeteredEvent
+    from .stage_app_metered_event_v1 import StageAppMeteredEventV1
+    from .stage_charge import StageCharge
+    from .stage_charge_capture_error import StageChargeCaptureError
+    from .stage_charge_capture_error_v1 import StageChargeCaptureErrorV1
+    from .stage_charge_history import StageChargeHistory
+    from .stage_charge_history_v1 import StageChargeHistoryV1
+    from .stage_charge_state_attempt import StageChargeStateAttempt
+    from .stage_charge_state_attempt_v1 import StageChargeStateAttemptV1
+    from .stage_charge_update import StageChargeUpdate
+    from .stage_charge_update_v1 import StageChargeUpdateV1
+    from .stage_charge_v1 import StageChargeV1
+    from .stage_email import StageEmail
+    from .stage_email_merchant_charge import StageEmailMerchantCharge
+    from .stage_email_merchant_charge_v1 import StageEmailMerchantChargeV1
+    from .stage_email_v1 import StageEmailV1
+    from .stage_infolease_charge_attempt import StageInfoleaseChargeAttempt
+    from .stage_infolease_charge_attempt_v1 import StageInfoleaseChargeAttemptV1
+    from .stage_infolease_disbursement_attempt import StageInfoleaseDisbursementAttempt
+    from .stage_infolease_disbursement_attempt_v1 import StageInfoleaseDisbursementAttemptV1
+    from .stage_merchant_app_charge import StageMerchantAppCharge
+    from .stage_merchant_app_charge_v1 import StageMerchantAppChargeV1
+    from .stage_merchant_plan_charge import StageMerchantPlanCharge
+    from .stage_merchant_plan_charge_v1 import StageMerchantPlanChargeV1
+    from .stage_vendor_disbursement_error import StageVendorDisbursementError
+    from .stage_vendor_disbursement_error_v1 import StageVendorDisbursementErrorV1
+    from .stage_vendor_disbursement_state_attempt import StageVendorDisbursementStateAttempt
+    from .stage_vendor_disbursement_state_attempt_v1 import StageVendorDisbursementStateAttemptV1
+    from .stop_ach_history import StopAchHistory
+    from .stop_ach_history_v1 import StopAchHistoryV1
+    from .suppression_metrics import SuppressionMetrics
+    from .suppression_metrics_v1 import SuppressionMetricsV1
+    from .vat_vendor_disbursement import VatVendorDisbursement
+    from .vat_vendor_disbursement_v1 import VatVendorDisbursementV1
+    from .vendor_disbursement_error import VendorDisbursementError
+    from .vendor_disbursement_error_v1 import VendorDisbursementErrorV1
+    from .vendor_disbursement_state_attempt import VendorDisbursementStateAttempt
+    from .vendor_disbursement_state_attempt_v1 import VendorDisbursementStateAttemptV1
 
 __all__ = [
     "AppSuppression",
@@ -356,3 +361,184 @@ __all__ = [
     "VendorDisbursementStateAttempt",
     "VendorDisbursementStateAttemptV1",
 ]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AppSuppression": ".app_suppression",
+        "AppSuppressionV1": ".app_suppression_v1",
+        "AutoDebitNoAuthConfig": ".auto_debit_no_auth_config",
+        "AutoDebitNoAuthConfigV1": ".auto_debit_no_auth_config_v1",
+        "BankRouting": ".bank_routing",
+        "BankRoutingV1": ".bank_routing_v1",
+        "BannerCurb": ".banner_curb",
+        "BannerCurbV1": ".banner_curb_v1",
+        "BannerData": ".banner_data",
+        "BannerDataV1": ".banner_data_v1",
+        "BannerDetails": ".banner_details",
+        "BannerDetailsV1": ".banner_details_v1",
+        "BiContext": ".bi_context",
+        "BiContextV1": ".bi_context_v1",
+        "BiieConfig": ".biie_config",
+        "BiieConfigV1": ".biie_config_v1",
+        "BiieFileDef": ".biie_file_def",
+        "BiieFileDefV1": ".biie_file_def_v1",
+        "BiieFileInstance": ".biie_file_instance",
+        "BiieFileInstanceRequest": ".biie_file_instance_request",
+        "BiieFileInstanceRequestV1": ".biie_file_instance_request_v1",
+        "BiieFileInstanceV1": ".biie_file_instance_v1",
+        "BiieFileStagingData": ".biie_file_staging_data",
+        "BiieFileStagingDataV1": ".biie_file_staging_data_v1",
+        "BillingBusinessInitiative": ".billing_business_initiative",
+        "BillingBusinessInitiativeV1": ".billing_business_initiative_v1",
+        "BillingRequest": ".billing_request",
+        "BillingRequestState": ".billing_request_state",
+        "BillingRequestStateV1": ".billing_request_state_v1",
+        "BillingRequestV1": ".billing_request_v1",
+        "ChargeCaptureError": ".charge_capture_error",
+        "ChargeCaptureErrorV1": ".charge_capture_error_v1",
+        "ChargeInvoiceNumber": ".charge_invoice_number",
+        "ChargeInvoiceNumberV1": ".charge_invoice_number_v1",
+        "ChargePostDate": ".charge_post_date",
+        "ChargePostDateV1": ".charge_post_date_v1",
+        "ChargeStateAttempt": ".charge_state_attempt",
+        "ChargeStateAttemptV1": ".charge_state_attempt_v1",
+        "CombinedCharge": ".combined_charge",
+        "CombinedChargeTree": ".combined_charge_tree",
+        "CombinedChargeTreeV1": ".combined_charge_tree_v1",
+        "CombinedChargeV1": ".combined_charge_v1",
+        "CombinedDisbursement": ".combined_disbursement",
+        "CombinedDisbursementTree": ".combined_disbursement_tree",
+        "CombinedDisbursementTreeV1": ".combined_disbursement_tree_v1",
+        "CombinedDisbursementV1": ".combined_disbursement_v1",
+        "CorollaryData": ".corollary_data",
+        "CorollaryDataV1": ".corollary_data_v1",
+        "CountrySuppression": ".country_suppression",
+        "CountrySuppressionV1": ".country_suppression_v1",
+        "DeviceOrderTracking": ".device_order_tracking",
+        "DeviceOrderTrackingV1": ".device_order_tracking_v1",
+        "DisbursementInvoiceNumber": ".disbursement_invoice_number",
+        "DisbursementInvoiceNumberV1": ".disbursement_invoice_number_v1",
+        "EmailAudit": ".email_audit",
+        "EmailAuditV1": ".email_audit_v1",
+        "EmailDeveloperCharge": ".email_developer_charge",
+        "EmailDeveloperChargeV1": ".email_developer_charge_v1",
+        "Explanation": ".explanation",
+        "ExplanationData": ".explanation_data",
+        "ExplanationDataV1": ".explanation_data_v1",
+        "ExplanationV1": ".explanation_v1",
+        "ExportTracker": ".export_tracker",
+        "ExportTrackerV1": ".export_tracker_v1",
+        "Fee": ".fee",
+        "FeeException": ".fee_exception",
+        "FeeExceptionV1": ".fee_exception_v1",
+        "FeeV1": ".fee_v1",
+        "FlightCheck": ".flight_check",
+        "FlightCheckArchive": ".flight_check_archive",
+        "FlightCheckArchiveV1": ".flight_check_archive_v1",
+        "FlightCheckExecution": ".flight_check_execution",
+        "FlightCheckExecutionV1": ".flight_check_execution_v1",
+        "FlightCheckV1": ".flight_check_v1",
+        "Heartbeat": ".heartbeat",
+        "HeartbeatV1": ".heartbeat_v1",
+        "InvoiceCharge": ".invoice_charge",
+        "InvoiceChargeV1": ".invoice_charge_v1",
+        "JobLock": ".job_lock",
+        "JobLockV1": ".job_lock_v1",
+        "MerchantDeviceInfo": ".merchant_device_info",
+        "MerchantDeviceInfoV1": ".merchant_device_info_v1",
+        "MerchantOdessaMapping": ".merchant_odessa_mapping",
+        "MerchantOdessaMappingV1": ".merchant_odessa_mapping_v1",
+        "MerchantQueueSensitive": ".merchant_queue_sensitive",
+        "MerchantQueueSensitiveV1": ".merchant_queue_sensitive_v1",
+        "MerchantSubscriptionAction": ".merchant_subscription_action",
+        "MerchantSubscriptionActionV1": ".merchant_subscription_action_v1",
+        "MerchantSuppression": ".merchant_suppression",
+        "MerchantSuppressionByApp": ".merchant_suppression_by_app",
+        "MerchantSuppressionByAppV1": ".merchant_suppression_by_app_v1",
+        "MerchantSuppressionV1": ".merchant_suppression_v1",
+        "MerchantTermsAcceptance": ".merchant_terms_acceptance",
+        "MerchantTermsAcceptanceEvents": ".merchant_terms_acceptance_events",
+        "MerchantTermsAcceptanceEventsV1": ".merchant_terms_acceptance_events_v1",
+        "MerchantTermsAcceptanceFailedEventLog": ".merchant_terms_acceptance_failed_event_log",
+        "MerchantTermsAcceptanceFailedEventLogV1": ".merchant_terms_acceptance_failed_event_log_v1",
+        "MerchantTermsAcceptanceV1": ".merchant_terms_acceptance_v1",
+        "MerchantTermsMissingAcceptance": ".merchant_terms_missing_acceptance",
+        "MerchantTermsMissingAcceptanceV1": ".merchant_terms_missing_acceptance_v1",
+        "Offboarding": ".offboarding",
+        "OffboardingV1": ".offboarding_v1",
+        "PlanAuthorizationSettings": ".plan_authorization_settings",
+        "PlanAuthorizationSettingsV1": ".plan_authorization_settings_v1",
+        "PlanMeta": ".plan_meta",
+        "PlanMetaHistory": ".plan_meta_history",
+        "PlanMetaHistoryV1": ".plan_meta_history_v1",
+        "PlanMetaV1": ".plan_meta_v1",
+        "ProducerFailure": ".producer_failure",
+        "ProducerFailureV1": ".producer_failure_v1",
+        "Promo": ".promo",
+        "PromoControl": ".promo_control",
+        "PromoControlV1": ".promo_control_v1",
+        "PromoV1": ".promo_v1",
+        "RemitMerchantDetails": ".remit_merchant_details",
+        "RemitMerchantDetailsV1": ".remit_merchant_details_v1",
+        "ResellerAppRevShare": ".reseller_app_rev_share",
+        "ResellerAppRevShareV1": ".reseller_app_rev_share_v1",
+        "ResellerInvoiceAlliance": ".reseller_invoice_alliance",
+        "ResellerInvoiceAllianceV1": ".reseller_invoice_alliance_v1",
+        "ResellerPlanFee": ".reseller_plan_fee",
+        "ResellerPlanFeeV1": ".reseller_plan_fee_v1",
+        "ResellerPlanRevShare": ".reseller_plan_rev_share",
+        "ResellerPlanRevShareV1": ".reseller_plan_rev_share_v1",
+        "ResellerSuppression": ".reseller_suppression",
+        "ResellerSuppressionV1": ".reseller_suppression_v1",
+        "ResellerUsageJobConfig": ".reseller_usage_job_config",
+        "ResellerUsageJobConfigV1": ".reseller_usage_job_config_v1",
+        "RevShare": ".rev_share",
+        "RevShareV1": ".rev_share_v1",
+        "SeasonalMerchantTransAudit": ".seasonal_merchant_trans_audit",
+        "SeasonalMerchantTransAuditV1": ".seasonal_merchant_trans_audit_v1",
+        "SeasonalResellerInfo": ".seasonal_reseller_info",
+        "SeasonalResellerInfoV1": ".seasonal_reseller_info_v1",
+        "ServerConfig": ".server_config",
+        "ServerConfigV1": ".server_config_v1",
+        "StageAppMeteredEvent": ".stage_app_metered_event",
+        "StageAppMeteredEventV1": ".stage_app_metered_event_v1",
+        "StageCharge": ".stage_charge",
+        "StageChargeCaptureError": ".stage_charge_capture_error",
+        "StageChargeCaptureErrorV1": ".stage_charge_capture_error_v1",
+        "StageChargeHistory": ".stage_charge_history",
+        "StageChargeHistoryV1": ".stage_charge_history_v1",
+        "StageChargeStateAttempt": ".stage_charge_state_attempt",
+        "StageChargeStateAttemptV1": ".stage_charge_state_attempt_v1",
+        "StageChargeUpdate": ".stage_charge_update",
+        "StageChargeUpdateV1": ".stage_charge_update_v1",
+        "StageChargeV1": ".stage_charge_v1",
+        "StageEmail": ".stage_email",
+        "StageEmailMerchantCharge": ".stage_email_merchant_charge",
+        "StageEmailMerchantChargeV1": ".stage_email_merchant_charge_v1",
+        "StageEmailV1": ".stage_email_v1",
+        "StageInfoleaseChargeAttempt": ".stage_infolease_charge_attempt",
+        "StageInfoleaseChargeAttemptV1": ".stage_infolease_charge_attempt_v1",
+        "StageInfoleaseDisbursementAttempt": ".stage_infolease_disbursement_attempt",
+        "StageInfoleaseDisbursementAttemptV1": ".stage_infolease_disbursement_attempt_v1",
+        "StageMerchantAppCharge": ".stage_merchant_app_charge",
+        "StageMerchantAppChargeV1": ".stage_merchant_app_charge_v1",
+        "StageMerchantPlanCharge": ".stage_merchant_plan_charge",
+        "StageMerchantPlanChargeV1": ".stage_merchant_plan_charge_v1",
+        "StageVendorDisbursementError": ".stage_vendor_disbursement_error",
+        "StageVendorDisbursementErrorV1": ".stage_vendor_disbursement_error_v1",
+        "StageVendorDisbursementStateAttempt": ".stage_vendor_disbursement_state_attempt",
+        "StageVendorDisbursementStateAttemptV1": ".stage_vendor_disbursement_state_attempt_v1",
+        "StopAchHistory": ".stop_ach_history",
+        "StopAchHistoryV1": ".stop_ach_history_v1",
+        "SuppressionMetrics": ".suppression_metrics",
+        "SuppressionMetricsV1": ".suppression_metrics_v1",
+        "VatVendorDisbursement": ".vat_vendor_disbursement",
+        "VatVendorDisbursementV1": ".vat_vendor_disbursement_v1",
+        "VendorDisbursementError": ".vendor_disbursement_error",
+        "VendorDisbursementErrorV1": ".vendor_disbursement_error_v1",
+        "VendorDisbursementStateAttempt": ".vendor_disbursement_state_attempt",
+        "VendorDisbursementStateAttemptV1": ".vendor_disbursement_state_attempt_v1",
+    },
+)
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class SuppressionContext(str, Enum):
@@ -45,7 +46,9 @@ class AppSuppression(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True, description="Unique identifier for the app suppression")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, unique=True, description="Unique identifier for the app suppression"
+    )
     developer_app_id: int | None = Field(default=None, description="ID of the developer app")
     merchant_id: int | None = Field(default=None, description="ID of the merchant")
     reseller_id: int | None = Field(default=None, description="ID of the reseller")
@@ -61,23 +64,3 @@ class AppSuppression(RhizomeModel, table=False):
     finalization_time: datetime.datetime | None = Field(
         default=None, description="Time when the suppression was finalized"
     )
-
-    def sanitize(self) -> AppSuppression:
-        """Return a sanitized copy of this AppSuppression instance."""
-        return AppSuppression(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            developer_app_id=self.developer_app_id,
-            merchant_id=self.merchant_id,
-            reseller_id=self.reseller_id,
-            country_id=self.country_id,
-            app_id=self.app_id,
-            app_billable=self.app_billable,
-            app_exportable=self.app_exportable,
-            context=self.context,
-            detail=self.detail,
-            start_time=self.start_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            finalization_time=self.finalization_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class AutoDebitNoAuthConfig(RhizomeModel, table=False):
@@ -24,19 +25,8 @@ class AutoDebitNoAuthConfig(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, description="Unique identifier for the config")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Unique identifier for the config")
     description: str = Field(max_length=200, description="Description of the configuration")
     hierarchy: str = Field(max_length=255, description="Hierarchy information")
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> AutoDebitNoAuthConfig:
-        """Return a sanitized copy of this AutoDebitNoAuthConfig instance."""
-        return AutoDebitNoAuthConfig(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            description=self.description,
-            hierarchy=self.hierarchy,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
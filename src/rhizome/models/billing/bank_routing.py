@@ -23,11 +23,3 @@ class BankRouting(RhizomeModel, table=False):
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     routing_number: str = Field(max_length=40, unique=True, description="Bank routing number")
     bank_name: str = Field(max_length=256, description="Name of the bank")
-
-    def sanitize(self) -> BankRouting:
-        """Return a sanitized copy of this BankRouting instance."""
-        return BankRouting(
-            id=self.id,
-            routing_number=self.routing_number,
-            bank_name=self.bank_name,
-        )
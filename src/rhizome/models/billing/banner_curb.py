@@ -27,13 +27,3 @@ class BannerCurb(RhizomeModel, table=False):
     merchant_uuid: str = Field(max_length=30, description="Merchant UUID")
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> BannerCurb:
-        """Return a sanitized copy of this BannerCurb instance."""
-        return BannerCurb(
-            id=self.id,
-            banner_data_id=self.banner_data_id,
-            merchant_uuid=self.merchant_uuid,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
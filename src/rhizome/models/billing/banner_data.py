@@ -44,19 +44,3 @@ class BannerData(RhizomeModel, table=False):
     owner: str = Field(max_length=30, description="Banner owner")
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> BannerData:
-        """Return a sanitized copy of this BannerData instance."""
-        return BannerData(
-            id=self.id,
-            banner_uuid=self.banner_uuid,
-            banner_lookup_name=self.banner_lookup_name,
-            banner_lookup_value=self.banner_lookup_value,
-            start_date=self.start_date,
-            end_date=self.end_date,
-            contentful_template_id=self.contentful_template_id,
-            active=self.active,
-            owner=self.owner,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
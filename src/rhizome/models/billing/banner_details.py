@@ -28,14 +28,3 @@ class BannerDetails(RhizomeModel, table=False):
     config: str | None = Field(default=None, max_length=256, description="Banner configuration")
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> BannerDetails:
-        """Return a sanitized copy of this BannerDetails instance."""
-        return BannerDetails(
-            id=self.id,
-            banner_data_id=self.banner_data_id,
-            tag=self.tag,
-            config=self.config,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -26,13 +26,3 @@ class BiContext(RhizomeModel, table=False):
     context_id: int = Field(description="context_id")
     billing_business_initiative_id: int = Field(description="billing_business_initiative_id")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> BiContext:
-        """Return a sanitized copy of this BiContext instance."""
-        return BiContext(
-            id=self.id,
-            context=self.context,
-            context_id=self.context_id,
-            billing_business_initiative_id=self.billing_business_initiative_id,
-            created_time=self.created_time,
-        )
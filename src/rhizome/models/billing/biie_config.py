@@ -7,10 +7,12 @@ billing database, along with sanitization functions.
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BiieConfig(RhizomeModel, table=False):
@@ -21,13 +23,5 @@ class BiieConfig(RhizomeModel, table=False):
     """
 
     id: int = Field(primary_key=True, description="id")
-    uuid: str = Field(max_length=13, description="uuid")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="uuid")
     enabled: bool = Field(description="enabled")
-
-    def sanitize(self) -> BiieConfig:
-        """Return a sanitized copy of this BiieConfig instance."""
-        return BiieConfig(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            enabled=self.enabled,
-        )
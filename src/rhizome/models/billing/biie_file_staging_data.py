@@ -54,39 +54,3 @@ class BiieFileStagingData(RhizomeModel, table=False):
     field20: str | None = Field(default=None, max_length=100, description="field20")
     key1: str | None = Field(default=None, max_length=100, description="key1")
     key2: str | None = Field(default=None, max_length=100, description="key2")
-
-    def sanitize(self) -> BiieFileStagingData:
-        """Return a sanitized copy of this BiieFileStagingData instance."""
-        return BiieFileStagingData(
-            id=self.id,
-            biie_file_instance_id=self.biie_file_instance_id,
-            record_num=self.record_num,
-            record_status=self.record_status,
-            reason_code=self.reason_code,
-            reason_detail=self.reason_detail,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            raw_record=self.raw_record,
-            field1=self.field1,
-            field2=self.field2,
-            field3=self.field3,
-            field4=self.field4,
-            field5=self.field5,
-            field6=self.field6,
-            field7=self.field7,
-            field8=self.field8,
-            field9=self.field9,
-            field10=self.field10,
-            field11=self.field11,
-            field12=self.field12,
-            field13=self.field13,
-            field14=self.field14,
-            field15=self.field15,
-            field16=self.field16,
-            field17=self.field17,
-            field18=self.field18,
-            field19=self.field19,
-            field20=self.field20,
-            key1=self.key1,
-            key2=self.key2,
-        )
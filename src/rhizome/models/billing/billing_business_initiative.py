@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BillingBusinessInitiative(RhizomeModel, table=False):
@@ -23,15 +24,6 @@ class BillingBusinessInitiative(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     name: str = Field(max_length=63, description="name")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> BillingBusinessInitiative:
-        """Return a sanitized copy of this BillingBusinessInitiative instance."""
-        return BillingBusinessInitiative(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            name=self.name,
-            created_time=self.created_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BillingRequest(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class BillingRequest(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     query_uuid: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     name: str = Field(max_length=127, description="name")
     status: str | None = Field(default=None, description="status")
@@ -33,19 +34,3 @@ class BillingRequest(RhizomeModel, table=False):
     modified_time: datetime.datetime = Field(description="modified_time")
     completed_time: datetime.datetime | None = Field(default=None, description="completed_time")
     server_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> BillingRequest:
-        """Return a sanitized copy of this BillingRequest instance."""
-        return BillingRequest(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            query_uuid=self.query_uuid,  # This is an int, not a UUID, so don't sanitize
-            name=self.name,
-            status=self.status,
-            input_class=self.input_class,
-            entry_point=self.entry_point,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            completed_time=self.completed_time,
-            server_id=self.server_id,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BillingRequestState(RhizomeModel, table=False):
@@ -23,15 +24,6 @@ class BillingRequestState(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    query_uuid: str | None = Field(default=None, description="UUID field")
+    query_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     state: str | None = Field(default=None, description="state")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> BillingRequestState:
-        """Return a sanitized copy of this BillingRequestState instance."""
-        return BillingRequestState(
-            id=self.id,
-            query_uuid=sanitize_uuid_field(self.query_uuid, 13),
-            state=self.state,
-            created_time=self.created_time,
-        )
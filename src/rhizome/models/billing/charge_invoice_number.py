@@ -25,12 +25,3 @@ class ChargeInvoiceNumber(RhizomeModel, table=False):
     charge_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     invoice_number: str = Field(max_length=30, description="invoice_number")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> ChargeInvoiceNumber:
-        """Return a sanitized copy of this ChargeInvoiceNumber instance."""
-        return ChargeInvoiceNumber(
-            id=self.id,
-            charge_id=self.charge_id,
-            invoice_number=self.invoice_number,
-            created_time=self.created_time,
-        )
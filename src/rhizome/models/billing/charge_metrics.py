@@ -48,24 +48,3 @@ class ChargeMetrics(RhizomeModel, table=False):
     num_ach_reject_merchants: int = Field(description="num_ach_reject_merchants")
     num_incurred_merchants: int = Field(description="num_incurred_merchants")
     orig_num_incurred_merchants: int = Field(description="orig_num_incurred_merchants")
-
-    def sanitize(self) -> ChargeMetrics:
-        """Return a sanitized copy of this ChargeMetrics instance."""
-        return ChargeMetrics(
-            stmt_month=self.stmt_month,
-            category=self.category,
-            net_pending=self.net_pending,
-            net_incurred=self.net_incurred,
-            net_in_progress=self.net_in_progress,
-            net_ach_reject=self.net_ach_reject,
-            net_billed=self.net_billed,
-            net_written_off=self.net_written_off,
-            net_waived=self.net_waived,
-            net_canceled=self.net_canceled,
-            num_charges=self.num_charges,
-            num_merchants=self.num_merchants,
-            num_in_progress_merchants=self.num_in_progress_merchants,
-            num_ach_reject_merchants=self.num_ach_reject_merchants,
-            num_incurred_merchants=self.num_incurred_merchants,
-            orig_num_incurred_merchants=self.orig_num_incurred_merchants,
-        )
@@ -26,13 +26,3 @@ class ChargePostDate(RhizomeModel, table=False):
     post_date: datetime.date | None = Field(default=None, description="post_date")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> ChargePostDate:
-        """Return a sanitized copy of this ChargePostDate instance."""
-        return ChargePostDate(
-            id=self.id,
-            charge_id=self.charge_id,
-            post_date=self.post_date,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -25,12 +25,3 @@ class CombinedChargeTree(RhizomeModel, table=False):
     combined_charge_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     charge_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> CombinedChargeTree:
-        """Return a sanitized copy of this CombinedChargeTree instance."""
-        return CombinedChargeTree(
-            id=self.id,
-            combined_charge_id=self.combined_charge_id,
-            charge_id=self.charge_id,
-            created_time=self.created_time,
-        )
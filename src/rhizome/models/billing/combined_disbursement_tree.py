@@ -27,12 +27,3 @@ class CombinedDisbursementTree(RhizomeModel, table=False):
     )
     charge_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> CombinedDisbursementTree:
-        """Return a sanitized copy of this CombinedDisbursementTree instance."""
-        return CombinedDisbursementTree(
-            id=self.id,
-            combined_disbursement_id=self.combined_disbursement_id,
-            charge_id=self.charge_id,
-            created_time=self.created_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class DeviceOrderTracking(RhizomeModel, table=False):
@@ -23,23 +24,10 @@ class DeviceOrderTracking(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     order_month: datetime.date = Field(description="order_month")
     serial_number: str = Field(max_length=16, description="serial_number")
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     activity: str | None = Field(default=None, description="activity")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> DeviceOrderTracking:
-        """Return a sanitized copy of this DeviceOrderTracking instance."""
-        return DeviceOrderTracking(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            order_month=self.order_month,
-            serial_number=self.serial_number,
-            merchant_id=self.merchant_id,
-            activity=self.activity,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -27,12 +27,3 @@ class DisbursementInvoiceNumber(RhizomeModel, table=False):
     )
     invoice_number: str = Field(max_length=30, description="invoice_number")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> DisbursementInvoiceNumber:
-        """Return a sanitized copy of this DisbursementInvoiceNumber instance."""
-        return DisbursementInvoiceNumber(
-            id=self.id,
-            combined_disbursement_id=self.combined_disbursement_id,
-            invoice_number=self.invoice_number,
-            created_time=self.created_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class Explanation(RhizomeModel, table=False):
@@ -23,17 +24,7 @@ class Explanation(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    explanation_uuid: str | None = Field(default=None, description="UUID field")
+    explanation_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> Explanation:
-        """Return a sanitized copy of this Explanation instance."""
-        return Explanation(
-            id=self.id,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            merchant_id=self.merchant_id,
-            explanation_uuid=sanitize_uuid_field(self.explanation_uuid, 13),
-            created_time=self.created_time,
-        )
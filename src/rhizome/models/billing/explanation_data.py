@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ExplanationData(RhizomeModel, table=False):
@@ -23,17 +24,7 @@ class ExplanationData(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    explanation_uuid: str | None = Field(default=None, description="UUID field")
+    explanation_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     json_class: str = Field(max_length=255, description="json_class")
     json_data: str = Field(max_length=2047, description="json_data")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> ExplanationData:
-        """Return a sanitized copy of this ExplanationData instance."""
-        return ExplanationData(
-            id=self.id,
-            explanation_uuid=sanitize_uuid_field(self.explanation_uuid, 13),
-            json_class=self.json_class,
-            json_data=self.json_data,
-            created_time=self.created_time,
-        )
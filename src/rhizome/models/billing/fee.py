@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class FeeType(str, Enum):
@@ -46,7 +47,9 @@ class Fee(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True, description="Unique identifier for the fee")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, unique=True, description="Unique identifier for the fee"
+    )
     merchant_id: int = Field(description="ID of the merchant")
     merchant_plan_id: int = Field(description="ID of the merchant plan")
     merchant_plan_type: str | None = Field(default=None, max_length=20, description="Type of merchant plan")
@@ -56,27 +59,9 @@ class Fee(RhizomeModel, table=False):
     amount: int = Field(description="Fee amount in smallest currency unit")
     status: FeeStatus = Field(description="Current status of the fee")
     export_month: datetime.date | None = Field(default=None, description="Month for export processing")
-    request_uuid: str = Field(max_length=13, description="UUID of the request that generated this fee")
+    request_uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, description="UUID of the request that generated this fee"
+    )
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
     reason: str | None = Field(default=None, max_length=100, description="Reason for the fee status")
-
-    def sanitize(self) -> Fee:
-        """Return a sanitized copy of this Fee instance."""
-        return Fee(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            merchant_id=self.merchant_id,
-            merchant_plan_id=self.merchant_plan_id,
-            merchant_plan_type=self.merchant_plan_type,
-            merchant_plan_group_id=self.merchant_plan_group_id,
-            fee_type=self.fee_type,
-            currency=self.currency,
-            amount=self.amount,
-            status=self.status,
-            export_month=self.export_month,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            reason=self.reason,
-        )
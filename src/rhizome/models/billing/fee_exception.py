@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ReferenceTypeType(str, Enum):
@@ -30,7 +31,7 @@ class FeeException(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     reference_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     reference_type: ReferenceTypeType = Field(description="reference_type")
     fee_type: str | None = Field(default=None, description="fee_type")
@@ -40,19 +41,3 @@ class FeeException(RhizomeModel, table=False):
     finalization_time: datetime.datetime | None = Field(default=None, description="finalization_time")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> FeeException:
-        """Return a sanitized copy of this FeeException instance."""
-        return FeeException(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            reference_id=self.reference_id,
-            reference_type=self.reference_type,
-            fee_type=self.fee_type,
-            context=self.context,
-            detail=self.detail,
-            start_time=self.start_time,
-            finalization_time=self.finalization_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class FlightCheck(RhizomeModel, table=False):
@@ -23,23 +24,10 @@ class FlightCheck(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     executor: str = Field(max_length=255, description="executor")
     enabled: bool = Field(description="enabled")
     cycle_minutes: int = Field(description="cycle_minutes")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
     deleted_time: datetime.datetime | None = Field(default=None, description="deleted_time")
-
-    def sanitize(self) -> FlightCheck:
-        """Return a sanitized copy of this FlightCheck instance."""
-        return FlightCheck(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            executor=self.executor,
-            enabled=self.enabled,
-            cycle_minutes=self.cycle_minutes,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            deleted_time=self.deleted_time,
-        )
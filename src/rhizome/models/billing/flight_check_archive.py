@@ -28,15 +28,3 @@ class FlightCheckArchive(RhizomeModel, table=False):
     payload: str | None = Field(default=None, description="payload")
     completed_time: datetime.datetime = Field(description="completed_time")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> FlightCheckArchive:
-        """Return a sanitized copy of this FlightCheckArchive instance."""
-        return FlightCheckArchive(
-            id=self.id,
-            executor_id=self.executor_id,
-            status=self.status,
-            output=self.output,
-            payload=self.payload,
-            completed_time=self.completed_time,
-            created_time=self.created_time,
-        )
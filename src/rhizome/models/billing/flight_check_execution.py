@@ -28,15 +28,3 @@ class FlightCheckExecution(RhizomeModel, table=False):
     payload: str | None = Field(default=None, description="payload")
     completed_time: datetime.datetime | None = Field(default=None, description="completed_time")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> FlightCheckExecution:
-        """Return a sanitized copy of this FlightCheckExecution instance."""
-        return FlightCheckExecution(
-            id=self.id,
-            executor_id=self.executor_id,
-            status=self.status,
-            output=self.output,
-            payload=self.payload,
-            completed_time=self.completed_time,
-            created_time=self.created_time,
-        )
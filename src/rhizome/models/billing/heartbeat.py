@@ -26,14 +26,3 @@ class Heartbeat(RhizomeModel, table=False):
     position: int | None = Field(default=None, description="Position in binary log")
     relay_master_log_file: str | None = Field(default=None, max_length=255, description="Master log file name")
     exec_master_log_pos: int | None = Field(default=None, description="Execution position in master log")
-
-    def sanitize(self) -> Heartbeat:
-        """Return a sanitized copy of this Heartbeat instance."""
-        return Heartbeat(
-            ts=self.ts,
-            server_id=self.server_id,
-            file=self.file,
-            position=self.position,
-            relay_master_log_file=self.relay_master_log_file,
-            exec_master_log_pos=self.exec_master_log_pos,
-        )
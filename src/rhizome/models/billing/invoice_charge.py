@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class InvoiceCharge(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class InvoiceCharge(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     type: str | None = Field(default=None, description="type")
     charge_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     merchant_app_charge_Id: int | None = Field(default=None, description="merchant_app_charge_Id")
@@ -39,25 +40,3 @@ class InvoiceCharge(RhizomeModel, table=False):
     dev_export: str | None = Field(default=None, description="dev_export")
     dev_export_month: datetime.date | None = Field(default=None, description="dev_export_month")
     post_date: datetime.date | None = Field(default=None, description="post_date")
-
-    def sanitize(self) -> InvoiceCharge:
-        """Return a sanitized copy of this InvoiceCharge instance."""
-        return InvoiceCharge(
-            id=self.id,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            type=self.type,
-            charge_id=self.charge_id,
-            merchant_app_charge_Id=self.merchant_app_charge_Id,
-            merchant_plan_charge_Id=self.merchant_plan_charge_Id,
-            error=self.error,
-            status=self.status,
-            mid=self.mid,
-            country_code=self.country_code,
-            merchant_id=self.merchant_id,
-            developer_id=self.developer_id,
-            promoted_time=self.promoted_time,
-            biie=self.biie,
-            dev_export=self.dev_export,
-            dev_export_month=self.dev_export_month,
-            post_date=self.post_date,
-        )
@@ -20,9 +20,3 @@ class JobLock(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> JobLock:
-        """Return a sanitized copy of this JobLock instance."""
-        return JobLock(
-            id=self.id,
-        )
@@ -26,12 +26,3 @@ class MerchantDeviceInfo(RhizomeModel, table=False):
     device_id: int = Field(primary_key=True, description="device_id")
     terminal_id: str = Field(primary_key=True, max_length=16, description="terminal_id")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> MerchantDeviceInfo:
-        """Return a sanitized copy of this MerchantDeviceInfo instance."""
-        return MerchantDeviceInfo(
-            merchant_id=self.merchant_id,
-            device_id=self.device_id,
-            terminal_id=self.terminal_id,
-            modified_time=self.modified_time,
-        )
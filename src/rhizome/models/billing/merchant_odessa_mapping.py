@@ -28,15 +28,3 @@ class MerchantOdessaMapping(RhizomeModel, table=False):
     modified_time: datetime.datetime = Field(description="modified_time")
     stop_ach: bool = Field(description="stop_ach")
     stop_ach_date: datetime.datetime | None = Field(default=None, description="stop_ach_date")
-
-    def sanitize(self) -> MerchantOdessaMapping:
-        """Return a sanitized copy of this MerchantOdessaMapping instance."""
-        return MerchantOdessaMapping(
-            id=self.id,
-            mid=self.mid,
-            odessa_id=self.odessa_id,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            stop_ach=self.stop_ach,
-            stop_ach_date=self.stop_ach_date,
-        )
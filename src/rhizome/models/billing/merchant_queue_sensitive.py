@@ -27,14 +27,3 @@ class MerchantQueueSensitive(RhizomeModel, table=False):
     value: str | None = Field(default=None, max_length=255, description="value")
     value_guid: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> MerchantQueueSensitive:
-        """Return a sanitized copy of this MerchantQueueSensitive instance."""
-        return MerchantQueueSensitive(
-            id=self.id,
-            mid=self.mid,
-            name=self.name,
-            value=self.value,
-            value_guid=self.value_guid,
-            created_time=self.created_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MerchantSubscriptionAction(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class MerchantSubscriptionAction(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     cause: str | None = Field(default=None, description="cause")
     context: str | None = Field(default=None, description="context")
@@ -31,17 +32,3 @@ class MerchantSubscriptionAction(RhizomeModel, table=False):
     dry_run: bool | None = Field(default=None, description="dry_run")
     created_time: datetime.datetime = Field(description="created_time")
     deleted_time: datetime.datetime | None = Field(default=None, description="deleted_time")
-
-    def sanitize(self) -> MerchantSubscriptionAction:
-        """Return a sanitized copy of this MerchantSubscriptionAction instance."""
-        return MerchantSubscriptionAction(
-            id=self.id,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            merchant_id=self.merchant_id,
-            cause=self.cause,
-            context=self.context,
-            detail=self.detail,
-            dry_run=self.dry_run,
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-        )
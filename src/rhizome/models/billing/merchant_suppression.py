@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MerchantSuppression(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class MerchantSuppression(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     reference_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     plan_billable: bool | None = Field(default=None, description="plan_billable")
     app_billable: bool | None = Field(default=None, description="app_billable")
@@ -36,22 +37,3 @@ class MerchantSuppression(RhizomeModel, table=False):
     modified_time: datetime.datetime = Field(description="modified_time")
     finalization_time: datetime.datetime | None = Field(default=None, description="finalization_time")
     finalize: bool | None = Field(default=None, description="finalize")
-
-    def sanitize(self) -> MerchantSuppression:
-        """Return a sanitized copy of this MerchantSuppression instance."""
-        return MerchantSuppression(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            reference_id=self.reference_id,
-            plan_billable=self.plan_billable,
-            app_billable=self.app_billable,
-            plan_exportable=self.plan_exportable,
-            app_exportable=self.app_exportable,
-            context=self.context,
-            detail=self.detail,
-            start_time=self.start_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            finalization_time=self.finalization_time,
-            finalize=self.finalize,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MerchantTermsAcceptanceEvents(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class MerchantTermsAcceptanceEvents(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     acceptance_id: str | None = Field(default=None, description="UUID field")
     agreement_type: str | None = Field(default=None, max_length=128, description="agreement_type")
@@ -34,20 +35,3 @@ class MerchantTermsAcceptanceEvents(RhizomeModel, table=False):
     action: str | None = Field(default=None, max_length=100, description="action")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> MerchantTermsAcceptanceEvents:
-        """Return a sanitized copy of this MerchantTermsAcceptanceEvents instance."""
-        return MerchantTermsAcceptanceEvents(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            merchant_id=self.merchant_id,
-            acceptance_id=self.acceptance_id,
-            agreement_type=self.agreement_type,
-            account_id=self.account_id,
-            acceptance_created=self.acceptance_created,
-            acceptance_modified=self.acceptance_modified,
-            acceptance_deleted=self.acceptance_deleted,
-            action=self.action,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
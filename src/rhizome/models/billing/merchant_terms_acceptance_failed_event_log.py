@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MerchantTermsAcceptanceFailedEventLog(RhizomeModel, table=False):
@@ -23,19 +24,8 @@ class MerchantTermsAcceptanceFailedEventLog(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     message_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     raw_data: str = Field(description="raw_data")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> MerchantTermsAcceptanceFailedEventLog:
-        """Return a sanitized copy of this MerchantTermsAcceptanceFailedEventLog instance."""
-        return MerchantTermsAcceptanceFailedEventLog(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            message_id=self.message_id,
-            raw_data=self.raw_data,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
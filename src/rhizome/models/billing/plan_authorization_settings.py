@@ -27,16 +27,3 @@ class PlanAuthorizationSettings(RhizomeModel, table=False):
     plan_group_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     device_name: str | None = Field(default=None, max_length=255, description="device_name")
     rules: str = Field(max_length=16383, description="rules")
-
-    def sanitize(self) -> PlanAuthorizationSettings:
-        """Return a sanitized copy of this PlanAuthorizationSettings instance."""
-        return PlanAuthorizationSettings(
-            id=self.id,
-            merchant_id=self.merchant_id,
-            partner_control_id=self.partner_control_id,
-            reseller_id=self.reseller_id,
-            country_code=self.country_code,
-            plan_group_id=self.plan_group_id,
-            device_name=self.device_name,
-            rules=self.rules,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class Promo(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class Promo(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     code: str = Field(max_length=32, description="code")
     description: str | None = Field(default=None, max_length=511, description="description")
     plan_trial_days: int | None = Field(default=None, description="plan_trial_days")
@@ -34,20 +35,3 @@ class Promo(RhizomeModel, table=False):
     deactivation_time: datetime.datetime | None = Field(default=None, description="deactivation_time")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> Promo:
-        """Return a sanitized copy of this Promo instance."""
-        return Promo(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            code=self.code,
-            description=self.description,
-            plan_trial_days=self.plan_trial_days,
-            plan_type=self.plan_type,
-            app_trial_days=self.app_trial_days,
-            developer_app_id=self.developer_app_id,
-            activation_time=self.activation_time,
-            deactivation_time=self.deactivation_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class PromoControl(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class PromoControl(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     code: str = Field(max_length=32, description="code")
     reseller_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     agent: str | None = Field(default=None, max_length=32, description="agent")
@@ -35,21 +36,3 @@ class PromoControl(RhizomeModel, table=False):
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
     deleted_time: datetime.datetime | None = Field(default=None, description="deleted_time")
-
-    def sanitize(self) -> PromoControl:
-        """Return a sanitized copy of this PromoControl instance."""
-        return PromoControl(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            code=self.code,
-            reseller_id=self.reseller_id,
-            agent=self.agent,
-            bank=self.bank,
-            business=self.business,
-            chain=self.chain,
-            corp=self.corp,
-            marker=self.marker,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            deleted_time=self.deleted_time,
-        )
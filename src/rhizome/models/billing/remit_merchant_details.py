@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class RemitMerchantDetails(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class RemitMerchantDetails(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    remit_uuid: str | None = Field(default=None, description="UUID field")
+    remit_uuid: Annotated[str | None, SanitizeUUID(30)] = Field(default=None, description="UUID field")
     hierarchy_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     remit_type: str | None = Field(default=None, max_length=30, description="remit_type")
     hierarchy_name: str | None = Field(default=None, description="hierarchy_name")
@@ -33,19 +34,3 @@ class RemitMerchantDetails(RhizomeModel, table=False):
     deleted_time: datetime.date | None = Field(default=None, description="deleted_time")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> RemitMerchantDetails:
-        """Return a sanitized copy of this RemitMerchantDetails instance."""
-        return RemitMerchantDetails(
-            id=self.id,
-            remit_uuid=sanitize_uuid_field(self.remit_uuid, 30),
-            hierarchy_id=self.hierarchy_id,
-            remit_type=self.remit_type,
-            hierarchy_name=self.hierarchy_name,
-            status_owner=self.status_owner,
-            entity_name=self.entity_name,
-            relm_code=self.relm_code,
-            deleted_time=self.deleted_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ResellerAppRevShare(RhizomeModel, table=False):
@@ -23,9 +24,9 @@ class ResellerAppRevShare(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     reseller_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    app_uuid: str | None = Field(default=None, max_length=13, description="app_uuid")
+    app_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, max_length=13, description="app_uuid")
     app_type: str | None = Field(default=None, description="app_type")
     rev_share: int = Field(description="rev_share")
     rev_share_type: str | None = Field(default=None, description="rev_share_type")
@@ -33,19 +34,3 @@ class ResellerAppRevShare(RhizomeModel, table=False):
     deleted_time: datetime.datetime | None = Field(default=None, description="deleted_time")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> ResellerAppRevShare:
-        """Return a sanitized copy of this ResellerAppRevShare instance."""
-        return ResellerAppRevShare(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            reseller_id=self.reseller_id,
-            app_uuid=sanitize_uuid_field(self.app_uuid, 13),
-            app_type=self.app_type,
-            rev_share=self.rev_share,
-            rev_share_type=self.rev_share_type,
-            effective_date=self.effective_date,
-            deleted_time=self.deleted_time,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -22,11 +22,3 @@ class ResellerInvoiceAlliance(RhizomeModel, table=False):
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     reseller_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     alliance: str = Field(max_length=3, description="alliance")
-
-    def sanitize(self) -> ResellerInvoiceAlliance:
-        """Return a sanitized copy of this ResellerInvoiceAlliance instance."""
-        return ResellerInvoiceAlliance(
-            id=self.id,
-            reseller_id=self.reseller_id,
-            alliance=self.alliance,
-        )
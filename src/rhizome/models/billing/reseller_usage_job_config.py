@@ -22,11 +22,3 @@ class ResellerUsageJobConfig(RhizomeModel, table=False):
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     reseller_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     report_type: str | None = Field(default=None, description="report_type")
-
-    def sanitize(self) -> ResellerUsageJobConfig:
-        """Return a sanitized copy of this ResellerUsageJobConfig instance."""
-        return ResellerUsageJobConfig(
-            id=self.id,
-            reseller_id=self.reseller_id,
-            report_type=self.report_type,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class RevShare(RhizomeModel, table=False):
@@ -23,19 +24,8 @@ class RevShare(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    charge_uuid: str | None = Field(default=None, description="UUID field")
+    charge_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     developer: int | None = Field(default=None, description="developer")
     partner: int | None = Field(default=None, description="partner")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> RevShare:
-        """Return a sanitized copy of this RevShare instance."""
-        return RevShare(
-            id=self.id,
-            charge_uuid=sanitize_uuid_field(self.charge_uuid, 13),
-            developer=self.developer,
-            partner=self.partner,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
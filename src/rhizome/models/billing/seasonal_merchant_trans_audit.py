@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class SeasonalMerchantTransAudit(RhizomeModel, table=False):
@@ -23,21 +24,9 @@ class SeasonalMerchantTransAudit(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str | None = Field(default=None, description="UUID field")
+    uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     bill_cycle: datetime.date = Field(description="bill_cycle")
     seasonal_event: str | None = Field(default=None, description="seasonal_event")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> SeasonalMerchantTransAudit:
-        """Return a sanitized copy of this SeasonalMerchantTransAudit instance."""
-        return SeasonalMerchantTransAudit(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            merchant_id=self.merchant_id,
-            bill_cycle=self.bill_cycle,
-            seasonal_event=self.seasonal_event,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
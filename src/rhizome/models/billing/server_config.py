@@ -27,13 +27,3 @@ class ServerConfig(RhizomeModel, table=False):
     config: str | None = Field(default=None, max_length=2000, description="Configuration value")
     created_time: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> ServerConfig:
-        """Return a sanitized copy of this ServerConfig instance."""
-        return ServerConfig(
-            id=self.id,
-            tag=self.tag,
-            config=self.config,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
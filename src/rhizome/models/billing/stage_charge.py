@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ChargeStatus(str, Enum):
@@ -81,7 +82,9 @@ class StageCharge(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True, description="Unique identifier for the stage charge")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, unique=True, description="Unique identifier for the stage charge"
+    )
     merchant_id: int = Field(description="ID of the merchant")
     currency: str | None = Field(default=None, max_length=3, description="Currency code (ISO 4217)")
     amount: int = Field(description="Charge amount in smallest currency unit")
@@ -98,34 +101,9 @@ class StageCharge(RhizomeModel, table=False):
     modified_time: datetime.datetime = Field(description="Timestamp when the record was last modified")
     export_month: datetime.date | None = Field(default=None, description="Month for export processing")
     status_modified_time: datetime.datetime | None = Field(default=None, description="When status was last modified")
-    request_uuid: str = Field(max_length=13, description="UUID of the request that generated this charge")
+    request_uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, description="UUID of the request that generated this charge"
+    )
     promoted_time: datetime.datetime | None = Field(default=None, description="When the charge was promoted")
     promoted_id: int | None = Field(default=None, description="ID of promoted charge")
     parent_id: int | None = Field(default=None, description="ID of parent charge")
-
-    def sanitize(self) -> StageCharge:
-        """Return a sanitized copy of this StageCharge instance."""
-        return StageCharge(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),  # type: ignore
-            merchant_id=self.merchant_id,
-            currency=self.currency,
-            amount=self.amount,
-            tax=self.tax,
-            developer_portion=self.developer_portion,
-            status=self.status,
-            developer_status=self.developer_status,
-            status_owner=self.status_owner,
-            type=self.type,
-            tax_classification_code=self.tax_classification_code,
-            start_date=self.start_date,
-            end_date=self.end_date,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            export_month=self.export_month,
-            status_modified_time=self.status_modified_time,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),  # type: ignore
-            promoted_time=self.promoted_time,
-            promoted_id=self.promoted_id,
-            parent_id=self.parent_id,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class StageChargeCaptureError(RhizomeModel, table=False):
@@ -23,23 +24,10 @@ class StageChargeCaptureError(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    charge_uuid: str | None = Field(default=None, description="UUID field")
+    charge_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     mid: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     file_instance_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     created_time: datetime.datetime = Field(description="created_time")
     promoted_time: datetime.datetime | None = Field(default=None, description="promoted_time")
     promoted_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> StageChargeCaptureError:
-        """Return a sanitized copy of this StageChargeCaptureError instance."""
-        return StageChargeCaptureError(
-            id=self.id,
-            charge_uuid=sanitize_uuid_field(self.charge_uuid, 13),
-            mid=self.mid,
-            file_instance_id=self.file_instance_id,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            created_time=self.created_time,
-            promoted_time=self.promoted_time,
-            promoted_id=self.promoted_id,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class StageChargeStateAttempt(RhizomeModel, table=False):
@@ -27,19 +28,6 @@ class StageChargeStateAttempt(RhizomeModel, table=False):
     state: str | None = Field(default=None, description="state")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     promoted_time: datetime.datetime | None = Field(default=None, description="promoted_time")
     promoted_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> StageChargeStateAttempt:
-        """Return a sanitized copy of this StageChargeStateAttempt instance."""
-        return StageChargeStateAttempt(
-            id=self.id,
-            charge_id=self.charge_id,
-            state=self.state,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            promoted_time=self.promoted_time,
-            promoted_id=self.promoted_id,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class StageChargeUpdate(RhizomeModel, table=False):
@@ -30,20 +31,5 @@ class StageChargeUpdate(RhizomeModel, table=False):
     tax: int | None = Field(default=None, description="tax")
     developer_portion: int | None = Field(default=None, description="developer_portion")
     status_owner: str = Field(max_length=30, description="status_owner")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     promoted_time: datetime.datetime | None = Field(default=None, description="promoted_time")
-
-    def sanitize(self) -> StageChargeUpdate:
-        """Return a sanitized copy of this StageChargeUpdate instance."""
-        return StageChargeUpdate(
-            id=self.id,
-            charge_id=self.charge_id,
-            merchant_id=self.merchant_id,
-            status=self.status,
-            developer_status=self.developer_status,
-            tax=self.tax,
-            developer_portion=self.developer_portion,
-            status_owner=self.status_owner,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            promoted_time=self.promoted_time,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class StageMerchantAppCharge(RhizomeModel, table=False):
@@ -33,23 +34,6 @@ class StageMerchantAppCharge(RhizomeModel, table=False):
     merchant_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     developer_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     app_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     promoted_time: datetime.datetime | None = Field(default=None, description="promoted_time")
     promoted_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> StageMerchantAppCharge:
-        """Return a sanitized copy of this StageMerchantAppCharge instance."""
-        return StageMerchantAppCharge(
-            id=self.id,
-            merchant_app_id=self.merchant_app_id,
-            app_subscription_id=self.app_subscription_id,
-            charge_id=self.charge_id,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            merchant_id=self.merchant_id,
-            developer_id=self.developer_id,
-            app_id=self.app_id,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            promoted_time=self.promoted_time,
-            promoted_id=self.promoted_id,
-        )
@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class StageMerchantPlanCharge(RhizomeModel, table=False):
@@ -30,24 +31,7 @@ class StageMerchantPlanCharge(RhizomeModel, table=False):
     num_of_devices: int = Field(description="num_of_devices")
     merchant_plan_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     plan_charge_type: str | None = Field(default=None, description="plan_charge_type")
-    request_uuid: str | None = Field(default=None, description="UUID field")
+    request_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, description="UUID field")
     promoted_time: datetime.datetime | None = Field(default=None, description="promoted_time")
     promoted_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     device_type_id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-
-    def sanitize(self) -> StageMerchantPlanCharge:
-        """Return a sanitized copy of this StageMerchantPlanCharge instance."""
-        return StageMerchantPlanCharge(
-            id=self.id,
-            merchant_id=self.merchant_id,
-            charge_id=self.charge_id,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-            num_of_devices=self.num_of_devices,
-            merchant_plan_id=self.merchant_plan_id,
-            plan_charge_type=self.plan_charge_type,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            promoted_time=self.promoted_time,
-            promoted_id=self.promoted_id,
-            device_type_id=self.device_type_id,
-        )
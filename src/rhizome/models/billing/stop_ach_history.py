@@ -28,13 +28,3 @@ class StopAchHistory(RhizomeModel, table=False):
     old_stop_ach: bool = Field(description="old_stop_ach")
     old_modified_time: datetime.datetime | None = Field(default=None, description="old_modified_time")
     created_time: datetime.datetime = Field(description="created_time")
-
-    def sanitize(self) -> StopAchHistory:
-        """Return a sanitized copy of this StopAchHistory instance."""
-        return StopAchHistory(
-            id=self.id,
-            merchant_odessa_mapping_id=self.merchant_odessa_mapping_id,
-            old_stop_ach=self.old_stop_ach,
-            old_modified_time=self.old_modified_time,
-            created_time=self.created_time,
-        )
@@ -64,17 +64,3 @@ class SuppressionMetrics(RhizomeModel, table=False):
     total_charges: int = Field(description="Total charges")
     num_suppressions: int = Field(description="Number of suppressions")
     num_merchants: int = Field(description="Number of merchants")
-
-    def sanitize(self) -> SuppressionMetrics:
-        """Return a sanitized copy of this SuppressionMetrics instance."""
-        return SuppressionMetrics(
-            supp_month=self.supp_month,
-            supp_type=self.supp_type,
-            supp_context=self.supp_context,
-            plan_charges=self.plan_charges,
-            app_charges=self.app_charges,
-            wm_charges=self.wm_charges,
-            total_charges=self.total_charges,
-            num_suppressions=self.num_suppressions,
-            num_merchants=self.num_merchants,
-        )
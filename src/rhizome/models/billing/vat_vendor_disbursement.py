@@ -8,11 +8,12 @@ billing database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class VatVendorDisbursement(RhizomeModel, table=False):
@@ -23,8 +24,8 @@ class VatVendorDisbursement(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, description="UUID field")
-    request_uuid: str = Field(max_length=13, description="request_uuid")
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="UUID field")
+    request_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="request_uuid")
     combined_disbursement_id: int | None = Field(
         default=None, primary_key=True, description="Primary key, auto-incrementing"
     )
@@ -36,20 +37,3 @@ class VatVendorDisbursement(RhizomeModel, table=False):
     vat_pay_out_exchange_rate: str | None = Field(default=None, max_length=10, description="vat_pay_out_exchange_rate")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> VatVendorDisbursement:
-        """Return a sanitized copy of this VatVendorDisbursement instance."""
-        return VatVendorDisbursement(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            request_uuid=sanitize_uuid_field(self.request_uuid, 13),
-            combined_disbursement_id=self.combined_disbursement_id,
-            vat_base_currency=self.vat_base_currency,
-            vat_base_amount=self.vat_base_amount,
-            state_date=self.state_date,
-            vat_pay_out_currency=self.vat_pay_out_currency,
-            vat_pay_out_amount=self.vat_pay_out_amount,
-            vat_pay_out_exchange_rate=self.vat_pay_out_exchange_rate,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
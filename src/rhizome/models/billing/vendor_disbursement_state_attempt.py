@@ -26,13 +26,3 @@ class VendorDisbursementStateAttempt(RhizomeModel, table=False):
     state: str | None = Field(default=None, description="state")
     created_time: datetime.datetime = Field(description="created_time")
     modified_time: datetime.datetime = Field(description="modified_time")
-
-    def sanitize(self) -> VendorDisbursementStateAttempt:
-        """Return a sanitized copy of this VendorDisbursementStateAttempt instance."""
-        return VendorDisbursementStateAttempt(
-            id=self.id,
-            charge_id=self.charge_id,
-            state=self.state,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
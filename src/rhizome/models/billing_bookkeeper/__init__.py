@@ -4,226 +4,231 @@ Bookkeeper database models.
 This module contains SQLModel definitions for the billing-bookkeeper database.
 """
 
-from .adjust_action import AdjustAction
-from .adjust_action_fee_code import AdjustActionFeeCode
-from .adjust_action_fee_code_v1 import AdjustActionFeeCodeV1
-from .adjust_action_type import AdjustActionType
-from .adjust_action_type_v1 import AdjustActionTypeV1
-from .adjust_action_v1 import AdjustActionV1
-from .adjust_reason import AdjustReason
-from .adjust_reason_v1 import AdjustReasonV1
-from .app_meter_action import AppMeterAction
-from .app_meter_action_error import AppMeterActionError
-from .app_meter_action_error_v1 import AppMeterActionErrorV1
-from .app_meter_action_fee_code import AppMeterActionFeeCode
-from .app_meter_action_fee_code_v1 import AppMeterActionFeeCodeV1
-from .app_meter_action_type import AppMeterActionType
-from .app_meter_action_type_v1 import AppMeterActionTypeV1
-from .app_meter_action_v1 import AppMeterActionV1
-from .app_sub_action import AppSubAction
-from .app_sub_action_error import AppSubActionError
-from .app_sub_action_error_v1 import AppSubActionErrorV1
-from .app_sub_action_fee_code import AppSubActionFeeCode
-from .app_sub_action_fee_code_v1 import AppSubActionFeeCodeV1
-from .app_sub_action_type import AppSubActionType
-from .app_sub_action_type_v1 import AppSubActionTypeV1
-from .app_sub_action_v1 import AppSubActionV1
-from .auto_adjust_advice import AutoAdjustAdvice
-from .auto_adjust_advice_v1 import AutoAdjustAdviceV1
-from .auto_adjust_qualifier import AutoAdjustQualifier
-from .auto_adjust_qualifier_v1 import AutoAdjustQualifierV1
-from .auto_adjust_rule import AutoAdjustRule
-from .auto_adjust_rule_v1 import AutoAdjustRuleV1
-from .billing_archetype import BillingArchetype
-from .billing_archetype_v1 import BillingArchetypeV1
-from .billing_entity import BillingEntity
-from .billing_entity_config import BillingEntityConfig
-from .billing_entity_config_v1 import BillingEntityConfigV1
-from .billing_entity_v1 import BillingEntityV1
-from .billing_event_history import BillingEventHistory
-from .billing_event_history_v1 import BillingEventHistoryV1
-from .billing_hierarchy import BillingHierarchy
-from .billing_hierarchy_cycle import BillingHierarchyCycle
-from .billing_hierarchy_cycle_v1 import BillingHierarchyCycleV1
-from .billing_hierarchy_type import BillingHierarchyType
-from .billing_hierarchy_type_v1 import BillingHierarchyTypeV1
-from .billing_hierarchy_v1 import BillingHierarchyV1
-from .billing_pseudo_entity import BillingPseudoEntity
-from .billing_pseudo_entity_v1 import BillingPseudoEntityV1
-from .billing_schedule import BillingSchedule
-from .billing_schedule_v1 import BillingScheduleV1
-from .cellular_action import CellularAction
-from .cellular_action_error import CellularActionError
-from .cellular_action_error_v1 import CellularActionErrorV1
-from .cellular_action_fee_code import CellularActionFeeCode
-from .cellular_action_fee_code_v1 import CellularActionFeeCodeV1
-from .cellular_action_type import CellularActionType
-from .cellular_action_type_v1 import CellularActionTypeV1
-from .cellular_action_v1 import CellularActionV1
-from .consumer_failure import ConsumerFailure
-from .consumer_failure_history import ConsumerFailureHistory
-from .consumer_failure_history_v1 import ConsumerFailureHistoryV1
-from .consumer_failure_v1 import ConsumerFailureV1
-from .cycle_validation import CycleValidation
-from .cycle_validation_mutation import CycleValidationMutation
-from .cycle_validation_mutation_v1 import CycleValidationMutationV1
-from .cycle_validation_v1 import CycleValidationV1
-from .deserializable_failure import DeserializableFailure
-from .deserializable_failure_v1 import DeserializableFailureV1
-from .fee_category import FeeCategory
-from .fee_category_v1 import FeeCategoryV1
-from .fee_code import FeeCode
-from .fee_code_app import FeeCodeApp
-from .fee_code_app_v1 import FeeCodeAppV1
-from .fee_code_ledger_account import FeeCodeLedgerAccount
-from .fee_code_ledger_account_v1 import FeeCodeLedgerAccountV1
-from .fee_code_v1 import FeeCodeV1
-from .fee_ctd import FeeCtd
-from .fee_ctd_v1 import FeeCtdV1
-from .fee_rate import FeeRate
-from .fee_rate_error_report import FeeRateErrorReport
-from .fee_rate_error_report_v1 import FeeRateErrorReportV1
-from .fee_rate_report_action_error import FeeRateReportActionError
-from .fee_rate_report_action_error_v1 import FeeRateReportActionErrorV1
-from .fee_rate_v1 import FeeRateV1
-from .fee_summary import FeeSummary
-from .fee_summary_mutation import FeeSummaryMutation
-from .fee_summary_mutation_v1 import FeeSummaryMutationV1
-from .fee_summary_v1 import FeeSummaryV1
-from .fee_tax import FeeTax
-from .fee_tax_mutation import FeeTaxMutation
-from .fee_tax_mutation_v1 import FeeTaxMutationV1
-from .fee_tax_v1 import FeeTaxV1
-from .fee_ytd import FeeYtd
-from .fee_ytd_v1 import FeeYtdV1
-from .flyway_schema_history import FlywaySchemaHistory
-from .flyway_schema_history_v1 import FlywaySchemaHistoryV1
-from .invoice_alliance_code import InvoiceAllianceCode
-from .invoice_alliance_code_v1 import InvoiceAllianceCodeV1
-from .invoice_info import InvoiceInfo
-from .invoice_info_amount import InvoiceInfoAmount
-from .invoice_info_amount_v1 import InvoiceInfoAmountV1
-from .invoice_info_mutation import InvoiceInfoMutation
-from .invoice_info_mutation_v1 import InvoiceInfoMutationV1
-from .invoice_info_settlement import InvoiceInfoSettlement
-from .invoice_info_settlement_mutation import InvoiceInfoSettlementMutation
-from .invoice_info_settlement_mutation_v1 import InvoiceInfoSettlementMutationV1
-from .invoice_info_settlement_v1 import InvoiceInfoSettlementV1
-from .invoice_info_v1 import InvoiceInfoV1
-from .job_assassination_contract import JobAssassinationContract
-from .job_assassination_contract_v1 import JobAssassinationContractV1
-from .jobrunr_backgroundjobservers import JobrunrBackgroundjobservers
-from .jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
-from .jobrunr_jobs import JobrunrJobs
-from .jobrunr_jobs_v1 import JobrunrJobsV1
-from .jobrunr_metadata import JobrunrMetadata
-from .jobrunr_metadata_v1 import JobrunrMetadataV1
-from .jobrunr_migrations import JobrunrMigrations
-from .jobrunr_migrations_v1 import JobrunrMigrationsV1
-from .jobrunr_recurring_jobs import JobrunrRecurringJobs
-from .jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
-from .ledger_account import LedgerAccount
-from .ledger_account_action import LedgerAccountAction
-from .ledger_account_action_v1 import LedgerAccountActionV1
-from .ledger_account_balance import LedgerAccountBalance
-from .ledger_account_balance_v1 import LedgerAccountBalanceV1
-from .ledger_account_key import LedgerAccountKey
-from .ledger_account_key_app import LedgerAccountKeyApp
-from .ledger_account_key_app_v1 import LedgerAccountKeyAppV1
-from .ledger_account_key_purpose import LedgerAccountKeyPurpose
-from .ledger_account_key_purpose_v1 import LedgerAccountKeyPurposeV1
-from .ledger_account_key_v1 import LedgerAccountKeyV1
-from .ledger_account_purpose import LedgerAccountPurpose
-from .ledger_account_purpose_v1 import LedgerAccountPurposeV1
-from .ledger_account_settlement import LedgerAccountSettlement
-from .ledger_account_settlement_v1 import LedgerAccountSettlementV1
-from .ledger_account_transition import LedgerAccountTransition
-from .ledger_account_transition_v1 import LedgerAccountTransitionV1
-from .ledger_account_v1 import LedgerAccountV1
-from .ledger_journal import LedgerJournal
-from .ledger_journal_mutation import LedgerJournalMutation
-from .ledger_journal_mutation_v1 import LedgerJournalMutationV1
-from .ledger_journal_v1 import LedgerJournalV1
-from .lexi_attribute import LexiAttribute
-from .lexi_attribute_v1 import LexiAttributeV1
-from .lexi_rule import LexiRule
-from .lexi_rule_v1 import LexiRuleV1
-from .look import Look
-from .look_data import LookData
-from .look_data_v1 import LookDataV1
-from .look_v1 import LookV1
-from .merchant_detail import MerchantDetail
-from .merchant_detail_v1 import MerchantDetailV1
-from .misc_action import MiscAction
-from .misc_action_error import MiscActionError
-from .misc_action_error_v1 import MiscActionErrorV1
-from .misc_action_fee_code import MiscActionFeeCode
-from .misc_action_fee_code_v1 import MiscActionFeeCodeV1
-from .misc_action_type import MiscActionType
-from .misc_action_type_v1 import MiscActionTypeV1
-from .misc_action_v1 import MiscActionV1
-from .misc_specifier import MiscSpecifier
-from .misc_specifier_v1 import MiscSpecifierV1
-from .model_fee_summary import ModelFeeSummary
-from .model_fee_summary_v1 import ModelFeeSummaryV1
-from .monetary_adjustment import MonetaryAdjustment
-from .monetary_adjustment_mutation import MonetaryAdjustmentMutation
-from .monetary_adjustment_mutation_v1 import MonetaryAdjustmentMutationV1
-from .monetary_adjustment_v1 import MonetaryAdjustmentV1
-from .monetary_rule_alias import MonetaryRuleAlias
-from .monetary_rule_alias_v1 import MonetaryRuleAliasV1
-from .monetary_rule_set import MonetaryRuleSet
-from .monetary_rule_set_rule import MonetaryRuleSetRule
-from .monetary_rule_set_rule_v1 import MonetaryRuleSetRuleV1
-from .monetary_rule_set_v1 import MonetaryRuleSetV1
-from .partner_config import PartnerConfig
-from .partner_config_v1 import PartnerConfigV1
-from .plan_action import PlanAction
-from .plan_action_error import PlanActionError
-from .plan_action_error_v1 import PlanActionErrorV1
-from .plan_action_fee_code import PlanActionFeeCode
-from .plan_action_fee_code_v1 import PlanActionFeeCodeV1
-from .plan_action_type import PlanActionType
-from .plan_action_type_v1 import PlanActionTypeV1
-from .plan_action_v1 import PlanActionV1
-from .processing_group_dates import ProcessingGroupDates
-from .processing_group_dates_v1 import ProcessingGroupDatesV1
-from .processing_note import ProcessingNote
-from .processing_note_mutation import ProcessingNoteMutation
-from .processing_note_mutation_v1 import ProcessingNoteMutationV1
-from .processing_note_v1 import ProcessingNoteV1
-from .prototype_fee_rate import PrototypeFeeRate
-from .prototype_fee_rate_v1 import PrototypeFeeRateV1
-from .prototype_fee_set import PrototypeFeeSet
-from .prototype_fee_set_v1 import PrototypeFeeSetV1
-from .revenue_action import RevenueAction
-from .revenue_action_error import RevenueActionError
-from .revenue_action_error_v1 import RevenueActionErrorV1
-from .revenue_action_fee_code import RevenueActionFeeCode
-from .revenue_action_fee_code_v1 import RevenueActionFeeCodeV1
-from .revenue_action_type import RevenueActionType
-from .revenue_action_type_v1 import RevenueActionTypeV1
-from .revenue_action_v1 import RevenueActionV1
-from .revenue_share_group import RevenueShareGroup
-from .revenue_share_group_v1 import RevenueShareGroupV1
-from .server_config import ServerConfig
-from .server_config_v1 import ServerConfigV1
-from .settlement import Settlement
-from .settlement_action import SettlementAction
-from .settlement_action_v1 import SettlementActionV1
-from .settlement_mutation import SettlementMutation
-from .settlement_mutation_v1 import SettlementMutationV1
-from .settlement_v1 import SettlementV1
-from .skip_fee_category_lexi_tag import SkipFeeCategoryLexiTag
-from .skip_fee_category_lexi_tag_v1 import SkipFeeCategoryLexiTagV1
-from .tier_detail import TierDetail
-from .tier_detail_v1 import TierDetailV1
-from .tiered_pricing import TieredPricing
-from .tiered_pricing_v1 import TieredPricingV1
-from .tiered_qualifier import TieredQualifier
-from .tiered_qualifier_v1 import TieredQualifierV1
-from .tiered_rule import TieredRule
-from .tiered_rule_v1 import TieredRuleV1
+from typing import TYPE_CHECKING
+
+from rhizome.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .adjust_action import AdjustAction
+    from .adjust_action_fee_code import AdjustActionFeeCode
+    from .adjust_action_fee_code_v1 import AdjustActionFeeCodeV1
+    from .adjust_action_type import AdjustActionType
+    from .adjust_action_type_v1 import AdjustActionTypeV1
+    from .adjust_action_v1 import AdjustActionV1
+    from .adjust_reason import AdjustReason
+    from .adjust_reason_v1 import AdjustReasonV1
+    from .app_meter_action import AppMeterAction
+    from .app_meter_action_error import AppMeterActionError
+    from .app_meter_action_error_v1 import AppMeterActionErrorV1
+    from .app_meter_action_fee_code import AppMeterActionFeeCode
+    from .app_meter_action_fee_code_v1 import AppMeterActionFeeCodeV1
+    from .app_meter_action_type import AppMeterActionType
+    from .app_meter_action_type_v1 import AppMeterActionTypeV1
+    from .app_meter_action_v1 import AppMeterActionV1
+    from .app_sub_action import AppSubAction
+    from .app_sub_action_error import AppSubActionError
+    from .app_sub_action_error_v1 import AppSubActionErrorV1
+    from .app_sub_action_fee_code import AppSubActionFeeCode
+    from .app_sub_action_fee_code_v1 import AppSubActionFeeCodeV1
+    from .app_sub_action_type import AppSubActionType
+    from .app_sub_action_type_v1 import AppSubActionTypeV1
+    from .app_sub_action_v1 import AppSubActionV1
+    from .auto_adjust_advice import AutoAdjustAdvice
+    from .auto_adjust_advice_v1 import AutoAdjustAdviceV1
+    from .auto_adjust_qualifier import AutoAdjustQualifier
+    from .auto_adjust_qualifier_v1 import AutoAdjustQualifierV1
+    from .auto_adjust_rule import AutoAdjustRule
+    from .auto_adjust_rule_v1 import AutoAdjustRuleV1
+    from .billing_archetype import BillingArchetype
+    from .billing_archetype_v1 import BillingArchetypeV1
+    from .billing_entity import BillingEntity
+    from .billing_entity_config import BillingEntityConfig
+    from .billing_entity_config_v1 import BillingEntityConfigV1
+    from .billing_entity_v1 import BillingEntityV1
+    from .billing_event_history import BillingEventHistory
+    from .billing_event_history_v1 import BillingEventHistoryV1
+    from .billing_hierarchy import BillingHierarchy
+    from .billing_hierarchy_cycle import BillingHierarchyCycle
+    from .billing_hierarchy_cycle_v1 import BillingHierarchyCycleV1
+    from .billing_hierarchy_type import BillingHierarchyType
+    from .billing_hierarchy_type_v1 import BillingHierarchyTypeV1
+    from .billing_hierarchy_v1 import BillingHierarchyV1
+    from .billing_pseudo_entity import BillingPseudoEntity
+    from .billing_pseudo_entity_v1 import BillingPseudoEntityV1
+    from .billing_schedule import BillingSchedule
+    from .billing_schedule_v1 import BillingScheduleV1
+    from .cellular_action import CellularAction
+    from .cellular_action_error import CellularActionError
+    from .cellular_action_error_v1 import CellularActionErrorV1
+    from .cellular_action_fee_code import CellularActionFeeCode
+    from .cellular_action_fee_code_v1 import CellularActionFeeCodeV1
+    from .cellular_action_type import CellularActionType
+    from .cellular_action_type_v1 import CellularActionTypeV1
+    from .cellular_action_v1 import CellularActionV1
+    from .consumer_failure import ConsumerFailure
+    from .consumer_failure_history import ConsumerFailureHistory
+    from .consumer_failure_history_v1 import ConsumerFailureHistoryV1
+    from .consumer_failure_v1 import ConsumerFailureV1
+    from .cycle_validation import CycleValidation
+    from .cycle_validation_mutation import CycleValidationMutation
+    from .cycle_validation_mutation_v1 import CycleValidationMutationV1
+    from .cycle_validation_v1 import CycleValidationV1
+    from .deserializable_failure import DeserializableFailure
+    from .deserializable_failure_v1 import DeserializableFailureV1
+    from .fee_category import FeeCategory
+    from .fee_category_v1 import FeeCategoryV1
+    from .fee_code import FeeCode
+    from .fee_code_app import FeeCodeApp
+    from .fee_code_app_v1 import FeeCodeAppV1
+    from .fee_code_ledger_account import FeeCodeLedgerAccount
+    from .fee_code_ledger_account_v1 import FeeCodeLedgerAccountV1
+    from .fee_code_v1 import FeeCodeV1
+    from .fee_ctd import FeeCtd
+    from .fee_ctd_v1 import FeeCtdV1
+    from .fee_rate import FeeRate
+    from .fee_rate_error_report import FeeRateErrorReport
+    from .fee_rate_error_report_v1 import FeeRateErrorReportV1
+    from .fee_rate_report_action_error import FeeRateReportActionError
+    from .fee_rate_report_action_error_v1 import FeeRateReportActionErrorV1
+    from .fee_rate_v1 import FeeRateV1
+    from .fee_summary import FeeSummary
+    from .fee_summary_mutation import FeeSummaryMutation
+    from .fee_summary_mutation_v1 import FeeSummaryMutationV1
+    from .fee_summary_v1 import FeeSummaryV1
+    from .fee_tax import FeeTax
+    from .fee_tax_mutation import FeeTaxMutation
+    from .fee_tax_mutation_v1 import FeeTaxMutationV1
+    from .fee_tax_v1 import FeeTaxV1
+    from .fee_ytd import FeeYtd
+    from .fee_ytd_v1 import FeeYtdV1
+    from .flyway_schema_history import FlywaySchemaHistory
+    from .flyway_schema_history_v1 import FlywaySchemaHistoryV1
+    from .invoice_alliance_code import InvoiceAllianceCode
+    from .invoice_alliance_code_v1 import InvoiceAllianceCodeV1
+    from .invoice_info import InvoiceInfo
+    from .invoice_info_amount import InvoiceInfoAmount
+    from .invoice_info_amount_v1 import InvoiceInfoAmountV1
+    from .invoice_info_mutation import InvoiceInfoMutation
+    from .invoice_info_mutation_v1 import InvoiceInfoMutationV1
+    from .invoice_info_settlement import InvoiceInfoSettlement
+    from .invoice_info_settlement_mutation import InvoiceInfoSettlementMutation
+    from .invoice_info_settlement_mutation_v1 import InvoiceInfoSettlementMutationV1
+    from .invoice_info_settlement_v1 import InvoiceInfoSettlementV1
+    from .invoice_info_v1 import InvoiceInfoV1
+    from .job_assassination_contract import JobAssassinationContract
+    from .job_assassination_contract_v1 import JobAssassinationContractV1
+    from .jobrunr_backgroundjobservers import JobrunrBackgroundjobservers
+    from .jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
+    from .jobrunr_jobs import JobrunrJobs
+    from .jobrunr_jobs_v1 import JobrunrJobsV1
+    from .jobrunr_metadata import JobrunrMetadata
+    from .jobrunr_metadata_v1 import JobrunrMetadataV1
+    from .jobrunr_migrations import JobrunrMigrations
+    from .jobrunr_migrations_v1 import JobrunrMigrationsV1
+    from .jobrunr_recurring_jobs import JobrunrRecurringJobs
+    from .jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
+    from .ledger_account import LedgerAccount
+    from .ledger_account_action import LedgerAccountAction
+    from .ledger_account_action_v1 import LedgerAccountActionV1
+    from .ledger_account_balance import LedgerAccountBalance
+    from .ledger_account_balance_v1 import LedgerAccountBalanceV1
+    from .ledger_account_key import LedgerAccountKey
+    from .ledger_account_key_app import LedgerAccountKeyApp
+    from .ledger_account_key_app_v1 import LedgerAccountKeyAppV1
+    from .ledger_account_key_purpose import LedgerAccountKeyPurpose
+    from .ledger_account_key_purpose_v1 import LedgerAccountKeyPurposeV1
+    from .ledger_account_key_v1 import LedgerAccountKeyV1
+    from .ledger_account_purpose import LedgerAccountPurpose
+    from .ledger_account_purpose_v1 import LedgerAccountPurposeV1
+    from .ledger_account_settlement import LedgerAccountSettlement
+    from .ledger_account_settlement_v1 import LedgerAccountSettlementV1
+    from .ledger_account_transition import LedgerAccountTransition
+    from .ledger_account_transition_v1 import LedgerAccountTransitionV1
+    from .ledger_account_v1 import LedgerAccountV1
+    from .ledger_journal import LedgerJournal
+    from .ledger_journal_mutation import LedgerJournalMutation
+    from .ledger_journal_mutation_v1 import LedgerJournalMutationV1
+    from .ledger_journal_v1 import LedgerJournalV1
+    from .lexi_attribute import LexiAttribute
+    from .lexi_attribute_v1 import LexiAttributeV1
+    from .lexi_rule import LexiRule
+    from .lexi_rule_v1 import LexiRuleV1
+    from .look import Look
+    from .look_data import LookData
+    from .look_data_v1 import LookDataV1
+    from .look_v1 import LookV1
+    from .merchant_detail import MerchantDetail
+    from .merchant_detail_v1 import MerchantDetailV1
+    from .misc_action import MiscAction
+    from .misc_action_error import MiscActionError
+    from .misc_action_error_v1 import MiscActionErrorV1
+    from .misc_action_fee_code import MiscActionFeeCode
+    from .misc_action_fee_code_v1 import MiscActionFeeCodeV1
+    from .misc_action_type import MiscActionType
+    from .misc_action_type_v1 import MiscActionTypeV1
+    from .misc_action_v1 import MiscActionV1
+    from .misc_specifier import MiscSpecifier
+    from .misc_specifier_v1 import MiscSpecifierV1
+    from .model_fee_summary import ModelFeeSummary
+    from .model_fee_summary_v1 import ModelFeeSummaryV1
+    from .monetary_adjustment import MonetaryAdjustment
+    from .monetary_adjustment_mutation import MonetaryAdjustmentMutation
+    from .monetary_adjustment_mutation_v1 import MonetaryAdjustmentMutationV1
+    from .monetary_adjustment_v1 import MonetaryAdjustmentV1
+    from .monetary_rule_alias import MonetaryRuleAlias
+    from .monetary_rule_alias_v1 import MonetaryRuleAliasV1
+    from .monetary_rule_set import MonetaryRuleSet
+    from .monetary_rule_set_rule import MonetaryRuleSetRule
+    from .monetary_rule_set_rule_v1 import MonetaryRuleSetRuleV1
+    from .monetary_rule_set_v1 import MonetaryRuleSetV1
+    from .partner_config import PartnerConfig
+    from .partner_config_v1 import PartnerConfigV1
+    from .plan_action import PlanAction
+    from .plan_action_error import PlanActionError
+    from .plan_action_error_v1 import PlanActionErrorV1
+    from .plan_action_fee_code import PlanActionFeeCode
+    from .plan_action_fee_code_v1 import PlanActionFeeCodeV1
+    from .plan_action_type import PlanActionType
+    from .plan_action_type_v1 import PlanActionTypeV1
+    from .plan_action_v1 import PlanActionV1
+    from .processing_group_dates import ProcessingGroupDates
+    from .processing_group_dates_v1 import ProcessingGroupDatesV1
+    from .processing_note import ProcessingNote
+    from .processing_note_mutation import ProcessingNoteMutation
+    from .processing_note_mutation_v1 import ProcessingNoteMutationV1
+    from .processing_note_v1 import ProcessingNoteV1
+    from .prototype_fee_rate import PrototypeFeeRate
+    from .prototype_fee_rate_v1 import PrototypeFeeRateV1
+    from .prototype_fee_set import PrototypeFeeSet
+    from .prototype_fee_set_v1 import PrototypeFeeSetV1
+    from .revenue_action import RevenueAction
+    from .revenue_action_error import RevenueActionError
+    from .revenue_action_error_v1 import RevenueActionErrorV1
+    from .revenue_action_fee_code import RevenueActionFeeCode
+    from .revenue_action_fee_code_v1 import RevenueActionFeeCodeV1
+    from .revenue_action_type import RevenueActionType
+    from .revenue_action_type_v1 import RevenueActionTypeV1
+    from .revenue_action_v1 import RevenueActionV1
+    from .revenue_share_group import RevenueShareGroup
+    from .revenue_share_group_v1 import RevenueShareGroupV1
+    from .server_config import ServerConfig
+    from .server_config_v1 import ServerConfigV1
+    from .settlement import Settlement
+    from .settlement_action import SettlementAction
+    from .settlement_action_v1 import SettlementActionV1
+    from .settlement_mutation import SettlementMutation
+    from .settlement_mutation_v1 import SettlementMutationV1
+    from .settlement_v1 import SettlementV1
+    from .skip_fee_category_lexi_tag import SkipFeeCategoryLexiTag
+    from .skip_fee_category_lexi_tag_v1 import SkipFeeCategoryLexiTagV1
+    from .tier_detail import TierDetail
+    from .tier_detail_v1 import TierDetailV1
+    from .tiered_pricing import TieredPricing
+    from .tiered_pricing_v1 import TieredPricingV1
+    from .tiered_qualifier import TieredQualifier
+    from .tiered_qualifier_v1 import TieredQualifierV1
+    from .tiered_rule import TieredRule
+    from .tiered_rule_v1 import TieredRuleV1
 
 __all__ = [
     "AdjustAction",
@@ -447,3 +452,230 @@ __all__ = [
     "TieredRule",
     "TieredRuleV1",
 ]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AdjustAction": ".adjust_action",
+        "AdjustActionFeeCode": ".adjust_action_fee_code",
+        "AdjustActionFeeCodeV1": ".adjust_action_fee_code_v1",
+        "AdjustActionType": ".adjust_action_type",
+        "AdjustActionTypeV1": ".adjust_action_type_v1",
+        "AdjustActionV1": ".adjust_action_v1",
+        "AdjustReason": ".adjust_reason",
+        "AdjustReasonV1": ".adjust_reason_v1",
+        "AppMeterAction": ".app_meter_action",
+        "AppMeterActionError": ".app_meter_action_error",
+        "AppMeterActionErrorV1": ".app_meter_action_error_v1",
+        "AppMeterActionFeeCode": ".app_meter_action_fee_code",
+        "AppMeterActionFeeCodeV1": ".app_meter_action_fee_code_v1",
+        "AppMeterActionType": ".app_meter_action_type",
+        "AppMeterActionTypeV1": ".app_meter_action_type_v1",
+        "AppMeterActionV1": ".app_meter_action_v1",
+        "AppSubAction": ".app_sub_action",
+        "AppSubActionError": ".app_sub_action_error",
+        "AppSubActionErrorV1": ".app_sub_action_error_v1",
+        "AppSubActionFeeCode": ".app_sub_action_fee_code",
+        "AppSubActionFeeCodeV1": ".app_sub_action_fee_code_v1",
+        "AppSubActionType": ".app_sub_action_type",
+        "AppSubActionTypeV1": ".app_sub_action_type_v1",
+        "AppSubActionV1": ".app_sub_action_v1",
+        "AutoAdjustAdvice": ".auto_adjust_advice",
+        "AutoAdjustAdviceV1": ".auto_adjust_advice_v1",
+        "AutoAdjustQualifier": ".auto_adjust_qualifier",
+        "AutoAdjustQualifierV1": ".auto_adjust_qualifier_v1",
+        "AutoAdjustRule": ".auto_adjust_rule",
+        "AutoAdjustRuleV1": ".auto_adjust_rule_v1",
+        "BillingArchetype": ".billing_archetype",
+        "BillingArchetypeV1": ".billing_archetype_v1",
+        "BillingEntity": ".billing_entity",
+        "BillingEntityConfig": ".billing_entity_config",
+        "BillingEntityConfigV1": ".billing_entity_config_v1",
+        "BillingEntityV1": ".billing_entity_v1",
+        "BillingEventHistory": ".billing_event_history",
+        "BillingEventHistoryV1": ".billing_event_history_v1",
+        "BillingHierarchy": ".billing_hierarchy",
+        "BillingHierarchyCycle": ".billing_hierarchy_cycle",
+        "BillingHierarchyCycleV1": ".billing_hierarchy_cycle_v1",
+        "BillingHierarchyType": ".billing_hierarchy_type",
+        "BillingHierarchyTypeV1": ".billing_hierarchy_type_v1",
+        "BillingHierarchyV1": ".billing_hierarchy_v1",
+        "BillingPseudoEntity": ".billing_pseudo_entity",
+        "BillingPseudoEntityV1": ".billing_pseudo_entity_v1",
+        "BillingSchedule": ".billing_schedule",
+        "BillingScheduleV1": ".billing_schedule_v1",
+        "CellularAction": ".cellular_action",
+        "CellularActionError": ".cellular_action_error",
+        "CellularActionErrorV1": ".cellular_action_error_v1",
+        "CellularActionFeeCode": ".cellular_action_fee_code",
+        "CellularActionFeeCodeV1": ".cellular_action_fee_code_v1",
+        "CellularActionType": ".cellular_action_type",
+        "CellularActionTypeV1": ".cellular_action_type_v1",
+        "CellularActionV1": ".cellular_action_v1",
+        "ConsumerFailure": ".consumer_failure",
+        "ConsumerFailureHistory": ".consumer_failure_history",
+        "ConsumerFailureHistoryV1": ".consumer_failure_history_v1",
+        "ConsumerFailureV1": ".consumer_failure_v1",
+        "CycleValidation": ".cycle_validation",
+        "CycleValidationMutation": ".cycle_validation_mutation",
+        "CycleValidationMutationV1": ".cycle_validation_mutation_v1",
+        "CycleValidationV1": ".cycle_validation_v1",
+        "DeserializableFailure": ".deserializable_failure",
+        "DeserializableFailureV1": ".deserializable_failure_v1",
+        "FeeCategory": ".fee_category",
+        "FeeCategoryV1": ".fee_category_v1",
+        "FeeCode": ".fee_code",
+        "FeeCodeApp": ".fee_code_app",
+        "FeeCodeAppV1": ".fee_code_app_v1",
+        "FeeCodeLedgerAccount": ".fee_code_ledger_account",
+        "FeeCodeLedgerAccountV1": ".fee_code_ledger_account_v1",
+        "FeeCodeV1": ".fee_code_v1",
+        "FeeCtd": ".fee_ctd",
+        "FeeCtdV1": ".fee_ctd_v1",
+        "FeeRate": ".fee_rate",
+        "FeeRateErrorReport": ".fee_rate_error_report",
+        "FeeRateErrorReportV1": ".fee_rate_error_report_v1",
+        "FeeRateReportActionError": ".fee_rate_report_action_error",
+        "FeeRateReportActionErrorV1": ".fee_rate_report_action_error_v1",
+        "FeeRateV1": ".fee_rate_v1",
+        "FeeSummary": ".fee_summary",
+        "FeeSummaryMutation": ".fee_summary_mutation",
+        "FeeSummaryMutationV1": ".fee_summary_mutation_v1",
+        "FeeSummaryV1": ".fee_summary_v1",
+        "FeeTax": ".fee_tax",
+        "FeeTaxMutation": ".fee_tax_mutation",
+        "FeeTaxMutationV1": ".fee_tax_mutation_v1",
+        "FeeTaxV1": ".fee_tax_v1",
+        "FeeYtd": ".fee_ytd",
+        "FeeYtdV1": ".fee_ytd_v1",
+        "FlywaySchemaHistory": ".flyway_schema_history",
+        "FlywaySchemaHistoryV1": ".flyway_schema_history_v1",
+        "InvoiceAllianceCode": ".invoice_alliance_code",
+        "InvoiceAllianceCodeV1": ".invoice_alliance_code_v1",
+        "InvoiceInfo": ".invoice_info",
+        "InvoiceInfoAmount": ".invoice_info_amount",
+        "InvoiceInfoAmountV1": ".invoice_info_amount_v1",
+        "InvoiceInfoMutation": ".invoice_info_mutation",
+        "InvoiceInfoMutationV1": ".invoice_info_mutation_v1",
+        "InvoiceInfoSettlement": ".invoice_info_settlement",
+        "InvoiceInfoSettlementMutation": ".invoice_info_settlement_mutation",
+        "InvoiceInfoSettlementMutationV1": ".invoice_info_settlement_mutation_v1",
+        "InvoiceInfoSettlementV1": ".invoice_info_settlement_v1",
+        "InvoiceInfoV1": ".invoice_info_v1",
+        "JobAssassinationContract": ".job_assassination_contract",
+        "JobAssassinationContractV1": ".job_assassination_contract_v1",
+        "JobrunrBackgroundjobservers": ".jobrunr_backgroundjobservers",
+        "JobrunrBackgroundjobserversV1": ".jobrunr_backgroundjobservers_v1",
+        "JobrunrJobs": ".jobrunr_jobs",
+        "JobrunrJobsV1": ".jobrunr_jobs_v1",
+        "JobrunrMetadata": ".jobrunr_metadata",
+        "JobrunrMetadataV1": ".jobrunr_metadata_v1",
+        "JobrunrMigrations": ".jobrunr_migrations",
+        "JobrunrMigrationsV1": ".jobrunr_migrations_v1",
+        "JobrunrRecurringJobs": ".jobrunr_recurring_jobs",
+        "JobrunrRecurringJobsV1": ".jobrunr_recurring_jobs_v1",
+        "LedgerAccount": ".ledger_account",
+        "LedgerAccountAction": ".ledger_account_action",
+        "LedgerAccountActionV1": ".ledger_account_action_v1",
+        "LedgerAccountBalance": ".ledger_account_balance",
+        "LedgerAccountBalanceV1": ".ledger_account_balance_v1",
+        "LedgerAccountKey": ".ledger_account_key",
+        "LedgerAccountKeyApp": ".ledger_account_key_app",
+        "LedgerAccountKeyAppV1": ".ledger_account_key_app_v1",
+        "LedgerAccountKeyPurpose": ".ledger_account_key_purpose",
+        "LedgerAccountKeyPurposeV1": ".ledger_account_key_purpose_v1",
+        "LedgerAccountKeyV1": ".ledger_account_key_v1",
+        "LedgerAccountPurpose": ".ledger_account_purpose",
+        "LedgerAccountPurposeV1": ".ledger_account_purpose_v1",
+        "LedgerAccountSettlement": ".ledger_account_settlement",
+        "LedgerAccountSettlementV1": ".ledger_account_settlement_v1",
+        "LedgerAccountTransition": ".ledger_account_transition",
+        "LedgerAccountTransitionV1": ".ledger_account_transition_v1",
+        "LedgerAccountV1": ".ledger_account_v1",
+        "LedgerJournal": ".ledger_journal",
+        "LedgerJournalMutation": ".ledger_journal_mutation",
+        "LedgerJournalMutationV1": ".ledger_journal_mutation_v1",
+        "LedgerJournalV1": ".ledger_journal_v1",
+        "LexiAttribute": ".lexi_attribute",
+        "LexiAttributeV1": ".lexi_attribute_v1",
+        "LexiRule": ".lexi_rule",
+        "LexiRuleV1": ".lexi_rule_v1",
+        "Look": ".look",
+        "LookData": ".look_data",
+        "LookDataV1": ".look_data_v1",
+        "LookV1": ".look_v1",
+        "MerchantDetail": ".merchant_detail",
+        "MerchantDetailV1": ".merchant_detail_v1",
+        "MiscAction": ".misc_action",
+        "MiscActionError": ".misc_action_error",
+        "MiscActionErrorV1": ".misc_action_error_v1",
+        "MiscActionFeeCode": ".misc_action_fee_code",
+        "MiscActionFeeCodeV1": ".misc_action_fee_code_v1",
+        "MiscActionType": ".misc_action_type",
+        "MiscActionTypeV1": ".misc_action_type_v1",
+        "MiscActionV1": ".misc_action_v1",
+        "MiscSpecifier": ".misc_specifier",
+        "MiscSpecifierV1": ".misc_specifier_v1",
+        "ModelFeeSummary": ".model_fee_summary",
+        "ModelFeeSummaryV1": ".model_fee_summary_v1",
+        "MonetaryAdjustment": ".monetary_adjustment",
+        "MonetaryAdjustmentMutation": ".monetary_adjustment_mutation",
+        "MonetaryAdjustmentMutationV1": ".monetary_adjustment_mutation_v1",
+        "MonetaryAdjustmentV1": ".monetary_adjustment_v1",
+        "MonetaryRuleAlias": ".monetary_rule_alias",
+        "MonetaryRuleAliasV1": ".monetary_rule_alias_v1",
+        "MonetaryRuleSet": ".monetary_rule_set",
+        "MonetaryRuleSetRule": ".monetary_rule_set_rule",
+        "MonetaryRuleSetRuleV1": ".monetary_rule_set_rule_v1",
+        "MonetaryRuleSetV1": ".monetary_rule_set_v1",
+        "PartnerConfig": ".partner_config",
+        "PartnerConfigV1": ".partner_config_v1",
+        "PlanAction": ".plan_action",
+        "PlanActionError": ".plan_action_error",
+        "PlanActionErrorV1": ".plan_action_error_v1",
+        "PlanActionFeeCode": ".plan_action_fee_code",
+        "PlanActionFeeCodeV1": ".plan_action_fee_code_v1",
+        "PlanActionType": ".plan_action_type",
+        "PlanActionTypeV1": ".plan_action_type_v1",
+        "PlanActionV1": ".plan_action_v1",
+        "ProcessingGroupDates": ".processing_group_dates",
+        "ProcessingGroupDatesV1": ".processing_group_dates_v1",
+        "ProcessingNote": ".processing_note",
+        "ProcessingNoteMutation": ".processing_note_mutation",
+        "ProcessingNoteMutationV1": ".processing_note_mutation_v1",
+        "ProcessingNoteV1": ".processing_note_v1",
+        "PrototypeFeeRate": ".prototype_fee_rate",
+        "PrototypeFeeRateV1": ".prototype_fee_rate_v1",
+        "PrototypeFeeSet": ".prototype_fee_set",
+        "PrototypeFeeSetV1": ".prototype_fee_set_v1",
+        "RevenueAction": ".revenue_action",
+        "RevenueActionError": ".revenue_action_error",
+        "RevenueActionErrorV1": ".revenue_action_error_v1",
+        "RevenueActionFeeCode": ".revenue_action_fee_code",
+        "RevenueActionFeeCodeV1": ".revenue_action_fee_code_v1",
+        "RevenueActionType": ".revenue_action_type",
+        "RevenueActionTypeV1": ".revenue_action_type_v1",
+        "RevenueActionV1": ".revenue_action_v1",
+        "RevenueShareGroup": ".revenue_share_group",
+        "RevenueShareGroupV1": ".revenue_share_group_v1",
+        "ServerConfig": ".server_config",
+        "ServerConfigV1": ".server_config_v1",
+        "Settlement": ".settlement",
+        "SettlementAction": ".settlement_action",
+        "SettlementActionV1": ".settlement_action_v1",
+        "SettlementMutation": ".settlement_mutation",
+        "SettlementMutationV1": ".settlement_mutation_v1",
+        "SettlementV1": ".settlement_v1",
+        "SkipFeeCategoryLexiTag": ".skip_fee_category_lexi_tag",
+        "SkipFeeCategoryLexiTagV1": ".skip_fee_category_lexi_tag_v1",
+        "TierDetail": ".tier_detail",
+        "TierDetailV1": ".tier_detail_v1",
+        "TieredPricing": ".tiered_pricing",
+        "TieredPricingV1": ".tiered_pricing_v1",
+        "TieredQualifier": ".tiered_qualifier",
+        "TieredQualifierV1": ".tiered_qualifier_v1",
+        "TieredRule": ".tiered_rule",
+        "TieredRuleV1": ".tiered_rule_v1",
+    },
+)
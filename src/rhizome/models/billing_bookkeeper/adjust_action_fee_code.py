@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class AdjustActionFeeCode(RhizomeModel, table=False):
@@ -23,9 +24,13 @@ class AdjustActionFeeCode(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
-    developer_uuid: str | None = Field(default=None, max_length=13, description="Developer Uuid")
-    developer_app_uuid: str | None = Field(default=None, max_length=13, description="Developer App Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
+    developer_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="Developer Uuid"
+    )
+    developer_app_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="Developer App Uuid"
+    )
     adjust_reason: str = Field(max_length=20, description="Adjust Reason")
     adjust_action_type: str = Field(max_length=25, description="Adjust Action Type")
     effective_date: datetime.date = Field(description="Effective Date")
@@ -34,22 +39,4 @@ class AdjustActionFeeCode(RhizomeModel, table=False):
     deleted_date: datetime.date | None = Field(default=None, description="Deleted Date")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit Id")
-
-    def sanitize(self) -> AdjustActionFeeCode:
-        """Return a sanitized copy of this AdjustActionFeeCode instance."""
-        return AdjustActionFeeCode(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            developer_uuid=sanitize_uuid_field(self.developer_uuid, 13),
-            developer_app_uuid=sanitize_uuid_field(self.developer_app_uuid, 13),
-            adjust_reason=self.adjust_reason,
-            adjust_action_type=self.adjust_action_type,
-            effective_date=self.effective_date,
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            deleted_date=self.deleted_date,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Audit Id")
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from decimal import Decimal
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class AutoAdjustAdvice(RhizomeModel, table=False):
@@ -24,9 +25,9 @@ class AutoAdjustAdvice(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
-    billing_entity_uuid: str = Field(max_length=26, description="Billing Entity Uuid")
-    auto_adjust_rule_uuid: str = Field(max_length=26, description="Auto Adjust Rule Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
+    billing_entity_uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, description="Billing Entity Uuid")
+    auto_adjust_rule_uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, description="Auto Adjust Rule Uuid")
     start_date: datetime.date = Field(description="Start Date")
     deleted_date: datetime.date | None = Field(default=None, description="Deleted Date")
     total_periods: int = Field(description="Total Periods")
@@ -36,29 +37,9 @@ class AutoAdjustAdvice(RhizomeModel, table=False):
     max_amount: Decimal | None = Field(default=None, max_digits=12, decimal_places=3, description="Max Amount")
     currency: str | None = Field(default=None, max_length=3, description="Currency")
     reference: str | None = Field(default=None, max_length=50, description="Reference")
-    request_uuid: str | None = Field(default=None, max_length=26, description="Request Uuid")
+    request_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Request Uuid"
+    )
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit Id")
-
-    def sanitize(self) -> AutoAdjustAdvice:
-        """Return a sanitized copy of this AutoAdjustAdvice instance."""
-        return AutoAdjustAdvice(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),  # type: ignore
-            auto_adjust_rule_uuid=sanitize_uuid_field(self.auto_adjust_rule_uuid, 26),  # type: ignore
-            start_date=self.start_date,
-            deleted_date=self.deleted_date,
-            total_periods=self.total_periods,
-            evaluated_periods=self.evaluated_periods,
-            applied_periods=self.applied_periods,
-            max_units=self.max_units,
-            max_amount=self.max_amount,
-            currency=self.currency,
-            reference=self.reference,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 26),
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Audit Id")
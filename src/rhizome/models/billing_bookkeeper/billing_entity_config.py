@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BillingEntityConfig(RhizomeModel, table=False):
@@ -23,33 +24,17 @@ class BillingEntityConfig(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
-    billing_entity_uuid: str = Field(max_length=26, description="Billing Entity Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
+    billing_entity_uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, description="Billing Entity Uuid")
     hierarchy_type: str = Field(max_length=20, description="Hierarchy Type")
     effective_date: datetime.date = Field(description="Effective Date")
     post_method: str | None = Field(default=None, max_length=20, description="Post Method")
     plan_billing_method: str | None = Field(default=None, max_length=20, description="Plan Billing Method")
     invoice_method: str | None = Field(default=None, max_length=20, description="Invoice Method")
     settlement_method: str | None = Field(default=None, max_length=20, description="Settlement Method")
-    seasonal_rule_set_uuid: str | None = Field(default=None, max_length=26, description="Seasonal Rule Set Uuid")
+    seasonal_rule_set_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Seasonal Rule Set Uuid"
+    )
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit Id")
-
-    def sanitize(self) -> BillingEntityConfig:
-        """Return a sanitized copy of this BillingEntityConfig instance."""
-        return BillingEntityConfig(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),  # type: ignore
-            hierarchy_type=self.hierarchy_type,
-            effective_date=self.effective_date,
-            post_method=self.post_method,
-            plan_billing_method=self.plan_billing_method,
-            invoice_method=self.invoice_method,
-            settlement_method=self.settlement_method,
-            seasonal_rule_set_uuid=sanitize_uuid_field(self.seasonal_rule_set_uuid, 26),
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Audit Id")
@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class BillingEventHistory(RhizomeModel, table=False):
@@ -24,22 +25,9 @@ class BillingEventHistory(RhizomeModel, table=False):
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
     environment: str = Field(max_length=25, description="Environment")
-    entity_uuid: str = Field(max_length=13, description="Entity Uuid")
+    entity_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Entity Uuid")
     entity_type: str = Field(description="Entity Type")
-    event_uuid: str | None = Field(default=None, max_length=26, description="Event Uuid")
+    event_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Event Uuid")
     input: str = Field(description="Input")
     message: str | None = Field(default=None, max_length=1024, description="Message")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
-
-    def sanitize(self) -> BillingEventHistory:
-        """Return a sanitized copy of this BillingEventHistory instance."""
-        return BillingEventHistory(
-            id=self.id,
-            environment=self.environment,
-            entity_uuid=sanitize_uuid_field(self.entity_uuid, 13),  # type: ignore
-            entity_type=self.entity_type,
-            event_uuid=sanitize_uuid_field(self.event_uuid, 26),
-            input=self.input,
-            message=self.message,
-            created_timestamp=self.created_timestamp,
-        )
@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class CellularActionFeeCode(RhizomeModel, table=False):
@@ -23,8 +24,10 @@ class CellularActionFeeCode(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
-    merchant_plan_uuid: str | None = Field(default=None, max_length=13, description="Merchant Plan Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
+    merchant_plan_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="Merchant Plan Uuid"
+    )
     carrier: str | None = Field(default=None, max_length=25, description="Carrier")
     cellular_action_type: str = Field(max_length=25, description="Cellular Action Type")
     effective_date: datetime.date = Field(description="Effective Date")
@@ -33,21 +36,4 @@ class CellularActionFeeCode(RhizomeModel, table=False):
     deleted_date: datetime.date | None = Field(default=None, description="Deleted Date")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit Id")
-
-    def sanitize(self) -> CellularActionFeeCode:
-        """Return a sanitized copy of this CellularActionFeeCode instance."""
-        return CellularActionFeeCode(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            merchant_plan_uuid=sanitize_uuid_field(self.merchant_plan_uuid, 13),
-            carrier=self.carrier,
-            cellular_action_type=self.cellular_action_type,
-            effective_date=self.effective_date,
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            deleted_date=self.deleted_date,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Audit Id")
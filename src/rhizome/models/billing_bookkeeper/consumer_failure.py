@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ConsumerFailure(RhizomeModel, table=False):
@@ -23,27 +24,12 @@ class ConsumerFailure(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=36, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(max_length=36, unique=True, description="Uuid")
     environment: str = Field(max_length=25, description="Environment")
-    reference_id: str = Field(max_length=13, description="Reference Id")
+    reference_id: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Reference Id")
     payload: str = Field(description="Payload")
     channel: str | None = Field(default=None, max_length=127, description="Channel")
     topic: str | None = Field(default=None, max_length=127, description="Topic")
     cause: str = Field(max_length=100, description="Cause")
     message: str | None = Field(default=None, max_length=500, description="Message")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
-
-    def sanitize(self) -> ConsumerFailure:
-        """Return a sanitized copy of this ConsumerFailure instance."""
-        return ConsumerFailure(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            environment=self.environment,
-            reference_id=sanitize_uuid_field(self.reference_id, 13),  # type: ignore
-            payload=self.payload,
-            channel=self.channel,
-            topic=self.topic,
-            cause=self.cause,
-            message=self.message,
-            created_timestamp=self.created_timestamp,
-        )
@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ConsumerFailureHistory(RhizomeModel, table=False):
@@ -23,9 +24,9 @@ class ConsumerFailureHistory(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=36, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(max_length=36, unique=True, description="Uuid")
     environment: str = Field(max_length=25, description="Environment")
-    reference_id: str = Field(max_length=13, description="Reference Id")
+    reference_id: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Reference Id")
     payload: str = Field(description="Payload")
     channel: str | None = Field(default=None, max_length=127, description="Channel")
     topic: str | None = Field(default=None, max_length=127, description="Topic")
@@ -33,19 +34,3 @@ class ConsumerFailureHistory(RhizomeModel, table=False):
     message: str | None = Field(default=None, max_length=500, description="Message")
     comment: str | None = Field(default=None, max_length=500, description="Comment")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
-
-    def sanitize(self) -> ConsumerFailureHistory:
-        """Return a sanitized copy of this ConsumerFailureHistory instance."""
-        return ConsumerFailureHistory(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            environment=self.environment,
-            reference_id=sanitize_uuid_field(self.reference_id, 13),  # type: ignore
-            payload=self.payload,
-            channel=self.channel,
-            topic=self.topic,
-            cause=self.cause,
-            message=self.message,
-            comment=self.comment,
-            created_timestamp=self.created_timestamp,
-        )
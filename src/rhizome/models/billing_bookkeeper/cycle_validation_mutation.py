@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from decimal import Decimal
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class CycleValidationMutation(RhizomeModel, table=False):
@@ -27,11 +28,13 @@ class CycleValidationMutation(RhizomeModel, table=False):
     mutation_action: str = Field(description="Mutation Action")
     mutation_timestamp: datetime.datetime = Field(description="Mutation Timestamp")
     cycle_validation_id: int = Field(description="Cycle Validation Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
     task_id: str | None = Field(default=None, max_length=126, description="Task Id")
     task_type: str | None = Field(default=None, description="Task Type")
     validation_group: str | None = Field(default=None, max_length=126, description="Validation Group")
-    billing_entity_uuid: str | None = Field(default=None, max_length=26, description="Billing Entity Uuid")
+    billing_entity_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Billing Entity Uuid"
+    )
     hierarchy_type: str | None = Field(default=None, max_length=20, description="Hierarchy Type")
     cycle_date: datetime.date | None = Field(default=None, description="Cycle Date")
     currency: str | None = Field(default=None, max_length=3, description="Currency")
@@ -44,35 +47,11 @@ class CycleValidationMutation(RhizomeModel, table=False):
     )
     total_count: Decimal | None = Field(default=None, max_digits=12, decimal_places=4, description="Total Count")
     total_amount: Decimal | None = Field(default=None, max_digits=12, decimal_places=3, description="Total Amount")
-    request_uuid: str | None = Field(default=None, max_length=26, description="Request Uuid")
-    validation_request_uuid: str | None = Field(default=None, max_length=26, description="Validation Request Uuid")
+    request_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Request Uuid"
+    )
+    validation_request_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Validation Request Uuid"
+    )
     created_timestamp: datetime.datetime | None = Field(default=None, description="Created Timestamp")
     modified_timestamp: datetime.datetime | None = Field(default=None, description="Modified Timestamp")
-
-    def sanitize(self) -> CycleValidationMutation:
-        """Return a sanitized copy of this CycleValidationMutation instance."""
-        return CycleValidationMutation(
-            id=self.id,
-            mutation_action=self.mutation_action,
-            mutation_timestamp=self.mutation_timestamp,
-            cycle_validation_id=self.cycle_validation_id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            task_id=self.task_id,
-            task_type=self.task_type,
-            validation_group=self.validation_group,
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),
-            hierarchy_type=self.hierarchy_type,
-            cycle_date=self.cycle_date,
-            currency=self.currency,
-            status=self.status,
-            bypass_count=self.bypass_count,
-            bypass_amount=self.bypass_amount,
-            accepted_count=self.accepted_count,
-            accepted_amount=self.accepted_amount,
-            total_count=self.total_count,
-            total_amount=self.total_amount,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 26),
-            validation_request_uuid=sanitize_uuid_field(self.validation_request_uuid, 26),
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class FeeCodeApp(RhizomeModel, table=False):
@@ -23,27 +24,18 @@ class FeeCodeApp(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
     fee_category: str = Field(max_length=25, description="Fee Category")
     fee_code: str = Field(max_length=25, description="Fee Code")
-    developer_uuid: str = Field(max_length=13, description="Developer Uuid")
-    developer_app_uuid: str | None = Field(default=None, max_length=13, description="Developer App Uuid")
-    app_subscription_uuid: str | None = Field(default=None, max_length=13, description="App Subscription Uuid")
-    app_metered_uuid: str | None = Field(default=None, max_length=13, description="App Metered Uuid")
+    developer_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Developer Uuid")
+    developer_app_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="Developer App Uuid"
+    )
+    app_subscription_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="App Subscription Uuid"
+    )
+    app_metered_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="App Metered Uuid"
+    )
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-
-    def sanitize(self) -> FeeCodeApp:
-        """Return a sanitized copy of this FeeCodeApp instance."""
-        return FeeCodeApp(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            developer_uuid=sanitize_uuid_field(self.developer_uuid, 13),  # type: ignore
-            developer_app_uuid=sanitize_uuid_field(self.developer_app_uuid, 13),
-            app_subscription_uuid=sanitize_uuid_field(self.app_subscription_uuid, 13),
-            app_metered_uuid=sanitize_uuid_field(self.app_metered_uuid, 13),
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from decimal import Decimal
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class FeeCtd(RhizomeModel, table=False):
@@ -24,8 +25,8 @@ class FeeCtd(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
-    billing_entity_uuid: str = Field(max_length=26, description="Billing Entity Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
+    billing_entity_uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, description="Billing Entity Uuid")
     fee_category: str = Field(max_length=25, description="Fee Category")
     fee_code: str = Field(max_length=25, description="Fee Code")
     currency: str = Field(max_length=3, description="Currency")
@@ -36,21 +37,3 @@ class FeeCtd(RhizomeModel, table=False):
     num_actions: int = Field(description="Num Actions")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-
-    def sanitize(self) -> FeeCtd:
-        """Return a sanitized copy of this FeeCtd instance."""
-        return FeeCtd(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),  # type: ignore
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            currency=self.currency,
-            ctd_num_units=self.ctd_num_units,
-            abs_num_units=self.abs_num_units,
-            ctd_basis_amount=self.ctd_basis_amount,
-            abs_basis_amount=self.abs_basis_amount,
-            num_actions=self.num_actions,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
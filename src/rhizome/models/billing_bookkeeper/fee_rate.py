@@ -10,11 +10,12 @@ from __future__ import annotations
 import datetime
 from decimal import Decimal
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ApplyType(StrEnum):
@@ -37,8 +38,12 @@ class FeeRate(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=26, unique=True, description="Unique identifier for the fee rate record")
-    billing_entity_uuid: str = Field(max_length=26, description="UUID of the billing entity")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, unique=True, description="Unique identifier for the fee rate record"
+    )
+    billing_entity_uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, description="UUID of the billing entity"
+    )
     fee_category: str = Field(max_length=25, description="Category of the fee")
     fee_code: str = Field(max_length=25, description="Code for the fee")
     currency: str = Field(max_length=3, description="Currency code (ISO 3-letter)")
@@ -50,22 +55,6 @@ class FeeRate(RhizomeModel, table=False):
     percentage: Decimal | None = Field(default=None, max_digits=5, decimal_places=2, description="Percentage fee")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_timestamp: datetime.datetime = Field(description="Timestamp when the record was last modified")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit trail identifier")
-
-    def sanitize(self) -> FeeRate:
-        """Return a sanitized copy of this FeeRate instance."""
-        return FeeRate(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),  # type: ignore
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            currency=self.currency,
-            effective_date=self.effective_date,
-            apply_type=self.apply_type,
-            per_item_amount=self.per_item_amount,
-            percentage=self.percentage,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Audit trail identifier"
+    )
@@ -31,18 +31,3 @@ class FlywaySchemaHistory(RhizomeModel, table=False):
     installed_on: datetime.datetime = Field(description="Installed On")
     execution_time: int = Field(description="Execution Time")
     success: bool = Field(description="Success")
-
-    def sanitize(self) -> FlywaySchemaHistory:
-        """Return a sanitized copy of this FlywaySchemaHistory instance."""
-        return FlywaySchemaHistory(
-            installed_rank=self.installed_rank,
-            version=self.version,
-            description=self.description,
-            type=self.type,
-            script=self.script,
-            checksum=self.checksum,
-            installed_by=self.installed_by,
-            installed_on=self.installed_on,
-            execution_time=self.execution_time,
-            success=self.success,
-        )
@@ -26,13 +26,3 @@ class JobAssassinationContract(RhizomeModel, table=False):
     killed: int = Field(description="Killed")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-
-    def sanitize(self) -> JobAssassinationContract:
-        """Return a sanitized copy of this JobAssassinationContract instance."""
-        return JobAssassinationContract(
-            id=self.id,
-            job_identifier=self.job_identifier,
-            killed=self.killed,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
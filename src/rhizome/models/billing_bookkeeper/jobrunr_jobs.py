@@ -30,17 +30,3 @@ class JobrunrJobs(RhizomeModel, table=False):
     updatedAt: datetime.datetime = Field(description="Updatedat")
     scheduledAt: datetime.datetime | None = Field(default=None, description="Scheduledat")
     recurringJobId: str | None = Field(default=None, max_length=128, description="Recurringjobid")
-
-    def sanitize(self) -> JobrunrJobs:
-        """Return a sanitized copy of this JobrunrJobs instance."""
-        return JobrunrJobs(
-            id=self.id,
-            version=self.version,
-            jobAsJson=self.jobAsJson,
-            jobSignature=self.jobSignature,
-            state=self.state,
-            createdAt=self.createdAt,
-            updatedAt=self.updatedAt,
-            scheduledAt=self.scheduledAt,
-            recurringJobId=self.recurringJobId,
-        )
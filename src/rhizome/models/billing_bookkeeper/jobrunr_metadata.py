@@ -27,14 +27,3 @@ class JobrunrMetadata(RhizomeModel, table=False):
     value: str = Field(description="Value")
     createdAt: datetime.datetime = Field(description="Createdat")
     updatedAt: datetime.datetime = Field(description="Updatedat")
-
-    def sanitize(self) -> JobrunrMetadata:
-        """Return a sanitized copy of this JobrunrMetadata instance."""
-        return JobrunrMetadata(
-            id=self.id,
-            name=self.name,
-            owner=self.owner,
-            value=self.value,
-            createdAt=self.createdAt,
-            updatedAt=self.updatedAt,
-        )
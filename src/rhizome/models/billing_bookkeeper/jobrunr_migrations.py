@@ -22,11 +22,3 @@ class JobrunrMigrations(RhizomeModel, table=False):
     id: str = Field(primary_key=True, max_length=36, description="Id")
     script: str = Field(max_length=64, description="Script")
     installedOn: str = Field(max_length=29, description="Installedon")
-
-    def sanitize(self) -> JobrunrMigrations:
-        """Return a sanitized copy of this JobrunrMigrations instance."""
-        return JobrunrMigrations(
-            id=self.id,
-            script=self.script,
-            installedOn=self.installedOn,
-        )
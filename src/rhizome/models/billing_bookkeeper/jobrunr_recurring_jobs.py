@@ -23,12 +23,3 @@ class JobrunrRecurringJobs(RhizomeModel, table=False):
     version: int = Field(description="Version")
     jobAsJson: str = Field(description="Jobasjson")
     createdAt: int = Field(description="Createdat")
-
-    def sanitize(self) -> JobrunrRecurringJobs:
-        """Return a sanitized copy of this JobrunrRecurringJobs instance."""
-        return JobrunrRecurringJobs(
-            id=self.id,
-            version=self.version,
-            jobAsJson=self.jobAsJson,
-            createdAt=self.createdAt,
-        )
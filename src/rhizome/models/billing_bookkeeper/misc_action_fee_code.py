@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MiscActionFeeCode(RhizomeModel, table=False):
@@ -23,7 +24,7 @@ class MiscActionFeeCode(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
     misc_specifier: str = Field(max_length=25, description="Misc Specifier")
     misc_action_type: str = Field(max_length=25, description="Misc Action Type")
     effective_date: datetime.date = Field(description="Effective Date")
@@ -32,20 +33,4 @@ class MiscActionFeeCode(RhizomeModel, table=False):
     deleted_date: datetime.date | None = Field(default=None, description="Deleted Date")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str | None = Field(default=None, max_length=26, description="Audit Id")
-
-    def sanitize(self) -> MiscActionFeeCode:
-        """Return a sanitized copy of this MiscActionFeeCode instance."""
-        return MiscActionFeeCode(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            misc_specifier=self.misc_specifier,
-            misc_action_type=self.misc_action_type,
-            effective_date=self.effective_date,
-            fee_category=self.fee_category,
-            fee_code=self.fee_code,
-            deleted_date=self.deleted_date,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),
-        )
+    audit_id: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26, description="Audit Id")
@@ -8,11 +8,12 @@ billing-bookkeeper database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ServerConfig(RhizomeModel, table=False):
@@ -27,15 +28,4 @@ class ServerConfig(RhizomeModel, table=False):
     config_value: str | None = Field(default=None, max_length=2000, description="Config Value")
     created_timestamp: datetime.datetime = Field(description="Created Timestamp")
     modified_timestamp: datetime.datetime = Field(description="Modified Timestamp")
-    audit_id: str = Field(max_length=26, description="Audit Id")
-
-    def sanitize(self) -> ServerConfig:
-        """Return a sanitized copy of this ServerConfig instance."""
-        return ServerConfig(
-            id=self.id,
-            config_key=self.config_key,
-            config_value=self.config_value,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=sanitize_uuid_field(self.audit_id, 26),  # type: ignore
-        )
+    audit_id: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, description="Audit Id")
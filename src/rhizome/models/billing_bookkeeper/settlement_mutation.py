@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from decimal import Decimal
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class SettlementMutation(RhizomeModel, table=False):
@@ -27,10 +28,12 @@ class SettlementMutation(RhizomeModel, table=False):
     mutation_action: str = Field(description="Mutation Action")
     mutation_timestamp: datetime.datetime = Field(description="Mutation Timestamp")
     settlement_id: int = Field(description="Settlement Id")
-    uuid: str = Field(max_length=26, unique=True, description="Uuid")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(max_length=26, unique=True, description="Uuid")
     settlement_date: datetime.date | None = Field(default=None, description="Settlement Date")
-    billing_entity_uuid: str | None = Field(default=None, max_length=26, description="Billing Entity Uuid")
-    entity_uuid: str | None = Field(default=None, max_length=13, description="Entity Uuid")
+    billing_entity_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Billing Entity Uuid"
+    )
+    entity_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, max_length=13, description="Entity Uuid")
     alternate_id: str | None = Field(default=None, max_length=30, description="Alternate Id")
     payable_receivable: str | None = Field(default=None, description="Payable Receivable")
     currency: str | None = Field(default=None, max_length=3, description="Currency")
@@ -44,35 +47,8 @@ class SettlementMutation(RhizomeModel, table=False):
     gl_code: str | None = Field(default=None, max_length=40, description="Gl Code")
     item_code: str | None = Field(default=None, max_length=30, description="Item Code")
     last_invoice_num: str | None = Field(default=None, max_length=30, description="Last Invoice Num")
-    request_uuid: str | None = Field(default=None, max_length=26, description="Request Uuid")
+    request_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="Request Uuid"
+    )
     created_timestamp: datetime.datetime | None = Field(default=None, description="Created Timestamp")
     modified_timestamp: datetime.datetime | None = Field(default=None, description="Modified Timestamp")
-
-    def sanitize(self) -> SettlementMutation:
-        """Return a sanitized copy of this SettlementMutation instance."""
-        return SettlementMutation(
-            id=self.id,
-            mutation_action=self.mutation_action,
-            mutation_timestamp=self.mutation_timestamp,
-            settlement_id=self.settlement_id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            settlement_date=self.settlement_date,
-            billing_entity_uuid=sanitize_uuid_field(self.billing_entity_uuid, 26),
-            entity_uuid=sanitize_uuid_field(self.entity_uuid, 13),
-            alternate_id=self.alternate_id,
-            payable_receivable=self.payable_receivable,
-            currency=self.currency,
-            total_amount=self.total_amount,
-            fee_amount=self.fee_amount,
-            tax1_amount=self.tax1_amount,
-            tax2_amount=self.tax2_amount,
-            tax3_amount=self.tax3_amount,
-            tax4_amount=self.tax4_amount,
-            lookup_ledger_account_key=self.lookup_ledger_account_key,
-            gl_code=self.gl_code,
-            item_code=self.item_code,
-            last_invoice_num=self.last_invoice_num,
-            request_uuid=sanitize_uuid_field(self.request_uuid, 26),
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
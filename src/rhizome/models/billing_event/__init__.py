@@ -1,96 +1,101 @@
 """billing_event database models."""
 
-from .app_metered_event import AppMeteredEvent
-from .app_metered_event_v1 import AppMeteredEventV1
-from .app_subscription_current import AppSubscriptionCurrent
-from .app_subscription_current_v1 import AppSubscriptionCurrentV1
-from .app_subscription_daily import AppSubscriptionDaily
-from .app_subscription_daily_v1 import AppSubscriptionDailyV1
-from .as_of_merchant import AsOfMerchant
+from typing import TYPE_CHECKING
 
-# Note: V1 and V2 are imported directly by environment files to avoid table conflicts
-# from .as_of_merchant_v1 import AsOfMerchantV1
-# from .as_of_merchant_v2 import AsOfMerchantV2
-from .as_of_merchant_device import AsOfMerchantDevice
-from .as_of_merchant_device_v1 import AsOfMerchantDeviceV1
-from .as_of_merchant_plan import AsOfMerchantPlan
+from rhizome.lazy import lazy_exports
 
-# Note: V1 and V2 are imported directly by environment files to avoid table conflicts
-# from .as_of_merchant_plan_v1 import AsOfMerchantPlanV1
-# from .as_of_merchant_plan_v2 import AsOfMerchantPlanV2
-from .backfill_acceptance import BackfillAcceptance
-from .backfill_acceptance_v1 import BackfillAcceptanceV1
-from .billing_event_history import BillingEventHistory
-from .billing_event_history_v1 import BillingEventHistoryV1
-from .cellular_arrears_acceptances import CellularArrearsAcceptances
-from .cellular_arrears_acceptances_v1 import CellularArrearsAcceptancesV1
-from .cellular_billing_arrears_info import CellularBillingArrearsInfo
-from .cellular_billing_arrears_info_v1 import CellularBillingArrearsInfoV1
-from .consumer_failure import ConsumerFailure
-from .consumer_failure_history import ConsumerFailureHistory
-from .consumer_failure_history_v1 import ConsumerFailureHistoryV1
-from .consumer_failure_v1 import ConsumerFailureV1
-from .deserializable_failure import DeserializableFailure
-from .deserializable_failure_v1 import DeserializableFailureV1
-from .event_filter import EventFilter
-from .event_filter_v1 import EventFilterV1
-from .event_ignored import EventIgnored
-from .event_ignored_v1 import EventIgnoredV1
-from .iccid_carrier import IccidCarrier
-from .iccid_carrier_v1 import IccidCarrierV1
-from .job_assassination_contract import JobAssassinationContract
-from .job_assassination_contract_v1 import JobAssassinationContractV1
-from .jobrunr_backgroundjobservers import JobrunrBackgroundjobservers
-from .jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
-from .jobrunr_jobs import JobrunrJobs
-from .jobrunr_jobs_v1 import JobrunrJobsV1
-from .jobrunr_metadata import JobrunrMetadata
-from .jobrunr_metadata_v1 import JobrunrMetadataV1
-from .jobrunr_migrations import JobrunrMigrations
-from .jobrunr_migrations_v1 import JobrunrMigrationsV1
-from .jobrunr_recurring_jobs import JobrunrRecurringJobs
-from .jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
-from .look import Look
-from .look_data import LookData
-from .look_data_v1 import LookDataV1
-from .look_v1 import LookV1
-from .managed_item import ManagedItem
-from .managed_item_v1 import ManagedItemV1
-from .merchant_acceptance import MerchantAcceptance
-from .merchant_acceptance_v1 import MerchantAcceptanceV1
-from .merchant_evolution import MerchantEvolution
+if TYPE_CHECKING:
+    from .app_metered_event import AppMeteredEvent
+    from .app_metered_event_v1 import AppMeteredEventV1
+    from .app_subscription_current import AppSubscriptionCurrent
+    from .app_subscription_current_v1 import AppSubscriptionCurrentV1
+    from .app_subscription_daily import AppSubscriptionDaily
+    from .app_subscription_daily_v1 import AppSubscriptionDailyV1
+    from .as_of_merchant import AsOfMerchant
 
-# Note: V1 and V2 are imported directly by environment files to avoid table conflicts
-# from .merchant_evolution_v1 import MerchantEvolutionV1
-# from .merchant_evolution_v2 import MerchantEvolutionV2
-from .merchant_offboarding import MerchantOffboarding
-from .merchant_offboarding_v1 import MerchantOffboardingV1
-from .merchant_payment import MerchantPayment
-from .merchant_payment_history import MerchantPaymentHistory
-from .merchant_payment_history_v1 import MerchantPaymentHistoryV1
-from .merchant_payment_v1 import MerchantPaymentV1
-from .migrated_merchant import MigratedMerchant
-from .migrated_merchant_v1 import MigratedMerchantV1
-from .mlc_captured_event import MlcCapturedEvent
-from .mlc_captured_event_v1 import MlcCapturedEventV1
-from .pending_event import PendingEvent
-from .pending_event_v1 import PendingEventV1
-from .plan_billing_latest import PlanBillingLatest
-from .plan_billing_latest_v1 import PlanBillingLatestV1
-from .plan_meta import PlanMeta
-from .plan_meta_v1 import PlanMetaV1
-from .plan_trial import PlanTrial
-from .plan_trial_v1 import PlanTrialV1
-from .producer_failure import ProducerFailure
-from .producer_failure_history import ProducerFailureHistory
-from .producer_failure_history_v1 import ProducerFailureHistoryV1
-from .producer_failure_v1 import ProducerFailureV1
-from .server_config import ServerConfig
-from .server_config_v1 import ServerConfigV1
-from .test_merchant_criteria import TestMerchantCriteria
-from .test_merchant_criteria_v1 import TestMerchantCriteriaV1
-from .uninstalled_app import UninstalledApp
-from .uninstalled_app_v1 import UninstalledAppV1
+    # Note: V1 and V2 are imported directly by environment files to avoid table conflicts
+    # from .as_of_merchant_v1 import AsOfMerchantV1
+    # from .as_of_merchant_v2 import AsOfMerchantV2
+    from .as_of_merchant_device import AsOfMerchantDevice
+    from .as_of_merchant_device_v1 import AsOfMerchantDeviceV1
+    from .as_of_merchant_plan import AsOfMerchantPlan
+
+    # Note: V1 and V2 are imported directly by environment files to avoid table conflicts
+    # from .as_of_merchant_plan_v1 import AsOfMerchantPlanV1
+    # from .as_of_merchant_plan_v2 import AsOfMerchantPlanV2
+    from .backfill_acceptance import BackfillAcceptance
+    from .backfill_acceptance_v1 import BackfillAcceptanceV1
+    from .billing_event_history import BillingEventHistory
+    from .billing_event_history_v1 import BillingEventHistoryV1
+    from .cellular_arrears_acceptances import CellularArrearsAcceptances
+    from .cellular_arrears_acceptances_v1 import CellularArrearsAcceptancesV1
+    from .cellular_billing_arrears_info import CellularBillingArrearsInfo
+    from .cellular_billing_arrears_info_v1 import CellularBillingArrearsInfoV1
+    from .consumer_failure import ConsumerFailure
+    from .consumer_failure_history import ConsumerFailureHistory
+    from .consumer_failure_history_v1 import ConsumerFailureHistoryV1
+    from .consumer_failure_v1 import ConsumerFailureV1
+    from .deserializable_failure import DeserializableFailure
+    from .deserializable_failure_v1 import DeserializableFailureV1
+    from .event_filter import EventFilter
+    from .event_filter_v1 import EventFilterV1
+    from .event_ignored import EventIgnored
+    from .event_ignored_v1 import EventIgnoredV1
+    from .iccid_carrier import IccidCarrier
+    from .iccid_carrier_v1 import IccidCarrierV1
+    from .job_assassination_contract import JobAssassinationContract
+    from .job_assassination_contract_v1 import JobAssassinationContractV1
+    from .jobrunr_backgroundjobservers import JobrunrBackgroundjobservers
+    from .jobrunr_backgroundjobservers_v1 import JobrunrBackgroundjobserversV1
+    from .jobrunr_jobs import JobrunrJobs
+    from .jobrunr_jobs_v1 import JobrunrJobsV1
+    from .jobrunr_metadata import JobrunrMetadata
+    from .jobrunr_metadata_v1 import JobrunrMetadataV1
+    from .jobrunr_migrations import JobrunrMigrations
+    from .jobrunr_migrations_v1 import JobrunrMigrationsV1
+    from .jobrunr_recurring_jobs import JobrunrRecurringJobs
+    from .jobrunr_recurring_jobs_v1 import JobrunrRecurringJobsV1
+    from .look import Look
+    from .look_data import LookData
+    from .look_data_v1 import LookDataV1
+    from .look_v1 import LookV1
+    from .managed_item import ManagedItem
+    from .managed_item_v1 import ManagedItemV1
+    from .merchant_acceptance import MerchantAcceptance
+    from .merchant_acceptance_v1 import MerchantAcceptanceV1
+    from .merchant_evolution import MerchantEvolution
+
+    # Note: V1 and V2 are imported directly by environment files to avoid table conflicts
+    # from .merchant_evolution_v1 import MerchantEvolutionV1
+    # from .merchant_evolution_v2 import MerchantEvolutionV2
+    from .merchant_offboarding import MerchantOffboarding
+    from .merchant_offboarding_v1 import MerchantOffboardingV1
+    from .merchant_payment import MerchantPayment
+    from .merchant_payment_history import MerchantPaymentHistory
+    from .merchant_payment_history_v1 import MerchantPaymentHistoryV1
+    from .merchant_payment_v1 import MerchantPaymentV1
+    from .migrated_merchant import MigratedMerchant
+    from .migrated_merchant_v1 import MigratedMerchantV1
+    from .mlc_captured_event import MlcCapturedEvent
+    from .mlc_captured_event_v1 import MlcCapturedEventV1
+    from .pending_event import PendingEvent
+    from .pending_event_v1 import PendingEventV1
+    from .plan_billing_latest import PlanBillingLatest
+    from .plan_billing_latest_v1 import PlanBillingLatestV1
+    from .plan_meta import PlanMeta
+    from .plan_meta_v1 import PlanMetaV1
+    from .plan_trial import PlanTrial
+    from .plan_trial_v1 import PlanTrialV1
+    from .producer_failure import ProducerFailure
+    from .producer_failure_history import ProducerFailureHistory
+    from .producer_failure_history_v1 import ProducerFailureHistoryV1
+    from .producer_failure_v1 import ProducerFailureV1
+    from .server_config import ServerConfig
+    from .server_config_v1 import ServerConfigV1
+    from .test_merchant_criteria import TestMerchantCriteria
+    from .test_merchant_criteria_v1 import TestMerchantCriteriaV1
+    from .uninstalled_app import UninstalledApp
+    from .uninstalled_app_v1 import UninstalledAppV1
 
 __all__ = [
     "AppMeteredEvent",
@@ -173,3 +178,89 @@ __all__ = [
     "UninstalledApp",
     "UninstalledAppV1",
 ]
+
+# Submodules are imported when one of their names is first accessed
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AppMeteredEvent": ".app_metered_event",
+        "AppMeteredEventV1": ".app_metered_event_v1",
+        "AppSubscriptionCurrent": ".app_subscription_current",
+        "AppSubscriptionCurrentV1": ".app_subscription_current_v1",
+        "AppSubscriptionDaily": ".app_subscription_daily",
+        "AppSubscriptionDailyV1": ".app_subscription_daily_v1",
+        "AsOfMerchant": ".as_of_merchant",
+        "AsOfMerchantDevice": ".as_of_merchant_device",
+        "AsOfMerchantDeviceV1": ".as_of_merchant_device_v1",
+        "AsOfMerchantPlan": ".as_of_merchant_plan",
+        "BackfillAcceptance": ".backfill_acceptance",
+        "BackfillAcceptanceV1": ".backfill_acceptance_v1",
+        "BillingEventHistory": ".billing_event_history",
+        "BillingEventHistoryV1": ".billing_event_history_v1",
+        "CellularArrearsAcceptances": ".cellular_arrears_acceptances",
+        "CellularArrearsAcceptancesV1": ".cellular_arrears_acceptances_v1",
+        "CellularBillingArrearsInfo": ".cellular_billing_arrears_info",
+        "CellularBillingArrearsInfoV1": ".cellular_billing_arrears_info_v1",
+        "ConsumerFailure": ".consumer_failure",
+        "ConsumerFailureHistory": ".consumer_failure_history",
+        "ConsumerFailureHistoryV1": ".consumer_failure_history_v1",
+        "ConsumerFailureV1": ".consumer_failure_v1",
+        "DeserializableFailure": ".deserializable_failure",
+        "DeserializableFailureV1": ".deserializable_failure_v1",
+        "EventFilter": ".event_filter",
+        "EventFilterV1": ".event_filter_v1",
+        "EventIgnored": ".event_ignored",
+        "EventIgnoredV1": ".event_ignored_v1",
+        "IccidCarrier": ".iccid_carrier",
+        "IccidCarrierV1": ".iccid_carrier_v1",
+        "JobAssassinationContract": ".job_assassination_contract",
+        "JobAssassinationContractV1": ".job_assassination_contract_v1",
+        "JobrunrBackgroundjobservers": ".jobrunr_backgroundjobservers",
+        "JobrunrBackgroundjobserversV1": ".jobrunr_backgroundjobservers_v1",
+        "JobrunrJobs": ".jobrunr_jobs",
+        "JobrunrJobsV1": ".jobrunr_jobs_v1",
+        "JobrunrMetadata": ".jobrunr_metadata",
+        "JobrunrMetadataV1": ".jobrunr_metadata_v1",
+        "JobrunrMigrations": ".jobrunr_migrations",
+        "JobrunrMigrationsV1": ".jobrunr_migrations_v1",
+        "JobrunrRecurringJobs": ".jobrunr_recurring_jobs",
+        "JobrunrRecurringJobsV1": ".jobrunr_recurring_jobs_v1",
+        "Look": ".look",
+        "LookData": ".look_data",
+        "LookDataV1": ".look_data_v1",
+        "LookV1": ".look_v1",
+        "ManagedItem": ".managed_item",
+        "ManagedItemV1": ".managed_item_v1",
+        "MerchantAcceptance": ".merchant_acceptance",
+        "MerchantAcceptanceV1": ".merchant_acceptance_v1",
+        "MerchantEvolution": ".merchant_evolution",
+        "MerchantOffboarding": ".merchant_offboarding",
+        "MerchantOffboardingV1": ".merchant_offboarding_v1",
+        "MerchantPayment": ".merchant_payment",
+        "MerchantPaymentHistory": ".merchant_payment_history",
+        "MerchantPaymentHistoryV1": ".merchant_payment_history_v1",
+        "MerchantPaymentV1": ".merchant_payment_v1",
+        "MigratedMerchant": ".migrated_merchant",
+        "MigratedMerchantV1": ".migrated_merchant_v1",
+        "MlcCapturedEvent": ".mlc_captured_event",
+        "MlcCapturedEventV1": ".mlc_captured_event_v1",
+        "PendingEvent": ".pending_event",
+        "PendingEventV1": ".pending_event_v1",
+        "PlanBillingLatest": ".plan_billing_latest",
+        "PlanBillingLatestV1": ".plan_billing_latest_v1",
+        "PlanMeta": ".plan_meta",
+        "PlanMetaV1": ".plan_meta_v1",
+        "PlanTrial": ".plan_trial",
+        "PlanTrialV1": ".plan_trial_v1",
+        "ProducerFailure": ".producer_failure",
+        "ProducerFailureHistory": ".producer_failure_history",
+        "ProducerFailureHistoryV1": ".producer_failure_history_v1",
+        "ProducerFailureV1": ".producer_failure_v1",
+        "ServerConfig": ".server_config",
+        "ServerConfigV1": ".server_config_v1",
+        "TestMerchantCriteria": ".test_merchant_criteria",
+        "TestMerchantCriteriaV1": ".test_merchant_criteria_v1",
+        "UninstalledApp": ".uninstalled_app",
+        "UninstalledAppV1": ".uninstalled_app_v1",
+    },
+)
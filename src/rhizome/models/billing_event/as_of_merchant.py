@@ -8,13 +8,12 @@ billing-event database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="AsOfMerchant")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class AsOfMerchant(RhizomeModel, table=False):
@@ -26,16 +25,13 @@ class AsOfMerchant(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=26, unique=True, description="Unique identifier for the as-of-merchant record")
-    merchant_uuid: str = Field(max_length=13, description="UUID of the merchant")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, unique=True, description="Unique identifier for the as-of-merchant record"
+    )
+    merchant_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="UUID of the merchant")
     as_of_timestamp: datetime.datetime = Field(description="Timestamp for this snapshot")
     event_datetime: datetime.datetime | None = Field(default=None, description="Datetime when the event occurred")
-    billing_event_uuid: str | None = Field(
+    billing_event_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
         default=None, max_length=26, description="UUID of the associated billing event"
     )
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AsOfMerchant instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
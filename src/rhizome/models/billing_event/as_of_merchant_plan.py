@@ -8,13 +8,12 @@ billing-event database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="AsOfMerchantPlan")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class AsOfMerchantPlan(RhizomeModel, table=False):
@@ -26,14 +25,13 @@ class AsOfMerchantPlan(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=26, unique=True, description="Unique identifier for the as-of-merchant-plan record")
-    as_of_merchant_uuid: str = Field(max_length=26, description="UUID of the associated as-of-merchant record")
-    merchant_plan_uuid: str = Field(max_length=13, description="UUID of the merchant plan")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, unique=True, description="Unique identifier for the as-of-merchant-plan record"
+    )
+    as_of_merchant_uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, description="UUID of the associated as-of-merchant record"
+    )
+    merchant_plan_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="UUID of the merchant plan")
     trial_start_date: datetime.date | None = Field(default=None, description="Start date of trial period")
     trial_days: int | None = Field(default=None, description="Number of trial days")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AsOfMerchantPlan instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
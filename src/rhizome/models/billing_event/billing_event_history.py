@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class EventSource(StrEnum):
@@ -44,26 +45,17 @@ class BillingEventHistory(RhizomeModel, table=False):
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     environment: str = Field(max_length=25, description="Environment where the event occurred")
-    merchant_id: str | None = Field(default=None, max_length=13, description="ID of the merchant")
-    input_event_uuid: str | None = Field(default=None, max_length=26, description="UUID of the input event")
-    billing_event_uuid: str | None = Field(default=None, max_length=26, description="UUID of the billing event")
+    merchant_id: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="ID of the merchant"
+    )
+    input_event_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="UUID of the input event"
+    )
+    billing_event_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
+        default=None, max_length=26, description="UUID of the billing event"
+    )
     event_source: EventSource = Field(description="Source of the billing event")
     event_context_json: str | None = Field(default=None, description="JSON context for the event")
     input: str | None = Field(default=None, description="Input data for the event")
     output: str | None = Field(default=None, description="Output data from the event")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self) -> BillingEventHistory:
-        """Return a sanitized copy of this BillingEventHistory instance."""
-        return BillingEventHistory(
-            id=self.id,
-            environment=self.environment,
-            merchant_id=sanitize_uuid_field(self.merchant_id, 13),
-            input_event_uuid=sanitize_uuid_field(self.input_event_uuid, 26),
-            billing_event_uuid=sanitize_uuid_field(self.billing_event_uuid, 26),
-            event_source=self.event_source,
-            event_context_json=self.event_context_json,
-            input=self.input,
-            output=self.output,
-            created_timestamp=self.created_timestamp,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class CellularArrearsAcceptanceStatus(StrEnum):
@@ -34,10 +35,16 @@ class CellularArrearsAcceptances(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    merchant_uuid: str | None = Field(default=None, max_length=13, description="UUID of the merchant")
-    request_uuid: str = Field(max_length=30, description="UUID of the request")
-    acceptance_id: str | None = Field(default=None, max_length=36, description="ID of the acceptance")
-    agreement_id: str | None = Field(default=None, max_length=36, description="ID of the agreement")
+    merchant_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(
+        default=None, max_length=13, description="UUID of the merchant"
+    )
+    request_uuid: Annotated[str, SanitizeUUID(30)] = Field(max_length=30, description="UUID of the request")
+    acceptance_id: Annotated[str | None, SanitizeUUID(36)] = Field(
+        default=None, max_length=36, description="ID of the acceptance"
+    )
+    agreement_id: Annotated[str | None, SanitizeUUID(36)] = Field(
+        default=None, max_length=36, description="ID of the agreement"
+    )
     device_serial: str | None = Field(default=None, max_length=16, description="Serial number of the device")
     activation_date: datetime.datetime | None = Field(default=None, description="Date when device was activated")
     deactivation_date: datetime.datetime | None = Field(default=None, description="Date when device was deactivated")
@@ -47,22 +54,3 @@ class CellularArrearsAcceptances(RhizomeModel, table=False):
     status: CellularArrearsAcceptanceStatus | None = Field(default=None, description="Status of the acceptance")
     is_oobe: bool = Field(default=False, description="Whether this is out-of-box experience")
     reason: str | None = Field(default=None, max_length=255, description="Reason for the acceptance")
-
-    def sanitize(self) -> CellularArrearsAcceptances:
-        """Return a sanitized copy of this CellularArrearsAcceptances instance."""
-        return CellularArrearsAcceptances(
-            id=self.id,
-            merchant_uuid=sanitize_uuid_field(self.merchant_uuid, 13),
-            request_uuid=sanitize_uuid_field(self.request_uuid, 30),  # type: ignore
-            acceptance_id=sanitize_uuid_field(self.acceptance_id, 36),
-            agreement_id=sanitize_uuid_field(self.agreement_id, 36),
-            device_serial=self.device_serial,
-            activation_date=self.activation_date,
-            deactivation_date=self.deactivation_date,
-            deleted_date=self.deleted_date,
-            num_days_prorated=self.num_days_prorated,
-            iccid=self.iccid,
-            status=self.status,
-            is_oobe=self.is_oobe,
-            reason=self.reason,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ConsumerSourceHistoryEnum(StrEnum):
@@ -32,9 +33,13 @@ class ConsumerFailureHistory(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=26, description="Unique identifier for the consumer failure")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, description="Unique identifier for the consumer failure"
+    )
     environment: str = Field(max_length=25, description="Environment where the failure occurred")
-    reference_id: str = Field(max_length=13, description="Reference ID associated with the failure")
+    reference_id: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, description="Reference ID associated with the failure"
+    )
     consumer_source: ConsumerSourceHistoryEnum = Field(description="Source of the consumer (MLC or AGREEMENT)")
     payload: str = Field(description="Payload data related to the failure")
     channel: str = Field(max_length=25, description="Channel where the failure occurred")
@@ -43,20 +48,3 @@ class ConsumerFailureHistory(RhizomeModel, table=False):
     message: str | None = Field(default=None, max_length=500, description="Failure message")
     comment: str | None = Field(default=None, max_length=500, description="Additional comment about the failure")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self) -> ConsumerFailureHistory:
-        """Return a sanitized copy of this ConsumerFailureHistory instance."""
-        return ConsumerFailureHistory(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            environment=self.environment,
-            reference_id=sanitize_uuid_field(self.reference_id, 13),  # type: ignore
-            consumer_source=self.consumer_source,
-            payload=self.payload,
-            channel=self.channel,
-            topic=self.topic,
-            cause=self.cause,
-            message=self.message,
-            comment=self.comment,
-            created_timestamp=self.created_timestamp,
-        )
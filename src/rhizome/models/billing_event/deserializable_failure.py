@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class DeserializableConsumerSourceEnum(StrEnum):
@@ -32,23 +33,12 @@ class DeserializableFailure(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=26, description="Unique identifier for the deserializable failure")
+    uuid: Annotated[str, SanitizeUUID(26)] = Field(
+        max_length=26, description="Unique identifier for the deserializable failure"
+    )
     topic: str | None = Field(default=None, max_length=127, description="Topic associated with the failure")
     channel: str | None = Field(default=None, max_length=127, description="Channel where the failure occurred")
     environment: str = Field(max_length=25, description="Environment where the failure occurred")
     consumer_source: DeserializableConsumerSourceEnum = Field(description="Source of the consumer (MLC or AGREEMENT)")
     b64: str = Field(description="Base64 encoded data that failed to deserialize")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self) -> DeserializableFailure:
-        """Return a sanitized copy of this DeserializableFailure instance."""
-        return DeserializableFailure(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 26),  # type: ignore
-            topic=self.topic,
-            channel=self.channel,
-            environment=self.environment,
-            consumer_source=self.consumer_source,
-            b64=self.b64,
-            created_timestamp=self.created_timestamp,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class EventFilterCriteriaEnum(StrEnum):
@@ -45,23 +46,10 @@ class EventFilter(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=36, description="Unique identifier for the event filter")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(max_length=36, description="Unique identifier for the event filter")
     criteria: EventFilterCriteriaEnum = Field(description="Criteria for the filter")
     action: EventFilterActionEnum = Field(description="Action to take when criteria is met")
     value: str = Field(max_length=255, description="Value to match against the criteria")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     begin_timestamp: datetime.datetime | None = Field(default=None, description="Timestamp when filter becomes active")
     end_timestamp: datetime.datetime | None = Field(default=None, description="Timestamp when filter becomes inactive")
-
-    def sanitize(self) -> EventFilter:
-        """Return a sanitized copy of this EventFilter instance."""
-        return EventFilter(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            criteria=self.criteria,
-            action=self.action,
-            value=self.value,
-            created_timestamp=self.created_timestamp,
-            begin_timestamp=self.begin_timestamp,
-            end_timestamp=self.end_timestamp,
-        )
@@ -27,13 +27,3 @@ class JobAssassinationContract(RhizomeModel, table=False):
     killed: int = Field(default=0, description="Status flag indicating if job was killed (0=no, 1=yes)")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_timestamp: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> JobAssassinationContract:
-        """Return a sanitized copy of this JobAssassinationContract instance."""
-        return JobAssassinationContract(
-            id=self.id,
-            job_identifier=self.job_identifier,
-            killed=self.killed,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
@@ -44,23 +44,3 @@ class JobrunrBackgroundjobservers(RhizomeModel, table=False):
     permanentlyDeleteJobsAfter: str | None = Field(
         default=None, max_length=32, description="Duration after which jobs are permanently deleted"
     )
-
-    def sanitize(self) -> JobrunrBackgroundjobservers:
-        """Return a sanitized copy of this JobrunrBackgroundjobservers instance."""
-        return JobrunrBackgroundjobservers(
-            id=self.id,
-            workerPoolSize=self.workerPoolSize,
-            pollIntervalInSeconds=self.pollIntervalInSeconds,
-            firstHeartbeat=self.firstHeartbeat,
-            lastHeartbeat=self.lastHeartbeat,
-            running=self.running,
-            systemTotalMemory=self.systemTotalMemory,
-            systemFreeMemory=self.systemFreeMemory,
-            systemCpuLoad=self.systemCpuLoad,
-            processMaxMemory=self.processMaxMemory,
-            processFreeMemory=self.processFreeMemory,
-            processAllocatedMemory=self.processAllocatedMemory,
-            processCpuLoad=self.processCpuLoad,
-            deleteSucceededJobsAfter=self.deleteSucceededJobsAfter,
-            permanentlyDeleteJobsAfter=self.permanentlyDeleteJobsAfter,
-        )
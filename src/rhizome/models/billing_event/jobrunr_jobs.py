@@ -35,17 +35,3 @@ class JobrunrJobs(RhizomeModel, table=False):
     recurringJobId: str | None = Field(
         default=None, max_length=128, description="ID of the recurring job this belongs to"
     )
-
-    def sanitize(self) -> JobrunrJobs:
-        """Return a sanitized copy of this JobrunrJobs instance."""
-        return JobrunrJobs(
-            id=self.id,
-            version=self.version,
-            jobAsJson=self.jobAsJson,
-            jobSignature=self.jobSignature,
-            state=self.state,
-            createdAt=self.createdAt,
-            updatedAt=self.updatedAt,
-            scheduledAt=self.scheduledAt,
-            recurringJobId=self.recurringJobId,
-        )
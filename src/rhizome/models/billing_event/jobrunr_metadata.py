@@ -30,14 +30,3 @@ class JobrunrMetadata(RhizomeModel, table=False):
     value: str = Field(description="Value of the metadata entry")
     createdAt: datetime.datetime = Field(description="Timestamp when the metadata was created")
     updatedAt: datetime.datetime = Field(description="Timestamp when the metadata was last updated")
-
-    def sanitize(self) -> JobrunrMetadata:
-        """Return a sanitized copy of this JobrunrMetadata instance."""
-        return JobrunrMetadata(
-            id=self.id,
-            name=self.name,
-            owner=self.owner,
-            value=self.value,
-            createdAt=self.createdAt,
-            updatedAt=self.updatedAt,
-        )
@@ -25,11 +25,3 @@ class JobrunrMigrations(RhizomeModel, table=False):
     )
     script: str = Field(max_length=64, description="Name of the migration script")
     installedOn: str = Field(max_length=29, description="Timestamp when the migration was installed")
-
-    def sanitize(self) -> JobrunrMigrations:
-        """Return a sanitized copy of this JobrunrMigrations instance."""
-        return JobrunrMigrations(
-            id=self.id,
-            script=self.script,
-            installedOn=self.installedOn,
-        )
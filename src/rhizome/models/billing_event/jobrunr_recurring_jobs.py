@@ -26,12 +26,3 @@ class JobrunrRecurringJobs(RhizomeModel, table=False):
     version: int = Field(description="Version number of the recurring job")
     jobAsJson: str = Field(description="Job definition as JSON")
     createdAt: int = Field(default=0, description="Timestamp when the recurring job was created (epoch time)")
-
-    def sanitize(self) -> JobrunrRecurringJobs:
-        """Return a sanitized copy of this JobrunrRecurringJobs instance."""
-        return JobrunrRecurringJobs(
-            id=self.id,
-            version=self.version,
-            jobAsJson=self.jobAsJson,
-            createdAt=self.createdAt,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class OffboardingStep(StrEnum):
@@ -39,8 +40,12 @@ class MerchantOffboarding(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing bigint")
-    uuid: str = Field(max_length=36, description="UUID identifier for the offboarding process")
-    merchant_uuid: str = Field(max_length=13, description="UUID of the merchant being offboarded")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(
+        max_length=36, description="UUID identifier for the offboarding process"
+    )
+    merchant_uuid: Annotated[str, SanitizeUUID(13)] = Field(
+        max_length=13, description="UUID of the merchant being offboarded"
+    )
     environment: str = Field(max_length=25, description="Environment where the offboarding is occurring")
     step: OffboardingStep = Field(description="Current step in the offboarding process")
     due_date: datetime.date = Field(description="Due date for the offboarding")
@@ -49,17 +54,3 @@ class MerchantOffboarding(RhizomeModel, table=False):
     deleted_timestamp: datetime.datetime | None = Field(
         default=None, description="Timestamp when the record was deleted"
     )
-
-    def sanitize(self) -> MerchantOffboarding:
-        """Return a sanitized copy of this MerchantOffboarding instance."""
-        return MerchantOffboarding(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            merchant_uuid=sanitize_uuid_field(self.merchant_uuid, 13),  # type: ignore
-            environment=self.environment,
-            step=self.step,
-            due_date=self.due_date,
-            created_timestamp=self.created_timestamp,
-            offboard_timestamp=self.offboard_timestamp,
-            deleted_timestamp=self.deleted_timestamp,
-        )
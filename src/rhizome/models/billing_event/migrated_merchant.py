@@ -8,11 +8,12 @@ billing-event database, along with sanitization functions.
 from __future__ import annotations
 
 import datetime
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MigratedMerchant(RhizomeModel, table=False):
@@ -24,8 +25,8 @@ class MigratedMerchant(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    reseller_uuid: str = Field(max_length=13, description="UUID of the reseller")
-    merchant_uuid: str = Field(max_length=13, description="UUID of the merchant")
+    reseller_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="UUID of the reseller")
+    merchant_uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="UUID of the merchant")
     backbook_merchant: bool = Field(description="Flag indicating if this is a backbook merchant")
     added_to_ebb_group: bool = Field(description="Flag indicating if merchant was added to EBB group")
     plan_trials_migrated: bool = Field(description="Flag indicating if plan trials were migrated")
@@ -34,19 +35,3 @@ class MigratedMerchant(RhizomeModel, table=False):
     app_meter_events_caught_up: bool = Field(description="Flag indicating if app meter events are caught up")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_timestamp: datetime.datetime = Field(description="Timestamp when the record was last modified")
-
-    def sanitize(self) -> MigratedMerchant:
-        """Return a sanitized copy of this MigratedMerchant instance."""
-        return MigratedMerchant(
-            id=self.id,
-            reseller_uuid=sanitize_uuid_field(self.reseller_uuid, 13),  # type: ignore
-            merchant_uuid=sanitize_uuid_field(self.merchant_uuid, 13),  # type: ignore
-            backbook_merchant=self.backbook_merchant,
-            added_to_ebb_group=self.added_to_ebb_group,
-            plan_trials_migrated=self.plan_trials_migrated,
-            apps_migrated=self.apps_migrated,
-            app_sub_events_caught_up=self.app_sub_events_caught_up,
-            app_meter_events_caught_up=self.app_meter_events_caught_up,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-        )
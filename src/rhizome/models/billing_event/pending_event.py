@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import StrEnum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ConsumerSource(StrEnum):
@@ -33,30 +34,15 @@ class PendingEvent(RhizomeModel, table=False):
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
     environment: str = Field(max_length=25, description="Environment where the event originated")
-    reference_id: str = Field(max_length=13, description="Reference ID for the event")
+    reference_id: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, description="Reference ID for the event")
     consumer_source: ConsumerSource = Field(description="Source of the consumer (MLC or AGREEMENT)")
     payload: str = Field(description="Event payload data")
     channel: str = Field(max_length=25, description="Channel through which the event was received")
     topic: str = Field(max_length=127, description="Topic of the event")
-    processor_uuid: str | None = Field(
+    processor_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(
         default=None, max_length=26, description="UUID of the processor handling the event"
     )
     processing_start_timestamp: datetime.datetime | None = Field(
         default=None, description="Timestamp when processing started"
     )
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
-
-    def sanitize(self) -> PendingEvent:
-        """Return a sanitized copy of this PendingEvent instance."""
-        return PendingEvent(
-            id=self.id,
-            environment=self.environment,
-            reference_id=sanitize_uuid_field(self.reference_id, 13),  # type: ignore
-            consumer_source=self.consumer_source,
-            payload=self.payload,
-            channel=self.channel,
-            topic=self.topic,
-            processor_uuid=sanitize_uuid_field(self.processor_uuid, 26),
-            processing_start_timestamp=self.processing_start_timestamp,
-            created_timestamp=self.created_timestamp,
-        )
@@ -28,14 +28,3 @@ class ServerConfig(RhizomeModel, table=False):
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     modified_timestamp: datetime.datetime = Field(description="Timestamp when the record was last modified")
     audit_id: str = Field(default="DEFAULTED", max_length=26, description="Audit ID for tracking changes")
-
-    def sanitize(self) -> ServerConfig:
-        """Return a sanitized copy of this ServerConfig instance."""
-        return ServerConfig(
-            id=self.id,
-            config_key=self.config_key,
-            config_value=self.config_value,
-            created_timestamp=self.created_timestamp,
-            modified_timestamp=self.modified_timestamp,
-            audit_id=self.audit_id,
-        )
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class CriteriaType(str, Enum):
@@ -32,21 +33,12 @@ class TestMerchantCriteria(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=36, description="Unique identifier for the test merchant criteria")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(
+        max_length=36, description="Unique identifier for the test merchant criteria"
+    )
     type: CriteriaType = Field(description="Type of criteria (SOURCE or EMAIL)")
     value: str = Field(max_length=255, description="Value for the criteria")
     created_timestamp: datetime.datetime = Field(description="Timestamp when the record was created")
     deleted_timestamp: datetime.datetime | None = Field(
         default=None, description="Timestamp when the record was deleted"
     )
-
-    def sanitize(self) -> TestMerchantCriteria:
-        """Return a sanitized copy of this TestMerchantCriteria instance."""
-        return TestMerchantCriteria(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            type=self.type,
-            value=self.value,
-            created_timestamp=self.created_timestamp,
-            deleted_timestamp=self.deleted_timestamp,
-        )
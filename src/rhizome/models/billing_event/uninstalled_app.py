@@ -7,10 +7,12 @@ billing-event database, along with sanitization functions.
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-from ...sanitize_helpers import sanitize_uuid_field
+from ...sanitize_helpers import SanitizeUUID
 
 
 class UninstalledApp(RhizomeModel, table=False):
@@ -22,17 +24,11 @@ class UninstalledApp(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=36, description="Unique identifier for the uninstalled app")
-    offboarding_uuid: str = Field(max_length=36, description="UUID of the offboarding process")
+    uuid: Annotated[str, SanitizeUUID(36)] = Field(
+        max_length=36, description="Unique identifier for the uninstalled app"
+    )
+    offboarding_uuid: Annotated[str, SanitizeUUID(36)] = Field(
+        max_length=36, description="UUID of the offboarding process"
+    )
     app_name: str | None = Field(default=None, max_length=36, description="Name of the uninstalled app")
     site_url: str | None = Field(default=None, max_length=255, description="Site URL of the uninstalled app")
-
-    def sanitize(self) -> UninstalledApp:
-        """Return a sanitized copy of this UninstalledApp instance."""
-        return UninstalledApp(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 36),  # type: ignore
-            offboarding_uuid=sanitize_uuid_field(self.offboarding_uuid, 36),  # type: ignore
-            app_name=self.app_name,
-            site_url=self.site_url,
-        )
@@ -4,14 +4,10 @@ SQLModel definition for the app_app_bundle table.
 
 from __future__ import annotations
 
-from typing import TypeVar
-
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppAppBundle")
-
 
 class AppAppBundle(RhizomeModel, table=False):
     """
@@ -24,8 +20,3 @@ class AppAppBundle(RhizomeModel, table=False):
     allow_uninstall: bool | None = Field(default=False)
     charge: bool | None = Field(default=True)
     app_subscription_id: int = Field(foreign_key="app_subscription.id")
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppAppBundle instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
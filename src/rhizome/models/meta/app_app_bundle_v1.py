@@ -24,14 +24,3 @@ class AppAppBundleV1(AppAppBundle, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_app_bundle"  # type: ignore
-
-    def sanitize(self) -> AppAppBundleV1:
-        """Return a sanitized copy of this AppAppBundleV1 instance."""
-        return AppAppBundleV1(
-            allow_uninstall=self.allow_uninstall,
-            app_bundle_id=self.app_bundle_id,
-            app_subscription_id=self.app_subscription_id,
-            charge=self.charge,
-            developer_app_id=self.developer_app_id,
-            id=self.id,
-        )
@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .app_bundle import AppBundle
 
@@ -25,11 +24,3 @@ class AppBundleV1(AppBundle, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_bundle"  # type: ignore
-
-    def sanitize(self) -> AppBundleV1:
-        """Return a sanitized copy of this AppBundleV1 instance."""
-        return AppBundleV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            name=self.name,
-        )
@@ -5,14 +5,11 @@ SQLModel definition for the app_metered table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppMetered")
-
 
 class AppMetered(RhizomeModel, table=False):
     """
@@ -26,8 +23,3 @@ class AppMetered(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     deleted_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppMetered instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
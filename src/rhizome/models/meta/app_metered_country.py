@@ -5,14 +5,11 @@ SQLModel definition for the app_metered_country table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppMeteredCountry")
-
 
 class AppMeteredCountry(RhizomeModel, table=False):
     """
@@ -29,8 +26,3 @@ class AppMeteredCountry(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     deleted_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppMeteredCountry instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -24,18 +24,3 @@ class AppMeteredCountryV1(AppMeteredCountry, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_metered_country"  # type: ignore
-
-    def sanitize(self) -> AppMeteredCountryV1:
-        """Return a sanitized copy of this AppMeteredCountryV1 instance."""
-        return AppMeteredCountryV1(
-            action=self.action,
-            active=self.active,
-            amount=self.amount,
-            app_metered_id=self.app_metered_id,
-            country=self.country,
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-            id=self.id,
-            modified_time=self.modified_time,
-            uuid=self.uuid,
-        )
@@ -5,14 +5,11 @@ SQLModel definition for the app_metered_event table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppMeteredEvent")
-
 
 class AppMeteredEvent(RhizomeModel, table=False):
     """
@@ -27,8 +24,3 @@ class AppMeteredEvent(RhizomeModel, table=False):
     charge_id: int | None = Field(default=None, foreign_key="charge.id")
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppMeteredEvent instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
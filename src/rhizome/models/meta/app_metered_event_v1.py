@@ -24,16 +24,3 @@ class AppMeteredEventV1(AppMeteredEvent, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_metered_event"  # type: ignore
-
-    def sanitize(self) -> AppMeteredEventV1:
-        """Return a sanitized copy of this AppMeteredEventV1 instance."""
-        return AppMeteredEventV1(
-            app_metered_id=self.app_metered_id,
-            charge_id=self.charge_id,
-            count=self.count,
-            created_time=self.created_time,
-            id=self.id,
-            merchant_app_id=self.merchant_app_id,
-            modified_time=self.modified_time,
-            uuid=self.uuid,
-        )
@@ -24,15 +24,3 @@ class AppMeteredV1(AppMetered, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_metered"  # type: ignore
-
-    def sanitize(self) -> AppMeteredV1:
-        """Return a sanitized copy of this AppMeteredV1 instance."""
-        return AppMeteredV1(
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-            developer_app_id=self.developer_app_id,
-            id=self.id,
-            label=self.label,
-            modified_time=self.modified_time,
-            uuid=self.uuid,
-        )
@@ -24,12 +24,3 @@ class AppPermissionV1(AppPermission, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_permission"  # type: ignore
-
-    def sanitize(self) -> AppPermissionV1:
-        """Return a sanitized copy of this AppPermissionV1 instance."""
-        return AppPermissionV1(
-            created_time=self.created_time,
-            id=self.id,
-            modified_time=self.modified_time,
-            name=self.name,
-        )
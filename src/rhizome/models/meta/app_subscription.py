@@ -5,14 +5,11 @@ SQLModel definition for the app_subscription table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppSubscription")
-
 
 class AppSubscription(RhizomeModel, table=False):
     """
@@ -27,8 +24,3 @@ class AppSubscription(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     deleted_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppSubscription instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
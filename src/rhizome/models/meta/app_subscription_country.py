@@ -5,14 +5,11 @@ SQLModel definition for the app_subscription_country table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="AppSubscriptionCountry")
-
 
 class AppSubscriptionCountry(RhizomeModel, table=False):
     """
@@ -30,8 +27,3 @@ class AppSubscriptionCountry(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     deleted_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this AppSubscriptionCountry instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
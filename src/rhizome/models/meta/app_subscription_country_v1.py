@@ -24,19 +24,3 @@ class AppSubscriptionCountryV1(AppSubscriptionCountry, MetaSQLModel, table=True)
     """
 
     __tablename__ = "app_subscription_country"  # type: ignore
-
-    def sanitize(self) -> AppSubscriptionCountryV1:
-        """Return a sanitized copy of this AppSubscriptionCountryV1 instance."""
-        return AppSubscriptionCountryV1(
-            active=self.active,
-            amount=self.amount,
-            app_subscription_id=self.app_subscription_id,
-            country=self.country,
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-            description=self.description,
-            id=self.id,
-            modified_time=self.modified_time,
-            name=self.name,
-            uuid=self.uuid,
-        )
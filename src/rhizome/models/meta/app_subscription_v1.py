@@ -24,16 +24,3 @@ class AppSubscriptionV1(AppSubscription, MetaSQLModel, table=True):
     """
 
     __tablename__ = "app_subscription"  # type: ignore
-
-    def sanitize(self) -> AppSubscriptionV1:
-        """Return a sanitized copy of this AppSubscriptionV1 instance."""
-        return AppSubscriptionV1(
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-            developer_app_id=self.developer_app_id,
-            id=self.id,
-            label=self.label,
-            modified_time=self.modified_time,
-            plan=self.plan,
-            uuid=self.uuid,
-        )
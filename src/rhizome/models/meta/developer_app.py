@@ -5,14 +5,11 @@ SQLModel definition for the developer_app table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="DeveloperApp")
-
 
 class DeveloperApp(RhizomeModel, table=False):
     """
@@ -86,8 +83,3 @@ class DeveloperApp(RhizomeModel, table=False):
     trial_days: int = Field(default=30)
     recaptcha: bool | None = Field(default=False)
     default_app_locale: str | None = Field(default=None, max_length=6)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this DeveloperApp instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
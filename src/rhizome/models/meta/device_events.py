@@ -5,14 +5,11 @@ SQLModel definition for the device_events table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="DeviceEvents")
-
 
 class DeviceEvents(RhizomeModel, table=False):
     """
@@ -27,8 +24,3 @@ class DeviceEvents(RhizomeModel, table=False):
     account_id: int | None = Field(default=None)
     internal_account_id: int | None = Field(default=None)
     timestamp: datetime.datetime
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this DeviceEvents instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -24,16 +24,3 @@ class DeviceEventsV1(DeviceEvents, MetaSQLModel, table=True):
     """
 
     __tablename__ = "device_events"  # type: ignore
-
-    def sanitize(self) -> DeviceEventsV1:
-        """Return a sanitized copy of this DeviceEventsV1 instance."""
-        return DeviceEventsV1(
-            account_id=self.account_id,
-            device_event=self.device_event,
-            device_type_id=self.device_type_id,
-            id=self.id,
-            internal_account_id=self.internal_account_id,
-            merchant_id=self.merchant_id,
-            serial_number=self.serial_number,
-            timestamp=self.timestamp,
-        )
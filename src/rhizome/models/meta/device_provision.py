@@ -5,14 +5,11 @@ SQLModel definition for the device_provision table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="DeviceProvision")
-
 
 class DeviceProvision(RhizomeModel, table=False):
     """
@@ -42,8 +39,3 @@ class DeviceProvision(RhizomeModel, table=False):
     shipping_status: str | None = Field(default=None, max_length=24)
     tasq_order_number: str | None = Field(default=None, max_length=50)
     next_calltag_notify_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this DeviceProvision instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -24,31 +24,3 @@ class DeviceProvisionV1(DeviceProvision, MetaSQLModel, table=True):
     """
 
     __tablename__ = "device_provision"  # type: ignore
-
-    def sanitize(self) -> DeviceProvisionV1:
-        """Return a sanitized copy of this DeviceProvisionV1 instance."""
-        return DeviceProvisionV1(
-            activated_time=self.activated_time,
-            activation_code=self.activation_code,
-            activation_code_created_time=self.activation_code_created_time,
-            chip_uid=self.chip_uid,
-            deauthorization_attempts=self.deauthorization_attempts,
-            deauthorization_code=self.deauthorization_code,
-            deleted_time=self.deleted_time,
-            email_sent=self.email_sent,
-            id=self.id,
-            imei=self.imei,
-            last_activation_code=self.last_activation_code,
-            merchant_id=self.merchant_id,
-            modified_time=self.modified_time,
-            next_calltag_notify_time=self.next_calltag_notify_time,
-            order_type=self.order_type,
-            provision_info=self.provision_info,
-            provisioned_time=self.provisioned_time,
-            reseller_id=self.reseller_id,
-            serial_number=self.serial_number,
-            shipping_status=self.shipping_status,
-            sms_sent=self.sms_sent,
-            tasq_order_number=self.tasq_order_number,
-            terminal_id=self.terminal_id,
-        )
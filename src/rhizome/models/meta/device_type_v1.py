@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .device_type import DeviceType
 
@@ -25,17 +24,3 @@ class DeviceTypeV1(DeviceType, MetaSQLModel, table=True):
     """
 
     __tablename__ = "device_type"  # type: ignore
-
-    def sanitize(self) -> DeviceTypeV1:
-        """Return a sanitized copy of this DeviceTypeV1 instance."""
-        return DeviceTypeV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            name=self.name,
-            models=self.models,
-            skus=self.skus,
-            sdk_version=self.sdk_version,
-            prioritized_kernel_types=self.prioritized_kernel_types,
-            modified_time=self.modified_time,
-            deleted_time=self.deleted_time,
-        )
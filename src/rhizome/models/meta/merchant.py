@@ -5,13 +5,12 @@ SQLModel definition for the merchant table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="Merchant")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class Merchant(RhizomeModel, table=True):
@@ -20,7 +19,7 @@ class Merchant(RhizomeModel, table=True):
     """
 
     id: int | None = Field(default=None, primary_key=True)
-    uuid: str = Field(max_length=13, unique=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
     name: str = Field(max_length=127)
     reseller_id: int = Field(foreign_key="reseller.id")
     owner_account_id: int
@@ -91,82 +90,3 @@ class Merchant(RhizomeModel, table=True):
     infolease_suppress_plan_billing: bool = Field(default=False)
     send_closeout_email: bool | None = Field(default=False)
     modified_time: datetime.datetime
-
-    def sanitize(self) -> Merchant:
-        """Return a sanitized copy of this Merchant instance."""
-        from ...sanitize_helpers import sanitize_uuid_field
-
-        return Merchant(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13) or self.uuid,
-            name=self.name,
-            reseller_id=self.reseller_id,
-            owner_account_id=self.owner_account_id,
-            address_id=self.address_id,
-            timezone_id=self.timezone_id,
-            default_currency=self.default_currency,
-            phone_number=self.phone_number,
-            website=self.website,
-            created_time=self.created_time,
-            merchant_gateway_id=self.merchant_gateway_id,
-            merchant_plan_id=self.merchant_plan_id,
-            tax_rate=self.tax_rate,
-            tips_enabled=self.tips_enabled,
-            receipt_properties=self.receipt_properties,
-            summary_hour=self.summary_hour,
-            last_summary_order_id=self.last_summary_order_id,
-            subscription_id=self.subscription_id,
-            levelup_auth_token=self.levelup_auth_token,
-            levelup_merchant_id=self.levelup_merchant_id,
-            levelup_location_id=self.levelup_location_id,
-            signature_threshold=self.signature_threshold,
-            tip_rate_default=self.tip_rate_default,
-            on_paper_tip_signatures=self.on_paper_tip_signatures,
-            force_signature_verify=self.force_signature_verify,
-            auto_logout=self.auto_logout,
-            order_title=self.order_title,
-            order_title_max=self.order_title_max,
-            reset_on_reporting_time=self.reset_on_reporting_time,
-            notes_on_orders=self.notes_on_orders,
-            delete_orders=self.delete_orders,
-            cash_management_enabled=self.cash_management_enabled,
-            remove_tax_enabled=self.remove_tax_enabled,
-            group_line_items=self.group_line_items,
-            alternate_inventory_names=self.alternate_inventory_names,
-            auto_print=self.auto_print,
-            hardware_profile=self.hardware_profile,
-            shipping_address=self.shipping_address,
-            marketing_preference_id=self.marketing_preference_id,
-            bank_marker=self.bank_marker,
-            support_phone=self.support_phone,
-            support_email=self.support_email,
-            debug_enabled=self.debug_enabled,
-            manual_closeout=self.manual_closeout,
-            stay_in_category=self.stay_in_category,
-            locale_id=self.locale_id,
-            is_vat=self.is_vat,
-            vat_tax_name=self.vat_tax_name,
-            track_stock=self.track_stock,
-            update_stock=self.update_stock,
-            allow_clock_out_with_open_orders=self.allow_clock_out_with_open_orders,
-            log_in_clock_in_prompt=self.log_in_clock_in_prompt,
-            account_type=self.account_type,
-            pin_length=self.pin_length,
-            cash_back_enabled=self.cash_back_enabled,
-            cash_back_options=self.cash_back_options,
-            cluster_id=self.cluster_id,
-            offline_opted_in=self.offline_opted_in,
-            offline_job_notification_time=self.offline_job_notification_time,
-            max_cash_back=self.max_cash_back,
-            business_type_code=self.business_type_code,
-            hierarchy=self.hierarchy,
-            app_config_id=self.app_config_id,
-            aba_account_number=self.aba_account_number,
-            dda_account_number=self.dda_account_number,
-            infolease_authorize_time=self.infolease_authorize_time,
-            infolease_authorize_code=self.infolease_authorize_code,
-            infolease_suppress_billing=self.infolease_suppress_billing,
-            infolease_suppress_plan_billing=self.infolease_suppress_plan_billing,
-            send_closeout_email=self.send_closeout_email,
-            modified_time=self.modified_time,
-        )
@@ -5,14 +5,11 @@ SQLModel definition for the merchant_address table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantAddress")
-
 
 class MerchantAddress(RhizomeModel, table=False):
     """
@@ -32,8 +29,3 @@ class MerchantAddress(RhizomeModel, table=False):
     longitude: int | None = Field(default=None)
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantAddress instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -24,21 +24,3 @@ class MerchantAddressV1(MerchantAddress, MetaSQLModel, table=True):
     """
 
     __tablename__ = "merchant_address"  # type: ignore
-
-    def sanitize(self) -> MerchantAddressV1:
-        """Return a sanitized copy of this MerchantAddressV1 instance."""
-        return MerchantAddressV1(
-            id=self.id,
-            address_1=self.address_1,
-            address_2=self.address_2,
-            address_3=self.address_3,
-            city=self.city,
-            state=self.state,
-            zip=self.zip,
-            country=self.country,
-            phone_number=self.phone_number,
-            latitude=self.latitude,
-            longitude=self.longitude,
-            created_time=self.created_time,
-            modified_time=self.modified_time,
-        )
@@ -5,14 +5,11 @@ SQLModel definition for the merchant_app table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantApp")
-
 
 class MerchantApp(RhizomeModel, table=False):
     """
@@ -62,8 +59,3 @@ class MerchantApp(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     uninstall_type: str | None = Field(default=None, max_length=23)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantApp instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -25,12 +25,3 @@ class MerchantAppSubscriptionHistoryV1(MerchantAppSubscriptionHistory, MetaSQLMo
     """
 
     __tablename__ = "merchant_app_subscription_history"  # type: ignore
-
-    def sanitize(self) -> MerchantAppSubscriptionHistoryV1:
-        """Return a sanitized copy of this MerchantAppSubscriptionHistoryV1 instance."""
-        return MerchantAppSubscriptionHistoryV1(
-            created_time=self.created_time,
-            id=self.id,
-            merchant_app_id=self.merchant_app_id,
-            old_app_subscription_id=self.old_app_subscription_id,
-        )
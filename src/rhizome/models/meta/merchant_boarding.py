@@ -5,14 +5,11 @@ SQLModel definition for the merchant_boarding table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantBoarding")
-
 
 class MerchantBoarding(RhizomeModel, table=False):
     """
@@ -81,8 +78,3 @@ class MerchantBoarding(RhizomeModel, table=False):
     created_time: datetime.datetime | None = Field(default=None)
     modified_time: datetime.datetime
     account_status_modified_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantBoarding instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -5,14 +5,11 @@ SQLModel definition for the merchant_creation_details table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantCreationDetails")
-
 
 class MerchantCreationDetails(RhizomeModel, table=False):
     """
@@ -27,8 +24,3 @@ class MerchantCreationDetails(RhizomeModel, table=False):
     modified_time: datetime.datetime
     pre_create: str | None = Field(default=None, max_length=5)
     pre_source: str | None = Field(default=None, max_length=13)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantCreationDetails instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -24,16 +24,3 @@ class MerchantCreationDetailsV1(MerchantCreationDetails, MetaSQLModel, table=Tru
     """
 
     __tablename__ = "merchant_creation_details"  # type: ignore
-
-    def sanitize(self) -> MerchantCreationDetailsV1:
-        """Return a sanitized copy of this MerchantCreationDetailsV1 instance."""
-        return MerchantCreationDetailsV1(
-            created_time=self.created_time,
-            creation_source=self.creation_source,
-            id=self.id,
-            merchant_id=self.merchant_id,
-            modified_time=self.modified_time,
-            pre_create=self.pre_create,
-            pre_source=self.pre_source,
-            source_identifier=self.source_identifier,
-        )
@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .merchant_gateway import MerchantGateway
 
@@ -25,19 +24,3 @@ class MerchantGatewayV1(MerchantGateway, MetaSQLModel, table=True):
     """
 
     __tablename__ = "merchant_gateway"  # type: ignore
-
-    def sanitize(self) -> MerchantGatewayV1:
-        """Return a sanitized copy of this MerchantGatewayV1 instance."""
-        return MerchantGatewayV1(
-            id=self.id,
-            merchant_id=self.merchant_id,
-            payment_processor_id=self.payment_processor_id,
-            processor_key_id=self.processor_key_id,
-            rki_processor_id=self.rki_processor_id,
-            partner_uuid=sanitize_uuid_field(self.partner_uuid, 64),
-            stan=self.stan,
-            config=self.config,
-            closing_time=self.closing_time,
-            new_batch_close_enabled=self.new_batch_close_enabled,
-            modified_time=self.modified_time,
-        )
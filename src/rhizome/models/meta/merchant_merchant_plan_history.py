@@ -5,14 +5,11 @@ SQLModel definition for the merchant_merchant_plan_history table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantMerchantPlanHistory")
-
 
 class MerchantMerchantPlanHistory(RhizomeModel, table=False):
     """
@@ -24,8 +21,3 @@ class MerchantMerchantPlanHistory(RhizomeModel, table=False):
     old_merchant_plan_id: int | None = Field(default=None)
     new_merchant_plan_id: int | None = Field(default=None)
     changed_timestamp: datetime.datetime
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantMerchantPlanHistory instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -25,13 +25,3 @@ class MerchantMerchantPlanHistoryV1(MerchantMerchantPlanHistory, MetaSQLModel, t
     """
 
     __tablename__ = "merchant_merchant_plan_history"  # type: ignore
-
-    def sanitize(self) -> MerchantMerchantPlanHistoryV1:
-        """Return a sanitized copy of this MerchantMerchantPlanHistoryV1 instance."""
-        return MerchantMerchantPlanHistoryV1(
-            changed_timestamp=self.changed_timestamp,
-            id=self.id,
-            merchant_id=self.merchant_id,
-            new_merchant_plan_id=self.new_merchant_plan_id,
-            old_merchant_plan_id=self.old_merchant_plan_id,
-        )
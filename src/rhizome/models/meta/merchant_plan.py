@@ -5,13 +5,12 @@ SQLModel definition for the merchant_plan table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="MerchantPlan")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class MerchantPlan(RhizomeModel, table=False):
@@ -20,7 +19,7 @@ class MerchantPlan(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
     name: str = Field(max_length=31)
     type: str | None = Field(default=None, max_length=13)
     plan_code: str | None = Field(default=None, max_length=50)
@@ -37,8 +36,3 @@ class MerchantPlan(RhizomeModel, table=False):
     default_plan: bool = Field(default=False)
     hidden: bool | None = Field(default=False)
     tags: str | None = Field(default=None, max_length=2047)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantPlan instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -5,14 +5,11 @@ SQLModel definition for the merchant_plan_group table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantPlanGroup")
-
 
 class MerchantPlanGroup(RhizomeModel, table=False):
     """
@@ -28,8 +25,3 @@ class MerchantPlanGroup(RhizomeModel, table=False):
     deleted_time: datetime.datetime | None = Field(default=None)
     created_time: datetime.datetime
     modified_time: datetime.datetime
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantPlanGroup instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
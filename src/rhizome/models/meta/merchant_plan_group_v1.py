@@ -24,17 +24,3 @@ class MerchantPlanGroupV1(MerchantPlanGroup, MetaSQLModel, table=True):
     """
 
     __tablename__ = "merchant_plan_group"  # type: ignore
-
-    def sanitize(self) -> MerchantPlanGroupV1:
-        """Return a sanitized copy of this MerchantPlanGroupV1 instance."""
-        return MerchantPlanGroupV1(
-            created_time=self.created_time,
-            deleted_time=self.deleted_time,
-            enforce_assignment=self.enforce_assignment,
-            id=self.id,
-            linkable=self.linkable,
-            modified_time=self.modified_time,
-            name=self.name,
-            trial_days=self.trial_days,
-            uuid=self.uuid,
-        )
@@ -4,14 +4,10 @@ SQLModel definition for the merchant_plan_merchant_plan_group table.
 
 from __future__ import annotations
 
-from typing import TypeVar
-
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="MerchantPlanMerchantPlanGroup")
-
 
 class MerchantPlanMerchantPlanGroup(RhizomeModel, table=False):
     """
@@ -22,8 +18,3 @@ class MerchantPlanMerchantPlanGroup(RhizomeModel, table=False):
     merchant_plan_id: int
     merchant_plan_group_id: int
     default_plan: bool = Field(default=False)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this MerchantPlanMerchantPlanGroup instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
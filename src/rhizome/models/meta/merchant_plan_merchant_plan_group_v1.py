@@ -25,12 +25,3 @@ class MerchantPlanMerchantPlanGroupV1(MerchantPlanMerchantPlanGroup, MetaSQLMode
     """
 
     __tablename__ = "merchant_plan_merchant_plan_group"  # type: ignore
-
-    def sanitize(self) -> MerchantPlanMerchantPlanGroupV1:
-        """Return a sanitized copy of this MerchantPlanMerchantPlanGroupV1 instance."""
-        return MerchantPlanMerchantPlanGroupV1(
-            default_plan=self.default_plan,
-            id=self.id,
-            merchant_plan_group_id=self.merchant_plan_group_id,
-            merchant_plan_id=self.merchant_plan_id,
-        )
@@ -24,19 +24,3 @@ class MerchantRoleV1(MerchantRole, MetaSQLModel, table=True):
     """
 
     __tablename__ = "merchant_role"  # type: ignore
-
-    def sanitize(self) -> MerchantRoleV1:
-        """Return a sanitized copy of this MerchantRoleV1 instance."""
-        return MerchantRoleV1(
-            account_id=self.account_id,
-            created_time=self.created_time,
-            custom_id=self.custom_id,
-            deleted_time=self.deleted_time,
-            id=self.id,
-            merchant_id=self.merchant_id,
-            modified_time=self.modified_time,
-            nickname=self.nickname,
-            pin=self.pin,
-            role=self.role,
-            role_id=self.role_id,
-        )
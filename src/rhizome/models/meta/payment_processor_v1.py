@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .payment_processor import PaymentProcessor
 
@@ -25,15 +24,3 @@ class PaymentProcessorV1(PaymentProcessor, MetaSQLModel, table=True):
     """
 
     __tablename__ = "payment_processor"  # type: ignore
-
-    def sanitize(self) -> PaymentProcessorV1:
-        """Return a sanitized copy of this PaymentProcessorV1 instance."""
-        return PaymentProcessorV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            name=self.name,
-            payment_gateway_api=self.payment_gateway_api,
-            production=self.production,
-            config=self.config,
-            modified_time=self.modified_time,
-        )
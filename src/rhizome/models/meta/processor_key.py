@@ -4,13 +4,12 @@ SQLModel definition for the processor_key table.
 
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="ProcessorKey")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ProcessorKey(RhizomeModel, table=False):
@@ -19,10 +18,5 @@ class ProcessorKey(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
     info: str | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this ProcessorKey instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
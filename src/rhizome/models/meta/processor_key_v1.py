@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .processor_key import ProcessorKey
 
@@ -25,11 +24,3 @@ class ProcessorKeyV1(ProcessorKey, MetaSQLModel, table=True):
     """
 
     __tablename__ = "processor_key"  # type: ignore
-
-    def sanitize(self) -> ProcessorKeyV1:
-        """Return a sanitized copy of this ProcessorKeyV1 instance."""
-        return ProcessorKeyV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            info=self.info,
-        )
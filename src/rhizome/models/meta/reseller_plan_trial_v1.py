@@ -24,16 +24,3 @@ class ResellerPlanTrialV1(ResellerPlanTrial, MetaSQLModel, table=True):
     """
 
     __tablename__ = "reseller_plan_trial"  # type: ignore
-
-    def sanitize(self) -> ResellerPlanTrialV1:
-        """Return a sanitized copy of this ResellerPlanTrialV1 instance."""
-        return ResellerPlanTrialV1(
-            created_time=self.created_time,
-            finalize_time=self.finalize_time,
-            id=self.id,
-            merchant_plan_id=self.merchant_plan_id,
-            modified_time=self.modified_time,
-            reseller_id=self.reseller_id,
-            trial_days=self.trial_days,
-            uuid=self.uuid,
-        )
@@ -5,13 +5,12 @@ SQLModel definition for the server_feature table.
 from __future__ import annotations
 
 import datetime
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="ServerFeature")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class ServerFeature(RhizomeModel, table=False):
@@ -20,14 +19,9 @@ class ServerFeature(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True)
-    uuid: str = Field(max_length=13, unique=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
     name: str = Field(max_length=127, unique=True)
     config: str | None = Field(default=None)
     enabled: bool
     modified_time: datetime.datetime
     deleted_time: datetime.datetime | None = Field(default=None)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this ServerFeature instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -9,7 +9,6 @@ contain actual schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .server_feature import ServerFeature
 
@@ -25,15 +24,3 @@ class ServerFeatureV1(ServerFeature, MetaSQLModel, table=True):
     """
 
     __tablename__ = "server_feature"  # type: ignore
-
-    def sanitize(self) -> ServerFeatureV1:
-        """Return a sanitized copy of this ServerFeatureV1 instance."""
-        return ServerFeatureV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),
-            name=self.name,
-            config=self.config,
-            enabled=self.enabled,
-            modified_time=self.modified_time,
-            deleted_time=self.deleted_time,
-        )
@@ -4,13 +4,12 @@ SQLModel definition for the terminal_config_merchant_props table.
 
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import Annotated
 
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
-
-T = TypeVar("T", bound="TerminalConfigMerchantProps")
+from ...sanitize_helpers import SanitizeUUID
 
 
 class TerminalConfigMerchantProps(RhizomeModel, table=False):
@@ -19,11 +18,6 @@ class TerminalConfigMerchantProps(RhizomeModel, table=False):
     """
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key, auto-incrementing")
-    uuid: str = Field(max_length=13, unique=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
     country: str | None = Field(default=None, max_length=2)
     currency: str | None = Field(default=None, max_length=3)
-
-    def sanitize(self: T) -> T:
-        """Return a sanitized copy of this TerminalConfigMerchantProps instance."""
-        # This will be overridden by concrete subclasses
-        raise NotImplementedError("Subclasses must implement sanitize()")
@@ -10,7 +10,6 @@ schema differences (new columns, modified types, etc.).
 
 from __future__ import annotations
 
-from ...sanitize_helpers import sanitize_uuid_field
 from ..metadata_registry import MetaSQLModel
 from .terminal_config_merchant_props import TerminalConfigMerchantProps
 
@@ -26,12 +25,3 @@ class TerminalConfigMerchantPropsV1(TerminalConfigMerchantProps, MetaSQLModel, t
     """
 
     __tablename__ = "terminal_config_merchant_props"  # type: ignore
-
-    def sanitize(self) -> TerminalConfigMerchantPropsV1:
-        """Return a sanitized copy of this TerminalConfigMerchantPropsV1 instance."""
-        return TerminalConfigMerchantPropsV1(
-            id=self.id,
-            uuid=sanitize_uuid_field(self.uuid, 13),  # type: ignore
-            country=self.country,
-            currency=self.currency,
-        )
@@ -4,14 +4,10 @@ SQLModel definition for the timezones table.
 
 from __future__ import annotations
 
-from typing import TypeVar
-
 from sqlmodel import Field
 
 from ...models.base import RhizomeModel
 
-T = TypeVar("T", bound="Timezones")
-
 
 class Timezones(RhizomeModel, table=True):
     """
@@ -24,14 +20,3 @@ class Timezones(RhizomeModel, table=True):
     visible: bool | None = Field(default=False)
     offset: int | None = Field(default=None)
     offset_dst: int | None = Field(default=None)
-
-    def sanitize(self) -> Timezones:
-        """Return a sanitized copy of this Timezones instance."""
-        return Timezones(
-            id=self.id,
-            name=self.name,
-            display_name=self.display_name,
-            visible=self.visible,
-            offset=self.offset,
-            offset_dst=self.offset_dst,
-        )
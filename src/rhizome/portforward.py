@@ -13,13 +13,22 @@ traffic from a local port to a service/pod port in a Kubernetes cluster.
 """
 
 import asyncio
+import os
 import re
+import signal
+import time
+from collections.abc import Callable
+from contextlib import aclosing, suppress
+from itertools import groupby
 from typing import TYPE_CHECKING
 
 import structlog
+from pydantic import BaseModel
 
 from rhizome.proc import NewProcessResponse, process_manager
 from rhizome.tools import SubprocessTools
+from rhizome.tunnel_registry import PersistedTunnel, is_port_forward, pid_alive, tunnel_registry
+from rhizome.tunnels import tcp_probe
 
 if TYPE_CHECKING:
     from rhizome.environments.base import Tools
@@ -66,97 +75,84 @@ async def port_forward(
     return NewProcessResponse(status="started", pid=process.pid)
 
 
+# Logged by the CloudSQL proxy once it listens, e.g.
+# "Starting proxy for connectionName 'project:region:instance' on port '12345'"
+_PROXY_START = re.compile(r"Starting proxy for connectionName '(?P<connection>[^']*)' on port '(?P<port>\d+)'")
+
+
+def _proxy_port(log_line: str, sql_connection: str | None) -> int | None:
+    """The port a CloudSQL proxy start line announces for a connection (for any connection if None)."""
+    match = _PROXY_START.search(log_line)
+    if match is None or (sql_connection is not None and match.group("connection") != sql_connection):
+        return None
+    return int(match.group("port"))
+
+
 async def _discover_remote_port(
     tools: "Tools",
     kube_context: str,
     kube_namespace: str,
     kube_deployment: str,
-    sql_connection: str,  # Add sql_connection parameter
+    sql_connection: str,
     log: structlog.BoundLogger,
+    timeout: float = 60.0,
 ) -> int:
-    """Poll logs to discover the remote port for CloudSQL proxy."""
+    """Follow the deployment's logs until the CloudSQL proxy announces its port."""
     source = "mock" if tools.is_mocked() else "subprocess"
     log.info("Waiting for Cloud SQL proxy to establish connection...", source=source)
-    for i in range(20):  # Poll for up to 60 seconds
-        logs = await tools.kubectl.get_logs(
-            context=kube_context,
-            namespace=kube_namespace,
-            deployment=kube_deployment,
-            since="15s",
-        )
-        log.info("Checking logs for remote port", attempt=i, logs=logs, source=source)
-
-        # Parse logs for remote port
-        for log_line in logs:
-            log.info("Checking log line", line=log_line.content, source=source)
-            # Check if this is a CloudSQL proxy start line
-            is_proxy_start = "Starting proxy for connectionName" in log_line.content and "on port" in log_line.content
-
-            # For mocked tests, be more flexible with connection name matching
-            if source == "mock":
-                connection_matches = is_proxy_start
-            else:
-                # For real environments, require exact SQL connection match
-                connection_matches = (
-                    is_proxy_start and f"Starting proxy for connectionName '{sql_connection}'" in log_line.content
+    # For mocked tests, be more flexible with connection name matching
+    connection = None if source == "mock" else sql_connection
+    try:
+        async with asyncio.timeout(timeout):
+            while True:
+                lines = tools.kubectl.follow_logs(
+                    context=kube_context, namespace=kube_namespace, deployment=kube_deployment, since="15s"
                 )
-
-            if connection_matches:
-                # Extract port from log line like "Starting proxy for ... on port '12345'"
-                match = re.search(r"on port '(\d+)'", log_line.content)
-                if match:
-                    remote_port = int(match.group(1))
-                    log.info("Found remote port", port=remote_port, source=source)
-                    return remote_port
-        await asyncio.sleep(3)
-    raise RuntimeError("Failed to discover remote port from logs")
+                async with aclosing(lines):
+                    async for log_line in lines:
+                        log.debug("Checking log line", line=log_line.content, source=source)
+                        remote_port = _proxy_port(log_line.content, connection)
+                        if remote_port is not None:
+                            log.info("Found remote port", port=remote_port, source=source)
+                            return remote_port
+                # The log stream ended (e.g. the pod restarted), so follow it again
+                log.info("Log stream ended before the proxy started, following again", source=source)
+                await asyncio.sleep(1)
+    except TimeoutError:
+        raise RuntimeError("Failed to discover remote port from logs") from None
 
 
 async def _wait_for_port_forward(
-    tools: "Tools",
+    process: asyncio.subprocess.Process,
     local_port: int,
     log: structlog.BoundLogger,
+    timeout: float = 10.0,
+    interval: float = 0.05,
 ) -> None:
-    """Wait for the port-forward to start listening."""
-    source = "mock" if tools.is_mocked() else "subprocess"
-    log.info("Waiting for port-forward to start listening...", source=source)
-    for _ in range(10):
-        port_info = await tools.lsof.check_port(local_port)
-        if port_info:
-            log.info("Port is listening!", port_info=port_info, source=source)
-            return
-        await asyncio.sleep(1)
-    log.error("Port-forward did not start listening in time.", source=source)
-    raise RuntimeError("Port-forward did not start listening in time.")
-
-
-async def cloudsql_port_forward(
+    """Wait for the port-forward to accept connections on its local port."""
+    log.info("Waiting for port-forward to start listening...", port=local_port)
+    deadline = time.monotonic() + timeout
+    # A refused connection fails at once, so probing often costs little
+    while not await tcp_probe(local_port, timeout=interval):
+        if process.returncode is not None:
+            log.error("Port-forward exited before listening.", returncode=process.returncode)
+            raise RuntimeError(f"Port-forward exited with code {process.returncode} before listening")
+        if time.monotonic() >= deadline:
+            log.error("Port-forward did not start listening in time.")
+            raise RuntimeError("Port-forward did not start listening in time.")
+        await asyncio.sleep(interval)
+    log.info("Port is listening!", port=local_port)
+
+
+async def _start_cloudsql_proxy(
+    tools: "Tools",
     kube_context: str,
     kube_namespace: str,
     kube_deployment: str,
     sql_connection: str,
-    local_port: int,
-    tools: "Tools | None" = None,
-) -> NewProcessResponse:
-    """
-    Start a Cloud SQL proxy port-forward subprocess.
-
-    This implements the complex production flow:
-    1. Check if port is already forwarded
-    2. Start connection script in pod
-    3. Get the remote port from logs
-    4. Set up port forwarding
-    """
-    process_name = "cloudsql-portforward"
-    tools = tools or SubprocessTools()
-    log = structlog.get_logger()
-
-    # 1. Check if port is already forwarded
-    port_info = await tools.lsof.check_port(local_port)
-    if port_info:
-        raise RuntimeError(f"Port {local_port} already in use by {port_info[0].process_name}")
-
-    # 2. Start connection script in pod
+    log: structlog.BoundLogger,
+) -> int:
+    """Start the CloudSQL proxy for a connection in the pod, returning the remote port it listens on."""
     connection_command_args = [
         "nohup",
         "sh",
@@ -177,17 +173,68 @@ async def cloudsql_port_forward(
         )
         raise RuntimeError("Failed to start connection script")
 
-    # 3. Wait and get remote port from logs
-    remote_port = await _discover_remote_port(
+    # The proxy's start line in the logs tells which port it got
+    return await _discover_remote_port(
         tools=tools,
         kube_context=kube_context,
         kube_namespace=kube_namespace,
         kube_deployment=kube_deployment,
-        sql_connection=sql_connection,  # Pass sql_connection
+        sql_connection=sql_connection,
         log=log,
     )
 
-    # 4. Start port-forward
+
+async def cloudsql_port_forward(
+    kube_context: str,
+    kube_namespace: str,
+    kube_deployment: str,
+    sql_connection: str,
+    local_port: int,
+    tools: "Tools | None" = None,
+    share_as: str | None = None,
+) -> NewProcessResponse:
+    """
+    Start a Cloud SQL proxy port-forward subprocess.
+
+    This implements the complex production flow:
+    1. Check if port is already forwarded
+    2. Start connection script in pod
+    3. Get the remote port from logs
+    4. Set up port forwarding
+    5. Wait for the local port to accept connections
+
+    Readiness is detected from events rather than fixed polls: the pod's logs are
+    followed until the proxy announces its port, and the local port is probed
+    with TCP connects, so setup takes as long as the proxy takes to start.
+
+    With `share_as`, step 4 adds the port to the deployment's shared port-forward
+    (see SharedPortForward) under that database id instead of starting a process
+    for it alone; the returned pid is then the shared process's.
+    """
+    process_name = "cloudsql-portforward"
+    tools = tools or SubprocessTools()
+    log = structlog.get_logger()
+
+    # 1. Check if port is already forwarded
+    if await tcp_probe(local_port):
+        # Only look up who holds the port to report it
+        port_info = await tools.lsof.check_port(local_port)
+        owner = port_info[0].process_name if port_info else "another process"
+        raise RuntimeError(f"Port {local_port} already in use by {owner}")
+
+    # 2. and 3. Start the proxy in the pod and find the port it listens on
+    remote_port = await _start_cloudsql_proxy(tools, kube_context, kube_namespace, kube_deployment, sql_connection, log)
+
+    # 4. and 5. Forward the port, through the deployment's shared process if asked to
+    if share_as is not None:
+        shared = shared_port_forwards.get(kube_context, kube_namespace, kube_deployment)
+        try:
+            pid = await shared.add(share_as, local_port, remote_port, tools)
+        except BaseException:
+            shared.remove(share_as)
+            raise
+        return NewProcessResponse(status="shared", pid=pid)
+
     process = await tools.kubectl.port_forward(
         context=kube_context,
         namespace=kube_namespace,
@@ -199,12 +246,336 @@ async def cloudsql_port_forward(
     # Register with process manager for tracking and output streaming
     process_manager.register_process(process, process_name)
 
-    # Give the port-forward a moment to start listening
-    await _wait_for_port_forward(tools=tools, local_port=local_port, log=log)
+    # Wait until the port-forward listens (mocked port-forwards don't)
+    if not tools.is_mocked():
+        await _wait_for_port_forward(process=process, local_port=local_port, log=log)
 
     return NewProcessResponse(status="started", pid=process.pid)
 
 
+class PortMapping(BaseModel):
+    """A database's CloudSQL proxy port and the local port it is forwarded to."""
+
+    database_id: str
+    local_port: int
+    remote_port: int
+    established_at: float
+    pid: int | None = None  # The port-forward process carrying it, once there is one
+
+
+class SharedPortForwardInfo(BaseModel):
+    kube_context: str
+    kube_namespace: str
+    kube_deployment: str
+    pids: list[int]  # Running port-forward processes
+    starts: int  # Processes started so far
+    mappings: list[PortMapping]
+
+
+class SharedPortForwardsResponse(BaseModel):
+    port_forwards: list[SharedPortForwardInfo]
+
+
+class _AdoptedProcess:
+    """A port-forward process left running by a previous server, which can only be signalled and polled."""
+
+    def __init__(self, pid: int, kube_deployment: str, ports: list[tuple[int, int]]) -> None:
+        self.pid = pid
+        self.kube_deployment = kube_deployment
+        self.ports = ports
+
+    @property
+    def returncode(self) -> int | None:
+        # It isn't our child, so its exit status is unknown
+        return None if pid_alive(self.pid) else -1
+
+    def terminate(self) -> None:
+        # The port-forward may have exited and its pid been reused since it was adopted
+        if not is_port_forward(self.pid, self.kube_deployment, self.ports):
+            structlog.get_logger().warning("Adopted port-forward is gone, not signalling its pid", pid=self.pid)
+            return
+        with suppress(ProcessLookupError):
+            os.kill(self.pid, signal.SIGTERM)
+
+    async def wait(self, interval: float = 0.05) -> int:
+        while pid_alive(self.pid):
+            await asyncio.sleep(interval)
+        return -1
+
+
+class SharedPortForward:
+    """
+    kubectl port-forward processes carrying the proxy ports of several databases on one deployment.
+
+    kubectl can't add ports to a running port-forward, so a database that needs
+    forwarding replaces the running processes with one carrying every database's
+    port (the others keep their local ports, and their pooled connections recover
+    through `pool_pre_ping`). Databases added while a process is starting are
+    picked up together by the next one, so a burst of additions starts at most
+    two processes. A process stops once none of its databases use it.
+
+    Processes may also be ones a previous server left running, adopted from the
+    tunnel registry (see rhizome.tunnel_registry).
+    """
+
+    def __init__(
+        self,
+        kube_context: str,
+        kube_namespace: str,
+        kube_deployment: str,
+        on_change: Callable[[], object] | None = None,
+    ) -> None:
+        """
+        Args:
+            kube_context: Kubernetes context name
+            kube_namespace: Kubernetes namespace
+            kube_deployment: Deployment running the CloudSQL proxies
+            on_change: Called whenever the processes or the ports they forward change (e.g. to persist them)
+        """
+        self.kube_context = kube_context
+        self.kube_namespace = kube_namespace
+        self.kube_deployment = kube_deployment
+        self.on_change = on_change
+        self.starts = 0
+        self._mappings: dict[str, PortMapping] = {}
+        # The process forwarding each database's port (databases waiting for one have none)
+        self._carriers: dict[str, asyncio.subprocess.Process | _AdoptedProcess] = {}
+        self._lock = asyncio.Lock()
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+    def _carrier(self, database_id: str) -> asyncio.subprocess.Process | _AdoptedProcess | None:
+        """The running process forwarding a database's port, if any."""
+        process = self._carriers.get(database_id)
+        return process if process is not None and process.returncode is None else None
+
+    async def add(self, database_id: str, local_port: int, remote_port: int, tools: "Tools") -> int:
+        """
+        Forward a database's proxy port, replacing the processes unless one already forwards it.
+
+        Args:
+            database_id: Database the port belongs to
+            local_port: Local port to forward from
+            remote_port: Port the database's CloudSQL proxy listens on in the pod
+            tools: Tool dependencies
+
+        Returns:
+            The pid of the port-forward process carrying the port
+        """
+        mapping = self._mappings.get(database_id)
+        if mapping is None or (mapping.local_port, mapping.remote_port) != (local_port, remote_port):
+            self.remove(database_id)
+            self._mappings[database_id] = PortMapping(
+                database_id=database_id, local_port=local_port, remote_port=remote_port, established_at=time.time()
+            )
+        async with self._lock:
+            process = self._carrier(database_id)
+            if process is None:
+                await self._stop_processes()
+                process = await self._start(list(self._mappings.values()), tools)
+            return process.pid
+
+    async def _stop_processes(self) -> None:
+        """Stop the running processes, waiting for them to release their local ports."""
+        processes = {process for process in self._carriers.values() if process.returncode is None}
+        self._carriers.clear()
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            await process.wait()
+
+    async def _start(self, mappings: list[PortMapping], tools: "Tools") -> asyncio.subprocess.Process:
+        """Start a process forwarding the given databases' ports."""
+        log = structlog.get_logger().bind(kube_context=self.kube_context, kube_deployment=self.kube_deployment)
+        ports = [(mapping.local_port, mapping.remote_port) for mapping in mappings]
+        # In its own session, so that a Ctrl-C meant for the server doesn't stop it (the server stops it if need be)
+        process = await tools.kubectl.port_forward_ports(
+            context=self.kube_context,
+            namespace=self.kube_namespace,
+            resource=f"deployment/{self.kube_deployment}",
+            ports=ports,
+            start_new_session=True,
+        )
+        process_manager.register_process(process, "cloudsql-portforward")
+        self.starts += 1
+        log.info(
+            "Started shared port-forward",
+            pid=process.pid,
+            databases=[mapping.database_id for mapping in mappings],
+            ports=ports,
+        )
+
+        # Wait until every port listens (mocked port-forwards don't)
+        if not tools.is_mocked():
+            try:
+                for local_port, _ in ports:
+                    await _wait_for_port_forward(process=process, local_port=local_port, log=log)
+            except BaseException:
+                if process.returncode is None:
+                    process.terminate()
+                raise
+
+        for mapping in mappings:
+            mapping.pid = process.pid
+            self._carriers[mapping.database_id] = process
+        self._changed()
+        return process
+
+    def remove(self, database_id: str) -> bool:
+        """
+        Stop forwarding a database's port.
+
+        Its process isn't replaced just to drop a port (that would interrupt the
+        other databases it carries); it stops once none of them use it.
+
+        Returns:
+            True if the database's port was being forwarded
+        """
+        if self._mappings.pop(database_id, None) is None:
+            return False
+        process = self._carriers.pop(database_id, None)
+        if process is not None and process.returncode is None and process not in self._carriers.values():
+            process.terminate()
+        self._changed()
+        return True
+
+    def adopt(self, pid: int, mappings: list[PortMapping]) -> None:
+        """Take over a port-forward process a previous server left running, forwarding `mappings`."""
+        ports = [(mapping.local_port, mapping.remote_port) for mapping in mappings]
+        process = _AdoptedProcess(pid, self.kube_deployment, ports)
+        for mapping in mappings:
+            mapping.pid = pid
+            self._mappings[mapping.database_id] = mapping
+            self._carriers[mapping.database_id] = process
+        structlog.get_logger().info(
+            "Adopted shared port-forward",
+            kube_context=self.kube_context,
+            kube_deployment=self.kube_deployment,
+            pid=pid,
+            databases=[mapping.database_id for mapping in mappings],
+        )
+
+    def stop(self) -> list[str]:
+        """
+        Stop every process, adopted ones included, and forget the deployment's databases.
+
+        Returns:
+            The databases whose ports were forwarded
+        """
+        database_ids = list(self._mappings)
+        for process in set(self._carriers.values()):
+            if process.returncode is None:
+                process.terminate()
+        self._mappings.clear()
+        self._carriers.clear()
+        if database_ids:
+            self._changed()
+        return database_ids
+
+    def detach(self) -> None:
+        """Leave the processes running when the server shuts down, for the next server to adopt."""
+        for process in set(self._carriers.values()):
+            if isinstance(process, asyncio.subprocess.Process):
+                process_manager.release(process.pid)
+
+    def persisted(self) -> list[PersistedTunnel]:
+        """The forwarded ports, as registry entries."""
+        tunnels: list[PersistedTunnel] = []
+        for database_id, mapping in self._mappings.items():
+            process = self._carrier(database_id)
+            if process is not None:
+                tunnels.append(
+                    PersistedTunnel(
+                        kube_context=self.kube_context,
+                        kube_namespace=self.kube_namespace,
+                        kube_deployment=self.kube_deployment,
+                        **mapping.model_dump(exclude={"pid"}),
+                        pid=process.pid,
+                    )
+                )
+        return tunnels
+
+    def local_ports(self) -> set[int]:
+        """Local ports held for the deployment's databases, including ones waiting for a process."""
+        return {mapping.local_port for mapping in self._mappings.values()}
+
+    def describe(self) -> SharedPortForwardInfo:
+        return SharedPortForwardInfo(
+            kube_context=self.kube_context,
+            kube_namespace=self.kube_namespace,
+            kube_deployment=self.kube_deployment,
+            pids=sorted({process.pid for process in self._carriers.values() if process.returncode is None}),
+            starts=self.starts,
+            mappings=[mapping.model_copy() for mapping in self._mappings.values()],
+        )
+
+
+class SharedPortForwards:
+    """Registry of shared port-forwards, one per (context, namespace, deployment), persisted to the tunnel registry."""
+
+    def __init__(self) -> None:
+        self._port_forwards: dict[tuple[str, str, str], SharedPortForward] = {}
+
+    def get(self, kube_context: str, kube_namespace: str, kube_deployment: str) -> SharedPortForward:
+        """Get the shared port-forward for a deployment, creating it if needed."""
+        key = (kube_context, kube_namespace, kube_deployment)
+        shared = self._port_forwards.get(key)
+        if shared is None:
+            shared = self._port_forwards[key] = SharedPortForward(*key, on_change=self._save)
+        return shared
+
+    def _save(self) -> None:
+        tunnel_registry.save([tunnel for shared in self._port_forwards.values() for tunnel in shared.persisted()])
+
+    async def adopt(self, probe_timeout: float = 1.0) -> list[PersistedTunnel]:
+        """
+        Take over the port-forwards recorded in the tunnel registry that still work.
+
+        Args:
+            probe_timeout: Seconds to wait for a TCP connection to each recorded local port
+
+        Returns:
+            The adopted tunnels
+        """
+
+        def process(tunnel: PersistedTunnel) -> tuple[str, str, str, int]:
+            return (tunnel.kube_context, tunnel.kube_namespace, tunnel.kube_deployment, tunnel.pid)
+
+        adopted = sorted(await tunnel_registry.validate(probe_timeout), key=process)
+        for (kube_context, kube_namespace, kube_deployment, pid), tunnels in groupby(adopted, key=process):
+            mappings = [PortMapping.model_validate(tunnel, from_attributes=True) for tunnel in tunnels]
+            self.get(kube_context, kube_namespace, kube_deployment).adopt(pid, mappings)
+        self._save()
+        return adopted
+
+    def stop(self) -> list[str]:
+        """
+        Stop every shared process, adopted ones included.
+
+        Returns:
+            The databases whose ports were forwarded
+        """
+        return [database_id for shared in self._port_forwards.values() for database_id in shared.stop()]
+
+    def detach(self) -> None:
+        """Leave every shared process running when the server shuts down, for the next server to adopt."""
+        for shared in self._port_forwards.values():
+            shared.detach()
+
+    def local_ports(self) -> set[int]:
+        """Local ports held for shared port-forwards, including ones waiting for a process."""
+        return {port for shared in self._port_forwards.values() for port in shared.local_ports()}
+
+    def describe(self) -> SharedPortForwardsResponse:
+        return SharedPortForwardsResponse(port_forwards=[shared.describe() for shared in self._port_forwards.values()])
+
+
+# Global shared port-forward registry
+shared_port_forwards = SharedPortForwards()
+
+
 # Legacy function for backward compatibility
 async def start_portforward(
     kube_context: str,
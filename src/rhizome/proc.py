@@ -122,6 +122,36 @@ class ProcessManager:
         self._output_tasks.add(task)
         task.add_done_callback(self._output_tasks.discard)
 
+    def is_running(self, pid: int) -> bool:
+        """Check whether a tracked process is still running."""
+        return any(p.pid == pid and p.returncode is None for p in self._processes)
+
+    def release(self, pid: int) -> bool:
+        """
+        Stop tracking a process without terminating it, so that it outlives cleanup.
+
+        Returns:
+            True if a process with that pid was being tracked
+        """
+        for process in self._processes:
+            if process.pid == pid:
+                self._processes.discard(process)
+                return True
+        return False
+
+    def terminate(self, pid: int) -> bool:
+        """
+        Terminate a tracked process.
+
+        Returns:
+            True if a running process with that pid was found
+        """
+        for process in self._processes:
+            if process.pid == pid and process.returncode is None:
+                process.terminate()
+                return True
+        return False
+
     async def cleanup(self) -> None:
         """Clean up all running processes and tasks."""
         # Cancel all output streaming tasks
@@ -0,0 +1,291 @@
+"""
+Server-side cache of query results.
+
+Reference tables (fee categories, adjust action types, server config, ...) are
+queried over and over and hardly ever change. Once the cache is enabled, the
+server keeps its responses to queries over such tables, keyed by
+(database_id, sql, parameters, sanitize) and the shape of the response, and
+answers repeats without a port forward or a database round trip:
+
+- The cache is opt-in: nothing is cached until it is enabled
+- Entries live for the TTL of the tables their query reads (the shortest one);
+  queries reading a table without a TTL are not cached
+- Least recently used entries are evicted to keep the cache within its memory bound
+- Canned writes (/write_query) invalidate the entries that read the tables they touch
+"""
+
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+from rhizome.server_models import ExecuteQueryRequest, ExecuteQueryResponse
+
+logger = structlog.get_logger()
+
+# Tables our workflows read constantly and that almost never change
+REFERENCE_TABLE_TTLS: dict[str, float] = {
+    "fee_category": 3600.0,
+    "adjust_action_type": 3600.0,
+    "billing_archetype": 3600.0,
+    "server_config": 3600.0,
+    "lexi_attribute": 3600.0,
+}
+
+# SQL tokens: (possibly schema-qualified) names, strings and punctuation
+_NAME = r"(?:`(?:[^`]|``)*`|\w+)"
+_TOKEN_PATTERN = re.compile(rf"{_NAME}(?:\.{_NAME})*|'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|\S")
+# Keywords followed by a table name
+_TABLE_KEYWORDS = {"FROM", "JOIN", "UPDATE", "INTO"}
+# Keywords ending a FROM clause (after which commas no longer separate tables)
+_CLAUSE_KEYWORDS = {"SELECT", "WHERE", "GROUP", "HAVING", "ORDER", "LIMIT", "UNION", "SET", "VALUES", "FOR", "WINDOW"}
+
+ResultKey = tuple[Any, ...]
+
+
+@lru_cache(maxsize=1024)
+def referenced_tables(sql: str) -> frozenset[str]:
+    """
+    The tables a statement reads or writes, by unqualified name.
+
+    The statement is scanned, not parsed, so it errs towards listing too many tables
+    (e.g. the column in `EXTRACT(YEAR FROM col)`), which at worst keeps a query out of the cache.
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        Names of the tables following FROM, JOIN, UPDATE and INTO, or listed in FROM clauses
+    """
+    tables: set[str] = set()
+    in_from = [False]  # Per parenthesis depth: whether we're in a FROM clause
+    expect_table = False
+    for token in _TOKEN_PATTERN.findall(sql):
+        keyword = token.upper()
+        if token == "(":
+            in_from.append(False)
+            expect_table = False
+        elif token == ")":
+            if len(in_from) > 1:
+                in_from.pop()
+        elif keyword in _TABLE_KEYWORDS:
+            in_from[-1] = keyword in ("FROM", "JOIN")
+            expect_table = True
+        elif keyword in _CLAUSE_KEYWORDS:
+            in_from[-1] = False
+            expect_table = False
+        elif token == ",":
+            expect_table = in_from[-1]
+        elif expect_table:
+            if token[0] == "`" or token[0].isalpha() or token[0] == "_":
+                # schema.table: keep the table
+                tables.add(re.findall(_NAME, token)[-1].strip("`"))
+            expect_table = False
+    return frozenset(tables)
+
+
+class ResultCacheSettings(BaseModel):
+    """Settings of the query result cache."""
+
+    enabled: bool = False  # Opt-in: nothing is cached until this is set
+    # How long results are reused, per table read by the query
+    table_ttl_seconds: dict[str, float] = Field(default_factory=lambda: dict(REFERENCE_TABLE_TTLS))
+    default_ttl_seconds: float = 0.0  # TTL for tables not listed above (0: don't cache their queries)
+    max_bytes: int = 64 * 1024 * 1024  # Memory bound, measured as serialized response size
+
+
+class ResultCacheResponse(BaseModel):
+    settings: ResultCacheSettings
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int  # Entries dropped to stay within max_bytes
+    invalidations: int  # Entries dropped because a write touched their tables
+
+
+@dataclass
+class _CachedResult:
+    response: ExecuteQueryResponse
+    tables: frozenset[str]
+    size: int
+    expires_at: float
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+def _result_key(request: ExecuteQueryRequest, dump_mode: str) -> ResultKey:
+    """Cache key of a query: what it reads, plus everything that shapes its response."""
+    model = request.model_id or f"{request.model_module}:{request.model_class}"
+    return (
+        request.database_id,
+        request.sql,
+        json.dumps(request.parameters, sort_keys=True, default=str),
+        request.sanitize,
+        request.mode,
+        model,
+        tuple(request.keyset_columns or ()),
+        dump_mode,
+    )
+
+
+class ResultCache:
+    """LRU cache of query responses with per-table TTLs and write invalidation."""
+
+    def __init__(self, settings: ResultCacheSettings | None = None) -> None:
+        self.settings = settings or ResultCacheSettings()
+        self._entries: OrderedDict[ResultKey, _CachedResult] = OrderedDict()
+        self._bytes = 0
+        self._stats = _Stats()
+        # Bumped whenever entries are invalidated, so results fetched before a write aren't cached after it
+        self.generation = 0
+        # Sync endpoints (/write_query) run in threadpool workers
+        self._lock = Lock()
+
+    def ttl(self, tables: frozenset[str]) -> float:
+        """How long results reading these tables may be reused (0 for none)."""
+        if not tables:
+            return 0.0
+        ttls = self.settings.table_ttl_seconds
+        return min(ttls.get(table, self.settings.default_ttl_seconds) for table in tables)
+
+    def get(self, request: ExecuteQueryRequest, dump_mode: str = "json") -> ExecuteQueryResponse | None:
+        """
+        Look up the cached response to a query.
+
+        Args:
+            request: Query execution request
+            dump_mode: How result values were serialized ("json", or "python" for the columnar encoding)
+
+        Returns:
+            The cached response, or None if the cache is disabled, or the query isn't cached or expired
+        """
+        if not self.settings.enabled:
+            return None
+        key = _result_key(request, dump_mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.response
+
+    def put(
+        self, request: ExecuteQueryRequest, response: ExecuteQueryResponse, generation: int, dump_mode: str = "json"
+    ) -> bool:
+        """
+        Cache the response to a query, if its tables have a TTL.
+
+        Args:
+            request: Query execution request
+            response: Response built for it
+            generation: Value of `generation` before the query ran; if tables were invalidated
+                since, the response may predate a write and is not cached
+            dump_mode: How result values were serialized
+
+        Returns:
+            Whether the response was cached
+        """
+        if not self.settings.enabled or not response.success:
+            return False
+        tables = referenced_tables(request.sql)
+        ttl = self.ttl(tables)
+        if ttl <= 0:
+            return False
+        size = len(to_json(response, bytes_mode="base64", fallback=str))
+        if size > self.settings.max_bytes:
+            return False
+
+        key = _result_key(request, dump_mode)
+        with self._lock:
+            if generation != self.generation:
+                return False
+            self._remove(key)
+            self._entries[key] = _CachedResult(
+                response=response, tables=tables, size=size, expires_at=time.time() + ttl
+            )
+            self._bytes += size
+            self._evict()
+        return True
+
+    def invalidate(self, database_id: str, tables: frozenset[str]) -> int:
+        """
+        Drop the cached results of a database that read any of the given tables.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self.generation += 1
+            stale = [key for key, entry in self._entries.items() if key[0] == database_id and entry.tables & tables]
+            for key in stale:
+                self._remove(key)
+            self._stats.invalidations += len(stale)
+        if stale:
+            logger.info("Invalidated cached results", database=database_id, tables=sorted(tables), entries=len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self.generation += 1
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def configure(self, settings: ResultCacheSettings) -> None:
+        """Apply new settings. Already cached entries keep their expiry; disabling the cache empties it."""
+        with self._lock:
+            self.settings = settings
+            self._evict()
+        if not settings.enabled:
+            self.clear()
+        logger.info("Updated result cache settings", **settings.model_dump())
+
+    def describe(self) -> ResultCacheResponse:
+        """Describe the cache's size and counters."""
+        with self._lock:
+            return ResultCacheResponse(
+                settings=self.settings,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+            )
+
+    def _remove(self, key: ResultKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is within its memory bound."""
+        while self._bytes > self.settings.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats.evictions += 1
+
+
+# Global result cache instance
+result_cache = ResultCache()
@@ -2,20 +2,76 @@
 Sanitization helpers for rhizome database models.
 
 This module provides utilities for sanitizing database records by replacing
-sensitive information with deterministic hashes.
+sensitive information with deterministic hashes. Models declare which fields
+to hash with `SanitizeUUID` metadata:
+
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
+
+The same UUIDs (billing entities, fee rates, ...) recur across thousands of
+rows, so hashes are memoized in a bounded LRU cache shared by all threads.
 """
 
 import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import overload
 
 import base58
+from pydantic import BaseModel
+
+# Distinct (uuid, length) pairs whose hashes are kept; each entry is a few hundred bytes
+HASH_CACHE_SIZE = 100_000
+
+_ALPHABET = base58.BITCOIN_ALPHABET.decode("ascii")
+# Every two-digit base58 string, indexed by its value
+_DIGIT_PAIRS = [first + second for first in _ALPHABET for second in _ALPHABET]
+# 58**10 still fits in a machine word, so each chunk is split with small-int arithmetic
+_CHUNK_DIGITS = 10
+_CHUNK = 58**_CHUNK_DIGITS
+
+
+@dataclass(frozen=True)
+class SanitizeUUID:
+    """Field metadata: sanitization replaces the value with a `length`-character hash of it."""
+
+    length: int
 
 
+class HashCacheStats(BaseModel):
+    """Counters of the UUID hash cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+def b58encode_digest(digest: bytes) -> str:
+    """
+    Base58-encode a digest, as `base58.b58encode(digest).decode()` does.
+
+    Converts the number ten digits at a time rather than one, and emits digits in pairs.
+    """
+    acc = int.from_bytes(digest, "big")
+    pairs: list[str] = []
+    while acc:
+        acc, chunk = divmod(acc, _CHUNK)
+        for _ in range(_CHUNK_DIGITS // 2):
+            chunk, pair = divmod(chunk, 58 * 58)
+            pairs.append(_DIGIT_PAIRS[pair])
+    # Leading zero digits come from chunk padding; leading zero bytes are encoded as "1" each
+    encoded = "".join(reversed(pairs)).lstrip(_ALPHABET[0])
+    zero_bytes = len(digest) - len(digest.lstrip(b"\0"))
+    return _ALPHABET[0] * zero_bytes + encoded
+
+
+@lru_cache(maxsize=HASH_CACHE_SIZE)
 def hash_uuid_to_base58(uuid_str: str, target_length: int) -> str:
     """
     Convert a UUID string to a deterministic base58 hash of the specified length.
 
     The output will be prefixed with "Hash" to clearly indicate it's not a real UUID.
+    Results are cached (see `hash_cache_stats`).
 
     Args:
         uuid_str: The UUID string to hash
@@ -28,7 +84,7 @@ def hash_uuid_to_base58(uuid_str: str, target_length: int) -> str:
     hash_bytes = hashlib.sha256(uuid_str.encode("utf-8")).digest()
 
     # Encode to base58
-    base58_hash = base58.b58encode(hash_bytes).decode("ascii")
+    base58_hash = b58encode_digest(hash_bytes)
 
     # Prefix with "Hash" to make it clear this is not a real UUID
     prefix = "Hash"
@@ -50,6 +106,12 @@ def hash_uuid_to_base58(uuid_str: str, target_length: int) -> str:
     return prefix + hash_portion
 
 
+def hash_cache_stats() -> HashCacheStats:
+    """Hit/miss counters and occupancy of the `hash_uuid_to_base58` cache."""
+    info = hash_uuid_to_base58.cache_info()
+    return HashCacheStats(hits=info.hits, misses=info.misses, size=info.currsize, max_size=info.maxsize or 0)
+
+
 @overload
 def sanitize_uuid_field(value: None, field_length: int) -> None: ...
 
@@ -78,3 +140,30 @@ def sanitize_uuid_field(value: str | bytes | None, field_length: int) -> str | N
         value = value.hex()
 
     return hash_uuid_to_base58(str(value), field_length)
+
+
+# Sanitized fields by model class, filled by `sanitized_fields`
+_sanitized_fields: dict[type[BaseModel], dict[str, int]] = {}
+
+
+def sanitized_fields(model_class: type[BaseModel]) -> dict[str, int]:
+    """
+    Find the fields of a model declared with `SanitizeUUID` metadata.
+
+    The result is worked out once per model class.
+
+    Args:
+        model_class: Model class to inspect
+
+    Returns:
+        Mapping of field name → length of its sanitized value, in field order
+    """
+    sanitized = _sanitized_fields.get(model_class)
+    if sanitized is None:
+        sanitized = {}
+        for name, field in model_class.model_fields.items():
+            marker = next((m for m in field.metadata if isinstance(m, SanitizeUUID)), None)
+            if marker is not None:
+                sanitized[name] = marker.length
+        _sanitized_fields[model_class] = sanitized
+    return sanitized
@@ -6,14 +6,148 @@ for transmission between client and server. Query execution happens on
 the server side, with queries serialized as SQL + parameters.
 """
 
+import datetime
+import decimal
 import enum
-from typing import Any, TypeVar, get_args, get_origin
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal, TypeVar, get_args, get_origin
 
+from pydantic_core import to_jsonable_python
+from sqlalchemy.sql.compiler import Compiled
+from sqlalchemy.util import LRUCache
 from sqlmodel import SQLModel
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
+from rhizome.bulk_sanitize import sanitize_columns, sanitize_plan, sanitize_serialized
+
 TModel = TypeVar("TModel", bound=SQLModel)
 
+# Compiled statements kept by serialize_query, by structural cache key. Applications build
+# a handful of statement shapes over and over with different values, so this stays small.
+STATEMENT_CACHE_SIZE = 500
+_statement_cache: LRUCache[Any, tuple[str, Compiled]] = LRUCache(STATEMENT_CACHE_SIZE)
+
+# "json": JSON-compatible values (datetimes, decimals as strings); "python": keep Python types
+DumpMode = Literal["json", "python"]
+
+
+def _to_bool(value: Any) -> Any:  # noqa: ANN401
+    """MySQL returns booleans as 0/1."""
+    return bool(value) if isinstance(value, int) else value
+
+
+def _to_datetime(value: Any) -> Any:  # noqa: ANN401
+    """JSON results carry datetimes as ISO strings."""
+    return datetime.datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_date(value: Any) -> Any:  # noqa: ANN401
+    """JSON results carry dates as ISO strings."""
+    return datetime.date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_decimal(value: Any) -> Any:  # noqa: ANN401
+    """JSON results carry Decimals as strings (and SQLite returns floats)."""
+    if isinstance(value, str | int | float) and not isinstance(value, bool):
+        try:
+            return decimal.Decimal(str(value))
+        except decimal.InvalidOperation:
+            return value
+    return value
+
+
+# Annotation → coercion of values that arrive as strings (looked up by exact type)
+_STRING_COERCIONS: dict[type, Callable[[Any], Any]] = {
+    datetime.datetime: _to_datetime,
+    datetime.date: _to_date,
+    decimal.Decimal: _to_decimal,
+}
+
+
+def _enum_coercion(enum_class: type[enum.Enum]) -> Callable[[Any], Any]:
+    def to_enum(value: Any) -> Any:  # noqa: ANN401
+        if not isinstance(value, str):
+            return value
+        try:
+            return enum_class(value)
+        except (ValueError, KeyError):
+            # If conversion fails, keep the original value
+            return value
+
+    return to_enum
+
+
+class TypeNormalizer:
+    """
+    Precompiled MySQL → Python type conversions for one model class.
+
+    Which fields need coercion (bool, Enum, and datetime/date/Decimal, which JSON
+    results carry as strings) depends only on the model's annotations, so it is
+    worked out once per class and reused for every row; other columns are passed
+    through untouched. Results therefore have the same field types whether they
+    arrived as JSON or as columnar MessagePack.
+    """
+
+    def __init__(self, model_class: type[SQLModel]) -> None:
+        # field name → coercion for its non-None values
+        self.coercions: dict[str, Callable[[Any], Any]] = {}
+
+        for name, field_info in model_class.model_fields.items():
+            annotation = field_info.annotation
+
+            # Handle Optional[T] by extracting T
+            if get_origin(annotation) is type(int | None):
+                args = get_args(annotation)
+                if args:
+                    # Get the non-None type
+                    annotation = next((arg for arg in args if arg is not type(None)), annotation)
+
+            if annotation is bool:
+                self.coercions[name] = _to_bool
+            elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+                self.coercions[name] = _enum_coercion(annotation)
+            elif annotation in _STRING_COERCIONS:
+                self.coercions[name] = _STRING_COERCIONS[annotation]
+
+    def normalize(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of a row dict with its values converted to the model's types."""
+        normalized = dict(data)
+        for key, coerce in self.coercions.items():
+            value = normalized.get(key)
+            if value is not None:
+                normalized[key] = coerce(value)
+        return normalized
+
+    def normalize_rows(self, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> list[dict[str, Any]]:
+        """Turn row tuples (in `columns` order) into row dicts with values converted to the model's types."""
+        # Only the columns that need coercion are visited per row
+        plan = [
+            (index, column, self.coercions[column]) for index, column in enumerate(columns) if column in self.coercions
+        ]
+
+        normalized: list[dict[str, Any]] = []
+        for row in rows:
+            data = dict(zip(columns, row, strict=True))
+            for index, column, coerce in plan:
+                value = row[index]
+                if value is not None:
+                    data[column] = coerce(value)
+            normalized.append(data)
+        return normalized
+
+
+# Type normalizers by model class, filled by `type_normalizer`
+_type_normalizers: dict[type[SQLModel], TypeNormalizer] = {}
+
+
+def type_normalizer(model_class: type[SQLModel]) -> TypeNormalizer:
+    """The type normalizer for a model class, compiled on first use."""
+    normalizer = _type_normalizers.get(model_class)
+    if normalizer is None:
+        # Compiling twice under a race is harmless: both normalizers are equivalent
+        normalizer = _type_normalizers[model_class] = TypeNormalizer(model_class)
+    return normalizer
+
 
 def _normalize_types(data: dict[str, Any], model_class: type[SQLModel]) -> dict[str, Any]:
     """
@@ -22,6 +156,7 @@ def _normalize_types(data: dict[str, Any], model_class: type[SQLModel]) -> dict[
     Handles common MySQL → Python type conversions:
     - int (0/1) → bool
     - str → Enum
+    - str → datetime, date, Decimal
 
     Args:
         data: Raw data dict from database
@@ -30,41 +165,7 @@ def _normalize_types(data: dict[str, Any], model_class: type[SQLModel]) -> dict[
     Returns:
         Normalized data dict with correct Python types
     """
-    normalized: dict[str, Any] = {}
-
-    # Get model field information
-    model_fields = model_class.model_fields
-
-    for key, value in data.items():
-        if value is None or key not in model_fields:
-            normalized[key] = value
-            continue
-
-        # Get the field's annotation
-        field_info = model_fields[key]
-        annotation = field_info.annotation
-
-        # Handle Optional[T] by extracting T
-        if get_origin(annotation) is type(int | None):
-            args = get_args(annotation)
-            if args:
-                # Get the non-None type
-                annotation = next((arg for arg in args if arg is not type(None)), annotation)
-
-        # Convert int (0/1) to bool
-        if annotation is bool and isinstance(value, int):
-            normalized[key] = bool(value)
-        # Convert str to Enum
-        elif isinstance(annotation, type) and issubclass(annotation, enum.Enum) and isinstance(value, str):
-            try:
-                normalized[key] = annotation(value)
-            except (ValueError, KeyError):
-                # If conversion fails, keep the original value
-                normalized[key] = value
-        else:
-            normalized[key] = value
-
-    return normalized
+    return type_normalizer(model_class).normalize(data)
 
 
 def serialize_query[TModel: SQLModel](query: SelectOfScalar[TModel]) -> tuple[str, dict[str, Any]]:
@@ -75,6 +176,9 @@ def serialize_query[TModel: SQLModel](query: SelectOfScalar[TModel]) -> tuple[st
     query object. The SQL string contains parameter placeholders (:param_name)
     and the parameters dict maps those names to values.
 
+    Compiled SQL is cached by the query's structural cache key, so repeating a
+    statement with different values only extracts the new parameters.
+
     Args:
         query: SQLModel select query to serialize
 
@@ -89,23 +193,36 @@ def serialize_query[TModel: SQLModel](query: SelectOfScalar[TModel]) -> tuple[st
         >>> print(sql)  # "SELECT ... FROM reseller WHERE reseller.name = :name_1"
         >>> print(params)  # {"name_1": "test"}
     """
-    # Compile query with parameter binding (not literal binds)
-    compiled = query.compile(compile_kwargs={"literal_binds": False})
-
-    # Extract SQL string and parameters
-    sql = str(compiled)
-    params = dict(compiled.params) if compiled.params else {}
-
-    return sql, params
-
-
-def serialize_result(result: SQLModel | None, sanitize: bool = True) -> dict[str, Any] | None:
+    # The structural cache key is the same for statements that differ only in their values.
+    # SQLAlchemy has no public accessor for it, but this is the method its own compiled cache
+    # (and the dogpile caching recipe in its docs) keys statements by, so it is stable in 2.x.
+    cache_key = query._generate_cache_key()  # pyright: ignore[reportPrivateUsage]
+    if cache_key is None:
+        # Not cacheable (constructs that opt out of caching): compile every time
+        compiled = query.compile(compile_kwargs={"literal_binds": False})
+        return str(compiled), dict(compiled.params) if compiled.params else {}
+
+    entry = _statement_cache.get(cache_key.key)
+    if entry is None:
+        # Compile query with parameter binding (not literal binds)
+        compiled = query.compile(compile_kwargs={"literal_binds": False}, cache_key=cache_key)
+        entry = (str(compiled), compiled)
+        _statement_cache[cache_key.key] = entry
+    sql, compiled = entry
+
+    # Take this query's values, in the cached statement's parameter names
+    params = compiled.construct_params(extracted_parameters=cache_key.bindparams)
+    return sql, dict(params) if params else {}
+
+
+def serialize_result(result: SQLModel | None, sanitize: bool = True, mode: DumpMode = "json") -> dict[str, Any] | None:
     """
     Serialize a single SQLModel result to JSON-compatible dict.
 
     Args:
         result: SQLModel instance or None
         sanitize: Whether to call .sanitize() if the method exists
+        mode: "python" keeps datetimes, decimals etc. as Python objects (for binary encodings)
 
     Returns:
         Dictionary with serialized data, or None if result is None
@@ -119,23 +236,19 @@ def serialize_result(result: SQLModel | None, sanitize: bool = True) -> dict[str
     if result is None:
         return None
 
-    # Apply sanitization if requested and available
-    sanitized_result: SQLModel = result
-    if sanitize and hasattr(result, "sanitize"):
-        sanitized_result = result.sanitize()  # type: ignore[attr-defined]
-
-    # Serialize to dict using Pydantic's JSON mode for proper datetime/UUID handling
-    # Type ignore needed because Pydantic's model_dump has complex overloads that include Unknown
-    return sanitized_result.model_dump(mode="json")  # type: ignore[return-value]
+    return serialize_result_list([result], sanitize=sanitize, mode=mode)[0]
 
 
-def serialize_result_list(results: list[SQLModel], sanitize: bool = True) -> list[dict[str, Any]]:
+def serialize_result_list(
+    results: Sequence[SQLModel], sanitize: bool = True, mode: DumpMode = "json"
+) -> list[dict[str, Any]]:
     """
     Serialize a list of SQLModel results to JSON-compatible dicts.
 
     Args:
-        results: List of SQLModel instances
+        results: SQLModel instances
         sanitize: Whether to call .sanitize() on each result if the method exists
+        mode: "python" keeps datetimes, decimals etc. as Python objects (for binary encodings)
 
     Returns:
         List of dictionaries with serialized data
@@ -145,6 +258,15 @@ def serialize_result_list(results: list[SQLModel], sanitize: bool = True) -> lis
         >>> data_list = serialize_result_list(resellers, sanitize=True)
         >>> len(data_list)  # 2
     """
+    # Hash the UUID columns of the whole batch at once when the model allows it
+    if sanitize and results and hasattr(results[0], "sanitize"):
+        model_class = type(results[0])
+        if sanitize_plan(model_class) is not None and all(type(result) is model_class for result in results):
+            # Type ignore needed because Pydantic's model_dump has complex overloads that include Unknown
+            serialized: list[dict[str, Any]] = [result.model_dump(mode=mode) for result in results]  # type: ignore[misc]
+            sanitize_serialized(results, serialized)
+            return serialized
+
     serialized_list: list[dict[str, Any]] = []
     for result in results:
         # Apply sanitization if requested and available
@@ -154,7 +276,7 @@ def serialize_result_list(results: list[SQLModel], sanitize: bool = True) -> lis
 
         # Serialize to dict
         # Type ignore needed because Pydantic's model_dump has complex overloads that include Unknown
-        serialized_list.append(sanitized_result.model_dump(mode="json"))  # type: ignore[arg-type]
+        serialized_list.append(sanitized_result.model_dump(mode=mode))  # type: ignore[arg-type]
 
     return serialized_list
 
@@ -163,7 +285,7 @@ def deserialize_result[TModel: SQLModel](data: dict[str, Any] | None, model_clas
     """
     Deserialize a dict back to a SQLModel instance.
 
-    Handles type coercion (int → bool, str → Enum) while supporting partial models
+    Handles type coercion (int → bool, str → Enum/datetime/date/Decimal) while supporting partial models
     by normalizing data types before using model_construct.
 
     Args:
@@ -197,7 +319,7 @@ def deserialize_result_list[TModel: SQLModel](
     """
     Deserialize a list of dicts back to SQLModel instances.
 
-    Handles type coercion (int → bool, str → Enum) while supporting partial models
+    Handles type coercion (int → bool, str → Enum/datetime/date/Decimal) while supporting partial models
     by normalizing data types before using model_construct.
 
     Args:
@@ -213,12 +335,116 @@ def deserialize_result_list[TModel: SQLModel](
         >>> resellers = deserialize_result_list(data_list, Reseller)
         >>> len(resellers)  # 2
     """
-    results: list[TModel] = []
-    for data in data_list:
-        # Normalize data types before constructing model
-        normalized_data = _normalize_types(data, model_class)
-        results.append(model_class.model_construct(**normalized_data))
-    return results
+    normalizer = type_normalizer(model_class)
+    construct = model_class.model_construct
+    # Normalize data types before constructing model
+    return [construct(**normalizer.normalize(data)) for data in data_list]
+
+
+def deserialize_rows[TModel: SQLModel](
+    columns: Sequence[str], rows: Iterable[Sequence[Any]], model_class: type[TModel]
+) -> list[TModel]:
+    """
+    Build SQLModel instances straight from database row tuples.
+
+    Same type coercion as `deserialize_result_list`, without first turning every row
+    into a dict keyed by column name.
+
+    Args:
+        columns: Column names, in the order values appear in each row
+        rows: Row tuples (e.g. SQLAlchemy Row objects)
+        model_class: The model class to instantiate
+
+    Returns:
+        List of SQLModel instances
+
+    Example:
+        >>> result = conn.execute(text("SELECT id, name FROM reseller"))
+        >>> resellers = deserialize_rows(list(result.keys()), result.fetchall(), Reseller)
+    """
+    construct = model_class.model_construct
+    return [construct(**data) for data in type_normalizer(model_class).normalize_rows(columns, rows)]
+
+
+def serialize_rows(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    model_class: type[SQLModel],
+    sanitize: bool = True,
+    mode: DumpMode = "json",
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """
+    Serialize database row tuples straight to dicts, keeping only the columns the query projected.
+
+    A query selecting a few columns of a wide model only pays for those columns: no
+    model instances are built, unselected fields aren't filled with their defaults and
+    dumped, and only selected columns are sanitized. Models that override `sanitize()`
+    still go through instances (and then have the unselected fields dropped).
+
+    Args:
+        columns: Column names, in the order values appear in each row
+        rows: Row tuples (e.g. SQLAlchemy Row objects)
+        model_class: The model class the rows belong to
+        sanitize: Whether to sanitize the rows as the model's `sanitize()` would
+        mode: "python" keeps datetimes, decimals etc. as Python objects (for binary encodings)
+
+    Returns:
+        The model fields the query projected (in result order), and one dict per row
+        holding just those fields
+
+    Example:
+        >>> result = conn.execute(text("SELECT id, uuid FROM reseller"))
+        >>> projection, data = serialize_rows(list(result.keys()), result.fetchall(), Reseller)
+        >>> projection  # ["id", "uuid"]
+    """
+    fields = model_class.model_fields
+    projection = [column for column in columns if column in fields]
+
+    plan: dict[str, int] | None = {}
+    if sanitize and hasattr(model_class, "sanitize"):
+        plan = sanitize_plan(model_class)
+    if plan is None:
+        # Custom sanitize(): it needs model instances
+        models = deserialize_rows(columns, rows, model_class)
+        serialized = serialize_result_list(models, sanitize=True, mode=mode)
+        return projection, [{column: row[column] for column in projection} for row in serialized]
+
+    if len(projection) < len(columns):
+        # Drop result columns that aren't model fields (extra labels)
+        indexes = [list(columns).index(column) for column in projection]
+        rows = ([row[index] for index in indexes] for row in rows)
+    normalized = type_normalizer(model_class).normalize_rows(projection, rows)
+    sanitize_columns(normalized, plan)
+    if mode == "json":
+        return projection, to_jsonable_python(normalized)
+    return projection, normalized
+
+
+def get_model_class[TModel: SQLModel](query: SelectOfScalar[TModel]) -> type[TModel]:
+    """
+    Extract the model class a query selects.
+
+    Args:
+        query: SQLModel select query
+
+    Returns:
+        The model class
+
+    Raises:
+        ValueError: If the query doesn't select a model
+
+    Example:
+        >>> from sqlmodel import select
+        >>> from rhizome.models.meta.reseller import Reseller
+        >>> get_model_class(select(Reseller))  # Reseller
+    """
+    # SQLModel queries have column_descriptions that tell us the entity
+    if hasattr(query, "column_descriptions") and query.column_descriptions:
+        entity = query.column_descriptions[0]["entity"]
+        if entity:
+            return entity
+
+    raise ValueError("Could not extract model class from query")
 
 
 def get_model_info[TModel: SQLModel](query: SelectOfScalar[TModel]) -> dict[str, str]:
@@ -242,17 +468,11 @@ def get_model_info[TModel: SQLModel](query: SelectOfScalar[TModel]) -> dict[str,
         >>> info["model_class"]  # "Reseller"
         >>> info["model_module"]  # "rhizome.models.meta.reseller"
     """
-    # Get the model class from the query
-    # SQLModel queries have column_descriptions that tell us the entity
-    if hasattr(query, "column_descriptions") and query.column_descriptions:
-        entity = query.column_descriptions[0]["entity"]
-        if entity:
-            return {
-                "model_class": entity.__name__,
-                "model_module": entity.__module__,
-            }
-
-    raise ValueError("Could not extract model class from query")
+    entity = get_model_class(query)
+    return {
+        "model_class": entity.__name__,
+        "model_module": entity.__module__,
+    }
 
 
 def import_model_class(model_module: str, model_class: str) -> type[SQLModel]:
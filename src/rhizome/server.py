@@ -1,30 +1,63 @@
 import asyncio
 import json
-from collections.abc import AsyncGenerator
+import socket
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Header
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
+from rhizome.cluster import ClusterConnectionsResponse, ClusterKey, cluster_connections
+from rhizome.credentials import (
+    CachingOnePasswordTool,
+    CachingPybritiveTool,
+    CredentialCacheResponse,
+    CredentialCacheSettings,
+    CredentialKey,
+    credential_cache,
+    is_auth_error,
+)
+from rhizome.engines import EngineListResponse, PoolSettings, engine_registry, is_connection_error
 from rhizome.logging import setup_logging
-from rhizome.portforward import start_portforward
+from rhizome.model_registry import ModelListResponse, model_registry
+from rhizome.portforward import (
+    SharedPortForward,
+    SharedPortForwardsResponse,
+    shared_port_forwards,
+    start_portforward,
+)
 from rhizome.proc import NewProcessResponse, ProcessListResponse, process_manager
+from rhizome.result_cache import ResultCacheResponse, ResultCacheSettings, referenced_tables, result_cache
+from rhizome.sanitize_helpers import HashCacheStats, hash_cache_stats, hash_uuid_to_base58
 from rhizome.server_models import (
     DatabaseConnectionLog,
+    ExecuteBatchRequest,
+    ExecuteBatchResponse,
     ExecuteQueryRequest,
     ExecuteQueryResponse,
     GetMode,
+    QueryLogBatch,
+    QueryLogBatchResponse,
+    QueryStreamChunk,
     SqlQueryLog,
     SqlQueryResultLog,
 )
 from rhizome.sleeper import start_sleeper
+from rhizome.tunnel_registry import tunnel_registry
+from rhizome.tunnels import Tunnel, TunnelListResponse, tunnel_manager
+from rhizome.warmup import WarmRequest, WarmupResponse, WarmupStep, warmup_tracker
 from trifolium.config import Home
 
 if TYPE_CHECKING:
+    from sqlalchemy import TextClause
+
+    from rhizome.serialization import DumpMode
     from rhizome.tools import GcloudTool, KubectlTool, LsofTool, OnePasswordTool, PybritiveTool
 
 
@@ -80,26 +113,57 @@ logger = structlog.get_logger()
 # Global variable to store the home instance for cleanup
 _home: Home | None = None
 
-# Global mapping of database_id → local_port for active port forwards
-_active_port_forwards: dict[str, int] = {}
+# Global mapping of database_id → credential cache keys used to build its connection
+_credential_keys: dict[str, list[CredentialKey]] = {}
+
+# Databases to warm up at startup (rhizome serve --warm)
+_warm_on_startup: list[str] = []
+
+# Whether shared port-forwards outlive the server, for the next one to adopt (rhizome serve --keep-tunnels)
+_keep_tunnels = False
+
+# Local ports picked by port forwards still being set up
+_reserved_ports: set[int] = set()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Handle app startup and shutdown."""
-    # Startup
+    # Startup: watch port forwards, dropping pooled connections through tunnels that die
+    supervisor = asyncio.create_task(tunnel_manager.supervise(on_dead=engine_registry.invalidate))
+    # Register the environments' models in the background; queries arriving before that's
+    # done register their model on first use
+    registering = asyncio.create_task(asyncio.to_thread(model_registry.register_environments))
+    # Take over tunnels a previous server left running, so that they aren't set up again
+    await _adopt_tunnels()
+    if _warm_on_startup:
+        warmup_tracker.start(_warm_on_startup, _warm)
     yield
     # Shutdown
     logger.info("Shutting down server, cleaning up processes")
+    supervisor.cancel()
+    registering.cancel()
+    warmup_tracker.cancel()
+
+    if _keep_tunnels:
+        # Leave shared port-forwards running for the next server to adopt (they're recorded in the tunnel registry)
+        shared_port_forwards.detach()
+    else:
+        # Including the ones adopted from a previous server, which the process manager doesn't know about
+        shared_port_forwards.stop()
 
     # Clean up all processes and tasks
     await process_manager.cleanup()
 
-    # Clean up port file
+    # Close pooled database connections
+    await engine_registry.dispose_all()
+
+    # Clean up port and socket files
     if _home is not None:
         port_file = _home.state / "rhizome_port"
         if port_file.exists():
             port_file.unlink()
+        _home.socket_path.unlink(missing_ok=True)
 
 
 app = FastAPI(lifespan=lifespan)
@@ -198,6 +262,133 @@ def ps() -> ProcessListResponse:
     return process_manager.list_processes()
 
 
+@app.get("/engines")
+def engines() -> EngineListResponse:
+    """List pooled database engines and their connection usage."""
+    return engine_registry.list_engines()
+
+
+@app.post("/engines/settings")
+async def configure_engines(settings: PoolSettings) -> EngineListResponse:
+    """Update connection pool settings. Existing engines are rebuilt on next use."""
+    await engine_registry.configure(settings)
+    return engine_registry.list_engines()
+
+
+@app.delete("/engines/{database_id}")
+async def invalidate_engine(database_id: str) -> dict[str, bool]:
+    """Drop the pooled engine for a database."""
+    return {"invalidated": await engine_registry.invalidate(database_id)}
+
+
+@app.get("/tunnels")
+def tunnels() -> TunnelListResponse:
+    """List port forwards to databases, in-flight establishments and establishment metrics."""
+    return tunnel_manager.list_tunnels()
+
+
+@app.get("/portforwards")
+def portforwards() -> SharedPortForwardsResponse:
+    """List shared port-forwards and the database each forwarded proxy port belongs to."""
+    return shared_port_forwards.describe()
+
+
+@app.delete("/portforwards")
+async def stop_portforwards() -> SharedPortForwardsResponse:
+    """Stop every shared port-forward (adopted ones included); the next query sets its tunnel up again."""
+    for database_id in shared_port_forwards.stop():
+        tunnel_manager.forget(database_id)
+        await engine_registry.invalidate(database_id)
+    return shared_port_forwards.describe()
+
+
+@app.get("/warm")
+def warm_status() -> WarmupResponse:
+    """Report the progress of database warm-ups."""
+    return warmup_tracker.describe()
+
+
+@app.post("/warm")
+async def warm(request: WarmRequest) -> WarmupResponse:
+    """Warm up databases in the background: tunnels, secrets and pooled connections."""
+    task = warmup_tracker.start(request.database_ids, _warm)
+    if request.wait:
+        await asyncio.shield(task)
+    return warmup_tracker.describe()
+
+
+@app.get("/clusters")
+def clusters() -> ClusterConnectionsResponse:
+    """Describe cached cluster connections."""
+    return cluster_connections.describe()
+
+
+@app.delete("/clusters")
+def clear_clusters() -> ClusterConnectionsResponse:
+    """Forget cached cluster connections, so tunnels reconnect to their cluster."""
+    cluster_connections.clear()
+    return cluster_connections.describe()
+
+
+@app.get("/credentials")
+def credentials() -> CredentialCacheResponse:
+    """List cached credentials (without their secrets) and cache counters."""
+    return credential_cache.describe()
+
+
+@app.post("/credentials/settings")
+def configure_credentials(settings: CredentialCacheSettings) -> CredentialCacheResponse:
+    """Update credential TTL and lease settings."""
+    credential_cache.configure(settings)
+    return credential_cache.describe()
+
+
+@app.delete("/credentials")
+def clear_credentials() -> CredentialCacheResponse:
+    """Drop all cached credentials so they are refetched on next use."""
+    credential_cache.clear()
+    return credential_cache.describe()
+
+
+@app.get("/models")
+def models() -> ModelListResponse:
+    """List registered model classes with their model ids and serialization metadata."""
+    return model_registry.describe()
+
+
+@app.get("/result_cache")
+def result_cache_status() -> ResultCacheResponse:
+    """Report the query result cache's settings, size and counters."""
+    return result_cache.describe()
+
+
+@app.post("/result_cache/settings")
+def configure_result_cache(settings: ResultCacheSettings) -> ResultCacheResponse:
+    """Enable, disable or tune the query result cache."""
+    result_cache.configure(settings)
+    return result_cache.describe()
+
+
+@app.delete("/result_cache")
+def clear_result_cache() -> ResultCacheResponse:
+    """Drop every cached query result."""
+    result_cache.clear()
+    return result_cache.describe()
+
+
+@app.get("/sanitize/cache")
+def sanitize_cache() -> HashCacheStats:
+    """Hit/miss counters of the UUID hash cache used for sanitization."""
+    return hash_cache_stats()
+
+
+@app.delete("/sanitize/cache")
+def clear_sanitize_cache() -> HashCacheStats:
+    """Empty the UUID hash cache and reset its counters."""
+    hash_uuid_to_base58.cache_clear()
+    return hash_cache_stats()
+
+
 class _ServerTools:
     """Server-side tools implementation with real external tool access."""
 
@@ -215,9 +406,16 @@ class _ServerTools:
             PybritiveTool,
         )
 
-        # Use real external tools for all operations
-        self._onepassword: OnePasswordTool = ExternalOnePasswordTool()
-        self._pybritive: PybritiveTool = ExternalPybritiveTool()
+        # Credential keys resolved through these tools, so they can be evicted if the database rejects them
+        self.credential_keys: list[CredentialKey] = []
+
+        # Use real external tools for all operations, serving secrets from the credential cache
+        self._onepassword: OnePasswordTool = CachingOnePasswordTool(
+            ExternalOnePasswordTool(), credential_cache, self.credential_keys
+        )
+        self._pybritive: PybritiveTool = CachingPybritiveTool(
+            ExternalPybritiveTool(), credential_cache, self.credential_keys
+        )
         self._kubectl: KubectlTool = ExternalKubectlTool()
         self._gcloud: GcloudTool = ExternalGcloudTool()
         self._lsof: LsofTool = ExternalLsofTool()
@@ -261,6 +459,8 @@ async def _ensure_port_forward(database_id: str, port_forward_config: Any) -> in
     """
     Ensure port forward exists for the given database, reusing if already active.
 
+    Concurrent callers for a database without a port forward share a single establishment.
+
     Args:
         database_id: Database identifier for tracking
         port_forward_config: PortForwardConfig with kubectl details
@@ -271,19 +471,29 @@ async def _ensure_port_forward(database_id: str, port_forward_config: Any) -> in
     Raises:
         RuntimeError: If port forward setup fails
     """
-    from rhizome.cluster import connect_cluster
-    from rhizome.portforward import cloudsql_port_forward
+    tunnel = await tunnel_manager.ensure(database_id, lambda: _establish_port_forward(database_id, port_forward_config))
+    return tunnel.local_port
 
-    # Check if we already have an active port forward for this database
-    if database_id in _active_port_forwards:
-        local_port = _active_port_forwards[database_id]
-        logger.info("Reusing existing port forward", database_id=database_id, local_port=local_port)
-        return local_port
 
-    # Find an unused port
-    import socket
+async def _establish_port_forward(database_id: str, port_forward_config: Any) -> Tunnel:  # noqa: ANN401
+    """
+    Set up a new port forward for the given database.
+
+    Args:
+        database_id: Database identifier for tracking
+        port_forward_config: PortForwardConfig with kubectl details
 
+    Returns:
+        The established tunnel
+
+    Raises:
+        RuntimeError: If port forward setup fails
+    """
+    # Find an unused port (skipping shared port-forwards' ports, which are free while their process starts)
+    held = shared_port_forwards.local_ports() | _reserved_ports
     for port in range(30000, 31000):
+        if port in held:
+            continue
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.bind(("127.0.0.1", port))
@@ -294,6 +504,21 @@ async def _ensure_port_forward(database_id: str, port_forward_config: Any) -> in
     else:
         raise RuntimeError("No unused ports available in range 30000-31000")
 
+    # Nothing listens on it until the shared port-forward starts, so keep concurrent setups off it
+    _reserved_ports.add(local_port)
+    try:
+        return await _forward_local_port(database_id, port_forward_config, local_port)
+    finally:
+        _reserved_ports.discard(local_port)
+
+
+async def _forward_local_port(database_id: str, port_forward_config: Any, local_port: int) -> Tunnel:  # noqa: ANN401
+    """Forward a local port to a database's CloudSQL proxy, through its deployment's shared port-forward."""
+    import time
+
+    from rhizome.cluster import connect_cluster
+    from rhizome.portforward import cloudsql_port_forward
+
     logger.info(
         "Setting up new port forward",
         database_id=database_id,
@@ -302,31 +527,54 @@ async def _ensure_port_forward(database_id: str, port_forward_config: Any) -> in
         sql_connection=port_forward_config.sql_connection,
     )
 
-    # Connect to the cluster
+    # Connect to the cluster (reusing a cached connection if it is still fresh)
     server_tools = _ServerTools()
-    await connect_cluster(
-        project=port_forward_config.project,
-        cluster=port_forward_config.cluster,
-        region=port_forward_config.region,
-        server=port_forward_config.server,
-        tools=server_tools,
+    cluster = (
+        port_forward_config.project,
+        port_forward_config.cluster,
+        port_forward_config.region,
+        port_forward_config.server,
     )
+    await connect_cluster(*cluster, tools=server_tools)
 
-    # Start CloudSQL port forward
-    await cloudsql_port_forward(
-        kube_context=port_forward_config.kube_context,
-        kube_namespace=port_forward_config.kube_namespace,
-        kube_deployment=port_forward_config.kube_deployment,
-        sql_connection=port_forward_config.sql_connection,
+    # Start CloudSQL port forward, through the single kubectl port-forward shared by the deployment's databases
+    try:
+        await cloudsql_port_forward(
+            kube_context=port_forward_config.kube_context,
+            kube_namespace=port_forward_config.kube_namespace,
+            kube_deployment=port_forward_config.kube_deployment,
+            sql_connection=port_forward_config.sql_connection,
+            local_port=local_port,
+            tools=server_tools,
+            share_as=database_id,
+        )
+    except Exception:
+        # The cluster connection may be what's broken, so the next attempt reconnects
+        cluster_connections.evict(cluster)
+        raise
+
+    shared = shared_port_forwards.get(
+        port_forward_config.kube_context, port_forward_config.kube_namespace, port_forward_config.kube_deployment
+    )
+    return _shared_tunnel(database_id, local_port, time.time(), shared)
+
+
+def _shared_tunnel(database_id: str, local_port: int, established_at: float, shared: SharedPortForward) -> Tunnel:
+    """A tunnel whose port is forwarded by a shared port-forward, and released from it when the tunnel dies."""
+    return Tunnel(
+        database_id=database_id,
         local_port=local_port,
-        tools=server_tools,
+        pid=None,
+        established_at=established_at,
+        release=lambda: shared.remove(database_id),
     )
 
-    # Track this port forward
-    _active_port_forwards[database_id] = local_port
-    logger.info("Port forward established", database_id=database_id, local_port=local_port)
 
-    return local_port
+async def _adopt_tunnels() -> None:
+    """Adopt the tunnels a previous server left running, if they still work."""
+    for tunnel in await shared_port_forwards.adopt():
+        shared = shared_port_forwards.get(tunnel.kube_context, tunnel.kube_namespace, tunnel.kube_deployment)
+        tunnel_manager.adopt(_shared_tunnel(tunnel.database_id, tunnel.local_port, tunnel.established_at, shared))
 
 
 def _get_database_config(database_id: str) -> Any:  # noqa: ANN401
@@ -360,7 +608,9 @@ def _get_database_config(database_id: str) -> Any:  # noqa: ANN401
 
     # Call the class method directly with server tools
     server_tools = _ServerTools()
-    return env_class.get_database_config(server_tools)
+    db_config = env_class.get_database_config(server_tools)
+    _credential_keys[database_id] = server_tools.credential_keys
+    return db_config
 
 
 def _get_database_config_rw(database_id: str) -> Any:  # noqa: ANN401
@@ -492,6 +742,9 @@ def write_query(request: WriteQueryRequest) -> WriteQueryResponse:
             connection.commit()
             rows_affected = result.rowcount
 
+        # Cached results reading the written tables are stale now
+        result_cache.invalidate(request.database_id, referenced_tables(query.sql))
+
         console.print(f"[green]✓ Query executed successfully. Rows affected: {rows_affected}[/green]")
         console.print()
 
@@ -504,78 +757,133 @@ def write_query(request: WriteQueryRequest) -> WriteQueryResponse:
         return WriteQueryResponse(approved=False, executed=False, error=error_msg)
 
 
-def _execute_query_first(
-    session: Any,  # noqa: ANN401
+async def _run_query(
+    engine: Any,  # noqa: ANN401
     request: ExecuteQueryRequest,
     model_class: type[Any],  # noqa: ANN401
+    dump_mode: "DumpMode" = "json",
 ) -> ExecuteQueryResponse:
-    """Execute query and return first result or None."""
-    import sqlalchemy
-
-    from rhizome.serialization import deserialize_result, serialize_result
+    """
+    Execute a query on a pooled async engine and build the response.
 
-    # Use execute() for raw SQL (exec() is for ORM queries)
-    result_proxy = session.execute(sqlalchemy.text(request.sql), request.parameters)  # type: ignore[call-overload]
-    row = result_proxy.first()
+    Database I/O is awaited on the server loop. Turning rows into sanitized, serialized
+    models is CPU-bound, so it runs in a worker thread to keep the loop responsive.
 
-    if row is None:
-        return ExecuteQueryResponse(success=True, result=None, row_count=0)
+    `dump_mode="python"` keeps result values as Python objects, for the columnar encoding.
+    """
+    error = _unsupported_mode_error(request)
+    if error is not None:
+        return error
 
-    # Convert row to dict then to model instance
-    # Type ignore: row._mapping is a private SQLAlchemy API with incomplete typing
-    row_dict: dict[str, Any] = dict(row._mapping)  # type: ignore[attr-defined, var-annotated]
-    result = deserialize_result(row_dict, model_class)  # type: ignore[arg-type]
+    async with engine.connect() as conn:
+        columns, rows = await _fetch_rows(conn, request)
 
-    # Serialize result (handles sanitization)
-    serialized = serialize_result(result, sanitize=request.sanitize)
-    return ExecuteQueryResponse(success=True, result=serialized, row_count=1)
+    return await asyncio.to_thread(_ROW_BUILDERS[request.mode], columns, rows, request, model_class, dump_mode)
 
 
-def _execute_query_all(
-    session: Any,  # noqa: ANN401
+async def _run_query_on_connection(
+    conn: Any,  # noqa: ANN401
     request: ExecuteQueryRequest,
     model_class: type[Any],  # noqa: ANN401
 ) -> ExecuteQueryResponse:
-    """Execute query and return all results."""
+    """Like `_run_query`, but on a connection the caller has already checked out (and keeps)."""
+    error = _unsupported_mode_error(request)
+    if error is not None:
+        return error
+
+    columns, rows = await _fetch_rows(conn, request)
+    return await asyncio.to_thread(_ROW_BUILDERS[request.mode], columns, rows, request, model_class)
+
+
+def _unsupported_mode_error(request: ExecuteQueryRequest) -> ExecuteQueryResponse | None:
+    """Error response for modes that can't be answered with a single ExecuteQueryResponse."""
+    if request.mode == GetMode.STREAM:
+        return ExecuteQueryResponse(success=False, result=None, error="STREAM mode requires /execute_query_stream")
+    if request.mode not in _ROW_BUILDERS:
+        return ExecuteQueryResponse(success=False, result=None, error=f"Unknown query mode: {request.mode}")
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _text_clause(sql: str) -> "TextClause":
+    """
+    The executable statement for a query's SQL, reused across requests.
+
+    Clients send the same few statement texts over and over, so the bind-parameter parsing
+    in `text()` runs once per text, and the engines' compiled caches always see the same
+    statement object.
+    """
     import sqlalchemy
-    from sqlmodel import SQLModel
 
-    from rhizome.serialization import deserialize_result, serialize_result_list
+    return sqlalchemy.text(sql)
 
+
+async def _fetch_rows(conn: Any, request: ExecuteQueryRequest) -> tuple[list[str], Sequence[Any]]:  # noqa: ANN401
+    """Execute a query's SQL and fetch its column names and as many rows as its mode needs."""
     # Use execute() for raw SQL (exec() is for ORM queries)
-    result_proxy = session.execute(sqlalchemy.text(request.sql), request.parameters)  # type: ignore[call-overload]
-    rows = result_proxy.fetchall()
+    result_proxy = await conn.execute(_text_clause(request.sql), request.parameters)
+    columns = list(result_proxy.keys())
+    if request.mode == GetMode.FIRST:
+        row = result_proxy.first()
+        return columns, [row] if row is not None else []
+    return columns, result_proxy.fetchall()
 
-    if not rows:
-        return ExecuteQueryResponse(success=True, result=[], row_count=0)
 
-    # Convert rows to model instances
-    model_results: list[SQLModel] = []
-    for row in rows:
-        # Type ignore: row._mapping is a private SQLAlchemy API with incomplete typing
-        row_dict: dict[str, Any] = dict(row._mapping)  # type: ignore[attr-defined, var-annotated]
-        deserialized = deserialize_result(row_dict, model_class)  # type: ignore[arg-type]
-        if deserialized is not None:
-            model_results.append(deserialized)
+def _execute_query_first(
+    columns: list[str],
+    rows: Sequence[Any],
+    request: ExecuteQueryRequest,
+    model_class: type[Any],  # noqa: ANN401
+    dump_mode: "DumpMode" = "json",
+) -> ExecuteQueryResponse:
+    """Build the response for the first result or None."""
+    from rhizome.serialization import serialize_rows
 
-    # Serialize results
-    serialized = serialize_result_list(model_results, sanitize=request.sanitize)
-    return ExecuteQueryResponse(success=True, result=serialized, row_count=len(serialized))
+    # Only the projected columns are sanitized and serialized
+    projection, serialized = serialize_rows(columns, rows, model_class, sanitize=request.sanitize, mode=dump_mode)
+    if not serialized:
+        return ExecuteQueryResponse(success=True, result=None, row_count=0, columns=projection)
+    return ExecuteQueryResponse(success=True, result=serialized[0], row_count=1, columns=projection)
 
 
-def _execute_query_one(
-    session: Any,  # noqa: ANN401
+def _execute_query_all(
+    columns: list[str],
+    rows: Sequence[Any],
     request: ExecuteQueryRequest,
     model_class: type[Any],  # noqa: ANN401
+    dump_mode: "DumpMode" = "json",
 ) -> ExecuteQueryResponse:
-    """Execute query and return exactly one result (error if 0 or >1)."""
-    import sqlalchemy
+    """Build the response for all results."""
+    from pydantic_core import to_jsonable_python
 
-    from rhizome.serialization import deserialize_result, serialize_result
+    from rhizome.serialization import serialize_rows
 
-    # Use execute() for raw SQL (exec() is for ORM queries)
-    result_proxy = session.execute(sqlalchemy.text(request.sql), request.parameters)  # type: ignore[call-overload]
-    rows = result_proxy.fetchall()
+    # Only the projected columns are sanitized and serialized
+    projection, serialized = serialize_rows(columns, rows, model_class, sanitize=request.sanitize, mode=dump_mode)
+
+    # Keyset pagination needs the real key of the last row, which sanitization may have altered
+    last_key: list[Any] | None = None
+    if request.keyset_columns and rows:
+        key = [rows[-1]._mapping[column] for column in request.keyset_columns]
+        if any(isinstance(value, bytes | bytearray | memoryview) for value in key):
+            # JSON would turn them into text, which doesn't compare like the binary column
+            raise ValueError(f"Keyset columns {request.keyset_columns} must not be binary")
+        last_key = to_jsonable_python(key)
+
+    return ExecuteQueryResponse(
+        success=True, result=serialized, row_count=len(serialized), last_key=last_key, columns=projection
+    )
+
+
+def _execute_query_one(
+    columns: list[str],
+    rows: Sequence[Any],
+    request: ExecuteQueryRequest,
+    model_class: type[Any],  # noqa: ANN401
+    dump_mode: "DumpMode" = "json",
+) -> ExecuteQueryResponse:
+    """Build the response for exactly one result (error if 0 or >1)."""
+    from rhizome.serialization import serialize_rows
 
     if len(rows) == 0:
         return ExecuteQueryResponse(
@@ -590,21 +898,244 @@ def _execute_query_one(
             error=f"Query returned {len(rows)} results (expected exactly one)",
         )
 
-    # Exactly one result
-    # Type ignore: row._mapping is a private SQLAlchemy API with incomplete typing
-    row_dict: dict[str, Any] = dict(rows[0]._mapping)  # type: ignore[attr-defined, var-annotated]
-    result = deserialize_result(row_dict, model_class)  # type: ignore[arg-type]
+    # Exactly one result; only the projected columns are sanitized and serialized
+    projection, serialized = serialize_rows(columns, rows, model_class, sanitize=request.sanitize, mode=dump_mode)
+    return ExecuteQueryResponse(success=True, result=serialized[0], row_count=1, columns=projection)
+
+
+# Turn fetched rows into a response, per query mode (run in a worker thread)
+_ROW_BUILDERS = {
+    GetMode.FIRST: _execute_query_first,
+    GetMode.ALL: _execute_query_all,
+    GetMode.ONE: _execute_query_one,
+}
+
+
+async def _prepare_query(request: ExecuteQueryRequest, query_id: str) -> tuple[Any, type[Any]]:
+    """
+    Get everything needed to run a query: the pooled engine for the database and the model class.
+
+    Looks up the environment, resolves credentials, sets up port forwarding if needed
+    (lazy, reuses existing) and logs the query.
+
+    Args:
+        request: Query execution request with SQL, parameters, model info
+        query_id: Identifier used to correlate log lines for this query
+
+    Returns:
+        Tuple of (async engine, model class)
+
+    Raises:
+        ValueError: If the database is unknown
+    """
+    engine, connection_string = await _connect_database(request.database_id)
+    _log_query(request, query_id, connection_string)
+
+    # Look up the model class for result deserialization
+    model_class = _request_model_class(request)
+    return engine, model_class
+
+
+def _log_query(request: ExecuteQueryRequest, query_id: str, connection_string: str) -> None:
+    """Log a query about to run, printing its statement to stderr for readability."""
+    import sys
+    import textwrap
+
+    logger.info(
+        "SQL query",
+        query_id=query_id,
+        database=request.database_id,
+        connection_string=connection_string,
+        parameters=request.parameters if request.parameters else None,
+    )
+    indented_statement = textwrap.indent(request.sql, "    ")
+    print(f"  Statement:\n{indented_statement}", file=sys.stderr)
+
+
+def _environment_class(database_id: str) -> Any:  # noqa: ANN401
+    """
+    Look up the environment class of a database.
+
+    Raises:
+        ValueError: If the database is unknown
+    """
+    from rhizome.environments.environment_list import RhizomeEnvironment, environment_type
+
+    try:
+        env_enum = RhizomeEnvironment(database_id)
+    except ValueError:
+        raise ValueError(f"Unknown database: {database_id}") from None
+
+    env_class = environment_type.get(env_enum)
+    if not env_class:
+        raise ValueError(f"Unknown database: {database_id}")
+    return env_class
+
+
+async def _connect_database(database_id: str) -> tuple[Any, str]:
+    """
+    Get the pooled engine for a database, setting up its port forward (lazy, reuses existing) if needed.
+
+    Args:
+        database_id: Database identifier (RhizomeEnvironment enum value, e.g., "dev_meta")
+
+    Returns:
+        Tuple of (async engine, connection string)
+
+    Raises:
+        ValueError: If the database is unknown
+    """
+    from urllib.parse import quote_plus
+
+    # Check if this environment needs port forwarding
+    port_forward_config = _environment_class(database_id).get_port_forward_config()
+
+    # Get database config (environments resolve secrets synchronously, so keep that off the loop)
+    if port_forward_config is None:
+        db_config = await asyncio.to_thread(_get_database_config, database_id)
+    else:
+        # Fetch the secret while the port forward comes up, then point the config at its local port
+        db_config, local_port = await asyncio.gather(
+            asyncio.to_thread(_get_database_config, database_id),
+            _ensure_port_forward(database_id, port_forward_config),
+        )
+        db_config.port = local_port
+
+    # Build connection string
+    encoded_password = quote_plus(db_config.password)
+    connection_string = (
+        f"mysql+aiomysql://{db_config.username}:{encoded_password}"
+        f"@{db_config.host}:{db_config.port}/{db_config.database}"
+    )
+
+    # Reuse the pooled engine for this database (rebuilt if connection details changed)
+    engine = await engine_registry.get_engine(database_id, connection_string)
+    return engine, connection_string
+
+
+async def _warm(database_ids: list[str]) -> None:
+    """
+    Connect each cluster once, then ready every database's tunnel, secret and pooled connection concurrently.
+
+    Progress and per-database failures are reported to the warm-up tracker.
+    """
+    # Group the databases by the cluster their port forward goes through
+    clusters: dict[ClusterKey, list[str]] = {}
+    direct: list[str] = []
+    for database_id in database_ids:
+        try:
+            config = _environment_class(database_id).get_port_forward_config()
+        except ValueError as e:
+            warmup_tracker.update(database_id, WarmupStep.FAILED, error=str(e))
+            continue
+        if config is None:
+            direct.append(database_id)
+        else:
+            clusters.setdefault((config.project, config.cluster, config.region, config.server), []).append(database_id)
+
+    await asyncio.gather(
+        *(_warm_cluster(cluster, cluster_database_ids) for cluster, cluster_database_ids in clusters.items()),
+        *(_warm_database(database_id) for database_id in direct),
+    )
+
+
+async def _warm_cluster(cluster: ClusterKey, database_ids: list[str]) -> None:
+    """Connect to a cluster, then warm up the databases behind it (whose tunnels reuse the connection)."""
+    from rhizome.cluster import connect_cluster
+
+    # Databases with an established tunnel don't need the cluster
+    if any(tunnel_manager.get(database_id) is None for database_id in database_ids):
+        for database_id in database_ids:
+            warmup_tracker.update(database_id, WarmupStep.CONNECTING_CLUSTER)
+        try:
+            await connect_cluster(*cluster, tools=_ServerTools())
+        except Exception as e:
+            for database_id in database_ids:
+                warmup_tracker.update(database_id, WarmupStep.FAILED, error=f"{type(e).__name__}: {e}")
+            return
+
+    await asyncio.gather(*(_warm_database(database_id) for database_id in database_ids))
+
 
-    # Serialize result
-    serialized = serialize_result(result, sanitize=request.sanitize)
-    return ExecuteQueryResponse(success=True, result=serialized, row_count=1)
+async def _warm_database(database_id: str) -> None:
+    """Set up a database's tunnel, secret and pooled engine, and open its first connection."""
+    warmup_tracker.update(database_id, WarmupStep.CONNECTING)
+    try:
+        engine, _ = await _connect_database(database_id)
+        # Open a connection, which goes back to the pool for the first query
+        async with engine.connect():
+            pass
+    except Exception as e:
+        warmup_tracker.update(database_id, WarmupStep.FAILED, error=f"{type(e).__name__}: {e}")
+    else:
+        warmup_tracker.update(database_id, WarmupStep.READY)
 
 
-@app.post("/execute_query")
-def execute_query(request: ExecuteQueryRequest) -> ExecuteQueryResponse:
+def _request_model_class(request: ExecuteQueryRequest) -> type[Any]:
+    """
+    Resolve the model class a query's results are built from.
+
+    Raises:
+        ValueError: If the request names no model
+    """
+    from rhizome.model_registry import model_registry
+    from rhizome.serialization import import_model_class
+
+    if request.model_id is not None:
+        return model_registry.resolve(request.model_id).model_class
+    if request.model_module is None or request.model_class is None:
+        raise ValueError("Query names no model: set model_id (or model_module and model_class)")
+    return model_registry.register(import_model_class(request.model_module, request.model_class)).model_class
+
+
+async def _handle_query_error(request: ExecuteQueryRequest, query_id: str, error: Exception, start_time: float) -> str:
+    """
+    Recover from a failed query and log it.
+
+    Dead connections invalidate the pooled engine and the database's own port
+    forward (a shared one carries other databases, so it is left to the health
+    checks); rejected credentials are evicted from the cache. Either way the next
+    query starts fresh.
+
+    Returns:
+        Error message for the response
+    """
+    import time
+
+    error_msg = f"{type(error).__name__}: {error}"
+    if is_connection_error(error):
+        # The connection (or the tunnel beneath it) is dead: drop the pool, and the
+        # port-forward unless other databases share it, so the next query rebuilds them
+        await engine_registry.invalidate(request.database_id)
+        tunnel = tunnel_manager.get(request.database_id)
+        if tunnel is not None and tunnel.release is None:
+            tunnel_manager.mark_dead(request.database_id, reason=error_msg)
+    elif is_auth_error(error):
+        # Credentials were rotated or the lease ended early: refetch them on the next query
+        credential_cache.evict(_credential_keys.pop(request.database_id, []))
+        await engine_registry.invalidate(request.database_id)
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    logger.error(
+        "Query execution failed",
+        query_id=query_id,
+        error=error_msg,
+        database=request.database_id,
+        duration_ms=duration_ms,
+    )
+    return error_msg
+
+
+@app.post("/execute_query", response_model=ExecuteQueryResponse)
+async def execute_query(
+    request: ExecuteQueryRequest, accept: Annotated[str | None, Header()] = None
+) -> ExecuteQueryResponse | Response:
     """
     Execute a query server-side and return serialized results.
 
+    The handler runs on the server's event loop: port forwarding and database I/O are
+    awaited, so queries to one slow database don't hold up queries to others.
+
     This endpoint:
     1. Gets the environment and database config
     2. Sets up port forwarding if needed (lazy, reuses existing)
@@ -612,126 +1143,208 @@ def execute_query(request: ExecuteQueryRequest) -> ExecuteQueryResponse:
     4. Executes the SQL query with parameters
     5. Deserializes results into model instances
     6. Applies sanitization if requested
-    7. Serializes results for transmission
+    7. Serializes results for transmission (JSON, or columnar MessagePack if the client accepts it)
 
     Args:
         request: Query execution request with SQL, parameters, model info
+        accept: Accept header; see `rhizome.wire` for the columnar encoding
 
     Returns:
         ExecuteQueryResponse with serialized results or error
     """
-    import asyncio
-    import sys
-    import textwrap
     import time
     import uuid
-    from urllib.parse import quote_plus
 
-    from sqlmodel import Session, create_engine
-
-    from rhizome.environments.environment_list import RhizomeEnvironment, environment_type
-    from rhizome.serialization import import_model_class
+    from rhizome.wire import COLUMNAR_MEDIA_TYPE, accepts_columnar, encode_response
 
     query_id = uuid.uuid4().hex[:8]
     start_time = time.time()
+    columnar = accepts_columnar(accept)
+    dump_mode: DumpMode = "python" if columnar else "json"
 
     try:
-        # Get the environment class to check if port forwarding is needed
-        try:
-            env_enum = RhizomeEnvironment(request.database_id)
-        except ValueError:
-            raise ValueError(f"Unknown database: {request.database_id}") from None
-
-        env_class = environment_type.get(env_enum)
-        if not env_class:
-            raise ValueError(f"Unknown database: {request.database_id}")
-
-        # Check if this environment needs port forwarding
-        port_forward_config = env_class.get_port_forward_config()
-
-        # Get database config
-        db_config = _get_database_config(request.database_id)
-
-        # If port forwarding is needed, ensure it's set up and update the port
-        if port_forward_config is not None:
-            local_port = asyncio.run(_ensure_port_forward(request.database_id, port_forward_config))
-            # Override the port in db_config with the actual local port
-            db_config.port = local_port
-
-        # Build connection string
-        encoded_password = quote_plus(db_config.password)
-        connection_string = (
-            f"mysql+pymysql://{db_config.username}:{encoded_password}"
-            f"@{db_config.host}:{db_config.port}/{db_config.database}"
-        )
+        # Cache hits skip the port forward and the database round trip
+        response = result_cache.get(request, dump_mode)
+        cached = response is not None
+        if response is None:
+            generation = result_cache.generation
+            engine, model_class = await _prepare_query(request, query_id)
+            response = await _run_query(engine, request, model_class, dump_mode=dump_mode)
+            result_cache.put(request, response, generation, dump_mode)
 
-        # Log query with details
+        # Log result
+        duration_ms = int((time.time() - start_time) * 1000)
         logger.info(
-            "SQL query",
+            "SQL query result",
             query_id=query_id,
-            database=request.database_id,
-            connection_string=connection_string,
-            parameters=request.parameters if request.parameters else None,
+            duration_ms=duration_ms,
+            row_count=response.row_count,
+            cached=cached,
         )
 
-        # Print statement to stderr for readability
-        indented_statement = textwrap.indent(request.sql, "    ")
-        print(f"  Statement:\n{indented_statement}", file=sys.stderr)
+    except Exception as e:
+        error_msg = await _handle_query_error(request, query_id, e, start_time)
+        response = ExecuteQueryResponse(success=False, result=None, error=error_msg)
 
-        # Import the model class for result deserialization
-        model_class = import_model_class(request.model_module, request.model_class)
+    if columnar:
+        return Response(content=await asyncio.to_thread(encode_response, response), media_type=COLUMNAR_MEDIA_TYPE)
+    return response
 
-        # Create engine and execute query
-        engine = create_engine(connection_string)
 
-        with Session(engine) as session:
-            if request.mode == GetMode.FIRST:
-                response = _execute_query_first(session, request, model_class)
-            elif request.mode == GetMode.ALL:
-                response = _execute_query_all(session, request, model_class)
-            elif request.mode == GetMode.ONE:
-                response = _execute_query_one(session, request, model_class)
-            else:
-                return ExecuteQueryResponse(
-                    success=False,
-                    result=None,
-                    error=f"Unknown query mode: {request.mode}",
+async def _execute_database_batch(requests: list[ExecuteQueryRequest]) -> list[ExecuteQueryResponse]:
+    """
+    Run one database's share of a batch, in order, on a single pooled connection.
+
+    The database's engine (and with it its tunnel and credentials) is resolved once,
+    when the first query that isn't answered from the result cache needs it; each
+    query then only resolves its model. A failed query doesn't fail the others: it
+    gets an error response and the batch moves on. If the connection itself died,
+    the next query resolves the engine again and checks out a new connection.
+    """
+    import time
+    import uuid
+    from contextlib import AsyncExitStack, suppress
+
+    responses: list[ExecuteQueryResponse] = []
+    async with AsyncExitStack() as stack:
+        conn: Any = None
+        connection_string = ""
+        for request in requests:
+            query_id = uuid.uuid4().hex[:8]
+            start_time = time.time()
+            try:
+                response = result_cache.get(request)
+                cached = response is not None
+                if response is None:
+                    generation = result_cache.generation
+                    if conn is None:
+                        engine, connection_string = await _connect_database(request.database_id)
+                        conn = await stack.enter_async_context(engine.connect())
+                    _log_query(request, query_id, connection_string)
+                    model_class = _request_model_class(request)
+                    response = await _run_query_on_connection(conn, request, model_class)
+                    result_cache.put(request, response, generation)
+                logger.info(
+                    "SQL query result",
+                    query_id=query_id,
+                    duration_ms=int((time.time() - start_time) * 1000),
+                    row_count=response.row_count,
+                    cached=cached,
                 )
+            except Exception as e:
+                error_msg = await _handle_query_error(request, query_id, e, start_time)
+                response = ExecuteQueryResponse(success=False, result=None, error=error_msg)
+                if conn is not None:
+                    if is_connection_error(e):
+                        conn = None
+                    else:
+                        # Start the next query outside of whatever state the failed one left behind
+                        with suppress(Exception):
+                            await conn.rollback()
+            responses.append(response)
+    return responses
+
+
+@app.post("/execute_batch")
+async def execute_batch(request: ExecuteBatchRequest) -> ExecuteBatchResponse:
+    """
+    Execute several queries in one round trip and return a result (or error) for each.
 
-        # Log result
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.info(
-            "SQL query result",
-            query_id=query_id,
-            duration_ms=duration_ms,
-            row_count=response.row_count,
-        )
+    Queries are grouped by database. Each database's queries run in request order on
+    one pooled connection; different databases run concurrently unless
+    `request.concurrent` is false.
 
-        return response
+    Args:
+        request: The queries to run
 
-    except Exception as e:
-        error_msg = f"{type(e).__name__}: {e}"
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.error(
-            "Query execution failed",
-            query_id=query_id,
-            error=error_msg,
-            database=request.database_id,
-            duration_ms=duration_ms,
-        )
-        return ExecuteQueryResponse(success=False, result=None, error=error_msg)
+    Returns:
+        ExecuteBatchResponse with one ExecuteQueryResponse per query, in request order
+    """
+    # Group query positions by database, keeping the order queries were given in
+    groups: dict[str, list[int]] = {}
+    for index, query in enumerate(request.queries):
+        groups.setdefault(query.database_id, []).append(index)
 
+    async def run_group(indexes: list[int]) -> list[ExecuteQueryResponse]:
+        return await _execute_database_batch([request.queries[i] for i in indexes])
 
-@app.post("/log_query")
-async def log_query(query: SqlQueryLog) -> dict[str, str]:
+    if request.concurrent:
+        group_responses = await asyncio.gather(*(run_group(indexes) for indexes in groups.values()))
+    else:
+        group_responses = [await run_group(indexes) for indexes in groups.values()]
+
+    results: list[ExecuteQueryResponse | None] = [None] * len(request.queries)
+    for indexes, responses in zip(groups.values(), group_responses, strict=True):
+        for index, response in zip(indexes, responses, strict=True):
+            results[index] = response
+
+    logger.info("Executed query batch", queries=len(request.queries), databases=len(groups))
+    return ExecuteBatchResponse(results=[r for r in results if r is not None])
+
+
+@app.post("/execute_query_stream")
+async def execute_query_stream(request: ExecuteQueryRequest) -> StreamingResponse:
     """
-    Log SQL query details before execution.
+    Execute a query server-side and stream serialized results as NDJSON.
 
-    Logs query_id, database, and parameters (if present) via structlog.
-    Prints the statement to stderr so newlines render properly for readability.
-    Does not log result data.
+    Rows are read through a server-side cursor and sent in batches of `request.batch_size`,
+    so neither the server nor the client holds the full result set in memory. Each line is
+    a QueryStreamChunk; the last one has `done` set and carries the row count or an error.
+
+    Args:
+        request: Query execution request with SQL, parameters, model info (mode STREAM)
+
+    Returns:
+        Streaming NDJSON response
     """
+    import time
+    import uuid
+
+    query_id = uuid.uuid4().hex[:8]
+    start_time = time.time()
+
+    async def generate() -> AsyncGenerator[str, None]:
+        row_count = 0
+        try:
+            engine, model_class = await _prepare_query(request, query_id)
+            async with engine.connect() as conn:
+                result = await conn.stream(_text_clause(request.sql), request.parameters)
+                async for rows in result.partitions(request.batch_size):
+                    chunk = await asyncio.to_thread(_serialize_stream_chunk, rows, request, model_class)
+                    row_count += len(chunk.rows)
+                    yield chunk.model_dump_json() + "\n"
+        except Exception as e:
+            error_msg = await _handle_query_error(request, query_id, e, start_time)
+            yield QueryStreamChunk(done=True, error=error_msg, row_count=row_count).model_dump_json() + "\n"
+            return
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info("SQL query result", query_id=query_id, duration_ms=duration_ms, row_count=row_count)
+        yield QueryStreamChunk(done=True, row_count=row_count).model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _serialize_stream_chunk(
+    rows: Sequence[Any],
+    request: ExecuteQueryRequest,
+    model_class: type[Any],  # noqa: ANN401
+) -> QueryStreamChunk:
+    """Sanitize and serialize the projected columns of one batch of streamed rows."""
+    from rhizome.serialization import serialize_rows
+
+    if not rows:
+        return QueryStreamChunk(rows=[])
+
+    # Type ignore: row._fields is a private SQLAlchemy API with incomplete typing
+    _, serialized = serialize_rows(rows[0]._fields, rows, model_class, sanitize=request.sanitize)  # type: ignore[attr-defined]
+    return QueryStreamChunk(rows=serialized)
+
+
+def _log_sql_query(query: SqlQueryLog) -> None:
+    """Log a statement's metadata via structlog and print the statement itself to stderr."""
     import sys
+    import textwrap
     from typing import Any
 
     # Prepare log data (without statement - we'll print that separately)
@@ -749,22 +1362,12 @@ async def log_query(query: SqlQueryLog) -> dict[str, str]:
     logger.info("SQL query", **log_data)
 
     # Print the statement to stderr with proper newline rendering and indentation
-    import textwrap
-
     indented_statement = textwrap.indent(query.statement, "    ")
     print(f"  Statement:\n{indented_statement}", file=sys.stderr)
 
-    return {"status": "logged"}
-
 
-@app.post("/log_query_result")
-async def log_query_result(result: SqlQueryResultLog) -> dict[str, str]:
-    """
-    Log SQL query result details after execution.
-
-    Logs only query_id (to associate with original query), duration, and row count.
-    Context (statement, database, connection_string) was already logged in /log_query.
-    """
+def _log_sql_query_result(result: SqlQueryResultLog) -> None:
+    """Log a statement's duration and row count (its context was logged with the query)."""
     from typing import Any
 
     # Prepare log data - only new information, not context already in /log_query
@@ -779,9 +1382,51 @@ async def log_query_result(result: SqlQueryResultLog) -> dict[str, str]:
 
     logger.info("SQL query result", **log_data)
 
+
+@app.post("/log_query")
+async def log_query(query: SqlQueryLog) -> dict[str, str]:
+    """
+    Log SQL query details before execution.
+
+    Logs query_id, database, and parameters (if present) via structlog.
+    Prints the statement to stderr so newlines render properly for readability.
+    Does not log result data.
+    """
+    _log_sql_query(query)
     return {"status": "logged"}
 
 
+@app.post("/log_query_result")
+async def log_query_result(result: SqlQueryResultLog) -> dict[str, str]:
+    """
+    Log SQL query result details after execution.
+
+    Logs only query_id (to associate with original query), duration, and row count.
+    Context (statement, database, connection_string) was already logged in /log_query.
+    """
+    _log_sql_query_result(result)
+    return {"status": "logged"}
+
+
+@app.post("/log_batch")
+async def log_batch(batch: QueryLogBatch) -> QueryLogBatchResponse:
+    """
+    Log a batch of query and query result records shipped by a client's log queue.
+
+    Records are logged in order, exactly as /log_query and /log_query_result would.
+    """
+    if batch.dropped:
+        logger.warning("Client dropped query logs (log queue full)", dropped=batch.dropped)
+
+    for entry in batch.entries:
+        if isinstance(entry, SqlQueryLog):
+            _log_sql_query(entry)
+        else:
+            _log_sql_query_result(entry)
+
+    return QueryLogBatchResponse(status="logged", logged=len(batch.entries))
+
+
 @app.post("/log_connection")
 async def log_connection(connection: DatabaseConnectionLog) -> dict[str, str]:
     """
@@ -806,9 +1451,39 @@ def message() -> str:
     return "rhizome is waiting for connections."
 
 
-def run(home: Home | None = None) -> None:
-    global _home
+def bind_unix_socket(path: Path) -> socket.socket | None:
+    """Bind the Unix domain socket that local clients use to skip TCP, if the platform supports it."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    # A leftover socket file from a server that didn't shut down cleanly would block the bind
+    path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(str(path))
+    except OSError as e:
+        # e.g. path too long for sun_path; clients fall back to TCP
+        logger.warning("Not listening on Unix domain socket", path=str(path), error=str(e))
+        sock.close()
+        return None
+    path.chmod(0o600)
+    return sock
+
+
+def run(home: Home | None = None, warm: list[str] | None = None, keep_tunnels: bool = False) -> None:
+    """
+    Serve until interrupted.
+
+    Args:
+        home: Where to find the port to listen on and keep state
+        warm: Databases to warm up at startup
+        keep_tunnels: Leave shared port-forwards running at shutdown, for the next server to adopt
+    """
+    global _home, _keep_tunnels
     _home = home or Home()
+    _warm_on_startup[:] = warm or []
+    _keep_tunnels = keep_tunnels
+    tunnel_registry.path = _home.state / "tunnels.json"
     port = _home.get_port()
     if port is None:
         raise ValueError("No port found in home configuration")
@@ -816,10 +1491,18 @@ def run(home: Home | None = None) -> None:
     # Set up unified logging before starting uvicorn
     setup_logging()
 
-    uvicorn.run(
+    # Listen on loopback TCP, and on a Unix domain socket for cheaper local round trips
+    tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tcp_socket.bind(("127.0.0.1", port))
+    sockets = [tcp_socket]
+    unix_socket = bind_unix_socket(_home.socket_path)
+    if unix_socket is not None:
+        sockets.append(unix_socket)
+
+    config = uvicorn.Config(
         app,
-        host="127.0.0.1",
-        port=port,
         log_config=None,  # Disable uvicorn's default logging config
         access_log=True,  # Keep access logs but they'll go through our handler
     )
+    uvicorn.Server(config).run(sockets=sockets)
@@ -24,6 +24,18 @@ class SqlQueryResultLog(BaseModel):
     row_count: int | None = None
 
 
+class QueryLogBatch(BaseModel):
+    """Request model for shipping several query/result log records at once."""
+
+    entries: list[SqlQueryLog | SqlQueryResultLog]  # In the order the client recorded them
+    dropped: int = 0  # Records the client discarded since its previous batch (log queue full)
+
+
+class QueryLogBatchResponse(BaseModel):
+    status: str
+    logged: int
+
+
 class DatabaseConnectionLog(BaseModel):
     """Request model for database connection logging."""
 
@@ -40,6 +52,7 @@ class GetMode(StrEnum):
     FIRST = auto()  # Return first result or None
     ALL = auto()  # Return all results as list
     ONE = auto()  # Return exactly one result (raises if 0 or >1)
+    STREAM = auto()  # Stream all results in batches (via /execute_query_stream)
 
 
 class ExecuteQueryRequest(BaseModel):
@@ -52,9 +65,11 @@ class ExecuteQueryRequest(BaseModel):
     sql: str  # Compiled SQL string
     parameters: dict[str, Any]  # Query parameters
 
-    # Model information for result deserialization
-    model_module: str  # e.g., "rhizome.models.meta.reseller"
-    model_class: str  # e.g., "Reseller"
+    # Model for result deserialization: its model id (see rhizome.model_registry), or
+    # (from older clients) its module and class name
+    model_id: str | None = None  # e.g., "meta.reseller:Reseller"
+    model_module: str | None = None  # e.g., "rhizome.models.meta.reseller"
+    model_class: str | None = None  # e.g., "Reseller"
 
     # Query execution mode
     mode: GetMode
@@ -62,6 +77,12 @@ class ExecuteQueryRequest(BaseModel):
     # Whether to sanitize results
     sanitize: bool = True
 
+    # Rows per batch in STREAM mode
+    batch_size: int = 1000
+
+    # For keyset pagination (ALL mode): report the last row's values for these columns, before sanitization
+    keyset_columns: list[str] | None = None
+
 
 class ExecuteQueryResponse(BaseModel):
     """Response model for server-side query execution."""
@@ -70,3 +91,30 @@ class ExecuteQueryResponse(BaseModel):
     result: dict[str, Any] | list[dict[str, Any]] | None  # Serialized result(s)
     error: str | None = None
     row_count: int | None = None  # For ALL mode, number of results returned
+    last_key: list[Any] | None = None  # For ALL mode with keyset_columns, the last row's unsanitized key
+    # Model fields the query projected; result rows hold only these (None if unknown)
+    columns: list[str] | None = None
+
+
+class ExecuteBatchRequest(BaseModel):
+    """Request model for running several queries in one round trip."""
+
+    queries: list[ExecuteQueryRequest]
+
+    # Run the queries for different databases concurrently (each database's queries always run in order)
+    concurrent: bool = True
+
+
+class ExecuteBatchResponse(BaseModel):
+    """Response model for a batch of queries."""
+
+    results: list[ExecuteQueryResponse]  # One per query, in request order
+
+
+class QueryStreamChunk(BaseModel):
+    """One line of an NDJSON response from /execute_query_stream."""
+
+    rows: list[dict[str, Any]] = []  # Serialized results in this batch
+    done: bool = False  # Set on the final line
+    error: str | None = None
+    row_count: int | None = None  # On the final line, total rows streamed
@@ -24,33 +24,14 @@ def get_database_short_name(environment_name: str) -> str:
 
 
 def create_lightweight_environment(env_class: type[Environment], client: RhizomeClient) -> Environment:
-    """Create a lightweight environment instance that skips expensive table_situation setup."""
-
-    # Try to create a normal instance first
-    try:
-        return env_class(client)
-    except NotImplementedError:
-        # If table_situation setup fails due to unimplemented models, create a lightweight version
-        # This is needed for schema syncing where we don't need the model/emplacement mappings
-
-        # Create instance without calling __init__
-        env_instance = env_class.__new__(env_class)
-
-        # Manually set up the essential attributes for schema syncing
-        env_instance.client = client
-
-        # Set up port forwarding if needed
-        port_forward_config = env_instance.get_port_forward_config()
-        if port_forward_config is not None:
-            env_instance.setup_port_forwarding(port_forward_config)
-
-        # Skip table_situation initialization for schema syncing
-        env_instance.table_situation = {}
-
-        return env_instance
-    except Exception:
-        # For other errors, let them propagate
-        raise
+    """
+    Create an environment instance for schema syncing.
+
+    Tables are only situated (their model/emplacement classes imported) on first
+    lookup in `table_situation`, which schema syncing never does, so this is cheap
+    even for environments whose models aren't implemented yet.
+    """
+    return env_class(client)
 
 
 def _convert_query_result_to_sequence(result: object) -> tuple[Any, ...] | list[Any] | None:
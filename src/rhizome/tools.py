@@ -7,6 +7,7 @@ of external tools like kubectl, gcloud, 1password CLI, and lsof.
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 
@@ -75,12 +76,33 @@ class KubectlTool(ABC):
     async def get_logs(self, context: str, namespace: str, deployment: str, since: str = "10s") -> list[LogLine]:
         """Get recent logs from a deployment."""
 
+    @abstractmethod
+    def follow_logs(self, context: str, namespace: str, deployment: str, since: str = "10s") -> AsyncIterator[LogLine]:
+        """Stream a deployment's logs from `since` ago, yielding lines as they are written."""
+
     @abstractmethod
     async def port_forward(
         self, context: str, namespace: str, resource: str, local_port: int, remote_port: int
     ) -> asyncio.subprocess.Process:
         """Start port forwarding process (returns running process)."""
 
+    @abstractmethod
+    async def port_forward_ports(
+        self,
+        context: str,
+        namespace: str,
+        resource: str,
+        ports: list[tuple[int, int]],
+        *,
+        start_new_session: bool = False,
+    ) -> asyncio.subprocess.Process:
+        """
+        Start a single port forwarding process for several (local_port, remote_port) pairs.
+
+        With `start_new_session`, the process runs in its own session, so a Ctrl-C meant for
+        the caller doesn't stop it.
+        """
+
     @abstractmethod
     async def get_pod_status(self, pod_name: str, context: str | None = None) -> CommandResult:
         """Get pod status."""
@@ -164,10 +186,53 @@ class ExternalKubectlTool(KubectlTool):
 
         return [LogLine(content=line) for line in result.stdout.splitlines() if line.strip()]
 
+    async def follow_logs(
+        self, context: str, namespace: str, deployment: str, since: str = "10s"
+    ) -> AsyncIterator[LogLine]:
+        """Stream a deployment's logs from `since` ago, yielding lines as they are written."""
+        args = [
+            "kubectl",
+            "--context",
+            context,
+            "-n",
+            namespace,
+            "logs",
+            "-f",
+            f"deployment/{deployment}",
+            "--since",
+            since,
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            assert process.stdout is not None
+            async for line in process.stdout:
+                content = line.decode(errors="replace").rstrip()
+                if content.strip():
+                    yield LogLine(content=content)
+        finally:
+            # Stop following once the caller has what it was waiting for
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+
     async def port_forward(
         self, context: str, namespace: str, resource: str, local_port: int, remote_port: int
     ) -> asyncio.subprocess.Process:
         """Start port forwarding process (returns running process)."""
+        return await self.port_forward_ports(context, namespace, resource, [(local_port, remote_port)])
+
+    async def port_forward_ports(
+        self,
+        context: str,
+        namespace: str,
+        resource: str,
+        ports: list[tuple[int, int]],
+        *,
+        start_new_session: bool = False,
+    ) -> asyncio.subprocess.Process:
+        """Start a single port forwarding process for several (local_port, remote_port) pairs."""
         args = [
             "kubectl",
             "--context",
@@ -176,10 +241,10 @@ class ExternalKubectlTool(KubectlTool):
             namespace,
             "port-forward",
             resource,
-            f"{local_port}:{remote_port}",
+            *(f"{local_port}:{remote_port}" for local_port, remote_port in ports),
         ]
 
-        process = await asyncio.create_subprocess_exec(*args)
+        process = await asyncio.create_subprocess_exec(*args, start_new_session=start_new_session)
         return process
 
     async def get_pod_status(self, pod_name: str, context: str | None = None) -> CommandResult:
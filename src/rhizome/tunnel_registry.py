@@ -0,0 +1,136 @@
+"""
+Tunnels recorded on disk, so that a restarted server can adopt them.
+
+With `rhizome serve --keep-tunnels`, shared port-forwards (see
+rhizome.portforward.SharedPortForward) are left running when the server shuts
+down, and the CloudSQL proxies they forward to keep listening in the pod. The
+registry, kept under Home.state, records which database each forwarded port
+belongs to; on startup the server re-validates the entries (the pid is still
+the recorded kubectl port-forward, not a process that reused it, and the local
+port accepts connections) and adopts the tunnels that pass rather than setting
+them up again.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import structlog
+from pydantic import BaseModel, ValidationError
+
+from rhizome.tunnels import tcp_probe
+
+logger = structlog.get_logger()
+
+
+class PersistedTunnel(BaseModel):
+    database_id: str
+    kube_context: str
+    kube_namespace: str
+    kube_deployment: str
+    local_port: int
+    remote_port: int  # Port the database's CloudSQL proxy listens on in the pod
+    pid: int  # The port-forward process, shared by the deployment's databases
+    established_at: float
+
+
+def pid_alive(pid: int) -> bool:
+    """Check whether a process exists (it may belong to another user)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def process_command(pid: int) -> list[str] | None:
+    """A process's command line (from ps, which works on Linux and macOS), or None if there is no such process."""
+    try:
+        # -ww: don't cut the command line at the terminal's width
+        result = subprocess.run(
+            ["ps", "-ww", "-o", "command=", "-p", str(pid)], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.split()
+
+
+def is_port_forward(pid: int, kube_deployment: str, ports: list[tuple[int, int]]) -> bool:
+    """
+    Check that a pid is the kubectl port-forward forwarding `ports` to a deployment.
+
+    Pids get reused, so a recorded pid being alive doesn't mean it is still our
+    port-forward; its command line does.
+    """
+    command = process_command(pid)
+    if not command:
+        return False
+    return (
+        any(Path(arg).name == "kubectl" for arg in command)
+        and "port-forward" in command
+        and f"deployment/{kube_deployment}" in command
+        and all(f"{local_port}:{remote_port}" in command for local_port, remote_port in ports)
+    )
+
+
+class TunnelRegistry:
+    """A JSON file of the tunnels a server has established (disabled until given a path)."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Args:
+            path: File to keep the registry in, e.g. Home.state / "tunnels.json"
+        """
+        self.path = path
+
+    def load(self) -> list[PersistedTunnel]:
+        """Read the recorded tunnels, ignoring a missing or unreadable file."""
+        if self.path is None or not self.path.exists():
+            return []
+        try:
+            entries = json.loads(self.path.read_text())
+            return [PersistedTunnel.model_validate(entry) for entry in entries]
+        except (OSError, ValueError, TypeError, ValidationError) as e:
+            logger.warning("Ignoring unreadable tunnel registry", path=str(self.path), error=str(e))
+            return []
+
+    def save(self, tunnels: list[PersistedTunnel]) -> None:
+        """Record the current tunnels, replacing the file atomically."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self.path.with_suffix(".tmp")
+        staging.write_text(json.dumps([tunnel.model_dump() for tunnel in tunnels], indent=2))
+        staging.replace(self.path)
+
+    async def validate(self, probe_timeout: float = 1.0) -> list[PersistedTunnel]:
+        """
+        Find the recorded tunnels that still work.
+
+        Returns:
+            Tunnels whose port-forward process is still running and whose local port accepts connections
+        """
+        valid: list[PersistedTunnel] = []
+        for tunnel in self.load():
+            ports = [(tunnel.local_port, tunnel.remote_port)]
+            if not pid_alive(tunnel.pid):
+                reason = "port-forward process exited"
+            elif not await asyncio.to_thread(is_port_forward, tunnel.pid, tunnel.kube_deployment, ports):
+                reason = "pid now belongs to another process"
+            elif not await tcp_probe(tunnel.local_port, timeout=probe_timeout):
+                reason = "local port refused connections"
+            else:
+                valid.append(tunnel)
+                continue
+            logger.info("Dropping stale tunnel", database_id=tunnel.database_id, pid=tunnel.pid, reason=reason)
+        return valid
+
+
+# Global tunnel registry instance (given a path under Home.state by rhizome serve)
+tunnel_registry = TunnelRegistry()
@@ -0,0 +1,291 @@
+"""
+Tracking of established database tunnels (kubectl port-forwards) on the server.
+
+Setting up a tunnel takes several seconds (cluster credentials, starting the
+CloudSQL proxy, discovering its port, starting kubectl port-forward). When
+several queries arrive for a cold database at once, only the first one should
+do that work: the others wait for the same establishment to finish and then
+share the resulting tunnel.
+
+Established tunnels are supervised: when the port-forward process exits or the
+local port stops accepting connections, the tunnel is marked dead so that the
+next query re-establishes it. Tunnels sharing a port-forward process with other
+databases (see rhizome.portforward.SharedPortForward) are supervised through
+their local port alone. Repeated establishment failures back off
+exponentially.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+
+import structlog
+from pydantic import BaseModel
+
+from rhizome.proc import process_manager
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class Tunnel:
+    """An established tunnel to a database."""
+
+    database_id: str
+    local_port: int
+    pid: int | None  # The tunnel's own port-forward process (None if it has none, e.g. when it is shared)
+    established_at: float
+    # Stops forwarding the tunnel's port when it is shared with other databases (instead of terminating pid)
+    release: Callable[[], object] | None = None
+
+
+class TunnelInfo(BaseModel):
+    database_id: str
+    local_port: int
+    pid: int | None
+    established_at: float
+
+
+class EstablishmentStats(BaseModel):
+    """How tunnel establishment has gone for a single database."""
+
+    database_id: str
+    establishments: int = 0  # Successful establishments
+    failures: int = 0
+    last_duration_seconds: float | None = None
+    total_duration_seconds: float = 0.0
+    last_waiters: int = 0  # Requests that shared the most recent establishment instead of starting their own
+    total_waiters: int = 0
+    deaths: int = 0  # Times an established tunnel was found dead
+    consecutive_failures: int = 0
+    retry_after: float | None = None  # No new attempt before this time (exponential backoff)
+
+
+class TunnelListResponse(BaseModel):
+    tunnels: list[TunnelInfo]
+    establishing: list[str]
+    stats: list[EstablishmentStats]
+
+
+async def tcp_probe(port: int, timeout: float = 1.0, host: str = "127.0.0.1") -> bool:
+    """Check whether a local port accepts TCP connections."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+class TunnelManager:
+    """Registry of tunnels with single-flight establishment and health supervision per database_id."""
+
+    def __init__(
+        self,
+        check_interval: float = 5.0,
+        probe_timeout: float = 1.0,
+        max_probe_failures: int = 2,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            check_interval: Seconds between health checks of established tunnels
+            probe_timeout: Seconds to wait for a TCP connection to a tunnel's local port
+            max_probe_failures: Consecutive failed probes before a tunnel is considered dead
+            backoff_base: Delay after the first failed establishment, doubled for each further failure
+            backoff_max: Upper bound for the establishment backoff
+        """
+        self.check_interval = check_interval
+        self.probe_timeout = probe_timeout
+        self.max_probe_failures = max_probe_failures
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._tunnels: dict[str, Tunnel] = {}
+        # In-flight establishments, shared by every caller for the same database
+        self._pending: dict[str, asyncio.Task[Tunnel]] = {}
+        # Callers waiting on each in-flight establishment (besides the one that started it)
+        self._waiters: dict[str, int] = {}
+        self._stats: dict[str, EstablishmentStats] = {}
+        self._probe_failures: dict[str, int] = {}
+
+    def get(self, database_id: str) -> Tunnel | None:
+        """Get the established tunnel for a database, if any."""
+        return self._tunnels.get(database_id)
+
+    async def ensure(self, database_id: str, establish: Callable[[], Awaitable[Tunnel]]) -> Tunnel:
+        """
+        Get the tunnel for a database, establishing it if needed.
+
+        The first caller for a cold database starts `establish`; concurrent callers
+        wait for that same establishment rather than starting their own.
+
+        Args:
+            database_id: Database identifier
+            establish: Coroutine factory that sets up the tunnel
+
+        Returns:
+            The established tunnel
+
+        Raises:
+            RuntimeError: If establishment recently failed and is backing off
+        """
+        tunnel = self._tunnels.get(database_id)
+        if tunnel is not None:
+            logger.debug("Reusing existing port forward", database_id=database_id, local_port=tunnel.local_port)
+            return tunnel
+
+        task = self._pending.get(database_id)
+        if task is None:
+            stats = self._stats.get(database_id)
+            if stats is not None and stats.retry_after is not None and time.time() < stats.retry_after:
+                raise RuntimeError(
+                    f"Port forward for {database_id} failed {stats.consecutive_failures} time(s) in a row, "
+                    f"next attempt in {stats.retry_after - time.time():.1f}s"
+                )
+
+            # Run establishment as its own task so a cancelled request doesn't abort it for the waiters
+            task = asyncio.create_task(self._establish(database_id, establish))
+            self._pending[database_id] = task
+            self._waiters[database_id] = 0
+        else:
+            self._waiters[database_id] += 1
+            logger.info("Waiting for in-flight port forward", database_id=database_id)
+
+        return await asyncio.shield(task)
+
+    async def _establish(self, database_id: str, establish: Callable[[], Awaitable[Tunnel]]) -> Tunnel:
+        stats = self._stats.setdefault(database_id, EstablishmentStats(database_id=database_id))
+        start = time.monotonic()
+        try:
+            tunnel = await establish()
+        except BaseException:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            backoff = min(self.backoff_base * 2 ** (stats.consecutive_failures - 1), self.backoff_max)
+            stats.retry_after = time.time() + backoff
+            logger.warning("Port forward failed, backing off", database_id=database_id, backoff_seconds=backoff)
+            raise
+        else:
+            duration = time.monotonic() - start
+            stats.establishments += 1
+            stats.consecutive_failures = 0
+            stats.retry_after = None
+            stats.last_duration_seconds = duration
+            stats.total_duration_seconds += duration
+            self._tunnels[database_id] = tunnel
+            logger.info(
+                "Port forward established",
+                database_id=database_id,
+                local_port=tunnel.local_port,
+                duration_seconds=round(duration, 3),
+                waiters=self._waiters.get(database_id, 0),
+            )
+            return tunnel
+        finally:
+            waiters = self._waiters.pop(database_id, 0)
+            stats.last_waiters = waiters
+            stats.total_waiters += waiters
+            del self._pending[database_id]
+
+    def adopt(self, tunnel: Tunnel) -> None:
+        """Track a tunnel established outside of `ensure`, e.g. one a previous server left running."""
+        self._tunnels[tunnel.database_id] = tunnel
+        self._probe_failures.pop(tunnel.database_id, None)
+        logger.info("Adopted port forward", database_id=tunnel.database_id, local_port=tunnel.local_port)
+
+    def forget(self, database_id: str) -> Tunnel | None:
+        """
+        Stop tracking the tunnel for a database so that the next query re-establishes it.
+
+        Returns:
+            The tunnel that was being tracked, if any
+        """
+        self._probe_failures.pop(database_id, None)
+        return self._tunnels.pop(database_id, None)
+
+    def mark_dead(self, database_id: str, reason: str) -> Tunnel | None:
+        """
+        Mark the tunnel for a database as dead: stop tracking it and stop its port-forward process.
+
+        Returns:
+            The dead tunnel, if one was being tracked
+        """
+        tunnel = self.forget(database_id)
+        if tunnel is None:
+            return None
+
+        stats = self._stats.setdefault(database_id, EstablishmentStats(database_id=database_id))
+        stats.deaths += 1
+        if tunnel.release is not None:
+            tunnel.release()
+        elif tunnel.pid is not None:
+            process_manager.terminate(tunnel.pid)
+        logger.warning("Port forward is dead", database_id=database_id, local_port=tunnel.local_port, reason=reason)
+        return tunnel
+
+    async def _diagnose(self, tunnel: Tunnel) -> str | None:
+        """Check a tunnel's health, returning why it is dead (or None if it is healthy)."""
+        if tunnel.pid is not None and not process_manager.is_running(tunnel.pid):
+            return "port-forward process exited"
+
+        if await tcp_probe(tunnel.local_port, timeout=self.probe_timeout):
+            self._probe_failures.pop(tunnel.database_id, None)
+            return None
+
+        failures = self._probe_failures.get(tunnel.database_id, 0) + 1
+        self._probe_failures[tunnel.database_id] = failures
+        if failures >= self.max_probe_failures:
+            return f"local port refused connections {failures} times in a row"
+        return None
+
+    async def check_health(self, on_dead: Callable[[str], Awaitable[object]]) -> list[str]:
+        """
+        Check every established tunnel once, marking dead ones.
+
+        Args:
+            on_dead: Called with the database_id of each dead tunnel (e.g. to drop its pooled engine)
+
+        Returns:
+            database_ids whose tunnels were found dead
+        """
+        dead: list[str] = []
+        for database_id, tunnel in list(self._tunnels.items()):
+            reason = await self._diagnose(tunnel)
+            # The tunnel may have been replaced while we were probing it
+            if reason is None or self._tunnels.get(database_id) is not tunnel:
+                continue
+
+            self.mark_dead(database_id, reason)
+            await on_dead(database_id)
+            dead.append(database_id)
+        return dead
+
+    async def supervise(self, on_dead: Callable[[str], Awaitable[object]]) -> None:
+        """Check tunnel health every `check_interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.check_health(on_dead)
+            except Exception as e:
+                logger.error("Tunnel health check failed", error=str(e))
+
+    def list_tunnels(self) -> TunnelListResponse:
+        """Describe established tunnels, in-flight establishments and establishment metrics."""
+        tunnels = [
+            TunnelInfo(database_id=t.database_id, local_port=t.local_port, pid=t.pid, established_at=t.established_at)
+            for t in self._tunnels.values()
+        ]
+        return TunnelListResponse(
+            tunnels=tunnels,
+            establishing=list(self._pending),
+            stats=[stats.model_copy() for stats in self._stats.values()],
+        )
+
+
+# Global tunnel manager instance
+tunnel_manager = TunnelManager()
@@ -0,0 +1,141 @@
+"""
+Warming up databases before their first query.
+
+The first query against a database pays for everything its connection needs:
+cluster credentials, the CloudSQL proxy and its port-forward, the database
+secret and a pooled connection. Warming does that work ahead of time (at
+`rhizome serve --warm ...` startup or through POST /warm): each cluster is
+connected to once, then every database behind it gets its tunnel, secret and
+first pooled connection concurrently. Progress is tracked per database so it
+can be reported while the warm-up runs.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+import structlog
+from pydantic import BaseModel
+
+logger = structlog.get_logger()
+
+
+class WarmupStep(StrEnum):
+    """How far a database's warm-up has got."""
+
+    PENDING = "pending"
+    CONNECTING_CLUSTER = "connecting_cluster"  # Fetching credentials for the database's cluster
+    CONNECTING = "connecting"  # Opening the tunnel, fetching the secret and a pooled connection
+    READY = "ready"
+    FAILED = "failed"
+
+
+class DatabaseWarmup(BaseModel):
+    database_id: str
+    step: WarmupStep = WarmupStep.PENDING
+    error: str | None = None
+    started_at: float
+    duration_seconds: float | None = None  # Set once the database is ready or failed
+
+
+class WarmRequest(BaseModel):
+    """Request model for warming up databases."""
+
+    database_ids: list[str]  # RhizomeEnvironment enum values, e.g., "dev_meta"
+    wait: bool = False  # Respond once the warm-up is done, rather than right away
+
+
+class WarmupResponse(BaseModel):
+    in_progress: bool
+    ready: int
+    failed: int
+    databases: list[DatabaseWarmup]
+
+
+class WarmupTracker:
+    """Runs warm-ups in the background and tracks each database's progress."""
+
+    def __init__(self) -> None:
+        self._databases: dict[str, DatabaseWarmup] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def start(self, database_ids: list[str], warm: Callable[[list[str]], Awaitable[None]]) -> asyncio.Task[None]:
+        """
+        Start warming up databases in the background.
+
+        Databases that are already warming up are left to the warm-up in progress.
+
+        Args:
+            database_ids: Databases to warm up
+            warm: Coroutine function doing the work, reporting progress through `update`
+
+        Returns:
+            The task running the warm-up
+        """
+        now = time.time()
+        in_progress = {
+            database_id
+            for database_id, status in self._databases.items()
+            if status.step not in (WarmupStep.READY, WarmupStep.FAILED)
+        }
+        database_ids = [database_id for database_id in dict.fromkeys(database_ids) if database_id not in in_progress]
+        for database_id in database_ids:
+            self._databases[database_id] = DatabaseWarmup(database_id=database_id, started_at=now)
+
+        logger.info("Warming up databases", databases=database_ids)
+        task = asyncio.create_task(self._run(database_ids, warm))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(self, database_ids: list[str], warm: Callable[[list[str]], Awaitable[None]]) -> None:
+        start = time.monotonic()
+        try:
+            await warm(database_ids)
+        except Exception as e:
+            # Only unexpected errors get here (warm reports each database's own failure)
+            logger.error("Warm-up failed", error=str(e))
+            for database_id in database_ids:
+                if self._databases[database_id].step != WarmupStep.READY:
+                    self.update(database_id, WarmupStep.FAILED, error=f"{type(e).__name__}: {e}")
+        statuses = [self._databases[database_id] for database_id in database_ids]
+        logger.info(
+            "Warm-up finished",
+            ready=sum(status.step == WarmupStep.READY for status in statuses),
+            failed=[status.database_id for status in statuses if status.step == WarmupStep.FAILED],
+            duration_seconds=round(time.monotonic() - start, 3),
+        )
+
+    def update(self, database_id: str, step: WarmupStep, error: str | None = None) -> None:
+        """Record a database's progress."""
+        status = self._databases[database_id]
+        status.step = step
+        status.error = error
+        if step in (WarmupStep.READY, WarmupStep.FAILED):
+            status.duration_seconds = round(time.time() - status.started_at, 3)
+        logger.info("Warm-up progress", database_id=database_id, step=step, error=error)
+
+    async def wait(self) -> None:
+        """Wait for every running warm-up to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self) -> None:
+        """Cancel running warm-ups (used at server shutdown)."""
+        for task in self._tasks:
+            task.cancel()
+
+    def describe(self) -> WarmupResponse:
+        """Report the progress of every database warmed up so far."""
+        databases = [status.model_copy() for status in self._databases.values()]
+        return WarmupResponse(
+            in_progress=bool(self._tasks),
+            ready=sum(status.step == WarmupStep.READY for status in databases),
+            failed=sum(status.step == WarmupStep.FAILED for status in databases),
+            databases=databases,
+        )
+
+
+# Global warm-up tracker instance
+warmup_tracker = WarmupTracker()
@@ -0,0 +1,177 @@
+"""
+Compact columnar encoding of query results for the server → client hop.
+
+By default `/execute_query` answers with JSON: a list of row objects, each
+repeating every column name, with datetimes and Decimals turned into strings.
+Clients that send `Accept: application/vnd.rhizome.columnar+msgpack` get
+MessagePack instead, with column names sent once, values as one array per
+column, and typed encodings for Decimal, date and datetime so they arrive as
+Python objects rather than strings. Anything else gets JSON.
+
+Columns whose values all share one of those types are tagged once and sent as
+plain strings, so they are converted column by column; stray values of those
+types in mixed columns fall back to MessagePack extension types.
+"""
+
+import datetime
+import decimal
+import enum
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import msgpack
+from pydantic_core import to_jsonable_python
+
+from rhizome.server_models import ExecuteQueryResponse
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.rhizome.columnar+msgpack"
+
+# Type codes, used both as MessagePack extension types and as column tags
+_EXT_DECIMAL = 1
+_EXT_DATE = 2
+_EXT_DATETIME = 3
+
+# Column type tag → decoder of its values' string form
+_COLUMN_DECODERS: dict[int, Callable[[str], Any]] = {
+    _EXT_DATETIME: datetime.datetime.fromisoformat,
+    _EXT_DATE: datetime.date.fromisoformat,
+    _EXT_DECIMAL: decimal.Decimal,
+}
+
+
+def _default(value: Any) -> Any:  # noqa: ANN401
+    """Encode values MessagePack has no native type for."""
+    # datetime is a subclass of date, so check it first
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, decimal.Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    # time, timedelta (as an ISO 8601 duration), ...: same as JSON
+    return to_jsonable_python(value)
+
+
+def _ext_hook(code: int, data: bytes) -> Any:  # noqa: ANN401
+    if code == _EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return datetime.date.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return decimal.Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _encode_column(values: list[Any]) -> tuple[int | None, list[Any]]:
+    """Tag a column whose non-null values all have one typed encoding, sending them as strings."""
+    first: object = next((v for v in values if v is not None), None)
+    tag: int
+    encode: Callable[[Any], str]
+    # datetime is a subclass of date, so check it first
+    if isinstance(first, datetime.datetime):
+        tag, encode = _EXT_DATETIME, datetime.datetime.isoformat
+    elif isinstance(first, datetime.date):
+        tag, encode = _EXT_DATE, datetime.date.isoformat
+    elif isinstance(first, decimal.Decimal):
+        tag, encode = _EXT_DECIMAL, str
+    else:
+        return None, values
+    # A date column must not hold datetimes (and vice versa): compare exact types
+    value_type = type(first)
+    if not all(v is None or type(v) is value_type for v in values):
+        return None, values
+    return tag, [None if v is None else encode(v) for v in values]
+
+
+def _decode_column(tag: int | None, values: list[Any]) -> list[Any]:
+    if tag is None:
+        return values
+    decode = _COLUMN_DECODERS[tag]
+    return [None if v is None else decode(v) for v in values]
+
+
+def accepts_columnar(accept: str | None) -> bool:
+    """Check whether an Accept header asks for the columnar encoding."""
+    if not accept:
+        return False
+    return any(part.split(";")[0].strip() == COLUMNAR_MEDIA_TYPE for part in accept.split(","))
+
+
+def encode_response(response: ExecuteQueryResponse) -> bytes:
+    """
+    Encode a query response columnar, as MessagePack.
+
+    The response's result rows should hold Python values (`model_dump()`, not
+    `model_dump(mode="json")`) so that dates and decimals keep their types.
+
+    Args:
+        response: Response whose result is a row dict, a list of row dicts, or None
+
+    Returns:
+        MessagePack body
+    """
+    rows: list[dict[str, Any]]
+    if response.result is None:
+        rows = []
+    elif isinstance(response.result, dict):
+        rows = [response.result]
+    else:
+        rows = response.result
+
+    # Column order of the first row; rows of one model share their keys
+    columns = list(rows[0]) if rows else []
+    encoded = [_encode_column([row.get(column) for row in rows]) for column in columns]
+    payload = {
+        "success": response.success,
+        "error": response.error,
+        "row_count": response.row_count,
+        "last_key": response.last_key,
+        "projection": response.columns,
+        # Whether result is a single row (FIRST/ONE) rather than a list (ALL)
+        "single": isinstance(response.result, dict),
+        "null": response.result is None,
+        "columns": columns,
+        "types": [tag for tag, _ in encoded],
+        "values": [values for _, values in encoded],
+    }
+    return msgpack.packb(payload, default=_default)
+
+
+def decode_response(content: bytes) -> ExecuteQueryResponse:
+    """
+    Decode a columnar MessagePack body back into a query response with row dicts.
+
+    Args:
+        content: Body produced by `encode_response`
+
+    Returns:
+        The response, with Decimal/date/datetime values restored
+    """
+    payload: dict[str, Any] = msgpack.unpackb(content, ext_hook=_ext_hook)
+    columns: list[str] = payload["columns"]
+    tags: list[int | None] = payload["types"]
+    column_values: list[list[Any]] = payload["values"]
+    values = [_decode_column(tag, column) for tag, column in zip(tags, column_values, strict=True)]
+    rows = [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+
+    result: dict[str, Any] | list[dict[str, Any]] | None
+    if payload["null"]:
+        result = None
+    elif payload["single"]:
+        result = rows[0]
+    else:
+        result = rows
+
+    return ExecuteQueryResponse.model_construct(
+        success=payload["success"],
+        result=result,
+        error=payload["error"],
+        row_count=payload["row_count"],
+        last_key=payload["last_key"],
+        columns=payload.get("projection"),
+    )
@@ -62,6 +62,17 @@ class Home:
             return int(port_file.read_text().strip())
         return None
 
+    @property
+    def socket_path(self) -> Path:
+        """Path of the rhizome server's Unix domain socket."""
+        return self.state / "rhizome.sock"
+
+    def get_socket_path(self) -> Path | None:
+        """Retrieve the rhizome server's Unix domain socket path, if the server is listening on one."""
+        if self.socket_path.is_socket():
+            return self.socket_path
+        return None
+
     def set_stolon_port(self, port: int) -> None:
         """Store the stolon server port number."""
         (self.state / "stolon_port").write_text(str(port))
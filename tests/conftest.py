@@ -2,12 +2,13 @@
 
 import os
 import tempfile
-from collections import defaultdict
-from collections.abc import Callable, Generator
+from collections import Counter, defaultdict
+from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import httpx
 import pytest
 from _pytest.config import Config
 from _pytest.config.argparsing import Parser
@@ -15,9 +16,16 @@ from _pytest.nodes import Item
 from _pytest.reports import TestReport
 from _pytest.runner import CallInfo
 from _pytest.terminal import TerminalReporter
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, SQLModel, create_engine, text
 
+import rhizome.server
 from rhizome.client import RhizomeClient
 from rhizome.environments.environment_list import environment_type
+from rhizome.model_registry import RegisteredModel, model_registry
 from rhizome.models.base import DataMismatchError
 from trifolium.config import Home
 
@@ -257,6 +265,81 @@ def pytest_collection_modifyitems(config: Config, items: list[Item]) -> None:
             item.add_marker(skip_external_infra)
 
 
+class SQLiteDatabases:
+    """
+    SQLite databases that the in-process rhizome server runs queries against,
+    one per database_id, instead of tunnelled MySQL databases.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.model_ids: list[str] = []  # Model id of every query the server ran against a database, in order
+        self.engines: Counter[str] = Counter()  # Engines looked up, by database_id
+        self.connections: Counter[str] = Counter()  # Connections opened, by database_id
+
+    def path(self, database_id: str) -> Path:
+        return self.directory / f"{database_id}.db"
+
+    def add(self, model: type[SQLModel], rows: Sequence[SQLModel] | str = (), database_id: str = "dev_meta") -> None:
+        """
+        Create a model's table in a database and fill it.
+
+        Args:
+            model: Table model
+            rows: Model instances, or raw INSERT SQL (e.g. for naive datetimes, which SQLModel refuses to bind)
+            database_id: Database to create the table in
+        """
+        seed_engine = create_engine(f"sqlite:///{self.path(database_id)}")
+        model.__table__.create(seed_engine)  # type: ignore[attr-defined]
+        if isinstance(rows, str):
+            with seed_engine.begin() as conn:
+                conn.execute(text(rows))
+        else:
+            with Session(seed_engine) as session:
+                session.add_all(rows)
+                session.commit()
+        seed_engine.dispose()
+
+    def client(self, **options: Any) -> RhizomeClient:  # noqa: ANN401
+        """A client whose HTTP calls go to the in-process server (options are passed to RhizomeClient)."""
+        client = RhizomeClient(home=Home.sandbox(self.directory), data_in_logs=False, **options)
+        client._base_url = "http://testserver"  # type: ignore
+        return client
+
+    async def connect_database(self, database_id: str) -> tuple[AsyncEngine, str]:
+        """Stands in for rhizome.server._connect_database."""
+        self.engines[database_id] += 1
+        url = f"sqlite+aiosqlite:///{self.path(database_id)}"
+        # Each TestClient runs its own event loop, so don't pool connections across requests
+        engine = create_async_engine(url, poolclass=NullPool)
+
+        def count_connection(*args: Any) -> None:  # noqa: ANN401
+            self.connections[database_id] += 1
+
+        event.listen(engine.sync_engine, "connect", count_connection)
+        return engine, url
+
+
+@pytest.fixture
+def sqlite_databases(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> SQLiteDatabases:
+    """
+    Serve queries from SQLite databases (see SQLiteDatabases.add) and route clients' HTTP calls to the server.
+    """
+    databases = SQLiteDatabases(tmp_path)
+    resolve = model_registry.resolve
+
+    # The server resolves a query's model id once it misses the result cache (legacy requests
+    # naming a module and class aren't recorded)
+    def record_model_id(model_id: str) -> RegisteredModel:
+        databases.model_ids.append(model_id)
+        return resolve(model_id)
+
+    monkeypatch.setattr(rhizome.server, "_connect_database", databases.connect_database)
+    monkeypatch.setattr(model_registry, "resolve", record_model_id)
+    monkeypatch.setattr(httpx, "Client", lambda **kwargs: TestClient(rhizome.server.app))  # type: ignore[misc]
+    return databases
+
+
 @dataclass
 class RunningServer:
     """Represents a running rhizome server instance for testing."""
@@ -5,6 +5,7 @@ This module contains mock implementations of external tools (kubectl, 1Password,
 that simulate their behavior without requiring actual external infrastructure.
 """
 
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock
 
 from rhizome.tools import (
@@ -36,18 +37,40 @@ class MockKubectlTool(KubectlTool):
             LogLine(content="Ready for new connections"),
         ]
 
+    async def follow_logs(
+        self, context: str, namespace: str, deployment: str, since: str = "10s"
+    ) -> AsyncIterator[LogLine]:
+        """Stream the same logs as get_logs."""
+        for line in await self.get_logs(context, namespace, deployment, since):
+            yield line
+
     async def port_forward(
         self, context: str, namespace: str, resource: str, local_port: int, remote_port: int
     ) -> AsyncMock:
         """Return a mock subprocess for port forwarding."""
+        return await self.port_forward_ports(context, namespace, resource, [(local_port, remote_port)])
+
+    async def port_forward_ports(
+        self,
+        context: str,
+        namespace: str,
+        resource: str,
+        ports: list[tuple[int, int]],
+        *,
+        start_new_session: bool = False,
+    ) -> AsyncMock:
+        """Return a mock subprocess forwarding several ports."""
         mock_process = AsyncMock()
         mock_process.pid = 12345
         mock_process.returncode = None  # Process is running
 
         # Create a mock stdout that yields a few messages then stops
         stdout_lines = [
-            f"Forwarding from 127.0.0.1:{local_port} -> {remote_port}\n".encode(),
-            f"Forwarding from [::1]:{local_port} -> {remote_port}\n".encode(),
+            *(
+                f"Forwarding from {address}:{local_port} -> {remote_port}\n".encode()
+                for local_port, remote_port in ports
+                for address in ("127.0.0.1", "[::1]")
+            ),
             b"",  # Empty bytes to signal end of output
         ]
         stdout_iterator = iter(stdout_lines)
@@ -141,7 +164,6 @@ class MockLsofTool(LsofTool):
             return []
 
         # Subsequent calls: port is now forwarded and in use
-        # This helps _wait_for_port_forward succeed
         return [PortInfo(pid=12345, process_name="kubectl", port=port)]
 
 
@@ -0,0 +1,96 @@
+"""
+Tests for batched query execution (/execute_batch and RhizomeClient.select_many).
+
+Each database_id is served from its own SQLite database, and the client's HTTP calls are
+routed to the in-process server, so batches run end to end.
+"""
+
+import pytest
+from sqlmodel import Field, col, select
+
+from rhizome.client import BatchQuery, RhizomeClient
+from rhizome.models.base import RhizomeModel
+from rhizome.sanitize_helpers import sanitize_uuid_field
+from rhizome.server_models import GetMode
+from tests.conftest import SQLiteDatabases
+
+DATABASES = ["dev_meta", "dev_billing"]
+
+
+class BatchedRow(RhizomeModel, table=True):
+    __tablename__ = "batched_row"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: str = Field(max_length=13)
+    name: str
+
+    def sanitize(self) -> "BatchedRow":
+        """Return a sanitized copy of this row."""
+        return BatchedRow(id=self.id, uuid=sanitize_uuid_field(self.uuid, 13) or self.uuid, name=self.name)
+
+
+class MissingRow(RhizomeModel, table=True):
+    """Model whose table doesn't exist, to make a query fail."""
+
+    __tablename__ = "missing_row"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+
+
+@pytest.fixture
+def client(sqlite_databases: SQLiteDatabases) -> tuple[RhizomeClient, SQLiteDatabases]:
+    """A client whose queries run against one SQLite database per database_id."""
+    for database_id in DATABASES:
+        rows = [BatchedRow(id=i, uuid=f"ROW{i:010d}", name=f"{database_id} {i}") for i in range(1, 4)]
+        sqlite_databases.add(BatchedRow, rows, database_id=database_id)
+    return sqlite_databases.client(), sqlite_databases
+
+
+def test_select_many_across_databases(client: tuple[RhizomeClient, SQLiteDatabases]) -> None:
+    """Results come back in request order, each database resolving its engine once and using a single connection."""
+    rhizome_client, databases = client
+    results = rhizome_client.select_many(
+        [
+            BatchQuery("dev_meta", select(BatchedRow).where(BatchedRow.id == 1), sanitize=False),
+            BatchQuery(
+                "dev_billing", select(BatchedRow).order_by(col(BatchedRow.id)), mode=GetMode.ALL, sanitize=False
+            ),
+            BatchQuery("dev_meta", select(BatchedRow).where(BatchedRow.id == 2), mode=GetMode.ONE, sanitize=False),
+            BatchQuery("dev_meta", select(BatchedRow).where(BatchedRow.id == 99)),
+            BatchQuery("dev_billing", select(BatchedRow).where(BatchedRow.id == 3)),
+        ]
+    )
+
+    assert [r.error for r in results] == [None] * 5
+    assert results[0].value.name == "dev_meta 1"
+    assert [row.name for row in results[1].value] == ["dev_billing 1", "dev_billing 2", "dev_billing 3"]
+    assert results[2].value.name == "dev_meta 2"
+    assert results[3].value is None
+    assert results[4].value.uuid.startswith("Hash")
+    assert databases.engines == databases.connections == {"dev_meta": 1, "dev_billing": 1}
+    assert len(databases.model_ids) == 5
+
+
+def test_failed_query_does_not_fail_the_batch(client: tuple[RhizomeClient, SQLiteDatabases]) -> None:
+    rhizome_client, databases = client
+    results = rhizome_client.select_many(
+        [
+            BatchQuery("dev_meta", select(MissingRow)),
+            BatchQuery("dev_meta", select(BatchedRow).where(BatchedRow.id == 99), mode=GetMode.ONE),
+            BatchQuery("dev_meta", select(BatchedRow).where(BatchedRow.id == 1), sanitize=False),
+        ],
+        concurrent=False,
+    )
+
+    assert results[0].error is not None and "missing_row" in results[0].error
+    assert results[1].error == "Query returned no results (expected exactly one)"
+    with pytest.raises(RuntimeError, match="expected exactly one"):
+        _ = results[1].value
+    assert results[2].value.name == "dev_meta 1"
+    assert databases.engines["dev_meta"] == databases.connections["dev_meta"] == 1
+
+
+def test_stream_mode_is_rejected_per_query(client: tuple[RhizomeClient, SQLiteDatabases]) -> None:
+    rhizome_client, _ = client
+    (result,) = rhizome_client.select_many([BatchQuery("dev_meta", select(BatchedRow), mode=GetMode.STREAM)])
+    assert result.error == "STREAM mode requires /execute_query_stream"
@@ -0,0 +1,131 @@
+"""
+Tests for column-wise batch sanitization (rhizome.bulk_sanitize).
+
+The bulk path must produce exactly what calling each model's own sanitize() produces.
+"""
+
+import datetime
+import decimal
+import enum
+import importlib
+import inspect
+from pathlib import Path
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+import pytest
+from annotated_types import MaxLen
+from pydantic.fields import FieldInfo
+from sqlmodel import Field, SQLModel
+
+import rhizome.models
+from rhizome.bulk_sanitize import sanitize_plan
+from rhizome.models.base import RhizomeModel
+from rhizome.models.meta.reseller import Reseller
+from rhizome.sanitize_helpers import sanitize_uuid_field
+from rhizome.serialization import serialize_result, serialize_result_list
+
+
+def _all_models() -> list[type[RhizomeModel]]:
+    models: set[type[RhizomeModel]] = set()
+    # Walk the files rather than pkgutil.walk_packages: rhizome.models.meta is a namespace package
+    root = Path(rhizome.models.__file__).parent
+    for path in root.rglob("*.py"):
+        if path.stem == "__init__":
+            continue
+        module = importlib.import_module(".".join(("rhizome.models", *path.relative_to(root).with_suffix("").parts)))
+        for value in vars(module).values():
+            if (
+                inspect.isclass(value)
+                and issubclass(value, RhizomeModel)
+                and value.__module__ == module.__name__
+                and not inspect.isabstract(value)
+            ):
+                models.add(value)
+    return sorted(models, key=lambda m: f"{m.__module__}.{m.__name__}")
+
+
+def _sample_value(field: FieldInfo, row: int) -> Any:  # noqa: ANN401
+    """A valid value for a field, varying with the row (UUID-like strings repeat every other row)."""
+    annotation = field.annotation
+    if get_origin(annotation) in (Union, UnionType):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation is bool:
+        return row % 2 == 0
+    if annotation is int:
+        return row
+    if annotation is float:
+        return row + 0.5
+    if annotation is decimal.Decimal:
+        return decimal.Decimal(row)
+    if annotation is datetime.datetime:
+        return datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    if annotation is datetime.date:
+        return datetime.date(2024, 1, 1)
+    if annotation is bytes:
+        return bytes([row % 2]) * 16
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+    max_length = next((m.max_length for m in field.metadata if isinstance(m, MaxLen)), None)
+    return f"VALUE{row % 2:08d}"[-max_length:] if max_length else f"VALUE{row % 2:08d}"
+
+
+def _sample_rows(model: type[RhizomeModel], count: int = 3) -> list[RhizomeModel]:
+    return [
+        model.model_validate({name: _sample_value(field, row) for name, field in model.model_fields.items()})
+        for row in range(count)
+    ]
+
+
+MODELS = _all_models()
+PLANNED = [model for model in MODELS if sanitize_plan(model) is not None]
+
+
+def test_models_declare_sanitization() -> None:
+    # Models declare sanitized fields with SanitizeUUID metadata rather than overriding sanitize()
+    assert PLANNED == MODELS
+
+
+@pytest.mark.parametrize("model", PLANNED, ids=lambda m: m.__name__)
+def test_bulk_matches_per_instance_sanitize(model: type[RhizomeModel]) -> None:
+    rows = _sample_rows(model)
+    expected = [row.sanitize().model_dump(mode="json") for row in rows]
+    assert serialize_result_list(rows, sanitize=True) == expected
+
+
+def test_reseller_plan() -> None:
+    assert sanitize_plan(Reseller) == {"uuid": 13}
+
+
+class Custom(RhizomeModel, table=True):
+    """Model whose sanitize() does more than hash UUIDs."""
+
+    __tablename__ = "bulk_sanitize_custom"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: str
+    secret: str
+
+    def sanitize(self) -> "Custom":
+        """Return a sanitized copy."""
+        return Custom(id=self.id, uuid=sanitize_uuid_field(self.uuid, 13), secret="[REDACTED]")
+
+
+class Unsanitized(SQLModel):
+    id: int
+
+
+def test_custom_sanitize_is_used_per_instance() -> None:
+    assert sanitize_plan(Custom) is None
+    rows = [Custom(id=1, uuid="ABC", secret="hunter2")]
+    assert serialize_result_list(rows)[0]["secret"] == "[REDACTED]"
+
+
+def test_models_without_sanitize() -> None:
+    assert sanitize_plan(Unsanitized) is None
+    assert serialize_result(Unsanitized(id=1)) == {"id": 1}
+
+
+def test_sanitize_false_leaves_values() -> None:
+    (row,) = _sample_rows(Reseller, count=1)
+    assert serialize_result_list([row], sanitize=False)[0]["uuid"] == "VALUE00000000"
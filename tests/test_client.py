@@ -0,0 +1,116 @@
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import uvicorn
+
+from rhizome.client import RhizomeClient
+from rhizome.server import app, bind_unix_socket, setup_logging
+from trifolium.config import Home
+
+
+def test_base_url_uses_loopback(tmp_path: Path) -> None:
+    home = Home.sandbox(tmp_path)
+    home.set_port(54329)
+
+    client = RhizomeClient(home=home, data_in_logs=False)
+    assert client.base_url == "http://127.0.0.1:54329"
+
+
+def test_http_client_is_reused_and_closed(tmp_path: Path) -> None:
+    home = Home.sandbox(tmp_path)
+    home.set_port(54329)
+
+    with RhizomeClient(home=home, data_in_logs=False) as client:
+        http = client.http
+        assert client.http is http
+        assert not http.is_closed
+
+    assert http.is_closed
+    # A closed client builds a fresh connection pool on next use
+    assert client.http is not http
+    client.close()
+
+
+def test_http_client_is_created_once_across_threads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The log shipper's thread and the caller's share one HTTP client, even when both create it."""
+    created: list[httpx.Client] = []
+    client_class = httpx.Client
+
+    def slow_client(**kwargs: Any) -> httpx.Client:  # noqa: ANN401
+        time.sleep(0.05)  # Widen the window in which a second thread could also create one
+        created.append(client_class(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(httpx, "Client", slow_client)
+    client = RhizomeClient(home=Home.sandbox(tmp_path), data_in_logs=False)
+
+    threads = [threading.Thread(target=lambda: client.http) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    client.close()
+    assert created[0].is_closed
+
+
+def test_no_socket_file_means_tcp(tmp_path: Path) -> None:
+    home = Home.sandbox(tmp_path)
+    assert home.get_socket_path() is None
+
+    # A regular file at the socket path is not mistaken for a socket
+    home.socket_path.write_text("stale")
+    assert home.get_socket_path() is None
+
+
+def test_bind_unix_socket_replaces_stale_file(tmp_path: Path) -> None:
+    path = tmp_path / "rhizome.sock"
+    path.write_text("left over from a crashed server")
+
+    sock = bind_unix_socket(path)
+    assert sock is not None
+    try:
+        assert path.is_socket()
+        assert path.stat().st_mode & 0o777 == 0o600
+    finally:
+        sock.close()
+
+
+def test_requests_go_over_unix_socket() -> None:
+    # AF_UNIX paths are limited to ~100 bytes, so keep the sandbox short
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir="/tmp") as temp_dir:
+        home = Home.sandbox(Path(temp_dir))
+
+        # Nothing listens on this TCP port: requests only succeed through the socket
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            home.set_port(s.getsockname()[1])
+
+        setup_logging()
+        server = uvicorn.Server(uvicorn.Config(app, uds=str(home.socket_path), log_config=None))
+        server_thread = threading.Thread(target=server.run, daemon=True)
+        server_thread.start()
+
+        try:
+            deadline = time.time() + 5
+            while home.get_socket_path() is None and time.time() < deadline:
+                time.sleep(0.05)
+
+            with RhizomeClient(home=home, data_in_logs=False) as client:
+                response = client.http.get(f"{client.base_url}/ps")
+                assert response.status_code == 200
+                assert response.json()["count"] == 0
+
+                # Same connection pool serves the next request
+                assert client.http.get(f"{client.base_url}/engines").status_code == 200
+        finally:
+            server.should_exit = True
+            server_thread.join(timeout=5)
@@ -0,0 +1,147 @@
+"""
+Tests for the cluster connection cache (rhizome.cluster).
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+import rhizome.cluster
+from rhizome.cluster import ClusterConnectionCache, connect_cluster
+from rhizome.tools import CommandResult, SubprocessTools
+from tests.mocked_subprocesses import (
+    MockGcloudTool,
+    MockKubectlTool,
+    MockLsofTool,
+    MockOnePasswordTool,
+    MockPybritiveTool,
+)
+
+DEV = ("clover-dev-kubernetes", "dev-us-west1-cluster", "us-west1", "https://dev.example")
+
+
+class CountingGcloudTool(MockGcloudTool):
+    def __init__(self, fail: bool = False) -> None:
+        self.credentials_fetched = 0
+        self.fail = fail
+
+    async def get_cluster_credentials(self, project: str, cluster: str, region: str) -> CommandResult:
+        self.credentials_fetched += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            return CommandResult(returncode=1, stdout="", stderr="Reauthentication required")
+        return await super().get_cluster_credentials(project, cluster, region)
+
+
+class ClusterInfoKubectlTool(MockKubectlTool):
+    def __init__(self, reachable: bool = True) -> None:
+        self.reachable = reachable
+        self.cluster_infos = 0
+
+    async def cluster_info(self, context: str) -> CommandResult:
+        self.cluster_infos += 1
+        return CommandResult(returncode=0 if self.reachable else 1, stdout="", stderr="")
+
+
+def _tools(gcloud: MockGcloudTool, kubectl: MockKubectlTool | None = None) -> SubprocessTools:
+    return SubprocessTools(
+        kubectl=kubectl or ClusterInfoKubectlTool(),
+        onepassword=MockOnePasswordTool(),
+        lsof=MockLsofTool(),
+        gcloud=gcloud,
+        pybritive=MockPybritiveTool(),
+    )
+
+
+@pytest.fixture
+def kubeconfig(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """A fresh cache, with kubectl reading a kubeconfig the test controls."""
+    path = tmp_path / "config"
+    path.write_text("apiVersion: v1\n")
+    monkeypatch.setenv("KUBECONFIG", str(path))
+    monkeypatch.setattr(rhizome.cluster, "cluster_connections", ClusterConnectionCache())
+    return path
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+def test_connections_are_reused(kubeconfig: Path) -> None:
+    gcloud = CountingGcloudTool()
+
+    async def scenario() -> None:
+        await connect_cluster(*DEV, tools=_tools(gcloud))
+        await connect_cluster(*DEV, tools=_tools(gcloud))
+        await connect_cluster("clover-prod-kubernetes", "na-prod", "us-central1", "https://prod", tools=_tools(gcloud))
+
+    asyncio.run(scenario())
+    assert gcloud.credentials_fetched == 2
+    status = rhizome.cluster.cluster_connections.describe()
+    assert (status.hits, status.misses) == (1, 2)
+    assert {c.cluster for c in status.clusters} == {"dev-us-west1-cluster", "na-prod"}
+
+
+def test_concurrent_callers_share_one_connect(kubeconfig: Path) -> None:
+    gcloud = CountingGcloudTool()
+
+    async def scenario() -> None:
+        await asyncio.gather(*(connect_cluster(*DEV, tools=_tools(gcloud)) for _ in range(4)))
+
+    asyncio.run(scenario())
+    assert gcloud.credentials_fetched == 1
+
+
+def test_changed_kubeconfig_is_verified(kubeconfig: Path) -> None:
+    gcloud = CountingGcloudTool()
+    kubectl = ClusterInfoKubectlTool()
+
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud, kubectl)))
+    _touch(kubeconfig)
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud, kubectl)))
+    assert (gcloud.credentials_fetched, kubectl.cluster_infos) == (1, 1)
+
+    # Verified connections aren't checked again until the kubeconfig changes again
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud, kubectl)))
+    assert kubectl.cluster_infos == 1
+
+    # A context that no longer works is reconnected
+    kubectl.reachable = False
+    _touch(kubeconfig)
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud, kubectl)))
+    assert (gcloud.credentials_fetched, kubectl.cluster_infos) == (2, 2)
+    status = rhizome.cluster.cluster_connections.describe()
+    assert (status.hits, status.verifications, status.misses) == (1, 1, 2)
+
+
+def test_expired_and_evicted_connections_reconnect(kubeconfig: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    gcloud = CountingGcloudTool()
+    cache = rhizome.cluster.cluster_connections
+
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud)))
+    assert cache.evict(DEV)
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud)))
+    monkeypatch.setattr(cache, "ttl_seconds", 0)
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud)))
+
+    assert gcloud.credentials_fetched == 3
+
+
+def test_failures_are_shared_and_not_cached(kubeconfig: Path) -> None:
+    gcloud = CountingGcloudTool(fail=True)
+
+    async def scenario() -> list[BaseException | None]:
+        return await asyncio.gather(
+            *(connect_cluster(*DEV, tools=_tools(gcloud)) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert gcloud.credentials_fetched == 1
+
+    gcloud.fail = False
+    asyncio.run(connect_cluster(*DEV, tools=_tools(gcloud)))
+    assert gcloud.credentials_fetched == 2
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+
+from sqlalchemy.exc import OperationalError
+
+from rhizome.credentials import (
+    CachingOnePasswordTool,
+    CachingPybritiveTool,
+    CredentialCache,
+    CredentialCacheSettings,
+    CredentialKey,
+    is_auth_error,
+)
+from rhizome.environments.base import SecretManager
+from rhizome.tools import BritiveInfo, OnePasswordTool, PybritiveTool
+
+
+class CountingOnePasswordTool(OnePasswordTool):
+    """1Password tool that counts reads and takes a moment to answer."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    async def read_secret(self, reference: str) -> str:
+        self.reads += 1
+        await asyncio.sleep(0.1)
+        return f"secret-{self.reads}"
+
+
+class CountingPybritiveTool(PybritiveTool):
+    """Pybritive tool that counts its checkouts."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+
+    async def checkout(
+        self, resource_path: str, pattern: str | None = None, database_name: str | None = None
+    ) -> BritiveInfo:
+        self.checkouts += 1
+        return BritiveInfo(username="user", password="pw", host="db", port=3306)
+
+
+def test_secret_reused_within_ttl() -> None:
+    """A second read within the TTL is served from the cache."""
+    inner = CountingOnePasswordTool()
+    keys: list[CredentialKey] = []
+    tool = CachingOnePasswordTool(inner, CredentialCache(), keys)
+
+    assert asyncio.run(tool.read_secret("op://vault/item/password")) == "secret-1"
+    assert asyncio.run(tool.read_secret("op://vault/item/password")) == "secret-1"
+    assert inner.reads == 1
+    assert keys == [(SecretManager.ONEPASSWORD, "op://vault/item/password")] * 2
+
+
+def test_secret_refetched_after_ttl() -> None:
+    """Expired secrets are fetched again."""
+    inner = CountingOnePasswordTool()
+    cache = CredentialCache(CredentialCacheSettings(ttl_seconds=0))
+    tool = CachingOnePasswordTool(inner, cache, [])
+
+    asyncio.run(tool.read_secret("op://vault/item/password"))
+    asyncio.run(tool.read_secret("op://vault/item/password"))
+    assert inner.reads == 2
+
+
+def test_concurrent_reads_share_one_fetch() -> None:
+    """Threads asking for the same secret at once wait on a single fetch."""
+    inner = CountingOnePasswordTool()
+    tool = CachingOnePasswordTool(inner, CredentialCache(), [])
+    results: list[str] = []
+
+    def read() -> None:
+        results.append(asyncio.run(tool.read_secret("op://vault/item/password")))
+
+    threads = [threading.Thread(target=read) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert inner.reads == 1
+    assert results == ["secret-1"] * 5
+
+
+def test_pybritive_lease_honoured() -> None:
+    """Checkouts are reused until shortly before their lease ends."""
+    long_lease = CountingPybritiveTool()
+    cache = CredentialCache(CredentialCacheSettings(lease_seconds=3600, expiry_margin_seconds=60))
+    tool = CachingPybritiveTool(long_lease, cache, [])
+    asyncio.run(tool.checkout("Resources/Prod/db", database_name="billing"))
+    asyncio.run(tool.checkout("Resources/Prod/db", database_name="billing"))
+    assert long_lease.checkouts == 1
+
+    # A lease inside the safety margin is already considered expired
+    short_lease = CountingPybritiveTool()
+    cache = CredentialCache(CredentialCacheSettings(lease_seconds=30, expiry_margin_seconds=60))
+    tool = CachingPybritiveTool(short_lease, cache, [])
+    asyncio.run(tool.checkout("Resources/Prod/db", database_name="orders"))
+    asyncio.run(tool.checkout("Resources/Prod/db", database_name="orders"))
+    assert short_lease.checkouts == 2
+
+
+def test_pybritive_checkouts_cached_per_pattern() -> None:
+    """Checkouts parsed with different patterns don't share a cache entry."""
+    inner = CountingPybritiveTool()
+    keys: list[CredentialKey] = []
+    tool = CachingPybritiveTool(inner, CredentialCache(), keys)
+    asyncio.run(tool.checkout("Resources/Prod/db", pattern="host=(.*)", database_name="billing"))
+    asyncio.run(tool.checkout("Resources/Prod/db", pattern="server=(.*)", database_name="billing"))
+    asyncio.run(tool.checkout("Resources/Prod/db", pattern="host=(.*)", database_name="billing"))
+    assert inner.checkouts == 2
+    assert len(set(keys)) == 2
+
+
+def test_evict_on_auth_failure() -> None:
+    """Rejected credentials are evicted and refetched."""
+    inner = CountingOnePasswordTool()
+    cache = CredentialCache()
+    keys: list[CredentialKey] = []
+    tool = CachingOnePasswordTool(inner, cache, keys)
+
+    asyncio.run(tool.read_secret("op://vault/item/password"))
+    assert cache.evict(keys) == 1
+    assert asyncio.run(tool.read_secret("op://vault/item/password")) == "secret-2"
+
+    stats = cache.describe()
+    assert (stats.hits, stats.misses, stats.evictions) == (0, 2, 1)
+
+    denied = OperationalError("SELECT 1", {}, Exception(1045, "Access denied for user"))
+    assert is_auth_error(denied)
+    assert not is_auth_error(OperationalError("SELECT 1", {}, Exception(2006, "MySQL server has gone away")))
@@ -0,0 +1,130 @@
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from rhizome.engines import EngineRegistry, PoolSettings, is_connection_error
+from rhizome.models.meta.reseller import Reseller
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, ExecuteQueryResponse, GetMode
+from tests.conftest import SQLiteDatabases
+
+
+def test_engine_reused_for_same_connection_string() -> None:
+    """Repeated lookups for a database share one pooled engine."""
+
+    async def scenario(url: str) -> None:
+        registry = EngineRegistry()
+        first = await registry.get_engine("db1", url)
+        second = await registry.get_engine("db1", url)
+        assert first is second
+
+        async with first.connect() as conn:
+            assert (await conn.execute(sqlalchemy.text("SELECT 1"))).scalar() == 1
+
+        listing = registry.list_engines()
+        assert listing.count == 1
+        assert listing.engines[0].database_id == "db1"
+        assert listing.engines[0].checked_in == 1
+        assert listing.engines[0].checked_out == 0
+        await registry.dispose_all()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asyncio.run(scenario(f"sqlite+aiosqlite:///{Path(temp_dir) / 'a.db'}"))
+
+
+def test_engine_replaced_when_connection_string_changes() -> None:
+    """A new port or rotated credentials produce a fresh engine."""
+
+    async def scenario(temp_dir: Path) -> None:
+        registry = EngineRegistry()
+        old = await registry.get_engine("db1", f"sqlite+aiosqlite:///{temp_dir / 'a.db'}")
+        new = await registry.get_engine("db1", f"sqlite+aiosqlite:///{temp_dir / 'b.db'}")
+        assert old is not new
+        assert registry.list_engines().count == 1
+        await registry.dispose_all()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asyncio.run(scenario(Path(temp_dir)))
+
+
+def test_invalidate_and_configure() -> None:
+    """Invalidation drops an engine; reconfiguring rebuilds engines with new settings."""
+
+    async def scenario(url: str) -> None:
+        registry = EngineRegistry()
+        engine = await registry.get_engine("db1", url)
+        assert await registry.invalidate("db1")
+        assert not await registry.invalidate("db1")
+        assert await registry.get_engine("db1", url) is not engine
+
+        await registry.configure(PoolSettings(pool_size=2, max_overflow=0))
+        assert registry.list_engines().count == 0
+        rebuilt = await registry.get_engine("db1", url)
+        assert rebuilt.pool.size() == 2  # type: ignore[attr-defined]
+        await registry.dispose_all()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asyncio.run(scenario(f"sqlite+aiosqlite:///{Path(temp_dir) / 'a.db'}"))
+
+
+def test_is_connection_error() -> None:
+    """MySQL 'server gone away' style failures are connection errors; others are not."""
+    gone = OperationalError("SELECT 1", {}, Exception(2006, "MySQL server has gone away"))
+    syntax = OperationalError("SELECT 1", {}, Exception(1064, "You have an error in your SQL syntax"))
+    assert is_connection_error(gone)
+    assert not is_connection_error(syntax)
+    assert not is_connection_error(ValueError("nope"))
+
+
+def test_execute_query_modes(sqlite_databases: SQLiteDatabases) -> None:
+    """Queries run on the async engine and come back as serialized, sanitized models."""
+    with sqlite3.connect(sqlite_databases.path("dev_meta")) as db:
+        db.executescript(
+            "CREATE TABLE reseller (id INTEGER PRIMARY KEY, name TEXT);"
+            "INSERT INTO reseller (id, name) VALUES (1, 'a'), (2, 'b');"
+        )
+
+    def execute(mode: GetMode) -> ExecuteQueryResponse:
+        request = ExecuteQueryRequest(
+            database_id="dev_meta",
+            sql="SELECT id, name FROM reseller",
+            parameters={},
+            model_module=Reseller.__module__,
+            model_class=Reseller.__name__,
+            mode=mode,
+            sanitize=False,
+        )
+        with TestClient(app) as http:
+            return ExecuteQueryResponse.model_validate(http.post("/execute_query", json=request.model_dump()).json())
+
+    all_rows = execute(GetMode.ALL)
+    assert all_rows.success and all_rows.row_count == 2
+
+    first = execute(GetMode.FIRST)
+    assert first.row_count == 1
+    assert isinstance(first.result, dict) and first.result["name"] == "a"
+
+    one = execute(GetMode.ONE)
+    assert not one.success and one.error == "Query returned 2 results (expected exactly one)"
+
+
+def test_engine_endpoints() -> None:
+    """The server exposes pool settings and lets them be tuned."""
+    with TestClient(app) as client:
+        response = client.post("/engines/settings", json={"pool_size": 3, "max_overflow": 1, "pool_recycle": 600})
+        assert response.status_code == 200
+        assert response.json()["settings"]["pool_size"] == 3
+
+        response = client.get("/engines")
+        assert response.status_code == 200
+        assert response.json()["settings"]["pool_recycle"] == 600
+
+        response = client.delete("/engines/unknown")
+        assert response.json() == {"invalidated": False}
+
+        client.post("/engines/settings", json={})
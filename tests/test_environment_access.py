@@ -153,6 +153,8 @@ for cls in ENVIRONMENT_CLASSES:
         client = RhizomeClient(home=temp_home, tools=mock_tools, data_in_logs=False)
         # Create environment instance
         env_instance = cls(client)
+        # Tables are situated lazily; situate them all up front so environments with unimplemented tables are skipped
+        dict(env_instance.table_situation)
         ENVIRONMENT_INSTANCES[cls] = env_instance
     except Exception:
         # Skip environments that can't be created
@@ -0,0 +1,72 @@
+"""
+Tests for deferred imports (rhizome.lazy) and the environments relying on them.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from rhizome.environments.base import TableSituation
+from rhizome.environments.dev.billing_bookkeeper import DevBillingBookkeeper
+from rhizome.environments.environment_list import RhizomeEnvironment, environment_type
+from rhizome.lazy import LazyMapping, lazy_class, lazy_exports
+from rhizome.models.billing_bookkeeper.fee_category import FeeCategory
+from rhizome.models.billing_bookkeeper.fee_category_v1 import FeeCategoryV1
+from rhizome.models.table_list import BillingBookkeeperTable
+
+
+def test_lazy_mapping_resolves_on_lookup() -> None:
+    mapping: LazyMapping[str, tuple[type, type | None]] = LazyMapping(
+        {"fee_category": ("rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1", None)}
+    )
+
+    assert "fee_category" in mapping and len(mapping) == 1
+    assert mapping.paths["fee_category"] == ("rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1", None)
+    assert mapping["fee_category"] == (FeeCategoryV1, None)
+    assert mapping["fee_category"] is mapping["fee_category"]
+
+
+def test_lazy_class_replaces_itself() -> None:
+    class Holder:
+        FeeCategory: type[FeeCategoryV1] = lazy_class("rhizome.models.billing_bookkeeper.fee_category_v1.FeeCategoryV1")
+
+    assert Holder.FeeCategory is FeeCategoryV1
+    assert Holder.__dict__["FeeCategory"] is FeeCategoryV1
+
+
+def test_lazy_exports() -> None:
+    getattr_ = lazy_exports("rhizome.models.billing_bookkeeper", {"FeeCategoryV1": ".fee_category_v1"})
+
+    assert getattr_("FeeCategoryV1") is FeeCategoryV1
+    with pytest.raises(AttributeError):
+        getattr_("Missing")
+
+
+def test_environments_situate_tables() -> None:
+    assert environment_type[RhizomeEnvironment.dev_billing_bookkeeper] is DevBillingBookkeeper
+
+    env = DevBillingBookkeeper.__new__(DevBillingBookkeeper)
+    # Table situations don't depend on the environment's client, so don't build one
+    env.table_situation = TableSituation(env)
+    model, _ = env.table_situation[BillingBookkeeperTable.fee_category]
+    assert model is FeeCategoryV1
+    assert issubclass(model, FeeCategory)
+    assert DevBillingBookkeeper.FeeCategory is FeeCategoryV1
+
+
+def test_cli_and_environment_list_import_no_models() -> None:
+    script = textwrap.dedent(
+        """
+        import sys
+        import rhizome.cli
+        from rhizome.environments.environment_list import get_environment_enum_by_name
+
+        assert get_environment_enum_by_name("NorthAmericaMeta") == "na_prod_meta"
+        loaded = [m for m in sys.modules if m.startswith(("rhizome.models.billing", "rhizome.server", "rhizome.sync"))]
+        assert not loaded, loaded
+        assert "rhizome.environments.dev.billing_bookkeeper" not in sys.modules
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
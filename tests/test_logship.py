@@ -0,0 +1,141 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from rhizome.client import RhizomeClient
+from rhizome.logship import QueryLogShipper
+from rhizome.server import app
+from trifolium.config import Home
+
+
+class RecordingPost:
+    """Collects shipped batches; can be held closed to simulate a slow server."""
+
+    def __init__(self) -> None:
+        self.batches: list[dict[str, Any]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def __call__(self, body: bytes) -> None:
+        self.entered.set()
+        self.gate.wait(timeout=5)
+        self.batches.append(json.loads(body))
+
+
+def test_records_are_shipped_in_order_on_close() -> None:
+    post = RecordingPost()
+    shipper = QueryLogShipper(post)
+
+    for i in range(5):
+        assert shipper.submit({"query_id": str(i), "duration_ms": 1.0})
+    shipper.close()
+
+    shipped = [entry["query_id"] for batch in post.batches for entry in batch["entries"]]
+    assert shipped == ["0", "1", "2", "3", "4"]
+    stats = shipper.stats()
+    assert stats.submitted == 5
+    assert stats.shipped == 5
+    assert stats.dropped == 0
+    assert stats.queued == 0
+
+
+def test_records_pile_up_into_batches_while_server_is_slow() -> None:
+    post = RecordingPost()
+    shipper = QueryLogShipper(post, max_batch=3)
+
+    post.gate.clear()
+    shipper.submit({"query_id": "first"})
+    assert post.entered.wait(timeout=5)
+    for i in range(7):
+        shipper.submit({"query_id": str(i)})
+    post.gate.set()
+    shipper.close()
+
+    assert [len(batch["entries"]) for batch in post.batches] == [1, 3, 3, 1]
+    assert shipper.stats().batches == 4
+
+
+def test_full_queue_drops_and_reports_count() -> None:
+    post = RecordingPost()
+    shipper = QueryLogShipper(post, max_queue=2)
+
+    # The worker takes the first record and blocks on the server; two more fill the queue
+    post.gate.clear()
+    shipper.submit({"query_id": "in-flight"})
+    assert post.entered.wait(timeout=5)
+    assert shipper.submit({"query_id": "a"})
+    assert shipper.submit({"query_id": "b"})
+    assert not shipper.submit({"query_id": "c"})
+    assert not shipper.submit({"query_id": "d"})
+
+    stats = shipper.stats()
+    assert stats.dropped == 2
+    assert stats.queued == 2
+
+    post.gate.set()
+    shipper.close()
+
+    # The next batch tells the server how many records were lost
+    assert [batch["dropped"] for batch in post.batches] == [0, 2]
+    assert shipper.stats().shipped == 3
+
+
+def test_failed_batches_are_counted_not_raised() -> None:
+    def failing_post(body: bytes) -> None:
+        raise OSError("connection refused")
+
+    shipper = QueryLogShipper(failing_post)
+    shipper.submit({"query_id": "x"})
+    shipper.close()
+
+    stats = shipper.stats()
+    assert stats.failed == 1
+    assert stats.shipped == 0
+    assert not shipper.submit({"query_id": "after close"})
+
+
+def test_log_batch_endpoint() -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/log_batch",
+            json={
+                "entries": [
+                    {
+                        "query_id": "q1",
+                        "statement": "SELECT 1",
+                        "parameters": None,
+                        "database": "meta",
+                        "connection_string": "mysql://127.0.0.1:3306/meta",
+                    },
+                    {"query_id": "q1", "duration_ms": 1.5, "row_count": 1},
+                ],
+                "dropped": 3,
+            },
+        )
+    assert response.status_code == 200
+    assert response.json() == {"status": "logged", "logged": 2}
+
+
+def test_instrumented_engine_queues_logs_without_http(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = RhizomeClient(home=Home.sandbox(tmp_path), data_in_logs=False)
+    posted: list[bytes] = []
+    monkeypatch.setattr(client, "_post_log_batch", posted.append)
+
+    engine = client._create_instrumented_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 42")).scalar() == 42
+    client.close()
+
+    entries = [entry for body in posted for entry in json.loads(body)["entries"]]
+    assert [set(entry) for entry in entries] == [
+        {"query_id", "statement", "parameters", "database", "connection_string"},
+        {"query_id", "duration_ms", "row_count"},
+    ]
+    assert entries[0]["statement"] == "SELECT 42"
+    assert entries[0]["query_id"] == entries[1]["query_id"]
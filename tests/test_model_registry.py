@@ -0,0 +1,131 @@
+"""
+Tests for the model registry (rhizome.model_registry).
+"""
+
+from typing import Annotated
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Field, SQLModel, select
+
+from rhizome import serialization
+from rhizome.model_registry import ModelRegistry, model_id, model_registry
+from rhizome.models.base import RhizomeModel
+from rhizome.models.meta.reseller import Reseller
+from rhizome.models.meta.reseller_plan_trial_v1 import ResellerPlanTrialV1
+from rhizome.sanitize_helpers import SanitizeUUID, sanitize_uuid_field
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, GetMode
+from tests.conftest import SQLiteDatabases
+
+
+class Terminal(RhizomeModel, table=False):
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13)
+    serial: str
+    active: bool = True
+
+
+class TerminalV1(Terminal, table=True):
+    __tablename__ = "model_registry_terminal"  # type: ignore[assignment]
+
+
+def test_model_ids() -> None:
+    assert model_id(Reseller) == "meta.reseller:Reseller"
+    assert model_id(TerminalV1) == "/tests.test_model_registry:TerminalV1"
+
+
+def test_resolve_imports_unregistered_models() -> None:
+    registry = ModelRegistry()
+
+    entry = registry.resolve("meta.reseller_plan_trial_v1:ResellerPlanTrialV1")
+    assert entry.model_class is ResellerPlanTrialV1
+    assert registry.resolve(model_id(TerminalV1)).model_class is TerminalV1
+
+    with pytest.raises(ValueError):
+        registry.resolve("meta.reseller")
+    with pytest.raises(AttributeError):
+        registry.resolve("meta.reseller:Missing")
+
+
+class TerminalSnapshot(Terminal, table=False):
+    """Model that only the metadata test compiles."""
+
+
+def test_register_compiles_serialization_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiled: list[type[SQLModel]] = []
+
+    class CountingNormalizer(serialization.TypeNormalizer):
+        def __init__(self, model_class: type[SQLModel]) -> None:
+            compiled.append(model_class)
+            super().__init__(model_class)
+
+    monkeypatch.setattr(serialization, "TypeNormalizer", CountingNormalizer)
+    registry = ModelRegistry()
+    registry.register(TerminalSnapshot)
+    assert compiled == [TerminalSnapshot]
+
+    # Serialization finds the type coercions already compiled
+    assert list(serialization.type_normalizer(TerminalSnapshot).coercions) == ["active"]
+    assert compiled == [TerminalSnapshot]
+    (info,) = registry.describe().models
+    assert (info.fields, info.coerced_fields, info.sanitized_fields) == (4, ["active"], ["uuid"])
+
+
+def test_register_environments() -> None:
+    registry = ModelRegistry()
+    assert registry.register_environments() > 0
+
+    ids = {model.model_id for model in registry.describe().models}
+    assert {"meta.reseller:Reseller", "meta.reseller_plan_trial_v1:ResellerPlanTrialV1"} <= ids
+
+
+def test_server_lists_models() -> None:
+    model_registry.register(TerminalV1)
+    with TestClient(app) as http:
+        models = http.get("/models").json()["models"]
+
+    terminal = next(model for model in models if model["model_id"] == model_id(TerminalV1))
+    assert terminal == {
+        "model_id": model_id(TerminalV1),
+        "fields": 4,
+        "coerced_fields": ["active"],
+        "sanitized_fields": ["uuid"],
+    }
+
+
+@pytest.fixture
+def terminals(sqlite_databases: SQLiteDatabases) -> SQLiteDatabases:
+    """Serve queries from a SQLite table, resolving the requested model through the registry."""
+    sqlite_databases.add(
+        TerminalV1,
+        "INSERT INTO model_registry_terminal (id, uuid, serial, active) VALUES "
+        "(1, 'TERMINALUUID1', 'C0001', 1), (2, 'TERMINALUUID2', 'C0002', 0)",
+    )
+    return sqlite_databases
+
+
+def test_client_sends_model_id(terminals: SQLiteDatabases) -> None:
+    client = terminals.client()
+
+    results = client.select_all("dev_meta", select(TerminalV1).order_by(TerminalV1.id))  # type: ignore[arg-type]
+
+    assert terminals.model_ids == [model_id(TerminalV1)]
+    assert [type(t) for t in results] == [TerminalV1, TerminalV1]
+    assert [t.active for t in results] == [True, False]
+    assert results[0].uuid == sanitize_uuid_field("TERMINALUUID1", 13)
+
+
+def test_legacy_requests_name_module_and_class(terminals: SQLiteDatabases) -> None:
+    request = ExecuteQueryRequest(
+        database_id="dev_meta",
+        sql="SELECT id, serial FROM model_registry_terminal WHERE id = 2",
+        parameters={},
+        model_module=TerminalV1.__module__,
+        model_class=TerminalV1.__name__,
+        mode=GetMode.FIRST,
+    )
+    with TestClient(app) as http:
+        response = http.post("/execute_query", json=request.model_dump()).json()
+
+    assert response["result"] == {"id": 2, "serial": "C0002"}
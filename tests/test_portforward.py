@@ -0,0 +1,329 @@
+"""
+Tests for CloudSQL port-forward readiness detection and shared port-forwards (rhizome.portforward).
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+import structlog
+from sqlalchemy.exc import OperationalError
+
+import rhizome.cluster
+import rhizome.portforward
+import rhizome.server
+from rhizome.portforward import (
+    SharedPortForward,
+    SharedPortForwards,
+    _discover_remote_port,
+    _proxy_port,
+    _wait_for_port_forward,
+    cloudsql_port_forward,
+    shared_port_forwards,
+)
+from rhizome.server_models import ExecuteQueryRequest, GetMode
+from rhizome.tools import LogLine, SubprocessTools
+from rhizome.tunnels import Tunnel, TunnelManager
+from tests.mocked_subprocesses import (
+    MockGcloudTool,
+    MockKubectlTool,
+    MockLsofTool,
+    MockOnePasswordTool,
+    MockPybritiveTool,
+)
+from tests.utils import get_open_port
+
+PROXY_START = "Starting proxy for connectionName '{connection}' on port '{port}'"
+
+
+class StreamingKubectlTool(MockKubectlTool):
+    """Streams log lines with delays, as a pod does while the proxy starts; each follow gets the next stream."""
+
+    def __init__(self, *streams: list[tuple[float, str]]) -> None:
+        self.streams = list(streams)
+        self.follows = 0
+
+    async def follow_logs(
+        self, context: str, namespace: str, deployment: str, since: str = "10s"
+    ) -> AsyncIterator[LogLine]:
+        stream = self.streams[self.follows]
+        self.follows += 1
+        for delay, content in stream:
+            await asyncio.sleep(delay)
+            yield LogLine(content=content)
+
+
+def _tools(kubectl: MockKubectlTool) -> SubprocessTools:
+    return SubprocessTools(
+        kubectl=kubectl,
+        onepassword=MockOnePasswordTool(),
+        lsof=MockLsofTool(),
+        gcloud=MockGcloudTool(),
+        pybritive=MockPybritiveTool(),
+    )
+
+
+def test_proxy_port() -> None:
+    line = PROXY_START.format(connection="clover-dev:us-central1:billing", port=62956)
+
+    assert _proxy_port(line, "clover-dev:us-central1:billing") == 62956
+    assert _proxy_port(line, None) == 62956
+    assert _proxy_port(line, "clover-dev:us-central1:meta") is None
+    assert _proxy_port("Ready for new connections", None) is None
+
+
+def test_remote_port_is_found_as_soon_as_it_is_logged() -> None:
+    kubectl = StreamingKubectlTool(
+        [(0.0, "Listening for connections"), (0.1, PROXY_START.format(connection="x", port=41000)), (10.0, "late")]
+    )
+
+    start = time.monotonic()
+    port = asyncio.run(
+        _discover_remote_port(_tools(kubectl), "ctx", "ns", "deploy", "x", structlog.get_logger(), timeout=5)
+    )
+
+    assert port == 41000
+    assert time.monotonic() - start < 1
+
+
+def test_ended_log_streams_are_followed_again() -> None:
+    kubectl = StreamingKubectlTool([(0.0, "Container restarting")], [(0.0, PROXY_START.format(connection="x", port=1))])
+
+    port = asyncio.run(
+        _discover_remote_port(_tools(kubectl), "ctx", "ns", "deploy", "x", structlog.get_logger(), timeout=5)
+    )
+
+    assert port == 1
+    assert kubectl.follows == 2
+
+
+def test_remote_port_discovery_times_out() -> None:
+    kubectl = StreamingKubectlTool([(10.0, "never")])
+
+    with pytest.raises(RuntimeError, match="Failed to discover remote port"):
+        asyncio.run(
+            _discover_remote_port(_tools(kubectl), "ctx", "ns", "deploy", "x", structlog.get_logger(), timeout=0.2)
+        )
+
+
+class _Process:
+    def __init__(self, returncode: int | None = None) -> None:
+        self.returncode = returncode
+
+
+def test_port_forward_is_ready_once_it_listens() -> None:
+    port = get_open_port()
+
+    async def scenario() -> float:
+        async def listen_later() -> asyncio.Server:
+            await asyncio.sleep(0.2)
+            return await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", port)
+
+        listening = asyncio.create_task(listen_later())
+        start = time.monotonic()
+        await _wait_for_port_forward(_Process(), port, structlog.get_logger(), timeout=5)  # type: ignore[arg-type]
+        elapsed = time.monotonic() - start
+        server = await listening
+        server.close()
+        await server.wait_closed()
+        return elapsed
+
+    assert 0.2 <= asyncio.run(scenario()) < 1
+
+
+def test_exited_port_forward_fails_fast() -> None:
+    with pytest.raises(RuntimeError, match="exited with code 1"):
+        asyncio.run(
+            _wait_for_port_forward(_Process(returncode=1), get_open_port(), structlog.get_logger(), timeout=5)  # type: ignore[arg-type]
+        )
+
+
+def test_cloudsql_port_forward_with_mocked_tools() -> None:
+    response = asyncio.run(
+        cloudsql_port_forward("ctx", "ns", "deploy", "x", get_open_port(), tools=_tools(MockKubectlTool()))
+    )
+
+    assert response.pid == 12345
+
+
+class _ForwardingProcess:
+    """Stands in for a kubectl port-forward process, recording the ports it forwards."""
+
+    pids = iter(range(50000, 60000))
+
+    def __init__(self, ports: list[tuple[int, int]], new_session: bool) -> None:
+        self.ports = ports
+        self.new_session = new_session
+        self.pid = next(self.pids)
+        self.returncode: int | None = None
+        self.stdout = self.stderr = None
+
+    def terminate(self) -> None:
+        self.returncode = -15
+
+    async def wait(self) -> int | None:
+        return self.returncode
+
+
+class MultiPortKubectlTool(MockKubectlTool):
+    def __init__(self) -> None:
+        self.processes: list[_ForwardingProcess] = []
+
+    async def port_forward_ports(  # type: ignore[override]
+        self,
+        context: str,
+        namespace: str,
+        resource: str,
+        ports: list[tuple[int, int]],
+        *,
+        start_new_session: bool = False,
+    ) -> _ForwardingProcess:
+        await asyncio.sleep(0.05)
+        self.processes.append(_ForwardingProcess(ports, start_new_session))
+        return self.processes[-1]
+
+
+def test_shared_port_forward_coalesces_additions() -> None:
+    kubectl = MultiPortKubectlTool()
+    shared = SharedPortForward("ctx", "ns", "deploy")
+
+    async def scenario() -> list[int]:
+        return await asyncio.gather(*(shared.add(f"db{i}", 30000 + i, 41000 + i, _tools(kubectl)) for i in range(4)))
+
+    pids = asyncio.run(scenario())
+
+    # The first addition starts a process, the rest replace it together
+    assert len(kubectl.processes) == 2
+    first, second = kubectl.processes
+    assert first.ports == [(30000, 41000)]
+    assert first.returncode is not None and second.returncode is None
+    assert second.ports == [(30000 + i, 41000 + i) for i in range(4)]
+    assert pids == [first.pid, second.pid, second.pid, second.pid]
+
+    # Ports already forwarded don't start anything
+    assert asyncio.run(shared.add("db2", 30002, 41002, _tools(kubectl))) == second.pid
+    assert len(kubectl.processes) == 2
+
+
+def test_shared_port_forward_replaces_processes_with_one_carrying_every_port() -> None:
+    kubectl = MultiPortKubectlTool()
+    shared = SharedPortForward("ctx", "ns", "deploy")
+
+    # Databases added one after another end up sharing a process
+    asyncio.run(shared.add("db1", 30001, 41001, _tools(kubectl)))
+    asyncio.run(shared.add("db2", 30002, 41002, _tools(kubectl)))
+    first, second = kubectl.processes
+    assert (first.ports, second.ports) == ([(30001, 41001)], [(30001, 41001), (30002, 41002)])
+    assert first.returncode is not None
+    assert shared.describe().pids == [second.pid]
+
+    # Databases whose process exited are forwarded again, along with the others
+    second.terminate()
+    asyncio.run(shared.add("db2", 30002, 41002, _tools(kubectl)))
+    assert kubectl.processes[-1].ports == [(30001, 41001), (30002, 41002)]
+    assert shared.describe().pids == [kubectl.processes[-1].pid]
+
+
+def test_shared_port_forward_stops_unused_processes() -> None:
+    kubectl = MultiPortKubectlTool()
+    shared = SharedPortForward("ctx", "ns", "deploy")
+
+    async def scenario() -> None:
+        await asyncio.gather(*(shared.add(f"db{i}", 30000 + i, 41000 + i, _tools(kubectl)) for i in (1, 2, 3)))
+
+    asyncio.run(scenario())
+    process = kubectl.processes[-1]
+    assert process.ports == [(30001, 41001), (30002, 41002), (30003, 41003)]
+
+    # Dropping a port doesn't interrupt the other databases; the last one using the process stops it
+    assert shared.remove("db2")
+    assert process.returncode is None
+    assert [mapping.database_id for mapping in shared.describe().mappings] == ["db1", "db3"]
+    assert shared.remove("db3") and not shared.remove("db3")
+    assert process.returncode is None
+    assert shared.remove("db1")
+    assert process.returncode is not None
+    assert shared.describe().pids == []
+
+
+def test_sequential_databases_share_a_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    kubectl = MultiPortKubectlTool()
+    shared_forwards = SharedPortForwards()
+    manager = TunnelManager()
+
+    async def connect_cluster(project: str, cluster: str, region: str, server: str, tools: object) -> None:
+        pass
+
+    monkeypatch.setattr(rhizome.cluster, "connect_cluster", connect_cluster)
+    monkeypatch.setattr(rhizome.server, "_ServerTools", lambda: _tools(kubectl))
+    monkeypatch.setattr(rhizome.server, "tunnel_manager", manager)
+    monkeypatch.setattr(rhizome.server, "shared_port_forwards", shared_forwards)
+    monkeypatch.setattr(rhizome.portforward, "shared_port_forwards", shared_forwards)
+
+    async def scenario() -> list[int]:
+        ports: list[int] = []
+        for database_id in ("dev_billing_event", "dev_billing_bookkeeper"):
+            config = rhizome.server._environment_class(database_id).get_port_forward_config()
+            ports.append(await rhizome.server._ensure_port_forward(database_id, config))
+        return ports
+
+    event_port, bookkeeper_port = asyncio.run(scenario())
+
+    # Only the requested databases are forwarded, and the second replaced the first's process
+    first, second = kubectl.processes
+    assert [local_port for local_port, _ in first.ports] == [event_port]
+    assert [local_port for local_port, _ in second.ports] == [event_port, bookkeeper_port]
+    assert first.returncode is not None and second.returncode is None
+    (shared,) = shared_forwards.describe().port_forwards
+    assert shared.pids == [second.pid]
+    assert [mapping.database_id for mapping in shared.mappings] == ["dev_billing_event", "dev_billing_bookkeeper"]
+
+
+def test_unshared_port_forward_stays_in_the_callers_session() -> None:
+    kubectl = MultiPortKubectlTool()
+
+    asyncio.run(cloudsql_port_forward("ctx", "ns", "deploy", "x", get_open_port(), tools=_tools(kubectl)))
+
+    # Nothing else stops it, so it goes with the caller
+    (process,) = kubectl.processes
+    assert not process.new_session
+
+
+def test_cloudsql_port_forwards_share_a_process() -> None:
+    kubectl = MultiPortKubectlTool()
+    shared = shared_port_forwards.get("ctx-shared", "ns", "deploy")
+
+    async def scenario() -> None:
+        for database_id, local_port in (("db1", get_open_port()), ("db2", get_open_port())):
+            response = await cloudsql_port_forward(
+                "ctx-shared", "ns", "deploy", "x", local_port, tools=_tools(kubectl), share_as=database_id
+            )
+            assert response.status == "shared"
+
+    asyncio.run(scenario())
+
+    # Shared port-forwards outlive a Ctrl-C of the server, in their own session
+    assert kubectl.processes[-1].returncode is None and kubectl.processes[-1].new_session
+    assert [mapping.database_id for mapping in shared.describe().mappings] == ["db1", "db2"]
+    assert {mapping.remote_port for mapping in shared.describe().mappings} == {62956}
+    assert shared_port_forwards.local_ports() >= {mapping.local_port for mapping in shared.describe().mappings}
+    shared.remove("db1")
+    shared.remove("db2")
+
+
+def test_connection_errors_leave_shared_tunnels_to_the_health_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = TunnelManager()
+    monkeypatch.setattr(rhizome.server, "tunnel_manager", manager)
+    released: list[str] = []
+    manager.adopt(Tunnel("shared", 30001, None, time.time(), release=lambda: released.append("shared")))
+    manager.adopt(Tunnel("own", 30002, None, time.time()))
+    error = OperationalError("SELECT 1", {}, Exception(2013, "Lost connection to MySQL server during query"))
+
+    for database_id in ("shared", "own"):
+        request = ExecuteQueryRequest(database_id=database_id, sql="SELECT 1", parameters={}, mode=GetMode.ALL)
+        asyncio.run(rhizome.server._handle_query_error(request, "query", error, time.time()))
+
+    # Other databases still use the shared port-forward
+    assert manager.get("shared") is not None and released == []
+    assert manager.get("own") is None
@@ -0,0 +1,105 @@
+"""
+Tests for projection pushdown: only the columns a query selects are sanitized and serialized.
+"""
+
+from typing import Annotated
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Field, select
+
+from rhizome.models.base import RhizomeModel
+from rhizome.models.meta.reseller import Reseller
+from rhizome.sanitize_helpers import SanitizeUUID, sanitize_uuid_field
+from rhizome.serialization import serialize_query, serialize_rows
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, GetMode
+from tests.conftest import SQLiteDatabases
+
+
+class Merchant(RhizomeModel, table=False):
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13)
+    name: str
+    reseller_uuid: Annotated[str | None, SanitizeUUID(13)] = Field(default=None, max_length=13)
+    is_test: bool = False
+
+
+class MerchantV1(Merchant, table=True):
+    __tablename__ = "projection_merchant"  # type: ignore[assignment]
+
+
+def test_full_rows_match_model_serialization() -> None:
+    columns = list(MerchantV1.model_fields)
+    rows = [(1, "MERCHANTUUID1", "Bakery", "RESELLERUUID1", 0), (2, "MERCHANTUUID2", "Cafe", None, 1)]
+
+    projection, serialized = serialize_rows(columns, rows, MerchantV1)
+
+    assert projection == columns
+    models = [MerchantV1.model_validate(dict(zip(columns, row, strict=True))) for row in rows]
+    assert serialized == [model.sanitize().model_dump(mode="json") for model in models]
+
+
+def test_partial_rows_hold_only_projected_columns() -> None:
+    columns = ["uuid", "name", "row_number"]
+    rows = [("MERCHANTUUID1", "Bakery", 1)]
+
+    projection, serialized = serialize_rows(columns, rows, MerchantV1)
+
+    # Unselected fields aren't filled with defaults, extra labels aren't model fields
+    assert projection == ["uuid", "name"]
+    assert serialized == [{"uuid": sanitize_uuid_field("MERCHANTUUID1", 13), "name": "Bakery"}]
+
+
+def test_unsanitized_python_mode() -> None:
+    _, serialized = serialize_rows(["id", "is_test"], [(1, 1)], MerchantV1, sanitize=False, mode="python")
+    assert serialized == [{"id": 1, "is_test": True}]
+
+
+@pytest.fixture
+def server_db(sqlite_databases: SQLiteDatabases) -> SQLiteDatabases:
+    """Serve queries from a SQLite table instead of a tunnelled MySQL database."""
+    sqlite_databases.add(
+        MerchantV1,
+        "INSERT INTO projection_merchant (id, uuid, name, reseller_uuid, is_test) VALUES "
+        "(1, 'MERCHANTUUID1', 'Bakery', 'RESELLERUUID1', 0), (2, 'MERCHANTUUID2', 'Cafe', NULL, 1)",
+    )
+    return sqlite_databases
+
+
+@pytest.mark.parametrize("mode", [GetMode.FIRST, GetMode.ALL, GetMode.ONE])
+def test_response_reports_projection(server_db: SQLiteDatabases, mode: GetMode) -> None:
+    query = select(MerchantV1).with_only_columns(MerchantV1.id, MerchantV1.name).where(MerchantV1.id == 1)  # type: ignore[arg-type]
+    sql, parameters = serialize_query(query)
+    request = ExecuteQueryRequest(
+        database_id="dev_meta",
+        sql=sql,
+        parameters=parameters,
+        model_module=MerchantV1.__module__,
+        model_class=MerchantV1.__name__,
+        mode=mode,
+    )
+    with TestClient(app) as http:
+        response = http.post("/execute_query", json=request.model_dump()).json()
+
+    assert response["columns"] == ["id", "name"]
+    rows = response["result"] if mode == GetMode.ALL else [response["result"]]
+    assert rows == [{"id": 1, "name": "Bakery"}]
+
+
+def test_client_builds_partial_models(server_db: SQLiteDatabases) -> None:
+    client = server_db.client()
+
+    query = select(MerchantV1).with_only_columns(MerchantV1.id, MerchantV1.uuid).order_by(MerchantV1.id)  # type: ignore[arg-type]
+    merchants = client.select_all("dev_meta", query)
+
+    assert [m.id for m in merchants] == [1, 2]
+    assert merchants[0].uuid == sanitize_uuid_field("MERCHANTUUID1", 13)
+    # Unselected fields come from the model's defaults on the client
+    assert merchants[0].is_test is False
+
+
+def test_reseller_projection_skips_unselected_columns() -> None:
+    projection, serialized = serialize_rows(["id", "uuid"], [(1, "RESELLERUUID1")], Reseller)
+    assert projection == ["id", "uuid"]
+    assert set(serialized[0]) == {"id", "uuid"}
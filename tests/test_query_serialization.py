@@ -14,6 +14,8 @@ from datetime import datetime
 import pytest
 from sqlmodel import Field, SQLModel, select
 
+from rhizome.serialization import _statement_cache, serialize_query
+
 
 # Test models
 class SampleModel(SQLModel, table=True):
@@ -41,26 +43,6 @@ class ComplexModel(SQLModel, table=True):
     status: str = "pending"
 
 
-def serialize_query(query: select) -> tuple[str, dict[str, any]]:
-    """
-    Serialize a SQLModel query to SQL string + parameters.
-
-    Args:
-        query: SQLModel select query
-
-    Returns:
-        Tuple of (sql_string, parameters_dict)
-    """
-    # Compile the query to get SQL and parameters
-    compiled = query.compile(compile_kwargs={"literal_binds": False})
-
-    # Extract SQL string and parameters
-    sql = str(compiled)
-    params = dict(compiled.params) if compiled.params else {}
-
-    return sql, params
-
-
 def test_simple_select_all() -> None:
     """Test serialization of simple SELECT * query."""
     query = select(SampleModel)
@@ -271,6 +253,30 @@ def test_parameter_type_preservation(test_value: str | int | float | bool | None
         assert any(isinstance(v, expected_type) for v in param_values)
 
 
+def test_repeated_statement_reuses_compiled_sql() -> None:
+    """Statements differing only in their values share one cached compilation."""
+    first_sql, first_params = serialize_query(select(SampleModel).where(SampleModel.name == "a").limit(5))
+    cached = len(_statement_cache)
+    second_sql, second_params = serialize_query(select(SampleModel).where(SampleModel.name == "b").limit(7))
+
+    assert len(_statement_cache) == cached
+    assert second_sql == first_sql
+    assert list(first_params.values()) == ["a", 5]
+    assert list(second_params.values()) == ["b", 7]
+
+
+def test_cached_statement_with_in_clause() -> None:
+    serialize_query(select(SampleModel).where(SampleModel.id.in_([1, 2, 3])))  # type: ignore[union-attr]
+    _, params = serialize_query(select(SampleModel).where(SampleModel.id.in_([4, 5])))  # type: ignore[union-attr]
+    assert list(params.values()) == [[4, 5]]
+
+
+def test_different_shapes_are_cached_separately() -> None:
+    by_name, _ = serialize_query(select(SampleModel).where(SampleModel.name == "a"))
+    by_value, _ = serialize_query(select(SampleModel).where(SampleModel.value == 1))
+    assert by_name != by_value
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,181 @@
+"""
+Tests for the query result cache (rhizome.result_cache).
+"""
+
+import time
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Field, SQLModel, select
+
+from rhizome.client import BatchQuery
+from rhizome.model_registry import model_id
+from rhizome.result_cache import ResultCache, ResultCacheSettings, referenced_tables, result_cache
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, ExecuteQueryResponse, GetMode
+from tests.conftest import SQLiteDatabases
+
+
+class ReferenceRow(SQLModel, table=True):
+    __tablename__ = "result_cache_reference"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str
+
+
+def _request(sql: str, database_id: str = "dev_billing", **parameters: Any) -> ExecuteQueryRequest:  # noqa: ANN401
+    return ExecuteQueryRequest(
+        database_id=database_id, sql=sql, parameters=parameters, model_id="/x:Y", mode=GetMode.ALL
+    )
+
+
+def _response(rows: int = 1) -> ExecuteQueryResponse:
+    return ExecuteQueryResponse(
+        success=True, result=[{"id": i, "name": "x" * 100} for i in range(rows)], row_count=rows
+    )
+
+
+def test_referenced_tables() -> None:
+    assert referenced_tables("SELECT fee_category.id FROM fee_category WHERE fee_category.id = %(id)s") == {
+        "fee_category"
+    }
+    assert referenced_tables(
+        "SELECT * FROM `billing`.`fee_category` AS f LEFT OUTER JOIN server_config s ON s.id = f.id, lexi_attribute"
+    ) == {"fee_category", "server_config", "lexi_attribute"}
+    assert referenced_tables("UPDATE account SET name = :name WHERE id = :id") == {"account"}
+    assert referenced_tables("INSERT INTO reseller_role (id) VALUES (:id)") == {"reseller_role"}
+    assert referenced_tables(
+        "SELECT t.id FROM (SELECT id FROM fee_category WHERE name IN ('a, b', 'FROM x')) AS t, billing_archetype"
+    ) == {"fee_category", "billing_archetype"}
+
+
+def test_disabled_by_default() -> None:
+    cache = ResultCache()
+    request = _request("SELECT * FROM fee_category")
+
+    assert not cache.put(request, _response(), cache.generation)
+    assert cache.get(request) is None
+
+
+def test_hits_match_database_sql_params_and_sanitize() -> None:
+    cache = ResultCache(ResultCacheSettings(enabled=True))
+    request = _request("SELECT * FROM fee_category WHERE id = %(id)s", id=1)
+    response = _response()
+
+    assert cache.put(request, response, cache.generation)
+    assert cache.get(_request("SELECT * FROM fee_category WHERE id = %(id)s", id=1)) is response
+    assert cache.get(_request("SELECT * FROM fee_category WHERE id = %(id)s", id=2)) is None
+    assert cache.get(_request("SELECT * FROM fee_category WHERE id = %(id)s", database_id="demo_billing", id=1)) is None
+    assert cache.get(request.model_copy(update={"sanitize": False})) is None
+    assert cache.get(request, dump_mode="python") is None
+
+    status = cache.describe()
+    assert (status.entries, status.hits, status.misses) == (1, 1, 4)
+
+
+def test_only_tables_with_a_ttl_are_cached() -> None:
+    cache = ResultCache(ResultCacheSettings(enabled=True))
+
+    assert not cache.put(_request("SELECT * FROM merchant"), _response(), cache.generation)
+    assert not cache.put(
+        _request("SELECT * FROM fee_category JOIN merchant ON merchant.id = fee_category.id"),
+        _response(),
+        cache.generation,
+    )
+    assert not cache.put(_request("SELECT * FROM fee_category"), _response().model_copy(update={"success": False}), 0)
+    assert cache.put(_request("SELECT * FROM fee_category"), _response(), cache.generation)
+
+
+def test_entries_expire() -> None:
+    cache = ResultCache(ResultCacheSettings(enabled=True, table_ttl_seconds={"fee_category": 0.05}))
+    request = _request("SELECT * FROM fee_category")
+    cache.put(request, _response(), cache.generation)
+
+    assert cache.get(request) is not None
+    time.sleep(0.1)
+    assert cache.get(request) is None
+    assert cache.describe().entries == 0
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    size = len(_response().model_dump_json())
+    cache = ResultCache(ResultCacheSettings(enabled=True, max_bytes=size * 2))
+    first, second, third = (_request("SELECT * FROM fee_category", id=i) for i in range(3))
+
+    cache.put(first, _response(), cache.generation)
+    cache.put(second, _response(), cache.generation)
+    cache.get(first)
+    cache.put(third, _response(), cache.generation)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.get(third) is not None
+    assert cache.describe().evictions == 1
+    # Responses bigger than the whole cache aren't cached
+    assert not cache.put(first, _response(rows=10), cache.generation)
+
+
+def test_writes_invalidate_tables() -> None:
+    cache = ResultCache(ResultCacheSettings(enabled=True))
+    fee_categories = _request("SELECT * FROM fee_category")
+    server_config = _request("SELECT * FROM server_config")
+    elsewhere = _request("SELECT * FROM fee_category", database_id="demo_billing")
+    for request in (fee_categories, server_config, elsewhere):
+        cache.put(request, _response(), cache.generation)
+
+    assert cache.invalidate("dev_billing", referenced_tables("UPDATE fee_category SET name = :name")) == 1
+
+    assert cache.get(fee_categories) is None
+    assert cache.get(server_config) is not None
+    assert cache.get(elsewhere) is not None
+
+
+def test_results_fetched_before_a_write_are_not_cached() -> None:
+    cache = ResultCache(ResultCacheSettings(enabled=True))
+    request = _request("SELECT * FROM fee_category")
+
+    generation = cache.generation
+    cache.invalidate("dev_billing", frozenset({"fee_category"}))
+
+    assert not cache.put(request, _response(), generation)
+
+
+@pytest.fixture
+def reference_table(sqlite_databases: SQLiteDatabases) -> Generator[SQLiteDatabases, None, None]:
+    """Serve queries from a SQLite reference table with the result cache enabled."""
+    sqlite_databases.add(
+        ReferenceRow,
+        "INSERT INTO result_cache_reference (id, name) VALUES (1, 'Processing'), (2, 'Hardware')",
+        database_id="dev_billing",
+    )
+
+    settings = result_cache.settings
+    with TestClient(app) as http:
+        http.post("/result_cache/settings", json={"enabled": True, "table_ttl_seconds": {"result_cache_reference": 60}})
+    yield sqlite_databases
+    result_cache.configure(settings)
+
+
+def test_hits_skip_the_database(reference_table: SQLiteDatabases) -> None:
+    client = reference_table.client()
+    prepared = reference_table.model_ids
+
+    query = select(ReferenceRow).order_by(ReferenceRow.id)  # type: ignore[arg-type]
+    first = client.select_all("dev_billing", query)
+    second = client.select_all("dev_billing", query)
+    assert [c.name for c in first] == [c.name for c in second] == ["Processing", "Hardware"]
+    assert prepared == [model_id(ReferenceRow)]
+
+    # Batches share the cache too (under their own key, as their results are encoded differently)
+    for _ in range(2):
+        (batched,) = client.select_many([BatchQuery("dev_billing", query, mode=GetMode.ALL)])
+        assert [c.name for c in batched.value] == ["Processing", "Hardware"]
+    assert prepared == [model_id(ReferenceRow)] * 2
+
+    with TestClient(app) as http:
+        status = http.get("/result_cache").json()
+        cleared = http.delete("/result_cache").json()
+    assert status["entries"] == 2 and status["hits"] == 2
+    assert cleared["entries"] == 0
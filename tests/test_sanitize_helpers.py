@@ -0,0 +1,99 @@
+"""
+Tests for UUID hashing (rhizome.sanitize_helpers).
+"""
+
+import hashlib
+import os
+from typing import Annotated
+
+import base58
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Field
+
+from rhizome.models.base import RhizomeModel
+from rhizome.sanitize_helpers import (
+    SanitizeUUID,
+    b58encode_digest,
+    hash_cache_stats,
+    hash_uuid_to_base58,
+    sanitize_uuid_field,
+    sanitized_fields,
+)
+from rhizome.server import app
+
+
+class Charge(RhizomeModel, table=False):
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: Annotated[str, SanitizeUUID(13)] = Field(max_length=13, unique=True)
+    request_uuid: Annotated[str | None, SanitizeUUID(26)] = Field(default=None, max_length=26)
+    amount: int
+
+
+class ChargeV1(Charge, table=True):
+    __tablename__ = "sanitize_helpers_charge"  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize(
+    "digest",
+    [
+        b"\0" * 32,
+        b"\0" * 31 + b"\1",
+        b"\0\0" + b"\xff" * 30,
+        b"\xff" * 32,
+        *(hashlib.sha256(os.urandom(16)).digest() for _ in range(200)),
+    ],
+)
+def test_b58encode_digest_matches_base58(digest: bytes) -> None:
+    assert b58encode_digest(digest) == base58.b58encode(digest).decode("ascii")
+
+
+def test_hash_output_is_unchanged() -> None:
+    # Values computed before hashes were cached and base58 encoding was inlined
+    assert hash_uuid_to_base58("f47ac10b-58cc-4372-a567-0e02b2c3d479", 13) == "HashAeBwnrjg1"
+    assert hash_uuid_to_base58("f47ac10b-58cc-4372-a567-0e02b2c3d479", 3) == "AeB"
+    assert len(hash_uuid_to_base58("x", 100)) == 100
+    assert sanitize_uuid_field(b"\x01\x02", 13) == hash_uuid_to_base58("0102", 13)
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    hash_uuid_to_base58.cache_clear()
+    for _ in range(3):
+        hash_uuid_to_base58("billing-entity", 13)
+    hash_uuid_to_base58("billing-entity", 36)
+
+    stats = hash_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+
+def test_server_reports_cache() -> None:
+    with TestClient(app) as http:
+        http.delete("/sanitize/cache")
+        hash_uuid_to_base58("fee-rate", 13)
+        hash_uuid_to_base58("fee-rate", 13)
+        stats = http.get("/sanitize/cache").json()
+        cleared = http.delete("/sanitize/cache").json()
+
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert cleared["size"] == 0
+
+
+def test_sanitized_fields() -> None:
+    assert sanitized_fields(Charge) == {"uuid": 13, "request_uuid": 26}
+    assert sanitized_fields(ChargeV1) == {"uuid": 13, "request_uuid": 26}
+
+
+def test_sanitize_hashes_declared_fields() -> None:
+    charge = Charge(id=7, uuid="ABCDEFGHIJKLM", request_uuid=None, amount=100)
+
+    sanitized = charge.sanitize()
+
+    assert sanitized is not charge
+    assert sanitized.model_dump() == {
+        "id": 7,
+        "uuid": hash_uuid_to_base58("ABCDEFGHIJKLM", 13),
+        "request_uuid": None,
+        "amount": 100,
+    }
+    assert charge.uuid == "ABCDEFGHIJKLM"
+    assert type(ChargeV1(uuid="ABCDEFGHIJKLM", amount=1).sanitize()) is ChargeV1
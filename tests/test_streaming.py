@@ -0,0 +1,104 @@
+"""
+Tests for streaming query results (/execute_query_stream and RhizomeClient.select_iter).
+
+The server's engine is replaced with a SQLite database so that the streaming path
+(server-side cursor, NDJSON batches, incremental client deserialization) runs end to end.
+"""
+
+import asyncio
+import json
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Field, select
+
+import rhizome.server
+from rhizome.models.base import RhizomeModel
+from rhizome.sanitize_helpers import sanitize_uuid_field
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, GetMode
+from tests.conftest import SQLiteDatabases
+
+ROW_COUNT = 25
+
+
+class StreamedRow(RhizomeModel, table=True):
+    """Small model standing in for a large production table."""
+
+    __tablename__ = "streamed_row"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+    uuid: str = Field(max_length=13)
+    name: str
+
+    def sanitize(self) -> "StreamedRow":
+        """Return a sanitized copy of this row."""
+        return StreamedRow(id=self.id, uuid=sanitize_uuid_field(self.uuid, 13) or self.uuid, name=self.name)
+
+
+@pytest.fixture
+def sqlite_server(sqlite_databases: SQLiteDatabases) -> Generator[TestClient, None, None]:
+    """Serve queries from a SQLite table instead of a tunnelled MySQL database."""
+    sqlite_databases.add(
+        StreamedRow, [StreamedRow(id=i + 1, uuid=f"RESELLER{i:05d}", name=f"row {i}") for i in range(ROW_COUNT)]
+    )
+    with TestClient(app) as client:
+        yield client
+
+
+def _request(sql: str, batch_size: int = 10) -> dict[str, Any]:
+    return ExecuteQueryRequest(
+        database_id="dev_meta",
+        sql=sql,
+        parameters={},
+        model_module=StreamedRow.__module__,
+        model_class=StreamedRow.__name__,
+        mode=GetMode.STREAM,
+        sanitize=False,
+        batch_size=batch_size,
+    ).model_dump()
+
+
+def test_stream_endpoint_sends_batches(sqlite_server: TestClient) -> None:
+    """Rows arrive as NDJSON batches of batch_size, followed by a final summary line."""
+    response = sqlite_server.post("/execute_query_stream", json=_request("SELECT * FROM streamed_row"))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    chunks = [json.loads(line) for line in response.text.splitlines()]
+    assert [len(c["rows"]) for c in chunks] == [10, 10, 5, 0]
+    assert chunks[-1]["done"] is True
+    assert chunks[-1]["row_count"] == ROW_COUNT
+    assert chunks[0]["rows"][0]["name"] == "row 0"
+
+
+def test_stream_endpoint_reports_errors(sqlite_server: TestClient) -> None:
+    """A failing query ends the stream with an error line."""
+    response = sqlite_server.post("/execute_query_stream", json=_request("SELECT * FROM no_such_table"))
+    chunks = [json.loads(line) for line in response.text.splitlines()]
+    assert chunks[-1]["done"] is True
+    assert "no_such_table" in chunks[-1]["error"]
+
+
+def test_select_iter(sqlite_server: TestClient, sqlite_databases: SQLiteDatabases) -> None:
+    """select_iter yields deserialized models lazily, batch by batch."""
+    client = sqlite_databases.client()
+
+    results = client.select_iter("dev_meta", select(StreamedRow), sanitize=False, batch_size=7)
+    first = next(results)
+    assert isinstance(first, StreamedRow)
+    assert first.name == "row 0"
+    assert len([first, *results]) == ROW_COUNT
+
+
+def test_stream_mode_rejected_by_execute_query() -> None:
+    """/execute_query points STREAM requests at the streaming endpoint."""
+
+    async def scenario() -> None:
+        response = await rhizome.server._run_query(None, ExecuteQueryRequest(**_request("SELECT 1")), StreamedRow)  # type: ignore
+        assert not response.success
+        assert response.error == "STREAM mode requires /execute_query_stream"
+
+    asyncio.run(scenario())
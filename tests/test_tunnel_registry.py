@@ -0,0 +1,254 @@
+"""
+Tests for tunnels persisted across server restarts (rhizome.tunnel_registry, SharedPortForwards.adopt).
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import rhizome.server
+from rhizome.portforward import SharedPortForwards, _AdoptedProcess
+from rhizome.server import app
+from rhizome.tools import SubprocessTools
+from rhizome.tunnel_registry import PersistedTunnel, TunnelRegistry, pid_alive, tunnel_registry
+from rhizome.tunnels import TunnelManager
+from tests.mocked_subprocesses import (
+    MockGcloudTool,
+    MockKubectlTool,
+    MockLsofTool,
+    MockOnePasswordTool,
+    MockPybritiveTool,
+)
+from tests.utils import get_open_port
+
+
+def _process(*ports: int) -> subprocess.Popen[bytes]:
+    """
+    A process standing in for a port-forward a previous server left running.
+
+    With ports, its command line reads like that of a kubectl port-forward forwarding them to port 41000;
+    without, it is an unrelated process (e.g. one that reused a port-forward's pid).
+    """
+    if ports:
+        forwarded = [f"{port}:41000" for port in ports]
+        args = [sys.executable, "-c", "import time; time.sleep(30)", "kubectl", "port-forward", "deployment/deploy"]
+        process = subprocess.Popen([*args, *forwarded])
+    else:
+        process = subprocess.Popen(["sleep", "30"])
+    # Reap it once it's terminated, as init would for a real orphan
+    threading.Thread(target=process.wait, daemon=True).start()
+    return process
+
+
+def _gone(pid: int, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while pid_alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not pid_alive(pid)
+
+
+def _tunnel(database_id: str, local_port: int, pid: int) -> PersistedTunnel:
+    return PersistedTunnel(
+        database_id=database_id,
+        kube_context="ctx",
+        kube_namespace="ns",
+        kube_deployment="deploy",
+        local_port=local_port,
+        remote_port=41000,
+        pid=pid,
+        established_at=time.time(),
+    )
+
+
+@pytest.fixture
+def listening_port() -> Generator[int, None, None]:
+    """A local port accepting connections, as a live port-forward's does."""
+    port = get_open_port()
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", port))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield port
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
+
+
+@pytest.fixture
+def registry_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "state" / "tunnels.json"
+    monkeypatch.setattr(tunnel_registry, "path", path)
+    return path
+
+
+def test_registry_round_trip(tmp_path: Path) -> None:
+    registry = TunnelRegistry(tmp_path / "tunnels.json")
+    tunnels = [_tunnel("db1", 30001, 123), _tunnel("db2", 30002, 123)]
+
+    registry.save(tunnels)
+    assert registry.load() == tunnels
+
+    registry.path.write_text("{not json")  # type: ignore[union-attr]
+    assert registry.load() == []
+
+    TunnelRegistry().save(tunnels)  # Without a path nothing is recorded
+    assert TunnelRegistry().load() == []
+
+
+def test_validate_drops_stale_tunnels(tmp_path: Path, listening_port: int) -> None:
+    refused_port = get_open_port()
+    alive = _process(listening_port, refused_port)
+    unrelated = _process()
+    exited = subprocess.Popen(["true"])
+    exited.wait()
+    registry = TunnelRegistry(tmp_path / "tunnels.json")
+    registry.save(
+        [
+            _tunnel("valid", listening_port, alive.pid),
+            _tunnel("refused", refused_port, alive.pid),
+            _tunnel("exited", listening_port, exited.pid),
+            _tunnel("reused", listening_port, unrelated.pid),
+        ]
+    )
+
+    try:
+        valid = asyncio.run(registry.validate(probe_timeout=0.5))
+    finally:
+        alive.terminate()
+        unrelated.terminate()
+
+    assert [tunnel.database_id for tunnel in valid] == ["valid"]
+
+
+def test_adopted_process_signals_only_its_port_forward(listening_port: int) -> None:
+    unrelated = _process()
+    port_forward = _process(listening_port)
+
+    try:
+        # A pid reused since adoption is left alone
+        _AdoptedProcess(unrelated.pid, "deploy", [(listening_port, 41000)]).terminate()
+        assert pid_alive(unrelated.pid)
+
+        _AdoptedProcess(port_forward.pid, "deploy", [(listening_port, 41000)]).terminate()
+        assert _gone(port_forward.pid)
+    finally:
+        unrelated.terminate()
+        port_forward.terminate()
+
+
+class _ForwardingProcess:
+    pid = 99999
+    stdout = stderr = None
+
+    def __init__(self, ports: list[tuple[int, int]]) -> None:
+        self.ports = ports
+        self.returncode: int | None = None
+
+    def terminate(self) -> None:
+        self.returncode = -15
+
+    async def wait(self) -> int | None:
+        return self.returncode
+
+
+class MultiPortKubectlTool(MockKubectlTool):
+    def __init__(self) -> None:
+        self.processes: list[_ForwardingProcess] = []
+
+    async def port_forward_ports(  # type: ignore[override]
+        self,
+        context: str,
+        namespace: str,
+        resource: str,
+        ports: list[tuple[int, int]],
+        *,
+        start_new_session: bool = False,
+    ) -> _ForwardingProcess:
+        self.processes.append(_ForwardingProcess(ports))
+        return self.processes[-1]
+
+
+def test_adopted_port_forward_is_replaced_when_a_database_is_added(registry_path: Path, listening_port: int) -> None:
+    previous = _process(listening_port)
+    tunnel_registry.save([_tunnel("db1", listening_port, previous.pid)])
+    shared_port_forwards = SharedPortForwards()
+    kubectl = MultiPortKubectlTool()
+    tools = SubprocessTools(
+        kubectl=kubectl,
+        onepassword=MockOnePasswordTool(),
+        lsof=MockLsofTool(),
+        gcloud=MockGcloudTool(),
+        pybritive=MockPybritiveTool(),
+    )
+
+    async def scenario() -> None:
+        adopted = await shared_port_forwards.adopt()
+        assert [tunnel.database_id for tunnel in adopted] == ["db1"]
+        assert shared_port_forwards.describe().port_forwards[0].pids == [previous.pid]
+
+        await shared_port_forwards.get("ctx", "ns", "deploy").add("db2", 30002, 41002, tools)
+
+    try:
+        asyncio.run(scenario())
+        # One process now carries both databases, and the registry records it for both
+        assert _gone(previous.pid)
+        assert kubectl.processes[0].ports == [(listening_port, 41000), (30002, 41002)]
+        assert [(tunnel.database_id, tunnel.pid) for tunnel in tunnel_registry.load()] == [
+            ("db1", 99999),
+            ("db2", 99999),
+        ]
+    finally:
+        previous.terminate()
+
+
+@pytest.mark.parametrize("keep_tunnels", [False, True])
+def test_server_adopts_tunnels_at_startup(
+    registry_path: Path, listening_port: int, monkeypatch: pytest.MonkeyPatch, keep_tunnels: bool
+) -> None:
+    previous = _process(listening_port)
+    tunnel_registry.save([_tunnel("dev_billing_event", listening_port, previous.pid)])
+    monkeypatch.setattr(rhizome.server, "shared_port_forwards", SharedPortForwards())
+    monkeypatch.setattr(rhizome.server, "tunnel_manager", TunnelManager())
+    monkeypatch.setattr(rhizome.server, "_keep_tunnels", keep_tunnels)
+
+    try:
+        with TestClient(app) as http:
+            tunnel = rhizome.server.tunnel_manager.get("dev_billing_event")
+            assert tunnel is not None and tunnel.local_port == listening_port
+            port_forwards = http.get("/portforwards").json()["port_forwards"]
+            assert [port_forward["pids"] for port_forward in port_forwards] == [[previous.pid]]
+
+        if keep_tunnels:
+            # Shutting down leaves it running for the next server
+            assert pid_alive(previous.pid)
+            assert [tunnel.database_id for tunnel in tunnel_registry.load()] == ["dev_billing_event"]
+        else:
+            assert _gone(previous.pid)
+            assert tunnel_registry.load() == []
+    finally:
+        previous.terminate()
+
+
+def test_stop_portforwards(registry_path: Path, listening_port: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    previous = _process(listening_port)
+    tunnel_registry.save([_tunnel("dev_billing_event", listening_port, previous.pid)])
+    monkeypatch.setattr(rhizome.server, "shared_port_forwards", SharedPortForwards())
+    monkeypatch.setattr(rhizome.server, "tunnel_manager", TunnelManager())
+
+    try:
+        with TestClient(app) as http:
+            assert http.delete("/portforwards").json()["port_forwards"][0]["mappings"] == []
+            assert rhizome.server.tunnel_manager.get("dev_billing_event") is None
+            assert _gone(previous.pid)
+            assert tunnel_registry.load() == []
+    finally:
+        previous.terminate()
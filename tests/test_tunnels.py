@@ -0,0 +1,172 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from rhizome.tunnels import Tunnel, TunnelManager, tcp_probe
+from tests.utils import get_open_port
+
+
+def test_concurrent_callers_share_one_establishment() -> None:
+    """Only the first caller for a cold database sets up the tunnel; the rest wait for it."""
+    manager = TunnelManager()
+    calls = 0
+
+    async def establish() -> Tunnel:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return Tunnel(database_id="db1", local_port=30001, pid=None, established_at=time.time())
+
+    async def scenario() -> list[Tunnel]:
+        return await asyncio.gather(*(manager.ensure("db1", establish) for _ in range(5)))
+
+    tunnels = asyncio.run(scenario())
+    assert calls == 1
+    assert {t.local_port for t in tunnels} == {30001}
+
+    listing = manager.list_tunnels()
+    assert [t.database_id for t in listing.tunnels] == ["db1"]
+    assert listing.establishing == []
+    stats = listing.stats[0]
+    assert stats.establishments == 1
+    assert stats.last_waiters == 4
+    assert stats.last_duration_seconds is not None and stats.last_duration_seconds >= 0.1
+
+
+def test_failed_establishment_is_shared_and_retried() -> None:
+    """Waiters see the same failure, and the next query tries again."""
+    manager = TunnelManager(backoff_base=0)
+    attempts = 0
+
+    async def establish() -> Tunnel:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.05)
+        if attempts == 1:
+            raise RuntimeError("Failed to discover remote port from logs")
+        return Tunnel(database_id="db1", local_port=30002, pid=None, established_at=time.time())
+
+    async def scenario() -> None:
+        results = await asyncio.gather(*(manager.ensure("db1", establish) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        tunnel = await manager.ensure("db1", establish)
+        assert tunnel.local_port == 30002
+
+    asyncio.run(scenario())
+    assert attempts == 2
+    stats = manager.list_tunnels().stats[0]
+    assert (stats.failures, stats.establishments) == (1, 1)
+
+
+def test_forget_forces_reestablishment() -> None:
+    """A forgotten tunnel is set up again on the next query."""
+    manager = TunnelManager()
+    ports = iter([30003, 30004])
+
+    async def establish() -> Tunnel:
+        return Tunnel(database_id="db1", local_port=next(ports), pid=None, established_at=time.time())
+
+    async def scenario() -> None:
+        assert (await manager.ensure("db1", establish)).local_port == 30003
+        assert (await manager.ensure("db1", establish)).local_port == 30003
+        assert manager.forget("db1") is not None
+        assert (await manager.ensure("db1", establish)).local_port == 30004
+
+    asyncio.run(scenario())
+    with pytest.raises(StopIteration):
+        next(ports)
+
+
+def test_failures_back_off_exponentially() -> None:
+    """After a failed establishment, queries fail fast until the backoff has passed."""
+    manager = TunnelManager(backoff_base=10, backoff_max=15)
+    attempts = 0
+
+    async def establish() -> Tunnel:
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("Port-forward did not start listening in time.")
+
+    async def scenario() -> None:
+        with pytest.raises(RuntimeError, match="did not start listening"):
+            await manager.ensure("db1", establish)
+        with pytest.raises(RuntimeError, match="failed 1 time"):
+            await manager.ensure("db1", establish)
+
+    asyncio.run(scenario())
+    assert attempts == 1
+
+    stats = manager.list_tunnels().stats[0]
+    assert stats.retry_after is not None and stats.retry_after - time.time() > 9
+
+    # Once the backoff has passed, the next failure doubles it (capped at backoff_max)
+    stats_ref = manager._stats["db1"]  # type: ignore
+    stats_ref.retry_after = time.time() - 1
+    with pytest.raises(RuntimeError, match="did not start listening"):
+        asyncio.run(manager.ensure("db1", establish))
+    assert stats_ref.retry_after is not None and 14 < stats_ref.retry_after - time.time() <= 15
+
+
+def test_tcp_probe() -> None:
+    """The probe detects whether a local port accepts connections."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        assert asyncio.run(tcp_probe(port))
+
+    assert not asyncio.run(tcp_probe(get_open_port()))
+
+
+def test_health_check_marks_unreachable_tunnel_dead() -> None:
+    """A tunnel whose port stops accepting connections is dropped and reported."""
+    manager = TunnelManager(max_probe_failures=2)
+    dead_reported: list[str] = []
+
+    async def on_dead(database_id: str) -> None:
+        dead_reported.append(database_id)
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+
+        async def establish() -> Tunnel:
+            return Tunnel(database_id="db1", local_port=port, pid=None, established_at=time.time())
+
+        async def healthy() -> None:
+            await manager.ensure("db1", establish)
+            assert await manager.check_health(on_dead) == []
+
+        asyncio.run(healthy())
+
+    async def unhealthy() -> None:
+        # A single refused probe is tolerated, the second marks the tunnel dead
+        assert await manager.check_health(on_dead) == []
+        assert await manager.check_health(on_dead) == ["db1"]
+
+    asyncio.run(unhealthy())
+    assert dead_reported == ["db1"]
+    assert manager.get("db1") is None
+    assert manager.list_tunnels().stats[0].deaths == 1
+
+
+def test_health_check_marks_exited_process_dead() -> None:
+    """A tunnel whose port-forward process is gone is dead without waiting for probes."""
+    manager = TunnelManager()
+
+    async def establish() -> Tunnel:
+        # No process with this pid is tracked by the process manager
+        return Tunnel(database_id="db1", local_port=get_open_port(), pid=999999, established_at=time.time())
+
+    async def on_dead(database_id: str) -> None:
+        pass
+
+    async def scenario() -> list[str]:
+        await manager.ensure("db1", establish)
+        return await manager.check_health(on_dead)
+
+    assert asyncio.run(scenario()) == ["db1"]
@@ -0,0 +1,69 @@
+"""
+Tests for the precompiled MySQL → Python type normalizers in rhizome.serialization.
+"""
+
+from enum import StrEnum
+
+from sqlmodel import SQLModel
+
+from rhizome.serialization import deserialize_result_list, deserialize_rows, type_normalizer
+
+
+class Color(StrEnum):
+    RED = "RED"
+    GREEN = "GREEN"
+
+
+class Paint(SQLModel):
+    id: int
+    name: str
+    color: Color | None = None
+    glossy: bool = False
+    archived: bool | None = None
+
+
+def test_plan_only_covers_fields_that_need_coercion() -> None:
+    normalizer = type_normalizer(Paint)
+    assert set(normalizer.coercions) == {"color", "glossy", "archived"}
+    # Compiled once per model class
+    assert type_normalizer(Paint) is normalizer
+
+
+def test_normalize_types() -> None:
+    data = {"id": 1, "name": "Teal", "color": "RED", "glossy": 1, "archived": None, "extra": 0}
+    assert type_normalizer(Paint).normalize(data) == {
+        "id": 1,
+        "name": "Teal",
+        "color": Color.RED,
+        "glossy": True,
+        "archived": None,
+        "extra": 0,
+    }
+    # The input dict is left alone
+    assert data["glossy"] == 1
+
+
+def test_unknown_enum_value_is_kept() -> None:
+    assert type_normalizer(Paint).normalize({"color": "PLAID"}) == {"color": "PLAID"}
+
+
+def test_deserialize_rows_matches_dict_path() -> None:
+    columns = ["id", "name", "color", "glossy"]
+    rows = [(1, "Teal", "GREEN", 0), (2, "Rust", None, 1)]
+
+    from_rows = deserialize_rows(columns, rows, Paint)
+    from_dicts = deserialize_result_list([dict(zip(columns, row, strict=True)) for row in rows], Paint)
+
+    assert [p.model_dump() for p in from_rows] == [p.model_dump() for p in from_dicts]
+    assert from_rows[0].color is Color.GREEN
+    assert from_rows[0].glossy is False
+    assert from_rows[1].color is None
+    assert from_rows[1].glossy is True
+
+
+def test_deserialize_rows_partial_columns() -> None:
+    """Queries selecting only some columns build partial models."""
+    (paint,) = deserialize_rows(["id", "glossy"], [(7, 1)], Paint)
+    assert paint.id == 7
+    assert paint.glossy is True
+    assert "name" not in paint.model_fields_set
@@ -0,0 +1,114 @@
+"""
+Tests for warming up databases ahead of their first query (rhizome.warmup, POST /warm).
+"""
+
+import asyncio
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+import rhizome.cluster
+import rhizome.server
+from rhizome.environments.base import DatabaseConfig
+from rhizome.server import app
+from rhizome.tunnels import Tunnel, TunnelManager
+from rhizome.warmup import WarmupTracker
+
+DELAY = 0.2
+
+
+class Calls:
+    def __init__(self) -> None:
+        self.clusters: list[str] = []
+        self.port_forwards: list[str] = []
+        self.secrets: list[str] = []
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Calls, None, None]:
+    """Stand in for cluster credentials, port forwards, secrets and engines, each taking DELAY seconds."""
+    calls = Calls()
+
+    async def connect_cluster(project: str, cluster: str, region: str, server: str, tools: Any) -> None:  # noqa: ANN401
+        calls.clusters.append(cluster)
+        await asyncio.sleep(DELAY)
+        if project == "clover-prod-kubernetes":
+            raise RuntimeError("Failed to get cluster credentials")
+
+    async def establish_port_forward(database_id: str, config: Any) -> Tunnel:  # noqa: ANN401
+        calls.port_forwards.append(database_id)
+        await asyncio.sleep(DELAY)
+        return Tunnel(database_id=database_id, local_port=30000, pid=None, established_at=time.time())
+
+    def get_database_config(database_id: str) -> DatabaseConfig:
+        calls.secrets.append(database_id)
+        time.sleep(DELAY)
+        return DatabaseConfig(host="127.0.0.1", port=0, database=database_id, username="reader", password="secret")
+
+    engines: dict[str, AsyncEngine] = {}
+
+    async def get_engine(database_id: str, connection_string: str) -> AsyncEngine:
+        assert "secret" in connection_string
+        return engines.setdefault(database_id, create_async_engine(f"sqlite+aiosqlite:///{tmp_path / database_id}"))
+
+    monkeypatch.setattr(rhizome.cluster, "connect_cluster", connect_cluster)
+    monkeypatch.setattr(rhizome.server, "_establish_port_forward", establish_port_forward)
+    monkeypatch.setattr(rhizome.server, "_get_database_config", get_database_config)
+    monkeypatch.setattr(rhizome.server.engine_registry, "get_engine", get_engine)
+    monkeypatch.setattr(rhizome.server, "tunnel_manager", TunnelManager())
+    monkeypatch.setattr(rhizome.server, "warmup_tracker", WarmupTracker())
+    yield calls
+    for engine in engines.values():
+        asyncio.run(engine.dispose())
+
+
+def test_warm_connects_each_cluster_once_and_databases_concurrently(calls: Calls) -> None:
+    database_ids = ["dev_billing_bookkeeper", "dev_billing_event", "demo_billing_bookkeeper", "dev_meta", "bogus"]
+
+    with TestClient(app) as http:
+        start = time.monotonic()
+        warmed = http.post("/warm", json={"database_ids": database_ids, "wait": True}).json()
+        elapsed = time.monotonic() - start
+
+    # Dev and demo tunnels go through the same cluster
+    assert calls.clusters == ["dev-us-west1-cluster"]
+    assert sorted(calls.port_forwards) == ["demo_billing_bookkeeper", "dev_billing_bookkeeper", "dev_billing_event"]
+    assert sorted(calls.secrets) == sorted(database_ids[:4])
+    # Cluster, then tunnels and secrets side by side; one at a time would take at least 8 * DELAY
+    assert elapsed < 6 * DELAY
+
+    steps = {status["database_id"]: status["step"] for status in warmed["databases"]}
+    assert steps == {**dict.fromkeys(database_ids[:4], "ready"), "bogus": "failed"}
+    assert (warmed["in_progress"], warmed["ready"], warmed["failed"]) == (False, 4, 1)
+
+
+def test_cluster_failures_fail_its_databases(calls: Calls) -> None:
+    with TestClient(app) as http:
+        warmed = http.post(
+            "/warm", json={"database_ids": ["na_prod_billing_bookkeeper", "na_prod_billing_event"], "wait": True}
+        ).json()
+
+    assert calls.clusters == ["na-prod-us-central1-cluster"]
+    assert calls.port_forwards == []
+    assert [status["step"] for status in warmed["databases"]] == ["failed", "failed"]
+    assert "Failed to get cluster credentials" in warmed["databases"][0]["error"]
+
+
+def test_serve_warms_up_at_startup(calls: Calls, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rhizome.server, "_warm_on_startup", ["dev_billing_event"])
+
+    with TestClient(app) as http:
+        deadline = time.monotonic() + 5
+        while (progress := http.get("/warm").json())["in_progress"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        # The first query finds the tunnel already up
+        assert rhizome.server.tunnel_manager.get("dev_billing_event") is not None
+
+    assert [status["step"] for status in progress["databases"]] == ["ready"]
+    assert calls.port_forwards == ["dev_billing_event"]
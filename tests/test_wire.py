@@ -0,0 +1,164 @@
+"""
+Tests for the columnar MessagePack encoding of query results (rhizome.wire).
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlmodel import Field, col, select
+
+from rhizome.models.base import RhizomeModel
+from rhizome.serialization import deserialize_result, deserialize_result_list
+from rhizome.server import app
+from rhizome.server_models import ExecuteQueryRequest, ExecuteQueryResponse, GetMode
+from rhizome.wire import COLUMNAR_MEDIA_TYPE, accepts_columnar, decode_response, encode_response
+from tests.conftest import SQLiteDatabases
+
+
+class Invoice(RhizomeModel, table=True):
+    __tablename__ = "wire_invoice"  # type: ignore[assignment]
+
+    id: int | None = Field(default=None, primary_key=True)
+    amount: Decimal = Field(max_digits=12, decimal_places=2)
+    due: date
+    created: datetime
+    paid: bool = False
+    note: str | None = None
+
+    def sanitize(self) -> "Invoice":
+        """Nothing to hide."""
+        return self
+
+
+def test_accepts_columnar() -> None:
+    assert accepts_columnar(COLUMNAR_MEDIA_TYPE)
+    assert accepts_columnar(f"application/json;q=0.5, {COLUMNAR_MEDIA_TYPE};q=1")
+    assert not accepts_columnar("application/json")
+    assert not accepts_columnar("*/*")
+    assert not accepts_columnar(None)
+
+
+def test_round_trip_keeps_types() -> None:
+    rows = [
+        {"id": 1, "amount": Decimal("10.25"), "due": date(2024, 2, 29), "created": datetime(2024, 1, 1, 12, 30)},
+        {"id": 2, "amount": Decimal("0.10"), "due": date(2024, 3, 1), "created": datetime(2024, 1, 2, 8, 0)},
+    ]
+    response = ExecuteQueryResponse(success=True, result=rows, row_count=2, last_key=[2])
+
+    decoded = decode_response(encode_response(response))
+
+    assert decoded.success
+    assert decoded.result == rows
+    assert decoded.row_count == 2
+    assert decoded.last_key == [2]
+    assert isinstance(decoded.result[0]["amount"], Decimal)  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        ExecuteQueryResponse(success=True, result=None, row_count=0),
+        ExecuteQueryResponse(success=True, result=[], row_count=0),
+        ExecuteQueryResponse(success=True, result={"id": 1, "note": None}, row_count=1),
+        ExecuteQueryResponse(success=False, result=None, error="boom"),
+    ],
+)
+def test_round_trip_shapes(response: ExecuteQueryResponse) -> None:
+    assert decode_response(encode_response(response)) == response
+
+
+def test_columnar_is_smaller_than_json() -> None:
+    rows = [
+        {"id": i, "amount": Decimal("12.50"), "due": date(2024, 1, 1), "created": datetime(2024, 1, 1), "paid": True}
+        for i in range(1000)
+    ]
+    columnar = encode_response(ExecuteQueryResponse(success=True, result=rows, row_count=len(rows)))
+    as_json = ExecuteQueryResponse(success=True, result=rows, row_count=len(rows)).model_dump_json()
+    assert len(columnar) < len(as_json) * 0.6
+
+
+@pytest.fixture
+def server_db(sqlite_databases: SQLiteDatabases) -> SQLiteDatabases:
+    """Serve queries from a SQLite table instead of a tunnelled MySQL database."""
+    # Raw SQL: MySQL DATETIME columns are naive, which SQLModel refuses to bind
+    sqlite_databases.add(
+        Invoice,
+        "INSERT INTO wire_invoice (id, amount, due, created, paid) VALUES "
+        "(1, 99.95, '2024-05-01', '2024-04-01 09:15:00.000000', 0), "
+        "(2, 5.00, '2024-06-01', '2024-04-02 00:00:00.000000', 1)",
+    )
+    return sqlite_databases
+
+
+def test_client_negotiates_encoding(server_db: SQLiteDatabases) -> None:
+    """Clients get the same models whichever encoding they ask for."""
+    results = {}
+    for columnar in (True, False):
+        client = server_db.client(columnar_results=columnar)
+        invoices = client.select_all("dev_meta", select(Invoice).order_by(col(Invoice.id)))
+        first = client.select_first("dev_meta", select(Invoice).where(Invoice.id == 2))
+        results[columnar] = ([i.model_dump() for i in invoices], first)
+
+    invoices, first = results[True]
+    assert [i["id"] for i in invoices] == [1, 2]
+    assert first is not None and first.paid is True
+    assert results[True] == results[False]
+    # SQLite hands back dates as strings and decimals as floats; fields get their model's types either way
+    assert invoices[0]["amount"] == Decimal("99.95")
+    assert (invoices[0]["due"], invoices[0]["created"]) == (date(2024, 5, 1), datetime(2024, 4, 1, 9, 15))
+
+
+def test_encodings_give_the_same_types() -> None:
+    """MySQL drivers return Decimal/date/datetime objects, which JSON turns into strings and MessagePack keeps."""
+    rows = [
+        {"id": 1, "amount": Decimal("10.25"), "due": date(2024, 2, 29), "created": datetime(2024, 1, 1, 12, 30)},
+        {"id": 2, "amount": Decimal("0.10"), "due": date(2024, 3, 1), "created": datetime(2024, 1, 2, 8, 0)},
+    ]
+    response = ExecuteQueryResponse(success=True, result=rows, row_count=2)
+    as_json = ExecuteQueryResponse.model_validate_json(response.model_dump_json())
+    assert as_json.result[0]["amount"] == "10.25"  # type: ignore[index]
+
+    from_json = deserialize_result_list(as_json.result, Invoice)  # type: ignore[arg-type]
+    from_columnar = deserialize_result_list(decode_response(encode_response(response)).result, Invoice)  # type: ignore[arg-type]
+
+    assert [invoice.model_dump() for invoice in from_json] == [invoice.model_dump() for invoice in from_columnar]
+    for invoice in from_json:
+        assert isinstance(invoice.amount, Decimal)
+        assert type(invoice.due) is date and type(invoice.created) is datetime
+    assert deserialize_result(as_json.result[1], Invoice).amount == Decimal("0.10")  # type: ignore[index]
+
+
+def test_other_values_are_encoded_as_in_json() -> None:
+    rows = [{"id": 1, "elapsed": timedelta(days=-1, seconds=5), "at": time(9, 15, 30)}]
+    response = ExecuteQueryResponse(success=True, result=rows, row_count=1)
+
+    as_json = ExecuteQueryResponse.model_validate_json(response.model_dump_json())
+    columnar = decode_response(encode_response(response))
+
+    assert columnar.result == as_json.result
+    # A negative duration comes back as it was (its str() form would parse as -86405s)
+    assert isinstance(columnar.result, list)
+    (row,) = columnar.result
+    assert TypeAdapter(timedelta).validate_python(row["elapsed"]) == timedelta(seconds=-86395)
+    assert TypeAdapter(time).validate_python(row["at"]) == time(9, 15, 30)
+
+
+def test_server_answers_json_without_accept(server_db: SQLiteDatabases) -> None:
+    request = ExecuteQueryRequest(
+        database_id="dev_meta",
+        sql="SELECT * FROM wire_invoice",
+        parameters={},
+        model_module=Invoice.__module__,
+        model_class=Invoice.__name__,
+        mode=GetMode.ALL,
+    )
+    with TestClient(app) as http:
+        plain = http.post("/execute_query", json=request.model_dump())
+        columnar = http.post("/execute_query", json=request.model_dump(), headers={"Accept": COLUMNAR_MEDIA_TYPE})
+
+    assert plain.headers["content-type"] == "application/json"
+    assert columnar.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert decode_response(columnar.content).row_count == plain.json()["row_count"] == 2
@@ -0,0 +1,18 @@
+# Type stubs for the parts of msgpack that rhizome uses (msgpack ships no type information).
+# pyright reads stubs from ./typings by default.
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+class ExtType(NamedTuple):
+    code: int
+    data: bytes
+
+def packb(o: object, *, default: Callable[[Any], object] | None = None, use_bin_type: bool = True) -> bytes: ...
+def unpackb(
+    packed: bytes,
+    *,
+    ext_hook: Callable[[int, bytes], object] = ...,
+    raw: bool = False,
+    strict_map_key: bool = True,
+) -> Any: ...